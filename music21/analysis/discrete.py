@@ -24,6 +24,7 @@ The :class:`music21.analysis.discrete.KrumhanslSchmuckler`
 
 import unittest
 
+from music21 import base # for _missingImport testing.
 from music21 import exceptions21
 
 from music21 import pitch
@@ -485,7 +486,9 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
     def _likelyKeys(self, sStream):
         pcDistribution = self._getPitchClassDistribution(sStream)
         #environLocal.printDebug(['process(); pcDistribution', pcDistribution])
-    
+        return self._likelyKeysFromDistribution(pcDistribution)
+
+    def _likelyKeysFromDistribution(self, pcDistribution):
         keyResultsMajor = self._convoluteDistribution(pcDistribution, 'major')
         differenceMajor = self._getDifference(keyResultsMajor, 
                           pcDistribution, 'major')
@@ -499,6 +502,36 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
 
         return likelyKeysMajor, likelyKeysMinor
 
+    def _getSortedSolutions(self, likelyKeysMajor, likelyKeysMinor):
+        '''
+        Given the results of :meth:`_likelyKeys`, return a list of 
+        (coefficient, pitch, mode) tuples, sorted from most to least likely.
+        '''
+        #find the largest correlation value to use to select major or minor as the resulting key
+        # values are the result of _getLikelyKeys
+        # each first index is the sorted results; there will be 12
+        # each first index is tuple
+        # the tuple defines a Pitch, as well as the differences value
+        # from _getDifference
+
+        # see which has a higher correlation coefficient, the first major or the
+        # the first minor
+        if likelyKeysMajor is not None:
+            sortList = [(coefficient, p, 'major') for 
+                        (p, coefficient) in likelyKeysMajor]
+        else:
+            sortList = []
+        if likelyKeysMinor is not None:
+            sortList += [(coefficient, p, 'minor') for 
+                         (p, coefficient) in likelyKeysMinor]
+        if len(sortList) == 0:
+            raise DiscreteAnalysisException('failed to get likely keys for Stream component')
+
+        sortList.sort()
+        sortList.reverse()
+        #environLocal.printDebug(['sortList', sortList])
+        return sortList
+
 
     def _bestKeyEnharmonic(self, pitchObj, mode, sStream=None):
         '''
@@ -571,34 +604,7 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         #pcDistribution = [9,0,3,0,2,5,0,2,0,2,2,0]
     
         likelyKeysMajor, likelyKeysMinor = self._likelyKeys(sStream)
-
-        #find the largest correlation value to use to select major or minor as the resulting key
-        # values are the result of _getLikelyKeys
-        # each first index is the sorted results; there will be 12
-        # each first index is tuple
-        # the tuple defines a Pitch, as well as the differences value
-        # from _getDifference
-
-        #if likelyKeysMajor is None or likelyKeysMinor is None:
-        #    mode = None
-        #    solution = (None, mode, 0)
-
-        # see which has a higher correlation coefficient, the first major or the
-        # the first minor
-        if likelyKeysMajor is not None:
-            sortList = [(coefficient, p, 'major') for 
-                        (p, coefficient) in likelyKeysMajor]
-        else:
-            sortList = []
-        if likelyKeysMinor is not None:
-            sortList += [(coefficient, p, 'minor') for 
-                         (p, coefficient) in likelyKeysMinor]
-        if len(sortList) == 0:
-            raise DiscreteAnalysisException('failed to get likely keys for Stream component')
-
-        sortList.sort()
-        sortList.reverse()
-        #environLocal.printDebug(['sortList', sortList])
+        sortList = self._getSortedSolutions(likelyKeysMajor, likelyKeysMinor)
 
         coefficient, p, mode = sortList[0]
         p = self._bestKeyEnharmonic(p, mode, sStream)
@@ -618,6 +624,170 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         # store solutions for compressed legend generation
         self._solutionsFound.append((solution, color))
         return solution, color        
+
+    def getCumulativeData(self, windows):
+        '''
+        Given a list of minimum windows, as found by 
+        :meth:`~music21.analysis.windowed.WindowedAnalysis._getMinimumWindowIndex`, 
+        each a list of (element, quarterLength) pairs giving the portion 
+        of each note, chord, or rest sounding in that window, return 
+        cumulative sums of their note counts and pitch class 
+        distributions, for use with :meth:`processWindows`. 
+
+        Row `i` gives the note count followed by the twelve pitch class 
+        weights of all windows before window `i`; the data for any run 
+        of adjacent windows is thus the difference of two rows. If NumPy 
+        is available an array is returned, otherwise a list of lists.
+
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> c = note.Note('c', quarterLength=3)
+        >>> e = note.Note('e')
+        >>> windows = [[(c, 1.0)], [(c, 1.0)], [(c, 1.0), (e, 1.0)]]
+        >>> cumulative = p.getCumulativeData(windows)
+        >>> len(cumulative)
+        4
+        >>> [float(x) for x in cumulative[2]]
+        [2.0, 2.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        >>> [float(x) for x in cumulative[3]]
+        [4.0, 3.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        '''
+        row = [0] * 13
+        post = [list(row)]
+        for window in windows:
+            for n, quarterLength in window:
+                if n.isRest:
+                    continue
+                row[0] += 1
+                if n.isChord:
+                    for m in n.pitchClasses:
+                        row[m+1] = row[m+1] + quarterLength
+                else:
+                    row[n.pitchClass+1] = row[n.pitchClass+1] + quarterLength
+            post.append(list(row))
+        if 'numpy' in base._missingImport:
+            return post
+        import numpy
+        return numpy.array(post, dtype=float)
+
+
+    def processWindows(self, cumulativeData, windowSize):
+        '''
+        Process all overlapping runs of `windowSize` adjacent windows 
+        from data produced by :meth:`getCumulativeData`, returning a 
+        list of solutions and a list of colors, as :meth:`process` would 
+        for each run.
+
+        With NumPy, the pitch class distributions of all runs are 
+        correlated against all 24 rotated key profiles at once; otherwise 
+        each run is analyzed in turn from its summed distribution, which 
+        still avoids building and flattening a Stream for each run. As 
+        with :meth:`process`, a DiscreteAnalysisException is raised if 
+        any run has no notes.
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> wa = analysis.windowed.WindowedAnalysis(s, p)
+        >>> cumulative = p.getCumulativeData(wa._windowIndex)
+        >>> data, colors = p.processWindows(cumulative, 8)
+        >>> len(data) == len(cumulative) - 8
+        True
+        >>> data[0][:2]
+        (<music21.pitch.Pitch E>, 'major')
+        >>> colors[0].startswith('#')
+        True
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note('c'))
+        >>> s.append(note.Rest(quarterLength=2))
+        >>> wa = analysis.windowed.WindowedAnalysis(s, p)
+        >>> cumulative = p.getCumulativeData(wa._windowIndex)
+        >>> p.processWindows(cumulative, 1)
+        Traceback (most recent call last):
+        DiscreteAnalysisException: failed to get likely keys for Stream component
+        '''
+        windowCount = len(cumulativeData) - windowSize
+        if windowCount <= 0:
+            return [], []
+        if 'numpy' in base._missingImport:
+            keyData = []
+            for i in range(windowCount):
+                start = cumulativeData[i]
+                end = cumulativeData[i + windowSize]
+                if end[0] - start[0] == 0:
+                    raise DiscreteAnalysisException('failed to get likely keys for Stream component')
+                pcDistribution = [end[j] - start[j] for j in range(1, 13)]
+                likelyKeysMajor, likelyKeysMinor = \
+                    self._likelyKeysFromDistribution(pcDistribution)
+                coefficient, p, mode = self._getSortedSolutions(
+                    likelyKeysMajor, likelyKeysMinor)[0]
+                keyData.append((coefficient, p, mode))
+        else:
+            keyData = self._processWindowsNumpy(cumulativeData, windowSize)
+
+        data = []
+        color = []
+        for coefficient, p, mode in keyData:
+            p = self._bestKeyEnharmonic(p, mode)
+            solution = (p, mode, coefficient)
+            solutionColor = self.solutionToColor(solution)
+            self._solutionsFound.append((solution, solutionColor))
+            data.append(solution)
+            color.append(solutionColor)
+        return data, color
+
+    def _processWindowsNumpy(self, cumulativeData, windowSize):
+        '''
+        Return a list of (coefficient, pitch, mode) for each run of 
+        `windowSize` windows, choosing among keys as 
+        :meth:`_getSortedSolutions` does: only the first of any equal 
+        convolution values is a candidate, and equal coefficients favor 
+        the higher pitch class, then minor.
+        '''
+        import numpy
+        counts = cumulativeData[windowSize:, 0] - cumulativeData[:-windowSize, 0]
+        if (counts == 0).any():
+            raise DiscreteAnalysisException('failed to get likely keys for Stream component')
+        pcDistributions = (cumulativeData[windowSize:, 1:] - 
+                           cumulativeData[:-windowSize, 1:])
+        centered = pcDistributions - pcDistributions.mean(axis=1)[:, numpy.newaxis]
+        bottomLeft = (centered ** 2).sum(axis=1)
+        # only consider the first of any equal convolution values
+        earlier = numpy.tril(numpy.ones((12, 12), dtype=bool), -1)
+
+        # columns alternate major and minor, so that the last of any equal
+        # coefficients gives the higher pitch class, then minor
+        coefficients = numpy.empty((len(pcDistributions), 24))
+        for column, weightType in enumerate(['major', 'minor']):
+            toneWeights = numpy.array(self._getWeights(weightType), dtype=float)
+            profiles = numpy.array([[toneWeights[(j - i) % 12] 
+                                     for j in range(12)] for i in range(12)])
+            keyResults = numpy.dot(pcDistributions, profiles.T)
+            profiles = profiles - toneWeights.mean()
+            top = numpy.dot(centered, profiles.T)
+            bottom = numpy.sqrt(numpy.outer(bottomLeft, 
+                                (profiles ** 2).sum(axis=1)))
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                soln = numpy.where(bottom == 0, 0.0, top / bottom)
+            equal = keyResults[:, :, numpy.newaxis] == keyResults[:, numpy.newaxis, :]
+            soln[(equal & earlier).any(axis=2)] = -numpy.inf
+            coefficients[:, column::2] = soln
+
+        best = coefficients.max(axis=1)
+        isBest = coefficients == best[:, numpy.newaxis]
+        bestColumns = 23 - isBest[:, ::-1].argmax(axis=1)
+        post = []
+        for i in range(len(best)):
+            if bottomLeft[i] == 0:
+                coefficient = 0
+            else:
+                coefficient = float(best[i])
+            column = int(bestColumns[i])
+            if column % 2:
+                mode = 'minor'
+            else:
+                mode = 'major'
+            post.append((coefficient, pitch.Pitch(column // 2), mode))
+        return post
     
     def _solutionToObject(self, solution):
         '''Convert a solution into an appropriate object representation, returning a Key object.
@@ -1477,6 +1647,49 @@ class Test(unittest.TestCase):
         #s.plot('grid', 'KrumhanslSchmuckler')
         #s.plot('windowed', 'aarden')
 
+    def testProcessWindowsNumpy(self):
+        from music21 import corpus
+        from music21.analysis import windowed
+        if 'numpy' in base._missingImport:
+            self.skipTest('numpy is not installed')
+
+        # all runs of windows at once give the solutions found for each
+        # run from its summed distribution
+        s = corpus.parse('bach/bwv66.6')
+        for pClass in [KrumhanslSchmuckler, TemperleyKostkaPayne]:
+            p = pClass()
+            wa = windowed.WindowedAnalysis(s, p)
+            cumulative = p.getCumulativeData(wa._windowIndex)
+            for windowSize in [1, 3, 8]:
+                post = p._processWindowsNumpy(cumulative, windowSize)
+                self.assertEqual(len(post), len(cumulative) - windowSize)
+                for i, (coefficient, pitchObj, mode) in enumerate(post):
+                    start = cumulative[i]
+                    end = cumulative[i + windowSize]
+                    distribution = [float(end[j] - start[j]) 
+                                    for j in range(1, 13)]
+                    likelyKeysMajor, likelyKeysMinor = \
+                        p._likelyKeysFromDistribution(distribution)
+                    expected = p._getSortedSolutions(likelyKeysMajor, 
+                                                     likelyKeysMinor)[0]
+                    self.assertAlmostEqual(coefficient, expected[0])
+                    self.assertEqual(pitchObj.name, expected[1].name)
+                    self.assertEqual(mode, expected[2])
+
+        # a run without notes raises, as in the pure-Python path
+        from music21 import note, stream
+        s = stream.Stream()
+        s.append(note.Note('c'))
+        s.append(note.Rest(quarterLength=2))
+        s.append(note.Note('e'))
+        p = KrumhanslSchmuckler()
+        wa = windowed.WindowedAnalysis(s, p)
+        cumulative = p.getCumulativeData(wa._windowIndex)
+        self.assertRaises(DiscreteAnalysisException, 
+                          p._processWindowsNumpy, cumulative, 1)
+        # runs of windows that each include a note do not
+        self.assertEqual(len(p._processWindowsNumpy(cumulative, 3)), 2)
+
 
 # define presented order in documentation
 _DOC_ORDER = [analyzeStream, DiscreteAnalysis, Ambitus, MelodicIntervalDiversity, KeyWeightKeyAnalysis, SimpleWeights, AardenEssen, BellmanBudge, KrumhanslSchmuckler, KrumhanslKessler, TemperleyKostkaPayne]
@@ -360,7 +360,7 @@ class ScoreReduction(object):
                         v.makeRests(fillGaps=True, inPlace=True) 
                 m.flattenUnnecessaryVoices(inPlace=True)
                 # hide all rests in all containers
-                for r in m.flat.getElementsByClass('Rest'):
+                for unused_offset, r in m.iterFlat('Rest'):
                     r.hideObjectOnPrint = True
                 #m.show('t')
             # add to score
@@ -16,6 +16,8 @@ Modular analysis procedures inherit from :class:`music21.analysis.discrete.Discr
 '''
 
 
+import copy
+import math
 import unittest
 import sys
 
@@ -42,15 +44,119 @@ class WindowedAnalysis(object):
     def __init__(self, streamObj, analysisProcessor):
         '''Create a WindowedAnalysis object.
 
-        The provided `analysisProcessor` must provide a `process()` method that, when given a windowed Stream (a Measure) returns two element tuple containing (a) a data value (implementation dependent) and (b) a color code. 
+        The provided `analysisProcessor` must provide a `process()` method that, when given a windowed Stream returns two element tuple containing (a) a data value (implementation dependent) and (b) a color code. 
         '''
         self.processor = analysisProcessor
         #environLocal.printDebug(self.processor)
         if 'Stream' not in streamObj.classes:
             raise WindowedAnalysisException, 'non-stream provided as argument'
         self._srcStream = streamObj
-        # store a windowed Stream, partitioned into bars of 1/4
-        self._windowedStream = self._getMinimumWindowStream() 
+        # index the notes and rests of the source into windows of 1/4 
+        self._windowIndex, self._elementSpans = self._getMinimumWindowIndex()
+        # the Stream of 1/4 measures is only created if requested
+        self._minimumWindowStream = None
+        # cumulative data for processors that can analyze all windows at once
+        self._cumulativeData = None
+
+    def _getWindowedStream(self):
+        if self._minimumWindowStream is None:
+            self._minimumWindowStream = self._getMinimumWindowStream()
+        return self._minimumWindowStream
+
+    _windowedStream = property(_getWindowedStream, doc='''
+        The source Stream restructured into measures of 1/4, as returned by 
+        :meth:`_getMinimumWindowStream`. This is created only when first 
+        accessed; analysis uses the window index instead.
+        ''')
+
+    def _getMinimumWindowIndex(self):
+        '''
+        Index the notes and rests of the flat source Stream by the minimum 
+        windows (of one quarter length) that they sound in. 
+
+        Returns a list with one list for each minimum window, containing 
+        (element, quarterLength) pairs, where the quarterLength is the 
+        portion of the element's duration within that window, and a 
+        dictionary of (offset, endTime) for each element, keyed by id.
+
+        No Measures are made and no elements are copied or split.
+
+        >>> s = corpus.parse('bach/bwv324')
+        >>> p = analysis.discrete.Ambitus()
+        >>> wa = analysis.windowed.WindowedAnalysis(s.parts[0], p)
+        >>> windows, spans = wa._getMinimumWindowIndex()
+        >>> len(windows) # the same as the number of 1/4 measures
+        42
+        >>> windows[4]
+        [(<music21.note.Note B>, 1.0)]
+
+        A half note sounds in two windows:
+
+        >>> windows[1]
+        [(<music21.note.Note B>, 1.0)]
+        >>> windows[1][0][0].quarterLength
+        2.0
+        >>> windows[0][0][0] is windows[1][0][0]
+        True
+        '''
+        flatStream = self._srcStream.flat
+        windowCount = int(math.ceil(flatStream.highestTime))
+        windows = [[] for unused in range(windowCount)]
+        spans = {}
+        for e in flatStream.notesAndRests:
+            start = e.getOffsetBySite(flatStream)
+            end = start + e.duration.quarterLength
+            spans[id(e)] = (start, end)
+            first = int(math.floor(start))
+            if first >= windowCount:
+                continue
+            if end <= start: # a grace note sounds in the window of its offset
+                windows[first].append((e, 0.0))
+                continue
+            for i in range(first, min(int(math.ceil(end)), windowCount)):
+                quarterLength = min(end, i + 1) - max(start, i)
+                if quarterLength > 0:
+                    windows[i].append((e, quarterLength))
+        return windows, spans
+
+    def _getWindowStream(self, start, end):
+        '''
+        Return a Stream of the notes and rests sounding in the minimum 
+        windows from `start` up to, but not including, `end`, offset so 
+        that the first window begins at zero.
+
+        Elements within these windows are not copied; only elements that 
+        extend beyond the first or last window are copied and shortened.
+
+        >>> s = corpus.parse('bach/bwv324')
+        >>> p = analysis.discrete.Ambitus()
+        >>> wa = analysis.windowed.WindowedAnalysis(s.parts[0], p)
+        >>> post = wa._getWindowStream(1, 4)
+        >>> [(e.offset, e.quarterLength) for e in post]
+        [(0.0, 1.0), (1.0, 2.0)]
+        >>> post[0] is s.parts[0].flat.notes[0]
+        False
+        >>> post[1] is s.parts[0].flat.notes[1]
+        True
+        >>> post = wa._getWindowStream(3, 4)
+        >>> [(e.offset, e.quarterLength) for e in post]
+        [(0.0, 1.0)]
+        '''
+        post = stream.Stream()
+        found = set()
+        for i in range(start, end):
+            for e, unused in self._windowIndex[i]:
+                if id(e) in found:
+                    continue
+                found.add(id(e))
+                offset, endTime = self._elementSpans[id(e)]
+                if offset < start or endTime > end:
+                    offset = max(offset, start)
+                    e = copy.deepcopy(e)
+                    e.duration.quarterLength = min(endTime, end) - offset
+                post._insertCore(offset - start, e)
+        post._elementsChanged()
+        return post
 
     def _getMinimumWindowStream(self, timeSignature='1/4'):
         ''' Take the loaded stream and restructure it into measures of 1 quarter note duration.
@@ -93,15 +199,17 @@ class WindowedAnalysis(object):
 
         If windowType is "overlap", windows above size 1 are always overlapped, so if a window of size 2 is used, windows 1-2, then 2-3, then 3-4 are compared. If a window of size 3 is used, windows 1-3, then 2-4, then 3-5 are compared. 
 
-        Windows are assumed to be partitioned by :class:`music21.stream.Measure` objects.
+        Windows are made of the minimum windows of :meth:`_getMinimumWindowIndex`; each window is given to the processor as a Stream from :meth:`_getWindowStream`.
 
         Returns two lists for results, each equal in size to the length of minimum windows minus the window size plus one. If we have 20 1/4 windows, then the results lists will be of length 20 for window size 1, 19 for window size 2, 18 for window size 3, etc. 
 
+        If windowType is "overlap" and the processor provides `getCumulativeData()` and `processWindows()` methods (as :class:`~music21.analysis.discrete.KeyWeightKeyAnalysis` does), all windows of a size are processed at once from cumulative data computed only once for all window sizes.
+
         
         >>> s = corpus.parse('bach/bwv66.6')
         >>> p = analysis.discrete.Ambitus()
         >>> wa = analysis.windowed.WindowedAnalysis(s, p)
-        >>> len(wa._windowedStream)
+        >>> len(wa._windowIndex)
         36
         >>> a, b = wa._analyze(1)
         >>> len(a), len(b)
@@ -112,7 +220,7 @@ class WindowedAnalysis(object):
         (33, 33)
 
         '''
-        maxWindowCount = len(self._windowedStream)
+        maxWindowCount = len(self._windowIndex)
         # assuming that this is sorted
 
         if windowType == 'overlap':
@@ -129,12 +237,18 @@ class WindowedAnalysis(object):
         # how many windows in this row
         windowCountIndices = range(windowCount)
         
-        if windowType == 'overlap':
+        if windowType == 'overlap' and hasattr(self.processor, 'processWindows'):
+            # processors such as KeyWeightKeyAnalysis can analyze all windows
+            # of a size from cumulative data shared by all window sizes
+            if self._cumulativeData is None:
+                self._cumulativeData = self.processor.getCumulativeData(
+                                       self._windowIndex)
+            data, color = self.processor.processWindows(self._cumulativeData, 
+                                                        windowSize)
+
+        elif windowType == 'overlap':
             for i in windowCountIndices:
-                current = stream.Stream()
-                for j in range(i, i+windowSize):
-                    #environLocal.printDebug(['self._windowedStream[j]', self._windowedStream[j]])
-                    current.append(self._windowedStream[j])
+                current = self._getWindowStream(i, i+windowSize)
                 data[i], color[i] = self.processor.process(current)
 
         elif windowType == 'noOverlap':
@@ -142,12 +256,10 @@ class WindowedAnalysis(object):
             end = start+windowSize
             i = 0
             while True:
-                if end >= len(self._windowedStream):
-                    end = len(self._windowedStream)
+                if end >= maxWindowCount:
+                    end = maxWindowCount
 
-                current = stream.Stream()
-                for j in range(start, end):
-                    current.append(self._windowedStream[j])
+                current = self._getWindowStream(start, end)
                 data[i], color[i] = self.processor.process(current)
 
                 start = end
@@ -157,25 +269,12 @@ class WindowedAnalysis(object):
                     break
        
         elif windowType == 'adjacentAverage':
-            # first get overlapping windows
-            overlapped = []
-            for i in range(maxWindowCount - windowSize + 1):
-                current = stream.Stream()
-                # store indices of min windows that participate
-                participants = [] 
-                for j in range(i, i+windowSize):
-                    current.append(self._windowedStream[j])
-                    participants.append(j)
-                overlapped.append([current, participants])
-
-            # then distribute to each of maxWindowCount
+            # each minimum window gets all windows of the overlapping 
+            # windows it participates in
             for i in range(maxWindowCount):
-                # get all participants, combine into a single 
-                current = stream.Stream()
-                for dataStream, participants in overlapped:
-                    if i in participants:
-                        for m in dataStream:
-                            current.append(m)
+                start = max(0, i - windowSize + 1)
+                end = min(maxWindowCount - windowSize, i) + windowSize
+                current = self._getWindowStream(start, end)
                 data[i], color[i] = self.processor.process(current)
 
         return data, color
@@ -219,12 +318,12 @@ class WindowedAnalysis(object):
         True
         '''
         if maxWindow == None:
-            maxLength = len(self._windowedStream)
+            maxLength = len(self._windowIndex)
         else:
             maxLength = maxWindow
 
         if minWindow == None:
-            minLength = len(self._windowedStream)
+            minLength = len(self._windowIndex)
         else:
             minLength = minWindow
         
@@ -257,7 +356,7 @@ class WindowedAnalysis(object):
                     break
 
         if includeTotalWindow:
-            totalWindow = len(self._windowedStream)
+            totalWindow = len(self._windowIndex)
             if totalWindow not in windowSizes:
                 windowSizes.append(totalWindow)
 
@@ -376,6 +475,58 @@ class Test(unittest.TestCase):
 
 
 
+    def testProcessWindows(self):
+        from music21.analysis import discrete
+        from music21 import corpus
+
+        # cumulative processing gives the same results as processing 
+        # each window Stream
+        for work in ['bach/bwv324', 'bach/bwv66.6']:
+            s = corpus.parse(work)
+            for pClass in [discrete.KrumhanslSchmuckler, 
+                           discrete.TemperleyKostkaPayne]:
+                wa = WindowedAnalysis(s, pClass())
+                for windowSize in [1, 3, 8, len(wa._windowedStream)]:
+                    data, color = wa._analyze(windowSize)
+                    self.assertEqual(len(data), 
+                                     len(wa._windowedStream) - windowSize + 1)
+                    for i in range(len(data)):
+                        current = stream.Stream()
+                        for j in range(i, i+windowSize):
+                            current.append(wa._windowedStream[j])
+                        solution, solutionColor = pClass().process(current)
+                        self.assertEqual(data[i][0].name, solution[0].name)
+                        self.assertEqual(data[i][1], solution[1])
+                        self.assertAlmostEqual(data[i][2], solution[2])
+                        self.assertEqual(color[i], solutionColor)
+
+    def testWindowStreams(self):
+        from music21.analysis import discrete
+        from music21 import corpus
+
+        # window Streams give the same results as windows of 1/4 measures
+        s = corpus.parse('bach/bwv66.6')
+        wa = WindowedAnalysis(s, discrete.Ambitus())
+        self.assertEqual(len(wa._windowIndex), len(wa._windowedStream))
+        for windowSize in [1, 2, 5]:
+            data, unused_color = wa._analyze(windowSize)
+            for i in range(len(data)):
+                current = stream.Stream()
+                for j in range(i, i+windowSize):
+                    current.append(wa._windowedStream[j])
+                self.assertEqual(data[i], discrete.Ambitus().process(current)[0])
+
+        # the source is not changed, and notes over window edges are copied
+        notes = list(s.flat.notes)
+        post = wa._getWindowStream(0, 3)
+        self.assertEqual(post.highestTime, 3.0)
+        self.assertEqual([n.quarterLength for n in s.flat.notes],
+                         [n.quarterLength for n in notes])
+
+        # each minimum window is analyzed with all windows it is part of
+        data, unused_color = wa._analyze(4, windowType='adjacentAverage')
+        self.assertEqual(len(data), 36)
+
     def testVariableWindowing(self):
         from music21.analysis import discrete
         from music21 import corpus, graph
@@ -251,6 +251,56 @@ class Groups(SlottedObject, list):
 #------------------------------------------------------------------------------
 
 
+class SiteRef(SlottedObject):
+    '''
+    A single entry in a :class:`~music21.base.Sites` object: a (weak)
+    reference to a site or context, with the offset of the object in the
+    site (None for contexts), the name of the site's class, and the time
+    index at which it was added.
+
+    ::
+
+        >>> s = stream.Stream()
+        >>> n = note.Note()
+        >>> s.insert(2.0, n)
+        >>> siteRef = n.sites._definedContexts[id(s)]
+        >>> siteRef
+        <music21.base.SiteRef Stream offset=2.0>
+        >>> common.unwrapWeakref(siteRef.obj) is s
+        True
+        >>> siteRef.isDead
+        False
+
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        'classString',
+        'isDead',
+        'obj',
+        'offset',
+        'time',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        self.classString = None
+        self.isDead = False  # store to access w/o unwrapping
+        self.obj = None  # a weak ref
+        self.offset = None  # offset can be None for contexts
+        self.time = None
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self):
+        if self.isDead:
+            return '<music21.base.SiteRef %s dead>' % self.classString
+        return '<music21.base.SiteRef %s offset=%r>' % (self.classString,
+            self.offset)
+
+
 class Sites(SlottedObject):
     '''
     An object, stored within a Music21Object, that stores (weak) references to
@@ -260,13 +310,30 @@ class Sites(SlottedObject):
     contain this object. In this case the Sites object stores an offset value,
     used for determining position within a Stream.
 
-    All defined contexts are stored as dictionaries in a dictionary. The
-    outermost dictionary stores objects.
+    All defined contexts are stored as :class:`~music21.base.SiteRef` objects
+    in a dictionary keyed by the id() of the object referenced.
+
+    References to sites that no longer exist are removed automatically: when
+    the number of stored references reaches a threshold, dead references are
+    purged and the threshold is set to twice the number remaining (but no
+    less than `compactThreshold`).
+
+    ::
+
+        >>> n = note.Note()
+        >>> for i in range(100):
+        ...     s = stream.Stream()
+        ...     s.insert(i, n)
+        >>> len(n.sites) < 100
+        True
+        >>> n.offset
+        99.0
     '''
 
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        '_compactAt',
         '_definedContexts',
         '_lastID',
         '_lastOffset',
@@ -275,10 +342,13 @@ class Sites(SlottedObject):
         'containedById',
         )
 
+    # the smallest number of references at which dead references are purged
+    compactThreshold = 8
+
     ### INITIALIZER ###
 
     def __init__(self, containedById=None):
-        # a dictionary of dictionaries
+        # a dictionary of SiteRef objects
         self._definedContexts = {}
         # store idKeys in lists for easy access
         # the same key may be both in locationKeys and contextKeys
@@ -291,6 +361,8 @@ class Sites(SlottedObject):
         # cache for performance
         self._lastID = -1  # cannot be None
         self._lastOffset = None
+        # number of references at which dead references are next purged
+        self._compactAt = self.compactThreshold
 
     ## SPECIAL METHODS ###
 
@@ -336,30 +408,43 @@ class Sites(SlottedObject):
         locations = []  # self._locationKeys[:]
         #environLocal.printDebug(['Sites.__deepcopy__', 'self._definedContexts.keys()', self._definedContexts.keys()])
         for idKey in self._definedContexts:
-            singleContextDict = self._definedContexts[idKey]
-            if singleContextDict['isDead']:
+            siteRef = self._definedContexts[idKey]
+            if siteRef.isDead:
                 continue  # do not copy dead references
-            post = {}
-            post['obj'] = singleContextDict['obj']  # already a weak ref
+            post = SiteRef()
+            post.obj = siteRef.obj  # already a weak ref
 
             # not copying the offset in deepcopying means that
             # the old site becomes a context, not a site
             # this is still experimental
-            # post['offset'] = None
+            # post.offset = None
 
-            post['offset'] = singleContextDict['offset']
-            if post['offset'] is not None:
+            post.offset = siteRef.offset
+            if post.offset is not None:
                 locations.append(idKey)  # if offset not None, a location
 
-            post['time'] = singleContextDict['time']  # assume still valid
-            post['class'] = singleContextDict['class']
-            post['isDead'] = False
+            post.time = siteRef.time  # assume still valid
+            post.classString = siteRef.classString
+            post.isDead = False
             new._definedContexts[idKey] = post
 
         new._locationKeys = locations
         new._timeIndex = self._timeIndex  # keep for coherency
         return new
 
+    def __setstate__(self, state):
+        # Sites pickled before automatic compaction was added have no
+        # threshold stored, and store each entry as a dictionary
+        self._compactAt = self.compactThreshold
+        SlottedObject.__setstate__(self, state)
+        for idKey, siteRef in self._definedContexts.items():
+            if isinstance(siteRef, dict):
+                post = SiteRef()
+                for attr in SiteRef.__slots__:
+                    if attr in siteRef:
+                        setattr(post, attr, siteRef[attr])
+                self._definedContexts[idKey] = post
+
     def __len__(self):
         '''
         Return the total number of references.
@@ -398,13 +483,13 @@ class Sites(SlottedObject):
             >>> aSites.add(aObj)
             >>> aSites.add(bObj)
             >>> k = aSites._keysByTime()
-            >>> aSites._definedContexts[k[0]]['time'] > aSites._definedContexts[k[1]]['time'] > aSites._definedContexts[k[2]]['time']
+            >>> aSites._definedContexts[k[0]].time > aSites._definedContexts[k[1]].time > aSites._definedContexts[k[2]].time
             True
 
         '''
         post = []
         for key in self._definedContexts:
-            post.append((self._definedContexts[key]['time'], key))
+            post.append((self._definedContexts[key].time, key))
         post.sort()
         if newFirst:
             post.reverse()
@@ -470,6 +555,8 @@ class Sites(SlottedObject):
         updateNotAdd = False
         if idKey in self._definedContexts:
             updateNotAdd = True
+        elif len(self._definedContexts) >= self._compactAt:
+            self.compact()
 
         if offset is not None:  # a location, not a context
             if idKey not in self._locationKeys:
@@ -487,22 +574,22 @@ class Sites(SlottedObject):
             objRef = self._prepareObject(obj)
 
         if updateNotAdd is True:
-            singleContextDict = self._definedContexts[idKey]
+            siteRef = self._definedContexts[idKey]
         else:
-            singleContextDict = {}
+            siteRef = SiteRef()
 
-        singleContextDict['obj'] = objRef  # a weak ref
-        singleContextDict['offset'] = offset  # offset can be None for contexts
-        singleContextDict['class'] = classString
-        singleContextDict['isDead'] = False  # store to access w/o unwrapping
+        siteRef.obj = objRef  # a weak ref
+        siteRef.offset = offset  # offset can be None for contexts
+        siteRef.classString = classString
+        siteRef.isDead = False  # store to access w/o unwrapping
         # time is a numeric count, not a real time measure
         if timeValue is None:
-            singleContextDict['time'] = self._timeIndex
+            siteRef.time = self._timeIndex
             self._timeIndex += 1  # increment for next usage
         else:
-            singleContextDict['time'] = timeValue
+            siteRef.time = timeValue
         if not updateNotAdd:  # add new/missing information to dictionary
-            self._definedContexts[idKey] = singleContextDict
+            self._definedContexts[idKey] = siteRef
 
     def clear(self):
         '''
@@ -512,6 +599,51 @@ class Sites(SlottedObject):
         self._locationKeys = []
         self._lastID = -1  # cannot be None
         self._lastOffset = None
+        self._compactAt = self.compactThreshold
+
+    def compact(self):
+        '''
+        Remove all references, locations or contexts, to objects that no
+        longer exist, and set the number of references at which this is next
+        done automatically.
+
+        ::
+
+            >>> import music21
+            >>> class Mock(music21.Music21Object):
+            ...     pass
+            ...
+            >>> aSite = Mock()
+            >>> bSite = Mock()
+            >>> cContext = Mock()
+            >>> aSites = music21.Sites()
+            >>> aSites.add(aSite, 0)
+            >>> aSites.add(bSite, 2)
+            >>> aSites.add(cContext)
+            >>> del aSite
+            >>> del cContext
+            >>> len(aSites)
+            3
+            >>> aSites.compact()
+            >>> len(aSites)
+            1
+            >>> aSites.getSites() == [bSite]
+            True
+
+        '''
+        remove = []
+        for idKey, siteRef in self._definedContexts.iteritems():
+            if idKey is None:
+                continue
+            if not siteRef.isDead and WEAKREF_ACTIVE:
+                if common.unwrapWeakref(siteRef.obj) is None:
+                    siteRef.isDead = True
+            if siteRef.isDead:
+                remove.append(idKey)
+        for idKey in remove:
+            self.removeById(idKey)
+        self._compactAt = max(self.compactThreshold,
+                              2 * len(self._definedContexts))
 
     def get(self, locationsTrail=False, sortByCreationTime=False,
             priorityTarget=None, excludeNone=False):
@@ -579,19 +711,19 @@ class Sites(SlottedObject):
 
         # get each dict from all defined contexts
         for key in keys:
-            singleContextDict = self._definedContexts[key]
+            siteRef = self._definedContexts[key]
             # check for None object; default location, not a weakref, keep
-            if singleContextDict['obj'] is None:
+            if siteRef.obj is None:
                 if not excludeNone:
-                    post.append(singleContextDict['obj'])
+                    post.append(siteRef.obj)
             elif WEAKREF_ACTIVE:
-                obj = common.unwrapWeakref(singleContextDict['obj'])
+                obj = common.unwrapWeakref(siteRef.obj)
                 if obj is None:  # dead ref
-                    singleContextDict['isDead'] = True
+                    siteRef.isDead = True
                 else:
                     post.append(obj)
             else:
-                post.append(singleContextDict['obj'])
+                post.append(siteRef.obj)
 
         # remove dead references
 #         if autoPurge:
@@ -838,13 +970,13 @@ class Sites(SlottedObject):
         Return the object specified by an id.
         Used for testing and debugging.
         '''
-        singleContextDict = self._definedContexts[id]
+        siteRef = self._definedContexts[id]
         # need to check if these is weakref
         #if common.isWeakref(dict['obj']):
         if WEAKREF_ACTIVE:
-            return common.unwrapWeakref(singleContextDict['obj'])
+            return common.unwrapWeakref(siteRef.obj)
         else:
-            return singleContextDict['obj']
+            return siteRef.obj
 
     def getOffsetByObjectMatch(self, obj):
         '''
@@ -875,17 +1007,17 @@ class Sites(SlottedObject):
 
         '''
         for idKey in self._definedContexts:
-            singleContextDict = self._definedContexts[idKey]
-            if singleContextDict['isDead']: # cal alway skip
+            siteRef = self._definedContexts[idKey]
+            if siteRef.isDead: # cal alway skip
                 continue
             # must unwrap references before comparison
             #if common.isWeakref(dict['obj']):
             if WEAKREF_ACTIVE:
-                compareObj = common.unwrapWeakref(singleContextDict['obj'])
+                compareObj = common.unwrapWeakref(siteRef.obj)
             else:
-                compareObj = singleContextDict['obj']
+                compareObj = siteRef.obj
             if compareObj is None: # mark isDead for later removal
-                singleContextDict['isDead'] = True
+                siteRef.isDead = True
                 continue
             if id(compareObj) == id(obj):
                 #environLocal.printDebug(['found object as site', obj, id(obj), 'idKey', idKey])
@@ -924,7 +1056,7 @@ class Sites(SlottedObject):
         try:
             # will raise a key error if not found
             return self.getOffsetBySiteId(siteId)
-            #post = self._definedContexts[siteId]['offset']
+            #post = self._definedContexts[siteId].offset
         except SitesException: # the site id is not valid
             #environLocal.printDebug(['getOffsetBySite: trying to get an offset by a site failed; self:', self, 'site:', site, 'defined contexts:', self._definedContexts])
             raise # re-raise Exception
@@ -961,17 +1093,17 @@ class Sites(SlottedObject):
 
             >>> idBSite = id(bSite)
             >>> del(bSite)
-            >>> aLocations._definedContexts[idBSite]['obj']
+            >>> aLocations._definedContexts[idBSite].obj
             <weakref at 0x...; dead>
 
         ::
 
-            >>> aLocations._definedContexts[idBSite]['obj'] is None
+            >>> aLocations._definedContexts[idBSite].obj is None
             False
 
         ::
 
-            >>> common.unwrapWeakref(aLocations._definedContexts[idBSite]['obj']) is None
+            >>> common.unwrapWeakref(aLocations._definedContexts[idBSite].obj) is None
             True
 
         ::
@@ -994,11 +1126,11 @@ class Sites(SlottedObject):
 #        if idKey == self._lastID:
 #            return self._lastOffset
         try:
-            value = self._definedContexts[idKey]['offset']
-            if WEAKREF_ACTIVE and strictDeadCheck is True and self._definedContexts[idKey]['obj'] is not None:
-                obj = common.unwrapWeakref(self._definedContexts[idKey]['obj'])
+            value = self._definedContexts[idKey].offset
+            if WEAKREF_ACTIVE and strictDeadCheck is True and self._definedContexts[idKey].obj is not None:
+                obj = common.unwrapWeakref(self._definedContexts[idKey].obj)
                 if obj is None:
-                    #if self._definedContexts[idKey]['isDead'] is True: # not good enough
+                    #if self._definedContexts[idKey].isDead is True: # not good enough
                     errorMsg = "Could not find the object with id %s in the Site marked with idKey %s (was there, now site is dead). " % (id(self), idKey)
                     errorMsg += "\n   object %r, definedContexts: %r" % (self, self._definedContexts)
                     errorMsg += "\n   containedById = %r" % (self.containedById)
@@ -1014,9 +1146,9 @@ class Sites(SlottedObject):
             if value not in ['highestTime', 'lowestOffset', 'highestOffset']:
                 raise SitesException('attempted to set a bound offset with a string attribute that is not supported: %s' % value)
             if WEAKREF_ACTIVE:
-                obj = common.unwrapWeakref(self._definedContexts[idKey]['obj'])
+                obj = common.unwrapWeakref(self._definedContexts[idKey].obj)
             else:
-                obj = self._definedContexts[idKey]['obj']
+                obj = self._definedContexts[idKey].obj
             # offset value is an attribute string
             # canot cache these values as may change outside of definedcontexts
             return getattr(obj, value)
@@ -1079,10 +1211,10 @@ class Sites(SlottedObject):
         match = None
         for siteId in self._definedContexts:
             # might need to use almost equals here
-            if self._definedContexts[siteId]['offset'] == offset:
-                if self._definedContexts[siteId]['isDead']:
+            if self._definedContexts[siteId].offset == offset:
+                if self._definedContexts[siteId].isDead:
                     return None
-                match = self._definedContexts[siteId]['obj']
+                match = self._definedContexts[siteId].obj
                 break
         if WEAKREF_ACTIVE:
             if match is None: # this is a dead erfs
@@ -1100,7 +1232,7 @@ class Sites(SlottedObject):
         '''
         count = 0
         for idKey in self._locationKeys:
-            if self._definedContexts[idKey]['isDead']:
+            if self._definedContexts[idKey].isDead:
                 continue
             count += 1
         return count
@@ -1161,11 +1293,11 @@ class Sites(SlottedObject):
                 if idKey in idExclude:
                     continue
             try:
-                objRef = self._definedContexts[idKey]['obj']
+                objRef = self._definedContexts[idKey].obj
             except KeyError:
                 raise SitesException('no such site: %s' % idKey)
             # skip dead references
-            if self._definedContexts[idKey]['isDead']:
+            if self._definedContexts[idKey].isDead:
                 continue
             if idKey is None:
                 if not excludeNone:
@@ -1175,7 +1307,7 @@ class Sites(SlottedObject):
             else:
                 obj = common.unwrapWeakref(objRef)
                 if obj is None:
-                    self._definedContexts[idKey]['isDead'] = True
+                    self._definedContexts[idKey].isDead = True
                     continue
                 post.append(obj)
         return post
@@ -1212,11 +1344,11 @@ class Sites(SlottedObject):
             className = common.classToClassStr(className)
 
         for idKey in self._locationKeys:
-            if self._definedContexts[idKey]['isDead']:
+            if self._definedContexts[idKey].isDead:
                 continue
-            classStr = self._definedContexts[idKey]['class']
+            classStr = self._definedContexts[idKey].classString
             if classStr == className:
-                objRef = self._definedContexts[idKey]['obj']
+                objRef = self._definedContexts[idKey].obj
                 if not WEAKREF_ACTIVE: # leave None alone
                     obj = objRef
                 else:
@@ -1259,9 +1391,9 @@ class Sites(SlottedObject):
         by looking for a SpannerStorage Stream class as a Site.
         '''
         for idKey in self._locationKeys:
-            if self._definedContexts[idKey]['isDead']:
+            if self._definedContexts[idKey].isDead:
                 continue
-            if self._definedContexts[idKey]['class'] == 'SpannerStorage':
+            if self._definedContexts[idKey].classString == 'SpannerStorage':
                 return True
         return False
 
@@ -1271,9 +1403,9 @@ class Sites(SlottedObject):
         by looking for a VariantStorage Stream class as a Site.
         '''
         for idKey in self._locationKeys:
-            if self._definedContexts[idKey]['isDead']:
+            if self._definedContexts[idKey].isDead:
                 continue
-            if self._definedContexts[idKey]['class'] == 'VariantStorage':
+            if self._definedContexts[idKey].classString == 'VariantStorage':
                 return True
         return False
 
@@ -1344,22 +1476,22 @@ class Sites(SlottedObject):
             for idKey in self._locationKeys:
                 if idKey is None:
                     continue
-                if self._definedContexts[idKey]['isDead']:
+                if self._definedContexts[idKey].isDead:
                     continue  # already marked
                 if WEAKREF_ACTIVE:
                     obj = common.unwrapWeakref(
-                        self._definedContexts[idKey]['obj'])
+                        self._definedContexts[idKey].obj)
                 else:
-                    obj = self._definedContexts[idKey]['obj']
+                    obj = self._definedContexts[idKey].obj
                 if obj is None: # if None, it no longer exists
-                    self._definedContexts[idKey]['isDead'] = True
+                    self._definedContexts[idKey].isDead = True
         # use previously set isDead entry, so as not to
         # unwrap all references
         remove = []
         for idKey in self._locationKeys:
             if idKey is None:
                 continue
-            if self._definedContexts[idKey]['isDead']:
+            if self._definedContexts[idKey].isDead:
                 remove.append(idKey)
         for idKey in remove:
             # this call changes the ._locationKeys list, and thus must be
@@ -1519,7 +1651,7 @@ class Sites(SlottedObject):
             siteId = id(site)
         # will raise an index error if the siteId does not exist
         try:
-            self._definedContexts[siteId]['offset'] = value
+            self._definedContexts[siteId].offset = value
             self._lastID = siteId
             self._lastOffset = value
         except KeyError:
@@ -1533,7 +1665,7 @@ class Sites(SlottedObject):
         The `siteId` parameter can be None.
         '''
         try:
-            self._definedContexts[siteId]['offset'] = value
+            self._definedContexts[siteId].offset = value
             self._lastID = siteId
             self._lastOffset = value
         except KeyError:
@@ -1557,18 +1689,18 @@ class Sites(SlottedObject):
 
         ::
 
-            >>> common.isWeakref(aSites._definedContexts[id(aObj)]['obj'])
+            >>> common.isWeakref(aSites._definedContexts[id(aObj)].obj)
             True
 
         ::
 
             >>> aSites.unwrapWeakref()
-            >>> common.isWeakref(aSites._definedContexts[id(aObj)]['obj'])
+            >>> common.isWeakref(aSites._definedContexts[id(aObj)].obj)
             False
 
         ::
 
-            >>> common.isWeakref(aSites._definedContexts[id(bObj)]['obj'])
+            >>> common.isWeakref(aSites._definedContexts[id(bObj)].obj)
             False
 
         '''
@@ -1579,14 +1711,14 @@ class Sites(SlottedObject):
         #environLocal.printDebug(['self', self, 'self._definedContexts.keys()', self._definedContexts.keys()])
         for idKey in self._definedContexts:
             if WEAKREF_ACTIVE:
-            #if common.isWeakref(self._definedContexts[idKey]['obj']):
-                target = self._definedContexts[idKey]['obj']
+            #if common.isWeakref(self._definedContexts[idKey].obj):
+                target = self._definedContexts[idKey].obj
                 if target is None:
                     continue
                 if common.isWeakref(target):
-                    #environLocal.printDebug(['unwrapping:', self._definedContexts[idKey]['obj']])
+                    #environLocal.printDebug(['unwrapping:', self._definedContexts[idKey].obj])
                     target = common.unwrapWeakref(target)
-                    self._definedContexts[idKey]['obj'] = target
+                    self._definedContexts[idKey].obj = target
 
     def wrapWeakref(self):
         '''
@@ -1604,22 +1736,22 @@ class Sites(SlottedObject):
             >>> aSites.add(bObj)
             >>> aSites.unwrapWeakref()
             >>> aSites.wrapWeakref()
-            >>> common.isWeakref(aSites._definedContexts[id(aObj)]['obj'])
+            >>> common.isWeakref(aSites._definedContexts[id(aObj)].obj)
             True
 
         ::
 
-            >>> common.isWeakref(aSites._definedContexts[id(bObj)]['obj'])
+            >>> common.isWeakref(aSites._definedContexts[id(bObj)].obj)
             True
 
         '''
         for idKey in self._definedContexts:
-            if self._definedContexts[idKey]['obj'] is None:
+            if self._definedContexts[idKey].obj is None:
                 continue  # always skip None
-            if not common.isWeakref(self._definedContexts[idKey]['obj']):
-                #environLocal.printDebug(['wrapping:', self._definedContexts[idKey]['obj']])
-                post = common.wrapWeakref(self._definedContexts[idKey]['obj'])
-                self._definedContexts[idKey]['obj'] = post
+            if not common.isWeakref(self._definedContexts[idKey].obj):
+                #environLocal.printDebug(['wrapping:', self._definedContexts[idKey].obj])
+                post = common.wrapWeakref(self._definedContexts[idKey].obj)
+                self._definedContexts[idKey].obj = post
 
 
 #------------------------------------------------------------------------------
@@ -1892,7 +2024,8 @@ class Music21Object(object):
 
     def _getClasses(self):
         #environLocal.printDebug(['calling _getClasses'])
-        if self._classes is None:
+        # recreate if not yet set or if __class__ has been reassigned
+        if self._classes is None or self._classes[0] != self.__class__.__name__:
             #environLocal.printDebug(['setting self._classes', id(self), self])
             self._classes = [x.__name__ for x in self.__class__.mro()]
         return self._classes
@@ -2649,79 +2782,29 @@ class Music21Object(object):
             # if this is a Stream and we have a caller, see if we
             # can get the offset from within this Stream of the caller
             # first, see if this element is even in this Stream
-            getOffsetOfCaller = False
-            skipGetOffsetOfCaller = False
-            #if (hasattr(self, "elements") and callerFirst is not None):
-            #if self.isStream and callerFirst is not None:
-
-#             if (self.isStream and callerFirst is not None and not
-#                 isinstance(callerFirst, Sites)):
             if (self.isStream and callerFirst is not None):
-
-                # memo check above is needed for string operational contexts
-                # where cached semiFlat generation raises an error
-
                 # find the offset of the callerFirst
                 # if this is a Stream, we need to find the offset relative
                 # to this Stream; it may only be available within a semiFlat
-                # representaiton
+                # representation
 
-                # this semiFlat name will be used in the getOffsetOfCaller
-                # branch below
-
-                #environLocal.printDebug(['getContextByClass, serialReverseSearch', 'requesting semi flat from self:', self, id(self)])
-
-                #if DEBUG_CONTEXT: print '\tX: getting semiFlat because self is Stream'
-
-                # using the cached semiFlat here can lead to an ever-
-                # increasing number of sites in the outermost semiflat
-                # lower level containers each gain a new site (self here)
-                # for example, each Measure in a Part that caches a semiflat
-                # each Measure will have a new site for every call; thus
-                # we delete the semiflat here used after every call
-                #semiFlat = self.semiFlat
-                semiFlat = self._getFlatOrSemiFlat(retainContainers=True)
-
-                # see if this element is in this Stream;
-                if not skipGetOffsetOfCaller:
-                    if semiFlat.hasElement(callerFirst):
-                        getOffsetOfCaller = True
-                    else:
-                        #if (hasattr(callerFirst, 'flattenedRepresentationOf') and callerFirst.flattenedRepresentationOf is not None):
-                        if (callerFirst.isStream and
-                            callerFirst.flattenedRepresentationOf is not None):
-                            if semiFlat.hasElement(
-                                callerFirst.flattenedRepresentationOf):
-                                getOffsetOfCaller = True
-
-            if getOffsetOfCaller:
-                # in some cases we may need to try to get the offset of a semiFlat representation. this is necessary when a Measure
-                # is the caller.
-                #if DEBUG_CONTEXT: print '\tX: getting offset of caller'
-
-                #environLocal.printDebug(['getContextByClass(): trying to get offset of caller from a semi-flat representation', 'self', self, self.id, 'callerFirst', callerFirst, callerFirst.id])
-
-                #offsetOfCaller = semiFlat.getOffsetByElement(callerFirst)
-                # TODO: use this, as should be faster
-                try:
-                    offsetOfCaller = callerFirst.getOffsetBySite(semiFlat)
-                except SitesException:
-                    offsetOfCaller = None
+                # rather than creating a semiFlat Stream for each call, which
+                # adds a new site to every contained element, the offsets of
+                # the semiFlat representation are stored in a ContextCache,
+                # kept in this Stream's cache until its elements change
+                contextCache = self._getContextCache()
+                offsetOfCaller = contextCache.getOffset(callerFirst)
 
                 # our caller might have been flattened after contexts were set
                 # thus, this object may be in the caller's defined contexts,
                 # but this object knows nothing about a flat version of the
                 # caller (it cannot get an offset of the caller, which we need
                 # to do the serial reverse search)
-                #if offsetOfCaller is None and hasattr(
-                #    callerFirst, 'flattenedRepresentationOf'):
                 if offsetOfCaller is None and callerFirst.isStream:
-                    #environLocal.printDebug(['getContextByClass(): trying to get offset of caller from the callers flattenedRepresentationOf attribute', 'self', self, 'callerFirst', callerFirst])
-
                     # Thanks Johannes Emerich [public@johannes.emerich.de] !
                     if callerFirst.flattenedRepresentationOf is not None:
                         unFlat = callerFirst.flattenedRepresentationOf
-                        offsetOfCaller = semiFlat.getOffsetByElement(unFlat)
+                        offsetOfCaller = contextCache.getOffset(unFlat)
 
                 # if the offset has been found, get element at or before
                 # this offset
@@ -2730,21 +2813,15 @@ class Music21Object(object):
                     # we are getting based only sort order, which may not be
                     # what we want
                     if getElementMethod == 'getElementAtOrBefore':
-                        post = semiFlat.getElementAtOrBefore(offsetOfCaller,
-                               [className])
+                        post = contextCache.getElementAtOrBefore(
+                               offsetOfCaller, className)
                     elif getElementMethod == 'getElementBeforeOffset':
-                        #environLocal.printDebug(['getContextByClass(): using getElementsBeforeOffset'])
-                        post = semiFlat.getElementBeforeOffset(offsetOfCaller,
-                               [className])
+                        post = contextCache.getElementBeforeOffset(
+                               offsetOfCaller, className)
                     else:
                         raise Music21ObjectException('cannot get element with requested method: %s' % getElementMethod)
                 #environLocal.printDebug([self, 'results of serialReverseSearch:', post, '; searching for:', className, '; starting from offset', offsetOfCaller])
 
-                # NOTE: deleting this semiFlat is critical, is it prohibits
-                # lower level components retaining this stream as a new site
-                # on successive calls
-                del semiFlat
-
         #if DEBUG_CONTEXT: print '\tX: about to call getByClass'
         if post is None: # still no match
             # this will call this method on all defined contexts, including
@@ -2759,13 +2836,6 @@ class Music21Object(object):
                    prioritizeActiveSite=prioritizeActiveSite,
                    priorityTarget=priorityTarget,  getElementMethod=getElementMethod, memo=memo)
 
-        # if we have a Stream, store the results
-#         if self.isStream and isinstance(className, str):
-#             if self._cache['contextCache'] is None:
-#                 self._cache['contextCache'] = contextCache.ContextCache()
-#             self._cache['contextCache'].add(className, callerFirst,
-#                                             getElementMethod, post)
-
         return post
 
     def getAllContextsByClass(self, className, found=None, idFound=None,
@@ -3480,6 +3550,12 @@ class Music21Object(object):
         elif fileFormat == 'midi':
             # returns a midi.MidiFile object
             from music21.midi import translate as midiTranslate
+            if 'Stream' in self.classes:
+                # write the data directly, without creating a MidiFile 
+                f = open(fp, 'wb') # write binary
+                f.write(midiTranslate.streamToMidiString(self))
+                f.close()
+                return fp
             mf = midiTranslate.music21ObjectToMidiFile(self)
             mf.open(fp, 'wb') # write binary
             mf.write()
@@ -4121,6 +4197,8 @@ class Music21Object(object):
         if self.activeSite is not None and self.activeSite.isMeasure:
             #environLocal.printDebug(['found activeSite as Measure, using for offset'])
             offsetLocal = self.getOffsetBySite(self.activeSite)
+            if includeMeasurePadding:
+                offsetLocal += self.activeSite.paddingLeft
         else:
             #environLocal.printDebug(['did not find activeSite as Measure, doing context search', 'self.activeSite', self.activeSite])
             # testing sortByCreationTime == true; this may be necessary
@@ -4428,6 +4506,11 @@ class Music21Object(object):
             raise Music21ObjectException('this object does not have a TempoIndication in Sites')
         mm = ti.getSoundingMetronomeMark()
         self.duration = mm.secondsToDuration(value)
+        # the durations cached by Streams containing this object are no
+        # longer valid
+        for site in self.sites.getSites(excludeNone=True):
+            if site.isStream:
+                site._elementsChanged()
 
     def _getSeconds(self):
         # do not search of duration is zero
@@ -5299,6 +5382,50 @@ class Test(unittest.TestCase):
         self.assertEqual(s.highestTime, 50.0)
         self.assertEqual(b1.getOffsetBySite(s), 50.0)
 
+    def testSitesCompaction(self):
+        import gc
+        from music21 import note, stream
+
+        n = note.Note()
+        keep = []
+        for i in range(200):
+            s = stream.Stream()
+            s.insert(i, n)
+            if i % 10 == 0:
+                keep.append(s)
+                # Streams are only freed when reference cycles are collected
+                gc.collect()
+        del s
+        gc.collect()
+        # dead sites are purged as they accumulate, so the number of
+        # references stays bounded by twice the number of live ones
+        self.assertEqual(len(n.sites) <= 2 * (len(keep) + 10), True)
+        self.assertEqual(n.sites.getSites(excludeNone=True), keep)
+        for i, s in enumerate(keep):
+            self.assertEqual(n.getOffsetBySite(s), i * 10.0)
+
+        # unpickled Sites have a threshold and can be added to
+        import pickle
+        sites = pickle.loads(pickle.dumps(Sites(), 2))
+        self.assertEqual(sites._compactAt, Sites.compactThreshold)
+        sites.add(keep[0], 3.0)
+        self.assertEqual(sites.getOffsetBySite(keep[0]), 3.0)
+
+        # entries of Sites pickled as dictionaries are converted
+        sites = Sites()
+        sites.add(keep[1], 4.0)
+        state = sites.__getstate__()
+        del state['_compactAt']
+        state['_definedContexts'] = dict(
+            (idKey, siteRef.__getstate__())
+            for idKey, siteRef in state['_definedContexts'].items())
+        sites = Sites()
+        sites.__setstate__(state)
+        self.assertEqual(isinstance(sites._definedContexts[id(keep[1])],
+                                    SiteRef), True)
+        self.assertEqual(sites.getOffsetBySite(keep[1]), 4.0)
+        self.assertEqual(sites.getSites(excludeNone=True), [keep[1]])
+
     def testGetAllContextsByClass(self):
         from music21 import note, stream, clef
         s1 = stream.Stream()
@@ -5684,7 +5811,7 @@ class Test(unittest.TestCase):
 
 #-------------------------------------------------------------------------------
 # define presented order in documentation
-_DOC_ORDER = [Music21Object, ElementWrapper, Sites]
+_DOC_ORDER = [Music21Object, ElementWrapper, Sites, SiteRef]
 
 
 def mainTest(*testClasses):
@@ -9,10 +9,15 @@
 # License:      LGPL
 #-------------------------------------------------------------------------------
 '''
-This module was an attempt to speed up getElementsByClass searches
-for :class:`~music21.stream.Stream` objects by caching each of the classes in
-the Stream, but in the end it offered no significant speed improvements, so
-it is not used.
+This module provides the :class:`~music21.classCache.ClassIndex`, a
+mapping of class names to element positions that is maintained by
+each :class:`~music21.stream.Stream` and used to speed up
+:meth:`~music21.stream.Stream.getElementsByClass` searches.
+
+The older :class:`~music21.classCache.ClassCache` and
+:class:`~music21.classCache.Repository` objects were a first attempt at
+this that copied elements into per-class containers; as these offered
+no significant speed improvements, they are not used.
 '''
 
 
@@ -32,6 +37,175 @@ class ClassCacheException(exceptions21.Music21Exception):
     pass
 
 
+#-------------------------------------------------------------------------------
+class ClassIndex(object):
+    '''
+    A mapping of every class name found in a Stream's elements (as
+    given by each element's :attr:`~music21.base.Music21Object.classes`)
+    to the sorted list of index positions of those elements in the
+    Stream's `_elements` and `_endElements` lists.
+
+    As positions, not elements, are stored, a ClassIndex remains valid
+    only while the source Stream's element lists are not reordered or
+    spliced; appending (as done by `_insertCore`, `_appendCore`, and
+    `_storeAtEndCore`) can be tracked with
+    :meth:`~music21.classCache.ClassIndex.addElement` and
+    :meth:`~music21.classCache.ClassIndex.addEndElement`. The Stream is
+    responsible for discarding the index on all other changes.
+
+
+    >>> s = stream.Stream()
+    >>> s.repeatAppend(note.Note(), 2)
+    >>> s.append(note.Rest())
+    >>> s.storeAtEnd(bar.Barline('final'))
+    >>> ci = classCache.ClassIndex(s)
+    >>> ci.positions['Note']
+    [0, 1]
+    >>> ci.positions['GeneralNote']
+    [0, 1, 2]
+    >>> ci.endPositions['Barline']
+    [0]
+    >>> ci.isValidFor(s)
+    True
+    >>> ci.isValidFor(stream.Stream())
+    False
+    '''
+    def __init__(self, srcStream=None):
+        self.streamId = None
+        self.elementCount = 0
+        self.endElementCount = 0
+        # class name : list of positions in _elements
+        self.positions = {}
+        # class name : list of positions in _endElements
+        self.endPositions = {}
+
+        if srcStream is not None:
+            self.load(srcStream)
+
+    def load(self, srcStream):
+        '''
+        Index all elements in `srcStream`, replacing any prior data.
+        '''
+        self.streamId = id(srcStream)
+        self.elementCount = 0
+        self.endElementCount = 0
+        self.positions = {}
+        self.endPositions = {}
+        for e in srcStream._elements:
+            self.addElement(e)
+        for e in srcStream._endElements:
+            self.addEndElement(e)
+
+    def addElement(self, e):
+        '''
+        Index an element that has just been appended to `_elements`.
+        '''
+        positions = self.positions
+        i = self.elementCount
+        # classes may list a name twice if it has been edited
+        for className in set(e.classes):
+            try:
+                positions[className].append(i)
+            except KeyError:
+                positions[className] = [i]
+        self.elementCount += 1
+
+    def addEndElement(self, e):
+        '''
+        Index an element that has just been appended to `_endElements`.
+        '''
+        positions = self.endPositions
+        i = self.endElementCount
+        # classes may list a name twice if it has been edited
+        for className in set(e.classes):
+            try:
+                positions[className].append(i)
+            except KeyError:
+                positions[className] = [i]
+        self.endElementCount += 1
+
+    def isValidFor(self, srcStream):
+        '''
+        Return True if this index was built for `srcStream` and the
+        number of indexed elements matches the Stream's element lists.
+        '''
+        return (self.streamId == id(srcStream) and
+            self.elementCount == len(srcStream._elements) and
+            self.endElementCount == len(srcStream._endElements))
+
+    def hasClass(self, className):
+        '''
+        Return True if an element of the class name `className` is indexed.
+
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note())
+        >>> ci = classCache.ClassIndex(s)
+        >>> ci.hasClass('NotRest')
+        True
+        >>> ci.hasClass('Rest')
+        False
+        '''
+        return className in self.positions or className in self.endPositions
+
+    def _match(self, classFilterList, positions, elements):
+        if len(classFilterList) == 1:
+            className = classFilterList[0]
+            if isinstance(className, str):
+                # most common case: return the stored list directly
+                return positions.get(className, [])
+        matched = set()
+        for className in classFilterList:
+            if isinstance(className, str):
+                matched.update(positions.get(className, []))
+                continue
+            try:
+                name = className.__name__
+            except AttributeError:
+                return None
+            # an instance of a class always has the class name in its
+            # classes; confirm with isinstance in case of name collisions
+            for i in positions.get(name, []):
+                if i not in matched and isinstance(elements[i], className):
+                    matched.add(i)
+        return sorted(matched)
+
+    def getPositions(self, classFilterList, srcStream):
+        '''
+        Given a list or tuple of class names or classes, return a
+        pair of sorted lists of positions in `srcStream._elements` and
+        `srcStream._endElements` of matching elements. Matching is
+        the same as :meth:`~music21.base.Music21Object.isClassOrSubclass`.
+
+        Returns None if the classFilterList cannot be matched by the index.
+
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note())
+        >>> s.append(note.Rest())
+        >>> s.append(chord.Chord())
+        >>> ci = classCache.ClassIndex(s)
+        >>> ci.getPositions(['Rest'], s)
+        ([1], [])
+        >>> ci.getPositions([note.Note, chord.Chord], s)
+        ([0, 2], [])
+        >>> ci.getPositions(['GeneralNote', note.Rest], s)
+        ([0, 1, 2], [])
+        '''
+        post = self._match(classFilterList, self.positions,
+                           srcStream._elements)
+        if post is None:
+            return None
+        if self.endElementCount == 0:
+            return post, []
+        postEnd = self._match(classFilterList, self.endPositions,
+                              srcStream._endElements)
+        if postEnd is None:
+            return None
+        return post, postEnd
+
+
+#-------------------------------------------------------------------------------
 class Repository(object):
     # perhaps use 
     # from collections import deque
@@ -42,7 +42,10 @@ the temp folder on the disk.
 
 import unittest
 
+import collections
 import copy
+import hashlib
+import multiprocessing
 import os
 import re
 import urllib
@@ -52,6 +55,7 @@ import zipfile
 # use io.StringIO  in python 3, avail in 2.6, not 2.5
 
 from music21 import abcFormat
+from music21 import base
 from music21 import exceptions21
 from music21 import common
 from music21 import humdrum
@@ -190,13 +194,25 @@ class ArchiveManager(object):
 
 #-------------------------------------------------------------------------------
 class PickleFilter(object):
-    '''Before opening a file path, this class can check if there is an up
-    to date version pickled and stored in the scratch directory.
+    '''
+    Before parsing a file path, this class can check if there is a Stream
+    parsed from the same file pickled and stored in the scratch directory.
+
+    Pickled Streams are found by an md5 hash of the contents of the file
+    (or of all files in a directory), the music21 version, and the number
+    and format used to parse it; an edited file, or a file parsed with
+    another version of music21, is thus parsed again. When the pickled
+    Streams in the scratch directory exceed `maxCacheSize` bytes, those
+    least recently used are removed.
 
     If the user has not specified a scratch directory, a pickle path will
     not be created.
     '''
-    def __init__(self, fp, forceSource=False):
+    # the maximum total size, in bytes, of pickled Streams stored in the
+    # scratch directory
+    maxCacheSize = 256 * 1024 * 1024
+
+    def __init__(self, fp, forceSource=False, number=None, format=None): # @ReservedAssignment
         '''Provide a file path to check if there is pickled version.
 
         If forceSource is True, pickled files, if available, will not be
@@ -204,17 +220,47 @@ class PickleFilter(object):
         '''
         self.fp = fp
         self.forceSource = forceSource
+        self.number = number
+        self.format = format
         #environLocal.printDebug(['creating pickle filter'])
 
+    def _getContentMd5(self):
+        '''
+        Return an md5 hash of the contents of the file, or of all files in
+        the directory, at the file path.
+        '''
+        m = hashlib.md5()
+        if os.path.isdir(self.fp):
+            for dirpath, dirnames, filenames in os.walk(self.fp):
+                dirnames.sort()
+                for fn in sorted(filenames):
+                    fpSub = os.path.join(dirpath, fn)
+                    # the relative path distinguishes moved files
+                    m.update(fpSub[len(self.fp):])
+                    f = open(fpSub, 'rb')
+                    m.update(f.read())
+                    f.close()
+        else:
+            f = open(self.fp, 'rb')
+            m.update(f.read())
+            f.close()
+        return m.hexdigest()
+
     def _getPickleFp(self, directory):
         if directory == None:
             raise ValueError
-        return os.path.join(directory, 'm21-' + common.getMd5(self.fp) + '.p')
+        key = '%s %s %s %s' % (self._getContentMd5(), base.VERSION_STR,
+                               self.number, self.format)
+        return os.path.join(directory, 'm21-parse-' + common.getMd5(key) + '.p')
 
     def status(self):
-        '''Given a file path specified with __init__, look for an up to date pickled version of this file path. If it exists, return its fp, other wise return the original file path.
+        '''
+        Given a file path specified with __init__, look for an up to date
+        pickled Stream parsed from this file. If it exists, return its fp,
+        otherwise return the original file path.
 
-        Return arguments are file path to load, boolean whether to write a pickle, and the file path of the pickle.
+        Return arguments are file path to load, boolean whether to write a
+        pickle, and the file path of the pickle.
         '''
         fpScratch = environLocal.getRootTempDir()
         m21Format = common.findFormatFile(self.fp)
@@ -229,21 +275,195 @@ class PickleFilter(object):
             writePickle = False # cannot write pickle if no scratch dir
             fpLoad = self.fp
             fpPickle = None
-        else: # see which is more up to doate
+        else:
             fpPickle = self._getPickleFp(fpScratch)
             if not os.path.exists(fpPickle):
                 writePickle = True # if pickled file does not exist
                 fpLoad = self.fp
             else:
-                post = common.sortFilesRecent([self.fp, fpPickle])
-                if post[0] == fpPickle: # pickle is most recent
-                    writePickle = False
-                    fpLoad = fpPickle
-                elif post[0] == self.fp: # file is most recent
-                    writePickle = True
-                    fpLoad = self.fp
+                writePickle = False
+                fpLoad = fpPickle
+                # mark as recently used
+                try:
+                    os.utime(fpPickle, None)
+                except OSError:
+                    pass
         return fpLoad, writePickle, fpPickle
 
+    def writePickle(self, fpPickle, data):
+        '''
+        Store `data`, a pickled Stream, at `fpPickle`, then remove the least
+        recently used pickled Streams if the size limit is exceeded.
+        '''
+        # write to a temporary file first, so that no other process can
+        # open an incomplete file
+        fpTemp = '%s.%s.tmp' % (fpPickle, os.getpid())
+        try:
+            f = open(fpTemp, 'wb')
+            f.write(data)
+            f.close()
+            os.rename(fpTemp, fpPickle)
+        except (IOError, OSError):
+            environLocal.printDebug(['could not write pickled file', fpPickle])
+            if os.path.exists(fpTemp):
+                os.remove(fpTemp)
+            return
+        self.removeOldPickles(os.path.dirname(fpPickle))
+
+    def removeOldPickles(self, directory):
+        '''
+        Remove the least recently used pickled Streams in `directory` until
+        their total size is at most `maxCacheSize` bytes.
+        '''
+        entries = []
+        totalSize = 0
+        for fn in os.listdir(directory):
+            if not (fn.startswith('m21-parse-') and fn.endswith('.p')):
+                continue
+            fpCached = os.path.join(directory, fn)
+            try:
+                fileStat = os.stat(fpCached)
+            except OSError: # removed by another process
+                continue
+            entries.append((fileStat.st_mtime, fileStat.st_size, fpCached))
+            totalSize += fileStat.st_size
+        if totalSize <= self.maxCacheSize:
+            return
+        entries.sort()
+        for unused_mtime, size, fpCached in entries:
+            if totalSize <= self.maxCacheSize:
+                break
+            try:
+                os.remove(fpCached)
+            except OSError:
+                pass
+            totalSize -= size
+
+
+
+class MemoryCache(object):
+    '''
+    An in-memory cache of Streams parsed from files by
+    :meth:`~music21.converter.Converter.parseFile` (and thus by
+    :func:`~music21.converter.parse` and :func:`~music21.corpus.parse`),
+    found by file path, number and format, for programs that parse the
+    same files repeatedly.
+
+    The cache is used only if `maxEntries` is greater than zero; the
+    module-level :data:`memoryCache` is disabled until it is set. When more
+    than `maxEntries` Streams are stored, or their estimated memory exceeds
+    `maxMemory` bytes, those least recently used are removed.
+
+    Each Stream is stored in pickled form, and each request returns a new
+    Stream, which can be altered freely. If `immutable` is True, the same
+    Stream, made immutable with :meth:`~music21.stream.Stream.makeImmutable`,
+    is instead returned to every request, saving the time of unpickling; it
+    must not be altered.
+
+    `hits`, `misses` and `evictions` count the requests for which a Stream
+    was found or not, and the Streams removed.
+
+
+    >>> mc = converter.memoryCache
+    >>> mc.maxEntries = 10
+    >>> mc.resetStatistics()
+    >>> s1 = corpus.parse('bwv66.6')
+    >>> s2 = corpus.parse('bwv66.6')
+    >>> s1 is s2
+    False
+    >>> mc
+    <music21.converter.MemoryCache entries=1 hits=1 misses=1 evictions=0>
+    >>> mc.clear()
+    >>> mc.maxEntries = 0
+    '''
+    # the estimated memory used by a Stream, as a multiple of the size of
+    # the pickled Stream
+    memoryPerPickledByte = 7
+
+    def __init__(self, maxEntries=0, maxMemory=256 * 1024 * 1024,
+        immutable=False):
+        self.maxEntries = maxEntries
+        self.maxMemory = maxMemory
+        self.immutable = immutable
+        # keys, from least to most recently used, and their entries: lists
+        # of the pickled Stream and the shared immutable Stream, if created
+        self._entries = collections.OrderedDict()
+        self.resetStatistics()
+
+    def __repr__(self):
+        return '<music21.converter.MemoryCache entries=%s hits=%s misses=%s evictions=%s>' % (
+            len(self), self.hits, self.misses, self.evictions)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def resetStatistics(self):
+        '''
+        Set the counts of hits, misses and evictions to zero.
+        '''
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self):
+        '''
+        Remove all stored Streams.
+        '''
+        self._entries.clear()
+
+    def getKey(self, fp, number=None, format=None): # @ReservedAssignment
+        '''
+        Return the key of the Stream parsed from `fp` with `number` and
+        `format`; the modification time of the file is included, so that
+        an edited file is parsed again.
+        '''
+        return (os.path.abspath(fp), os.path.getmtime(fp), number, format)
+
+    def _getMemory(self, entry):
+        data, sharedStream = entry
+        memory = len(data)
+        if sharedStream is not None:
+            memory += len(data) * self.memoryPerPickledByte
+        return memory
+
+    def get(self, key):
+        '''
+        Return a Stream stored with `key`, or None.
+        '''
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries[key] = entry # most recently used
+        if not self.immutable:
+            return thawStr(entry[0])
+        if entry[1] is None:
+            entry[1] = thawStr(entry[0])
+            entry[1].makeImmutable()
+            self._removeOldEntries()
+        return entry[1]
+
+    def add(self, key, data):
+        '''
+        Store `data`, a pickled Stream, with `key`.
+        '''
+        self._entries.pop(key, None)
+        self._entries[key] = [data, None]
+        self._removeOldEntries()
+
+    def _removeOldEntries(self):
+        memory = sum(self._getMemory(entry)
+                     for entry in self._entries.itervalues())
+        # the most recently used entry is always kept
+        while len(self._entries) > 1 and (len(self._entries) >
+            self.maxEntries or memory > self.maxMemory):
+            unused_key, entry = self._entries.popitem(last=False)
+            memory -= self._getMemory(entry)
+            self.evictions += 1
+
+
+memoryCache = MemoryCache()
 
 
 #-------------------------------------------------------------------------------
@@ -395,10 +615,12 @@ class ConverterMusicXML(object):
     '''Converter for MusicXML
     '''
 
-    def __init__(self, forceSource):
+    def __init__(self, forceSource, streaming=False):
         self._mxScore = None # store the musicxml object representation
         self._stream = stream.Score()
         self.forceSource = forceSource
+        # if True, translate each measure as soon as it is parsed
+        self.streaming = streaming
 
     #---------------------------------------------------------------------------
     def partIdToNameDict(self):
@@ -423,8 +645,26 @@ class ConverterMusicXML(object):
 
 
     #---------------------------------------------------------------------------
+    def loadStreaming(self, fileLike, isFile=True):
+        '''
+        Parse and translate MusicXML in one pass, translating each measure
+        as soon as it has been parsed and discarding the parsed XML, rather
+        than first building the complete musicxml object representation.
+        '''
+        from music21.musicxml import fromMxObjects
+        c = musicxmlHandler.Document()
+        mxParts = c.iterParts(fileLike, isFile=isFile)
+        fromMxObjects.mxScoreToScore(c.score, inputM21=self._stream,
+            mxParts=mxParts)
+        self._mxScore = c.score
+
     def parseData(self, xmlString, number=None):
         '''Open MusicXML data from a string.'''
+        if self.streaming:
+            self.loadStreaming(xmlString, isFile=False)
+            if len(self._mxScore) == 0:
+                raise ConverterException('score from xmlString (%s...) either has no parts defined or was incompletely parsed' % xmlString[:30])
+            return
         c = musicxmlHandler.Document()
         c.read(xmlString)
         self._mxScore = c.score #  the mxScore object from the musicxml Document
@@ -434,62 +674,31 @@ class ConverterMusicXML(object):
         self.load()
 
     def parseFile(self, fp, number=None):
-        '''Open from a file path; check to see if there is a pickled
-        version available and up to date; if so, open that, otherwise
-        open source.
-        '''
-        # return fp to load, if pickle needs to be written, fp pickle
-        # this should be able to work on a .mxl file, as all we are doing
-        # here is seeing which is more recent
-
-        pfObj = PickleFilter(fp, self.forceSource)
-        # fpDst here is the file path to load, which may or may not be
-        # a pickled file
-        fpDst, writePickle, fpPickle = pfObj.status() # get status
-
-        formatSrc = common.findFormatFile(fp)
-        # here we determine if we have pickled file or a musicxml file
-        m21Format = common.findFormatFile(fpDst)
-        pickleError = False
+        '''Open from a file path, which may be a compressed .mxl file or a
+        pickled MusicXML object representation.
 
+        Streams parsed from any format are pickled by
+        :meth:`~music21.converter.Converter.parseFile`, using a
+        :class:`~music21.converter.PickleFilter`.
+        '''
+        if self.streaming and common.findFormatFile(fp) != 'pickle':
+            self._parseFileStreaming(fp)
+            return
         c = musicxmlHandler.Document()
-        if m21Format == 'pickle':
-            environLocal.printDebug(['opening pickled file', fpDst])
+        if common.findFormatFile(fp) == 'pickle':
+            environLocal.printDebug(['opening pickled file', fp])
             try:
-                c.openPickle(fpDst)
+                c.openPickle(fp)
             except (ImportError, EOFError):
-                msg = 'pickled file (%s) is damaged; a new file will be created.' % fpDst
-                pickleError = True
-                writePickle = True
-                if formatSrc == 'musicxml':
-                    #environLocal.printDebug([msg], environLocal)
-                    fpDst = fp # set to orignal file path
-                else:
-                    raise ConverterException(msg)
-            # check if this pickle is up to date
-            if (hasattr(c.score, 'm21Version') and
-                c.score.m21Version >= musicxmlHandler.musicxmlMod.VERSION_MINIMUM):
-                pass
-                #environLocal.printDebug(['pickled file version is compatible', c.score.m21Version])
-            else:
-                try:
-                    environLocal.printDebug(['pickled file version is not compatible', c.score.m21Version])
-                except (AttributeError, TypeError):
-                    # some old pickles have no versions
-                    pass
-                pickleError = True
-                writePickle = True
-                fpDst = fp # set to orignal file path
-
-        if m21Format == 'musicxml' or (formatSrc == 'musicxml' and pickleError):
-            environLocal.printDebug(['opening musicxml file:', fpDst])
-
+                raise ConverterException('pickled file (%s) is damaged' % fp)
+        else:
+            environLocal.printDebug(['opening musicxml file:', fp])
             # here, we can see if this is a mxl or similar archive
-            arch = ArchiveManager(fpDst)
+            arch = ArchiveManager(fp)
             if arch.isArchive():
                 c.read(arch.getData())
             else: # its a file path or a raw musicxml string
-                c.open(fpDst)
+                c.open(fp)
 
         # get mxScore object from .score attribute
         self._mxScore = c.score
@@ -507,15 +716,26 @@ class ConverterMusicXML(object):
                 # set as movement title
                 self._mxScore.set('movementTitle', fn)
 
-        # only write pickle if we have parts defined
-        if writePickle:
-            if fpPickle == None: # if original file cannot be found
-                raise ConverterException('attempting to write pickle but no file path is given')
-            environLocal.printDebug(['writing pickled file', fpPickle])
-            c.writePickle(fpPickle)
-
         self.load()
 
+    def _parseFileStreaming(self, fp):
+        environLocal.printDebug(['streaming musicxml file:', fp])
+        arch = ArchiveManager(fp)
+        if arch.isArchive():
+            self.loadStreaming(arch.getData(), isFile=False)
+        else:
+            self.loadStreaming(fp)
+        if len(self._mxScore) == 0:
+            raise ConverterException('score from file path (%s) no parts defined' % fp)
+
+        # as in parseFile, use the file name as a title if none is defined;
+        # the metadata has already been translated
+        if self._mxScore.get('movementTitle') == None:
+            mxWork = self._mxScore.get('workObj')
+            if mxWork == None or mxWork.get('workTitle') == None:
+                junk, fn = os.path.split(fp)
+                self._stream.metadata.movementName = fn
+
 
 
 
@@ -523,11 +743,15 @@ class ConverterMusicXML(object):
 class ConverterMidi(object):
     '''
     Simple class wrapper for parsing MIDI.
+
+    If `streaming` is True, each track is converted while its events 
+    are read.
     '''
 
-    def __init__(self):
+    def __init__(self, streaming=False):
         # always create a score instance
         self._stream = stream.Score()
+        self.streaming = streaming
 
     def parseData(self, strData, number=None):
         '''
@@ -536,7 +760,8 @@ class ConverterMidi(object):
         Calls midi.translate.midiStringToStream.
         '''
         from music21.midi import translate as midiTranslate
-        midiTranslate.midiStringToStream(strData, self._stream)
+        midiTranslate.midiStringToStream(strData, self._stream, 
+                                         streaming=self.streaming)
 
     def parseFile(self, fp, number=None):
         '''
@@ -545,7 +770,8 @@ class ConverterMidi(object):
         Calls midi.translate.midiFilePathToStream.
         '''
         from music21.midi import translate as midiTranslate
-        midiTranslate.midiFilePathToStream(fp, self._stream)
+        midiTranslate.midiFilePathToStream(fp, self._stream, 
+                                           streaming=self.streaming)
 
     def _getStream(self):
         return self._stream
@@ -753,17 +979,19 @@ class Converter(object):
 
     def __init__(self):
         self._converter = None
+        self._thawedStream = None # a Stream loaded from a pickle
 
-    def _setConverter(self, format, forceSource=False): # @ReservedAssignment
+    def _setConverter(self, format, forceSource=False, streaming=False): # @ReservedAssignment
         # assume for now that pickled files are always musicxml
         # this WILL change in the future
         if format is None:
             raise ConverterException('Did not find a format from the source file')
 
         if format in ['musicxml', 'pickle']:
-            self._converter = ConverterMusicXML(forceSource=forceSource)
+            self._converter = ConverterMusicXML(forceSource=forceSource,
+                                                streaming=streaming)
         elif format == 'midi':
-            self._converter = ConverterMidi()
+            self._converter = ConverterMidi(streaming=streaming)
         elif format == 'humdrum':
             self._converter = ConverterHumdrum()
         elif format.lower() in ['tinynotation']:
@@ -793,7 +1021,7 @@ class Converter(object):
             raise ValueError
         return os.path.join(directory, 'm21-' + common.getMd5(url) + ext)
 
-    def parseFile(self, fp, number=None, format=None, forceSource=False): # @ReservedAssignment
+    def parseFile(self, fp, number=None, format=None, forceSource=False, streaming=False): # @ReservedAssignment
         '''
         Given a file path, parse and store a music21 Stream.
 
@@ -801,6 +1029,17 @@ class Converter(object):
         If format is None then look up the format from the file
         extension using `common.findFormatFile`.
 
+        If `streaming` is True, MusicXML is translated measure by measure
+        as it is parsed (see :meth:`ConverterMusicXML.loadStreaming`), 
+        and MIDI track by track as its events are read, which needs less 
+        memory; other formats ignore it.
+
+        Unless `forceSource` is True, the parsed Stream is pickled in the
+        scratch directory, and a Stream pickled from a file with the same
+        contents is loaded rather than parsed, as determined by a
+        :class:`~music21.converter.PickleFilter`. A Stream parsed with
+        `streaming` is not pickled, as that would need a second copy of
+        the whole Stream in memory, nor is a Stream that cannot be pickled.
         '''
         #environLocal.printDebug(['attempting to parseFile', fp])
         if not os.path.exists(fp):
@@ -816,16 +1055,74 @@ class Converter(object):
                 useFormat = common.findFormatFile(fp)
                 if useFormat is None:
                     raise ConverterFileException('cannot find a format extensions for: %s' % fp)
-        self._setConverter(useFormat, forceSource=forceSource)
-        self._converter.parseFile(fp, number=number)
+
+        self._thawedStream = None
+        memoryKey = None
+        if memoryCache.maxEntries > 0 and not forceSource:
+            memoryKey = memoryCache.getKey(fp, number, useFormat)
+            self._thawedStream = memoryCache.get(memoryKey)
+            if self._thawedStream is not None:
+                self._setStreamAttributes(fp, number, useFormat)
+                return
+
+        pfObj = PickleFilter(fp, forceSource, number=number, format=useFormat)
+        # fpDst here is the file path to load, which may be a pickled Stream
+        fpDst, writePickle, fpPickle = pfObj.status()
+        data = None # the pickled Stream, if available
+        if fpPickle is not None and fpDst == fpPickle:
+            environLocal.printDebug(['opening pickled file', fpPickle])
+            try:
+                f = open(fpPickle, 'rb')
+                data = f.read()
+                f.close()
+                self._thawedStream = thawStr(data)
+            except Exception: # any error in unpickling; parse the source
+                environLocal.printDebug(['pickled file (%s) is damaged; a new file will be created.' % fpPickle])
+                data = None
+                writePickle = True
+
+        if self._thawedStream is None:
+            self._setConverter(useFormat, forceSource=forceSource,
+                               streaming=streaming)
+            self._converter.parseFile(fp, number=number)
+            if streaming:
+                writePickle = False
+                memoryKey = None
+            if writePickle or memoryKey is not None:
+                try:
+                    data = self._freezeStream()
+                    if writePickle:
+                        environLocal.printDebug(['writing pickled file', fpPickle])
+                        pfObj.writePickle(fpPickle, data)
+                except Exception as e: # any error in pickling; do not cache
+                    environLocal.printDebug(['cannot pickle parsed file (%s): %s' % (fp, e)])
+                    data = None
+
+        if memoryKey is not None and data is not None:
+            memoryCache.add(memoryKey, data)
+        self._setStreamAttributes(fp, number, useFormat)
+
+    def _setStreamAttributes(self, fp, number, useFormat):
         self.stream.filePath = fp
         self.stream.fileNumber = number
         self.stream.fileFormat = useFormat
 
-    def parseData(self, dataStr, number=None, format=None, forceSource=False): # @ReservedAssignment
+    def _freezeStream(self):
+        '''
+        Return the parsed Stream in pickled form. The Stream is frozen
+        from a copy, so the parsed Stream itself is left unaltered.
+        '''
+        from music21 import freezeThaw
+        sf = freezeThaw.StreamFreezer(self.stream)
+        return sf.writeStr(fmt='pickle')
+
+    def parseData(self, dataStr, number=None, format=None, forceSource=False, streaming=False): # @ReservedAssignment
         '''
         Given raw data, determine format and parse into a music21 Stream.
+
+        See :meth:`parseFile` for `streaming`.
         '''
+        self._thawedStream = None
         useFormat = format
         if common.isListLike(dataStr):
             useFormat = 'tinyNotation'
@@ -858,11 +1155,11 @@ class Converter(object):
             else:
                 raise ConverterException('File not found or no such format found for: %s' % dataStr)
 
-        self._setConverter(useFormat)
+        self._setConverter(useFormat, streaming=streaming)
         self._converter.parseData(dataStr, number=number)
 
 
-    def parseURL(self, url, format=None, number=None): # @ReservedAssignment
+    def parseURL(self, url, format=None, number=None, streaming=False): # @ReservedAssignment
         '''Given a url, download and parse the file
         into a music21 Stream stored in the `stream`
         property of the converter object.
@@ -933,7 +1230,8 @@ class Converter(object):
             useFormat = common.findFormatFile(fp)
         else:
             useFormat = format
-        self._setConverter(useFormat, forceSource=False)
+        self._thawedStream = None
+        self._setConverter(useFormat, forceSource=False, streaming=streaming)
         self._converter.parseFile(fp, number=number)
         self.stream.filePath = fp
         self.stream.fileNumber = number
@@ -979,6 +1277,8 @@ class Converter(object):
     def _getStream(self):
         '''All converters have to have a stream property or attribute.
         '''
+        if self._thawedStream is not None:
+            return self._thawedStream
         return self._converter.stream
         # not _stream: please don't look in other objects' private variables;
         #              humdrum worked differently.
@@ -992,31 +1292,32 @@ class Converter(object):
 # module level convenience methods
 
 
-def parseFile(fp, number=None, format=None, forceSource=False):  #@ReservedAssignment
+def parseFile(fp, number=None, format=None, forceSource=False, streaming=False):  #@ReservedAssignment
     '''
     Given a file path, attempt to parse the file into a Stream.
     '''
     v = Converter()
-    v.parseFile(fp, number=number, format=format, forceSource=forceSource)
+    v.parseFile(fp, number=number, format=format, forceSource=forceSource,
+                streaming=streaming)
     return v.stream
 
-def parseData(dataStr, number=None, format=None): # @ReservedAssignment
+def parseData(dataStr, number=None, format=None, streaming=False): # @ReservedAssignment
     '''
     Given musical data represented within a Python string, attempt to parse the
     data into a Stream.
     '''
     v = Converter()
-    v.parseData(dataStr, number=number, format=format)
+    v.parseData(dataStr, number=number, format=format, streaming=streaming)
     return v.stream
 
-def parseURL(url, number=None, format=None, forceSource=False): # @ReservedAssignment
+def parseURL(url, number=None, format=None, forceSource=False, streaming=False): # @ReservedAssignment
     '''
     Given a URL, attempt to download and parse the file into a Stream. Note:
     URL downloading will not happen automatically unless the user has set their
     Environment "autoDownload" preference to "allow".
     '''
     v = Converter()
-    v.parseURL(url, format=format)
+    v.parseURL(url, format=format, streaming=streaming)
     return v.stream
 
 def parse(value, *args, **keywords):
@@ -1031,6 +1332,11 @@ def parse(value, *args, **keywords):
 
     `format` specifies the format to parse the line of text or the file as.
 
+    If `streaming` is True, MusicXML is translated measure by measure, and
+    MIDI track by track, while it is parsed, rather than after the whole 
+    file has been read into intermediate objects; this uses less memory 
+    for large scores.
+
     A string of text is first checked to see if it is a filename that exists on
     disk.  If not it is searched to see if it looks like a URL.  If not it is
     processed as data.
@@ -1076,6 +1382,11 @@ def parse(value, *args, **keywords):
     else:
         m21Format = None
 
+    if 'streaming' in keywords:
+        streaming = keywords['streaming']
+    else:
+        streaming = False
+
     if (common.isListLike(value) and len(value) == 2 and
         value[1] == None and os.path.exists(value[0])):
         # comes from corpus.search
@@ -1090,16 +1401,99 @@ def parse(value, *args, **keywords):
         return parseData(value, number=number)
     # a midi string, must come before os.path.exists test
     elif value.startswith('MThd'):
-        return parseData(value, number=number, format=m21Format)
+        return parseData(value, number=number, format=m21Format,
+                         streaming=streaming)
     elif os.path.exists(value):
-        return parseFile(value, number=number, format=m21Format, forceSource=forceSource)
+        return parseFile(value, number=number, format=m21Format,
+                         forceSource=forceSource, streaming=streaming)
     elif (value.startswith('http://') or value.startswith('https://')):
         # its a url; may need to broaden these criteria
-        return parseURL(value, number=number, format=m21Format, forceSource=forceSource)
+        return parseURL(value, number=number, format=m21Format,
+                        forceSource=forceSource, streaming=streaming)
     else:
-        return parseData(value, number=number, format=m21Format)
+        return parseData(value, number=number, format=m21Format,
+                         streaming=streaming)
+
 
 
+def _parseManyWorker(job):
+    '''
+    Parse a single value in a worker process of :func:`_parseMany`,
+    returning the Stream serialized as a string.
+    '''
+    from music21 import freezeThaw
+    parseFunction, value, keywords = job
+    streamObj = parseFunction(value, **keywords)
+    # the Stream is discarded after serialization; no copy is needed
+    v = freezeThaw.StreamFreezer(streamObj, fastButUnsafe=True)
+    return v.writeStr(fmt='pickle')
+
+
+def _parseMany(parseFunction, values, processes=None, ordered=True,
+    keywords=None):
+    '''
+    Call `parseFunction` with each of `values` and `keywords` in a pool of
+    `processes` worker processes, yielding the resulting Streams. Used by
+    :func:`~music21.converter.parseMany` and
+    :func:`~music21.corpus.parseMany`.
+    '''
+    if keywords is None:
+        keywords = {}
+    if processes is None:
+        processes = multiprocessing.cpu_count() - 1
+    # daemonic processes, such as the workers of a pool, cannot start a pool
+    if processes < 2 or multiprocessing.current_process().daemon:
+        for value in values:
+            yield parseFunction(value, **keywords)
+        return
+    jobs = [(parseFunction, value, keywords) for value in values]
+    pool = multiprocessing.Pool(processes)
+    try:
+        if ordered:
+            results = pool.imap(_parseManyWorker, jobs, 1)
+        else:
+            results = pool.imap_unordered(_parseManyWorker, jobs, 1)
+        for data in results:
+            yield thawStr(data)
+        pool.close()
+    finally:
+        # if the caller stops early or an error is raised, remaining jobs
+        # are abandoned
+        pool.terminate()
+        pool.join()
+
+
+def parseMany(values, processes=None, ordered=True, **keywords):
+    '''
+    Given a list of file paths, encoded data, or URLs, parse each of them,
+    as :func:`~music21.converter.parse` does, in a pool of `processes`
+    worker processes, and yield the resulting Streams.
+
+    If `processes` is None, one fewer process than the number of available
+    cores is used; if fewer than two processes are used, values are parsed
+    one at a time in this process. Keywords, such as `format` and
+    `forceSource`, are passed to :func:`~music21.converter.parse`.
+
+    Streams are yielded in the order of `values`. If `ordered` is False,
+    each Stream is yielded as soon as it is parsed; the `filePath` attribute
+    of Streams parsed from files can then identify them.
+
+    Streams are returned from the worker processes in serialized form, as
+    with :func:`~music21.converter.freezeStr`.
+
+
+    >>> data = ['tinyNotation: 3/4 c4 d e', 'tinyNotation: 2/4 f4 g']
+    >>> for s in converter.parseMany(data, processes=2):
+    ...     print(s.flat.getElementsByClass('TimeSignature')[0].ratioString)
+    ...     print([n.name for n in s.flat.notes])
+    3/4
+    ['C', 'D', 'E']
+    2/4
+    ['F', 'G']
+    '''
+    return _parseMany(parse, values, processes=processes, ordered=ordered,
+        keywords=keywords)
+
 
 def freeze(streamObj, fmt=None, fp=None):
     '''Given a StreamObject and a file path, serialize and store the Stream to a file.
@@ -1815,10 +2209,199 @@ class Test(unittest.TestCase):
         cmd = ConverterMuseData()
         cmd.parseFile(fp)
 
+    def testPickleFilterA(self):
+        import tempfile
+        fp = environLocal.getTempFile('.krn')
+        f = open(fp, 'w')
+        # a unique comment, so that no pickle exists yet
+        f.write('!! %s\n**kern\n*M2/4\n=1\n4c\n4d\n=2\n2e\n*-\n' %
+                common.getMd5())
+        f.close()
+
+        pfObj = PickleFilter(fp, format='humdrum')
+        fpDst, writePickle, fpPickle = pfObj.status()
+        self.assertEqual((fpDst, writePickle), (fp, True))
+        s = parseFile(fp)
+        self.assertEqual(len(s.flat.notes), 3)
+        # the Stream is now loaded from the pickle
+        fpDst, writePickle, fpPickle2 = pfObj.status()
+        self.assertEqual((fpDst, writePickle), (fpPickle, False))
+        s = parseFile(fp)
+        self.assertEqual([n.name for n in s.flat.notes], ['C', 'D', 'E'])
+        self.assertEqual(s.filePath, fp)
+        # or parsed, if forced
+        pfObj = PickleFilter(fp, forceSource=True, format='humdrum')
+        self.assertEqual(pfObj.status(), (fp, False, None))
+
+        # a pickle is found by the contents of the file
+        f = open(fp, 'w')
+        f.write('**kern\n*M2/4\n=1\n4c\n4d\n=2\n2f\n*-\n')
+        f.close()
+        pfObj = PickleFilter(fp, format='humdrum')
+        self.assertNotEqual(pfObj.status()[2], fpPickle)
+        s = parseFile(fp)
+        self.assertEqual([n.name for n in s.flat.notes], ['C', 'D', 'F'])
+        os.remove(fp)
+
+        # the least recently used pickles are removed
+        directory = tempfile.mkdtemp()
+        for i in range(4):
+            fpCached = os.path.join(directory, 'm21-parse-%s.p' % i)
+            f = open(fpCached, 'wb')
+            f.write('x' * 100)
+            f.close()
+            os.utime(fpCached, (1000 + i, 1000 + i))
+        pfObj = PickleFilter(fp)
+        pfObj.maxCacheSize = 250
+        pfObj.removeOldPickles(directory)
+        self.assertEqual(sorted(os.listdir(directory)),
+                         ['m21-parse-2.p', 'm21-parse-3.p'])
+        for fn in os.listdir(directory):
+            os.remove(os.path.join(directory, fn))
+        os.rmdir(directory)
+
+    def testMemoryCacheA(self):
+        fp = environLocal.getTempFile('.krn')
+        f = open(fp, 'w')
+        f.write('**kern\n*M2/4\n=1\n4c\n4d\n=2\n2e\n*-\n')
+        f.close()
+
+        mc = MemoryCache(maxEntries=2)
+        key = mc.getKey(fp)
+        self.assertEqual(mc.get(key), None)
+        s = parseFile(fp)
+        mc.add(key, freezeStr(s))
+        s1 = mc.get(key)
+        s2 = mc.get(key)
+        self.assertEqual([n.name for n in s1.flat.notes], ['C', 'D', 'E'])
+        # each request gets a new Stream
+        self.assertFalse(s1 is s2)
+        s1.flat.notes[0].name = 'B'
+        self.assertEqual(mc.get(key).flat.notes[0].name, 'C')
+        self.assertEqual((mc.hits, mc.misses), (3, 1))
+
+        # or the same immutable Stream
+        mc.immutable = True
+        s1 = mc.get(key)
+        self.assertTrue(mc.get(key) is s1)
+        self.assertEqual(s1._mutable, False)
+
+        # least recently used Streams are removed
+        mc.add(mc.getKey(fp, number=1), freezeStr(s))
+        mc.add(mc.getKey(fp, number=2), freezeStr(s))
+        self.assertEqual(len(mc), 2)
+        self.assertEqual(mc.evictions, 1)
+        self.assertEqual(mc.get(key), None)
+        self.assertFalse(mc.get(mc.getKey(fp, number=2)) is None)
+        mc.maxMemory = 0
+        mc.add(key, freezeStr(s))
+        # the most recently added is kept
+        self.assertEqual(len(mc), 1)
+        self.assertFalse(mc.get(key) is None)
+
+        # with the module-level cache enabled, parsing uses it
+        memoryCache.maxEntries = 5
+        try:
+            memoryCache.resetStatistics()
+            s1 = parseFile(fp)
+            s2 = parseFile(fp)
+            self.assertFalse(s1 is s2)
+            self.assertEqual((memoryCache.hits, memoryCache.misses), (1, 1))
+            self.assertEqual(s2.filePath, fp)
+            self.assertEqual([n.name for n in s2.flat.notes], ['C', 'D', 'E'])
+            # forced parsing ignores the cache
+            parseFile(fp, forceSource=True)
+            self.assertEqual((memoryCache.hits, memoryCache.misses), (1, 1))
+        finally:
+            memoryCache.maxEntries = 0
+            memoryCache.clear()
+        os.remove(fp)
+
+    def testUnpicklableStreamA(self):
+        from music21 import freezeThaw
+        fp = environLocal.getTempFile('.abc')
+        f = open(fp, 'w')
+        # an inline part field gives a Stream that cannot be pickled;
+        # a unique comment, so that no pickle exists yet
+        f.write('%% %s\nX:1\nM:2/4\nL:1/8\nK:D\nd2 e2|[P:A]f4|]\n' %
+                common.getMd5())
+        f.close()
+        s = parseFile(fp, forceSource=True)
+        self.assertRaises(freezeThaw.pickleMod.PicklingError, freezeStr, s,
+                          'pickle')
+
+        pfObj = PickleFilter(fp, format='abc')
+        fpPickle = pfObj.status()[2]
+        memoryCache.maxEntries = 5
+        try:
+            memoryCache.clear()
+            # parsed, but neither pickled nor cached in memory
+            s = parseFile(fp)
+            self.assertEqual([p.name for p in s.pitches], ['D', 'E', 'F#'])
+            self.assertEqual(s.filePath, fp)
+            self.assertFalse(os.path.exists(fpPickle))
+            self.assertEqual(len(memoryCache), 0)
+        finally:
+            memoryCache.maxEntries = 0
+            memoryCache.clear()
+        os.remove(fp)
+
+    def testParseManyA(self):
+        from music21.musicxml import testPrimitive
+        from music21 import humdrum
+
+        values = [testPrimitive.pitches01a, humdrum.testFiles.schubert,
+                  'tinyNotation: 3/4 c4 d e']
+        serial = [parse(v) for v in values]
+        for processes in (1, 2):
+            post = list(parseMany(values, processes=processes))
+            self.assertEqual(len(post), 3)
+            for i in range(3):
+                self.assertEqual(len(post[i].flat.notes),
+                                 len(serial[i].flat.notes))
+                self.assertEqual(post[i].highestTime, serial[i].highestTime)
+            post = list(parseMany(values, processes=processes, ordered=False))
+            self.assertEqual(sorted(len(s.flat.notes) for s in post),
+                             sorted(len(s.flat.notes) for s in serial))
+
+        # errors in worker processes are raised
+        post = parseMany(['tinyNotation: 3/4 c4', 'tinyNotation: 3/4 c4 x'],
+                         processes=2)
+        self.assertRaises(Exception, list, post)
+
+    def testParseStreamingA(self):
+        from music21.musicxml import testPrimitive
+
+        for xmlString in (testPrimitive.pianoStaff43a,
+                          testPrimitive.staffGroupsNested41d,
+                          testPrimitive.transposingInstruments72a,
+                          testPrimitive.spanners33a):
+            s1 = parse(xmlString)
+            s2 = parse(xmlString, streaming=True)
+            self.assertEqual([p.id for p in s2.parts], [p.id for p in s1.parts])
+            self.assertEqual([p.atSoundingPitch for p in s2.parts],
+                             [p.atSoundingPitch for p in s1.parts])
+            self.assertEqual([(repr(n), n.offset) for n in s2.flat.notesAndRests],
+                             [(repr(n), n.offset) for n in s1.flat.notesAndRests])
+            self.assertEqual(len(s2.spanners), len(s1.spanners))
+            self.assertEqual(s2.metadata.title, s1.metadata.title)
+
+        # without a title, the file name is used as with parseFile
+        fp = environLocal.getTempFile('.xml')
+        f = open(fp, 'w')
+        f.write(testPrimitive.pitches01a.replace(
+            '<movement-title>Pitches and accidentals</movement-title>', ''))
+        f.close()
+        s = parseFile(fp, forceSource=True, streaming=True)
+        self.assertEqual(s.metadata.movementName, os.path.basename(fp))
+        self.assertEqual(len(s.flat.notes),
+                         len(parseFile(fp, forceSource=True).flat.notes))
+        os.remove(fp)
+
 
 #-------------------------------------------------------------------------------
 # define presented order in documentation
-_DOC_ORDER = [parse, parseFile, parseData, parseURL, freeze, thaw, freezeStr, thawStr, Converter, ConverterMusicXML, ConverterHumdrum]
+_DOC_ORDER = [parse, parseFile, parseData, parseURL, parseMany, freeze, thaw, freezeStr, thawStr, Converter, ConverterMusicXML, ConverterHumdrum, MemoryCache]
 
 
 if __name__ == "__main__":
@@ -674,6 +674,40 @@ def parse(
         )
 
 
+def parseMany(
+    workNames,
+    processes=None,
+    ordered=True,
+    **keywords
+    ):
+    '''
+    Parse each of `workNames`, as :func:`~music21.corpus.parse` does, in a
+    pool of `processes` worker processes, yielding the resulting Streams in
+    the order of `workNames` (or, if `ordered` is False, as soon as each is
+    parsed). Keywords, such as `fileExtensions`, are passed to
+    :func:`~music21.corpus.parse`.
+
+    See :func:`~music21.converter.parseMany` for details.
+
+    ::
+
+        >>> from music21 import corpus
+        >>> workNames = ['bwv66.6', 'bach/bwv7.7']
+        >>> for s in corpus.parseMany(workNames, processes=2):
+        ...     print(s.corpusFilepath)
+        bach/bwv66.6.mxl
+        bach/bwv7.7.mxl
+
+    '''
+    return converter._parseMany(
+        parse,
+        workNames,
+        processes=processes,
+        ordered=ordered,
+        keywords=keywords,
+        )
+
+
 def _addCorpusFilepath(streamObj, filePath):
     # metadata attribute added to store the file path,
     # for use later in identifying the score
@@ -9,6 +9,9 @@
 # License:      LGPL, see license.txt
 #-------------------------------------------------------------------------------
 
+import copy
+import multiprocessing
+import time
 import unittest
 import os
 
@@ -89,7 +92,14 @@ class FeatureExtractor(object):
 
     The extractor can be passed a Stream or a reference to a DataInstance. All Stream's are internally converted to a DataInstance if necessary. Usage of a DataInstance offers significant performance advantages, as common forms of the Stream are cached for easy processing. 
 
+    Subclasses list the forms of the DataInstance that they use in `requiredForms`, so that these can be made in advance with :meth:`~music21.features.base.DataInstance.prepareForms`.
+
+    >>> features.jSymbolic.DirectionOfMotionFeature.requiredForms
+    ('parts.contourList',)
     '''
+    # keys of the DataInstance forms used by this extractor
+    requiredForms = ()
+
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         self.stream = None # the original Stream, or None
         self.data = None # a DataInstance object: use to get data
@@ -223,12 +233,93 @@ class StreamForms(object):
 
     A DataSet object manages one or more StreamForms 
     objects, and exposes them to FeatureExtractors for usage.
+
+    Each form is made by a method from the forms it depends on, as 
+    declared in `formDependencies`; these are made first, and are 
+    cached and shared by all forms that use them. The time taken to make 
+    each form, not counting the forms it depends on, is stored in 
+    `formTimes`.
+
+    >>> s = corpus.parse('bwv66.6')
+    >>> sf = features.StreamForms(s)
+    >>> sf.formDependencies['pitchClassHistogram']
+    ('flat.pitches',)
+    >>> sf['pitchClassHistogram']
+    [0, 32, 12, 1, 16, 6, 29, 0, 14, 22, 3, 28]
+    >>> sorted(sf.keys())
+    ['flat', 'flat.pitches', 'pitchClassHistogram']
+    >>> sorted(sf.formTimes.keys())
+    ['flat', 'flat.pitches', 'pitchClassHistogram', 'prepareStream']
+    >>> sf.getDependencies(['flat.tonalCertainty', 'midiPitchHistogram'])
+    ['flat', 'flat.analyzedKey', 'flat.tonalCertainty', 'flat.pitches', 'midiPitchHistogram']
     '''
+    # the forms that each form is made from, given in order to its method
+    formDependencies = {
+        'flat': (),
+        'flat.pitches': ('flat',),
+        'flat.notes': ('flat',),
+        'getElementsByClass.Measure': (),
+        'flat.getElementsByClass.TimeSignature': ('flat',),
+        'flat.getElementsByClass.KeySignature': ('flat',),
+        'flat.getElementsByClass.Harmony': ('flat',),
+        'metronomeMarkBoundaries': (),
+        'chordify': (),
+        'chordify.getElementsByClass.Chord': ('chordify',),
+        'partitionByInstrument': (),
+        'chordifySetClassHistogram': ('chordify.getElementsByClass.Chord',),
+        'chordifyPitchClassSetHistogram': ('chordify.getElementsByClass.Chord',),
+        'chordifyTypesHistogram': ('chordify.getElementsByClass.Chord',),
+        'noteQuarterLengthHistogram': ('flat.notes',),
+        'pitchClassHistogram': ('flat.pitches',),
+        'midiPitchHistogram': ('flat.pitches',),
+        'stripTiesByPart': (),
+        'midiIntervalHistogram': ('stripTiesByPart',),
+        'contourList': ('stripTiesByPart',),
+        'flat.analyzedKey': ('flat',),
+        'flat.tonalCertainty': ('flat.analyzedKey',),
+        'metadata': (),
+        'secondsMap': ('flat',),
+        'assembledLyrics': (),
+        }
+
+    # the method that makes each form
+    _formMethods = {
+        'flat': '_formFlat',
+        'flat.pitches': '_formFlatPitches',
+        'flat.notes': '_formFlatNotes',
+        'getElementsByClass.Measure': '_formMeasures',
+        'flat.getElementsByClass.TimeSignature': '_formTimeSignatures',
+        'flat.getElementsByClass.KeySignature': '_formKeySignatures',
+        'flat.getElementsByClass.Harmony': '_formHarmonies',
+        'metronomeMarkBoundaries': '_formMetronomeMarkBoundaries',
+        'chordify': '_formChordify',
+        'chordify.getElementsByClass.Chord': '_formChordifyChords',
+        'partitionByInstrument': '_formPartitionByInstrument',
+        'chordifySetClassHistogram': '_formChordifySetClassHistogram',
+        'chordifyPitchClassSetHistogram': '_formChordifyPitchClassSetHistogram',
+        'chordifyTypesHistogram': '_formChordifyTypesHistogram',
+        'noteQuarterLengthHistogram': '_formNoteQuarterLengthHistogram',
+        'pitchClassHistogram': '_formPitchClassHistogram',
+        'midiPitchHistogram': '_formMidiPitchHistogram',
+        'stripTiesByPart': '_formStripTiesByPart',
+        'midiIntervalHistogram': '_formMidiIntervalHistogram',
+        'contourList': '_formContourList',
+        'flat.analyzedKey': '_formAnalyzedKey',
+        'flat.tonalCertainty': '_formTonalCertainty',
+        'metadata': '_formMetadata',
+        'secondsMap': '_formSecondsMap',
+        'assembledLyrics': '_formAssembledLyrics',
+        }
+
     def __init__(self, streamObj, prepareStream=True):   
         self.stream = streamObj
+        # seconds taken to make each form
+        self.formTimes = {}
         if self.stream is not None:
             if prepareStream:
+                t = time.time()
                 self._base = self._prepareStream(self.stream)
+                self.formTimes['prepareStream'] = time.time() - t
             else: # possibly make a copy?
                 self._base = self.stream
         else:       
@@ -250,272 +341,287 @@ class StreamForms(object):
         streamObj = streamObj.stripTies(retainContainers=True)
         return streamObj
 
+    def getDependencies(self, keys):
+        '''
+        Return a list of the forms needed to make the forms of `keys`, 
+        including these, in an order in which they can be made.
+
+        >>> sf = features.StreamForms(None)
+        >>> sf.getDependencies(['chordifyTypesHistogram'])
+        ['chordify', 'chordify.getElementsByClass.Chord', 'chordifyTypesHistogram']
+        '''
+        post = []
+        def add(key):
+            if key in post:
+                return
+            if key not in self.formDependencies:
+                raise AttributeError('no such attribute: %s' % key)
+            for dependency in self.formDependencies[key]:
+                add(dependency)
+            post.append(key)
+        for key in keys:
+            add(key)
+        return post
+
     def __getitem__(self, key):
         '''Get a form of this Stream, using a cached version if available.
         '''
         # first, check for cached version
         if key in self._forms:
             return self._forms[key]
+        if key not in self._formMethods:
+            raise AttributeError('no such attribute: %s' % key)
+        # else, make the forms this form depends on, then process, store, 
+        # and return 
+        arguments = [self.__getitem__(dependency) 
+                     for dependency in self.formDependencies[key]]
+        t = time.time()
+        self._forms[key] = getattr(self, self._formMethods[key])(*arguments)
+        self.formTimes[key] = time.time() - t
+        return self._forms[key]
 
-        # else, process, store, and return
-        elif key in ['flat']:
-            self._forms['flat'] = self._base.flat
-            return self._forms['flat']
-
-        elif key in ['flat.pitches']:
-            self._forms['flat.pitches'] = self._base.flat.pitches
-            return self._forms['flat.pitches']
-
-        elif key in ['flat.notes']:
-            self._forms['flat.notes'] = self._base.flat.notes
-            return self._forms['flat.notes']
-
-        elif key in ['getElementsByClass.Measure']:
-            # need to determine if should concatenate
-            # measure for all parts if a score?
-            if 'Score' in self._base.classes:
-                post = stream.Stream()
-                for p in self._base.parts:
-                    # insert in overlapping offset positions
-                    for m in p.getElementsByClass('Measure'):
-                        post.insert(m.getOffsetBySite(p), m)
-            else:
-                post = self._base.getElementsByClass('Measure')
-
-            self._forms['getElementsByClass.Measure'] = post
-            return self._forms['getElementsByClass.Measure']
-
-        elif key in ['flat.getElementsByClass.TimeSignature']:
-            self._forms['flat.getElementsByClass.TimeSignature'] = self._base.flat.getElementsByClass('TimeSignature')
-            return self._forms['flat.getElementsByClass.TimeSignature']
+    #---------------------------------------------------------------------------
+    def _formFlat(self):
+        return self._base.flat
+
+    def _formFlatPitches(self, flat):
+        return flat.pitches
+
+    def _formFlatNotes(self, flat):
+        return flat.notes
+
+    def _formMeasures(self):
+        # need to determine if should concatenate
+        # measure for all parts if a score?
+        if 'Score' in self._base.classes:
+            post = stream.Stream()
+            for p in self._base.parts:
+                # insert in overlapping offset positions
+                for m in p.getElementsByClass('Measure'):
+                    post.insert(m.getOffsetBySite(p), m)
+        else:
+            post = self._base.getElementsByClass('Measure')
+        return post
 
-        elif key in ['flat.getElementsByClass.KeySignature']:
-            self._forms['flat.getElementsByClass.KeySignature'] = self._base.flat.getElementsByClass('KeySignature')
-            return self._forms['flat.getElementsByClass.KeySignature']
+    def _formTimeSignatures(self, flat):
+        return flat.getElementsByClass('TimeSignature')
 
-        elif key in ['flat.getElementsByClass.Harmony']:
-            self._forms['flat.getElementsByClass.Harmony'] = self._base.flat.getElementsByClass('Harmony')
-            return self._forms['flat.getElementsByClass.Harmony']
+    def _formKeySignatures(self, flat):
+        return flat.getElementsByClass('KeySignature')
 
+    def _formHarmonies(self, flat):
+        return flat.getElementsByClass('Harmony')
 
-        elif key in ['metronomeMarkBoundaries']: # already flat
-            self._forms['metronomeMarkBoundaries'] = self._base.metronomeMarkBoundaries()
-            return self._forms['metronomeMarkBoundaries']
+    def _formMetronomeMarkBoundaries(self): # already flat
+        return self._base.metronomeMarkBoundaries()
 
-        # some methods that return new streams
-        elif key in ['chordify']:
-            if 'Score' in self._base.classes:
-                # options here permit getting part information out
-                # of chordified representation
-                self._forms['chordify'] = self._base.chordify(
-                    addPartIdAsGroup=True, removeRedundantPitches=False)
-            else: # for now, just return a normal Part or Stream
-                self._forms['chordify'] = self._base
-            return self._forms['chordify']
+    # some methods that return new streams
+    def _formChordify(self):
+        if 'Score' in self._base.classes:
+            # options here permit getting part information out
+            # of chordified representation
+            return self._base.chordify(
+                addPartIdAsGroup=True, removeRedundantPitches=False)
+        else: # for now, just return a normal Part or Stream
+            return self._base
 
-        elif key in ['chordify.getElementsByClass.Chord']:
-            # need flat here, as chordify might return Measures
-            x = self.__getitem__('chordify').flat.getElementsByClass('Chord')
-            self._forms['chordify.getElementsByClass.Chord'] = x
-            return self._forms['chordify.getElementsByClass.Chord']
+    def _formChordifyChords(self, chordified):
+        # need flat here, as chordify might return Measures
+        return chordified.flat.getElementsByClass('Chord')
 
+    def _formPartitionByInstrument(self):
         # create a Part in a Score for each Instrument
-        elif key in ['partitionByInstrument']:
-            from music21 import instrument
-            x = instrument.partitionByInstrument(self._base)
-            self._forms['partitionByInstrument'] = x
-            return self._forms['partitionByInstrument']
+        from music21 import instrument
+        return instrument.partitionByInstrument(self._base)
             
+    def _formChordifySetClassHistogram(self, chords):
         # create a dictionary of encountered set classes and a count
-        elif key in ['chordifySetClassHistogram']:  
-            histo = {}
-            for c in self.__getitem__('chordify.getElementsByClass.Chord'):
-                key = c.forteClassTnI
-                if key not in histo:
-                    histo[key] = 0
-                histo[key] += 1
-            self._forms['chordifySetClassHistogram'] = histo
-            return self._forms['chordifySetClassHistogram']
-
+        histo = {}
+        for c in chords:
+            key = c.forteClassTnI
+            if key not in histo:
+                histo[key] = 0
+            histo[key] += 1
+        return histo
+
+    def _formChordifyPitchClassSetHistogram(self, chords):
         # a dictionary of pitch class sets
-        elif key in ['chordifyPitchClassSetHistogram']:  
-            histo = {}
-            for c in self.__getitem__('chordify.getElementsByClass.Chord'):
-                key = c.orderedPitchClassesString
+        histo = {}
+        for c in chords:
+            key = c.orderedPitchClassesString
+            if key not in histo:
+                histo[key] = 0
+            histo[key] += 1
+        return histo
+
+    def _formChordifyTypesHistogram(self, chords):
+        # dictionary of common chord types
+        histo = {}
+        # keys are methods on Chord 
+        keys = ['isTriad', 'isSeventh', 'isMajorTriad', 'isMinorTriad', 'isIncompleteMajorTriad', 'isIncompleteMinorTriad', 'isDiminishedTriad', 'isAugmentedTriad', 'isDominantSeventh', 'isDiminishedSeventh', 'isHalfDiminishedSeventh']
+
+        for c in chords:
+            for key in keys:
                 if key not in histo:
                     histo[key] = 0
-                histo[key] += 1
-            self._forms['chordifyPitchClassSetHistogram'] = histo
-            return self._forms['chordifyPitchClassSetHistogram']
+                # get the function attr, call it, check bool
+                if getattr(c, key)():
+                    histo[key] += 1
+                    # not breaking here means that we may get multiple 
+                    # hits for the same chord
+        return histo
 
-        # dictionary of common chord types
-        elif key in ['chordifyTypesHistogram']:  
-            histo = {}
-            # keys are methods on Chord 
-            keys = ['isTriad', 'isSeventh', 'isMajorTriad', 'isMinorTriad', 'isIncompleteMajorTriad', 'isIncompleteMinorTriad', 'isDiminishedTriad', 'isAugmentedTriad', 'isDominantSeventh', 'isDiminishedSeventh', 'isHalfDiminishedSeventh']
-
-            for c in self.__getitem__('chordify.getElementsByClass.Chord'):
-                for key in keys:
-                    if key not in histo:
-                        histo[key] = 0
-                    # get the function attr, call it, check bool
-                    if getattr(c, key)():
-                        histo[key] += 1
-                        # not breaking here means that we may get multiple 
-                        # hits for the same chord
-            self._forms['chordifyTypesHistogram'] = histo
-            return self._forms['chordifyTypesHistogram']
-
-        # a dictionary of intervals
-        #self.flat.melodicIntervals(skipRests=True, skipChords=False, skipGaps=True)
+    # a dictionary of intervals
+    #self.flat.melodicIntervals(skipRests=True, skipChords=False, skipGaps=True)
 
+    def _formNoteQuarterLengthHistogram(self, notes):
         # a dictionary of quarter length values
-        elif key in ['noteQuarterLengthHistogram']:  
-            histo = {}
-            for n in self.__getitem__('flat.notes'):
-                key = n.quarterLength
-                if key not in histo:
-                    histo[key] = 0
-                histo[key] += 1
-            self._forms['noteQuarterLengthHistogram'] = histo
-            return self._forms['noteQuarterLengthHistogram']
-
-        # data lists / histograms
-        elif key in ['pitchClassHistogram']:
-            histo = [0] * 12
-            for p in self.__getitem__('flat.pitches'): # recursive call
-                histo[p.pitchClass] += 1
-            self._forms['pitchClassHistogram'] = histo
-            return self._forms['pitchClassHistogram']
-
-        elif key in ['midiPitchHistogram']:
-            histo = [0] * 128
-            for p in self.__getitem__('flat.pitches'): # recursive call
-                histo[p.midi] += 1
-            self._forms['midiPitchHistogram'] = histo
-            return self._forms['midiPitchHistogram']
+        histo = {}
+        for n in notes:
+            key = n.quarterLength
+            if key not in histo:
+                histo[key] = 0
+            histo[key] += 1
+        return histo
+
+    # data lists / histograms
+    def _formPitchClassHistogram(self, pitches):
+        histo = [0] * 12
+        for p in pitches:
+            histo[p.pitchClass] += 1
+        return histo
+
+    def _formMidiPitchHistogram(self, pitches):
+        histo = [0] * 128
+        for p in pitches:
+            histo[p.midi] += 1
+        return histo
+
+    def _formStripTiesByPart(self):
+        # a flat Stream of notes and rests, with ties stripped, for each part
+        post = []
+        # if we have parts, must add one at a time
+        if self._base.hasPartLikeStreams():
+            parts = self._base.parts
+        else:
+            parts = [self._base] # emulate a list
+        for p in parts:
+            # edit June 2012:
+            # was causing millions of deepcopy calls
+            # so I made it inPlace, but for some reason
+            # code errored with 'p =' not present
+            # also, this part has measures...so should retainContains be True?
+            post.append(p.stripTies(retainContainers=False, inPlace=True))
+        return post
 
+    def _formMidiIntervalHistogram(self, partStreams):
         # bins for all abs spans between adjacent melodic notes
-        elif key in ['midiIntervalHistogram']:
-            # note that this does not optimize and cache part presentations            
-            histo = [0] * 128
-            # if we have parts, must add one at a time
-            if self._base.hasPartLikeStreams():
-                parts = self._base.parts
-            else:
-                parts = [self._base] # emulate a list
-            for p in parts:
-                # will be flat
-                
-                # edit June 2012:
-                # was causing millions of deepcopy calls
-                # so I made it inPlace, but for some reason
-                # code errored with 'p =' not present
-                # also, this part has measures...so should retainContains be True?
-                p = p.stripTies(retainContainers=False, inPlace=True)
-                # noNone means that we will see all connections, even w/ a gap
-                post = p.findConsecutiveNotes(skipRests=True, 
-                    skipChords=True, skipGaps=True, noNone=True)
-                for i, n in enumerate(post):
-                    if i < len(post) - 1: # if not last
-                        iNext = i + 1
-                        nNext = post[iNext]
-                        try:
-                            histo[abs(n.midi - nNext.midi)] += 1
-                        except:
-                            pass # problem with not having midi
-            self._forms['midiIntervalHistogram'] = histo
-            return self._forms['midiIntervalHistogram']
-
-
-        elif key in ['contourList']:
-            # list of all directed half steps
-            cList = []
-            # if we have parts, must add one at a time
-            if self._base.hasPartLikeStreams():
-                parts = self._base.parts
-            else:
-                parts = [self._base] # emulate a list
-            for p in parts:
-                # this may be unnecessary but we cannot accessed cached part data
-                
-                # edit June 2012:
-                # was causing lots of deepcopy calls, so I made
-                # it inPlace=True, but errors when 'p =' no present
-                # also, this part has measures...so should retainContains be True?
-                p = p.stripTies(retainContainers=False, inPlace=True) # will be flat
-                # noNone means that we will see all connections, even w/ a gap
-                post = p.findConsecutiveNotes(skipRests=True, 
-                    skipChords=False, skipGaps=True, noNone=True)
-                for i, n in enumerate(post):
-                    if i < (len(post) - 1): # if not last
-                        iNext = i + 1
-                        nNext = post[iNext]
-
-                        if n.isChord:
-                            ps = n.sortDiatonicAscending().pitches[-1].midi
-                        else: # normal note
-                            ps = n.midi
-                        if nNext.isChord:
-                            psNext = nNext.sortDiatonicAscending().pitches[-1].midi
-                        else: # normal note
-                            psNext = nNext.midi
-
-                        cList.append(psNext - ps)
-            #environLocal.printDebug(['contourList', cList])
-            self._forms['contourList'] = cList
-            return self._forms['contourList']
-
-
-        elif key in ['flat.analyzedKey']:
-            # this will use default weightings
-            self._forms['analyzedKey'] = self.__getitem__('flat').analyze(
-                                         method='key')
-            return self._forms['analyzedKey']
-
-        elif key in ['flat.tonalCertainty']:
-            # this will use default weightings
-            foundKey = self.__getitem__('flat.analyzedKey')
-            self._forms['flat.tonalCertainty'] = foundKey.tonalCertainty()         
-            return self._forms['flat.tonalCertainty']
-        
-        elif key in ['metadata']:
-            self._forms['metadata'] = self._base.metadata
-            return self._forms['metadata']
-
-        elif key in ['secondsMap']:
-            secondsMap = self.__getitem__('flat').secondsMap
-            post = []
-            # filter only notes; all elements would otherwise be gathered
-            for bundle in secondsMap:
-                if 'GeneralNote' in bundle['element'].classes:
-                    post.append(bundle)
-            self._forms['secondsMap'] = post
-            return self._forms['secondsMap']
-
-        elif key in ['assembledLyrics']:
-            self._forms['assembledLyrics'] = text.assembleLyrics(self._base)
-            return self._forms['assembledLyrics']
+        histo = [0] * 128
+        for p in partStreams:
+            # noNone means that we will see all connections, even w/ a gap
+            post = p.findConsecutiveNotes(skipRests=True, 
+                skipChords=True, skipGaps=True, noNone=True)
+            for i, n in enumerate(post):
+                if i < len(post) - 1: # if not last
+                    iNext = i + 1
+                    nNext = post[iNext]
+                    try:
+                        histo[abs(n.midi - nNext.midi)] += 1
+                    except:
+                        pass # problem with not having midi
+        return histo
+
+    def _formContourList(self, partStreams):
+        # list of all directed half steps
+        cList = []
+        for p in partStreams:
+            # noNone means that we will see all connections, even w/ a gap
+            post = p.findConsecutiveNotes(skipRests=True, 
+                skipChords=False, skipGaps=True, noNone=True)
+            for i, n in enumerate(post):
+                if i < (len(post) - 1): # if not last
+                    iNext = i + 1
+                    nNext = post[iNext]
+
+                    if n.isChord:
+                        ps = n.sortDiatonicAscending().pitches[-1].midi
+                    else: # normal note
+                        ps = n.midi
+                    if nNext.isChord:
+                        psNext = nNext.sortDiatonicAscending().pitches[-1].midi
+                    else: # normal note
+                        psNext = nNext.midi
+
+                    cList.append(psNext - ps)
+        #environLocal.printDebug(['contourList', cList])
+        return cList
+
+    def _formAnalyzedKey(self, flat):
+        # this will use default weightings
+        return flat.analyze(method='key')
+
+    def _formTonalCertainty(self, foundKey):
+        # this will use default weightings
+        return foundKey.tonalCertainty()         
         
-        else:
-            raise AttributeError('no such attribute: %s' % key)
+    def _formMetadata(self):
+        return self._base.metadata
 
-        
+    def _formSecondsMap(self, flat):
+        post = []
+        # filter only notes; all elements would otherwise be gathered
+        for bundle in flat.secondsMap:
+            if 'GeneralNote' in bundle['element'].classes:
+                post.append(bundle)
+        return post
+
+    def _formAssembledLyrics(self):
+        return text.assembleLyrics(self._base)
 
 
 
 #-------------------------------------------------------------------------------
+def _parseDataPath(dataPath):
+    '''
+    Parse a file path, URL, or corpus path given to a DataInstance.
+    '''
+    # could be corpus or file path
+    if os.path.exists(dataPath) or dataPath.startswith('http'):
+        return converter.parse(dataPath)
+    else: # assume corpus
+        return corpus.parse(dataPath)
+
+
 class DataInstance(object):
     '''
     A data instance for analysis. This object prepares a Stream 
     (by stripping ties, etc.) and stores 
     multiple commonly-used stream representations once, providing rapid processing. 
+
+    In place of a Stream, a file path, URL, or corpus path can be given; 
+    it is not parsed until the Stream or one of its representations is 
+    needed. The path is then used as the id if none is given.
+
+    >>> di = features.DataInstance('bwv66.6')
+    >>> di.getId()
+    'bwv66.6'
+    >>> di.isLoaded()
+    False
+    >>> len(di['flat.notes'])
+    163
+    >>> di.isLoaded()
+    True
     '''
     def __init__(self, streamObj=None, id=None): #@ReservedAssignment
-        self.stream = streamObj
-
-        # perform basic operations that are performed on all
-        # streams
+        self._stream = None
+        # a path to parse when the stream is first needed
+        self._dataPath = None
+        if common.isStr(streamObj):
+            self._dataPath = streamObj
+            if id is None:
+                id = streamObj #@ReservedAssignment
+        else:
+            self._stream = streamObj
 
         # store an id for the source stream: file path url, corpus url
         # or metadata title
@@ -530,25 +636,123 @@ class DataInstance(object):
         # store the class value for this data instance
         self._classValue = None
 
+        # StreamForms are created when first needed
+        self._forms = None
+        self._formsByPart = None
+        self._formsByVoice = None
+        self._partsCount = None
+
+    def _getStream(self):
+        if self._stream is None and self._dataPath is not None:
+            self._stream = _parseDataPath(self._dataPath)
+        return self._stream
+
+    stream = property(_getStream, doc='''
+        The Stream of this DataInstance, parsed from the path given 
+        at creation if not yet parsed.
+        ''')
+
+    def isLoaded(self):
+        '''
+        Return True if the Stream of this DataInstance has been given or 
+        parsed.
+        '''
+        return self._stream is not None
+
+    def _prepareForms(self):
+        '''
+        Create the StreamForms of the Stream and of each of its parts.
+        '''
+        # perform basic operations that are performed on all
+        # streams
+        streamObj = self.stream
         # store a dictionary of StreamForms
-        self._forms = StreamForms(self.stream)
+        self._forms = StreamForms(streamObj)
+        # ties of parts are stripped with those of the Score, so the parts 
+        # of the prepared Score can be shared, rather than copied again
+        base = self._forms._base
+        sharedParts = base is not None and base.hasPartLikeStreams()
         
         # if parts exist, store a forms for each
         self._formsByPart = []
-        if hasattr(self.stream, 'parts'):
-            self.partsCount = len(self.stream.parts)
-            for p in self.stream.parts:
-                # note that this will join ties and expand rests again
-                self._formsByPart.append(StreamForms(p))
+        if hasattr(streamObj, 'parts'):
+            self._partsCount = len(streamObj.parts)
+            if sharedParts:
+                for p in base.parts:
+                    self._formsByPart.append(StreamForms(p, 
+                                             prepareStream=False))
+            else:
+                for p in streamObj.parts:
+                    # note that this will join ties and expand rests again
+                    self._formsByPart.append(StreamForms(p))
         else:
-            self.partsCount = 0
+            self._partsCount = 0
 
         # TODO: store a list of voices, extracted from each part, 
         # presently this will only work on a measure stream
         self._formsByVoice = []
-        if hasattr(self.stream, 'voices'):
-            for v in self.stream.voices:
+        if hasattr(streamObj, 'voices'):
+            for v in streamObj.voices:
                 self._formsByPart.append(StreamForms(v))
+
+    def prepareForms(self, keys):
+        '''
+        Make the forms of `keys`, and the forms they depend on, so that 
+        they are ready for FeatureExtractors. A key starting with 
+        "parts." names a form of each part, or of the whole Stream if 
+        there are no parts, as used by FeatureExtractors that look at 
+        parts one at a time. The `requiredForms` of a FeatureExtractor 
+        are given this way.
+
+        Forms that cannot be made are skipped; the error is raised when 
+        the form is used.
+
+        >>> di = features.DataInstance(corpus.parse('bwv66.6'))
+        >>> di.prepareForms(['pitchClassHistogram', 'parts.contourList'])
+        >>> sorted(di.getFormTimes().keys())
+        ['flat', 'flat.pitches', 'parts.contourList', 'parts.stripTiesByPart', 'pitchClassHistogram', 'prepareStream']
+        '''
+        if self._forms is None:
+            self._prepareForms()
+        for key in keys:
+            if key.startswith('parts.'):
+                key = key[len('parts.'):]
+                if self._partsCount > 0:
+                    formsList = self._formsByPart
+                else:
+                    formsList = [self._forms]
+            else:
+                formsList = [self._forms]
+            for forms in formsList:
+                try:
+                    junk = forms[key]
+                except Exception: # raised again when used
+                    pass
+
+    def getFormTimes(self):
+        '''
+        Return a dictionary of the seconds taken to make each form of the 
+        Stream, and, with keys starting with "parts.", the total seconds 
+        taken to make each form of the parts.
+        '''
+        post = {}
+        if self._forms is None:
+            return post
+        post.update(self._forms.formTimes)
+        for forms in self._formsByPart:
+            for key, value in forms.formTimes.items():
+                key = 'parts.' + key
+                post[key] = post.get(key, 0.0) + value
+        return post
+
+    def _getPartsCount(self):
+        if self._forms is None:
+            self._prepareForms()
+        return self._partsCount
+
+    partsCount = property(_getPartsCount, doc='''
+        The number of Parts in the Stream.
+        ''')
   
     def setClassLabel(self, classLabel, classValue=None):
         '''Set the class label, as well as the class value if known. The class label is the attribute name used to define the class of this data instance.
@@ -594,12 +798,14 @@ class DataInstance(object):
         >>> len(di['flat.getElementsByClass.TimeSignature'])
         4
         '''
+        if self._forms is None:
+            self._prepareForms()
         if key in ['parts']:
             # return a list of Forms for each part
             return self._formsByPart
         elif key in ['voices']:
             # return a list of Forms for voices
-            return self._formsByVoices
+            return self._formsByVoice
         # try to create by calling the attribute
         # will raise an attribute error if there is a problem
         return self._forms[key]
@@ -838,7 +1044,135 @@ class OutputARFF(OutputFormat):
 
 
 
+class OutputNPZ(OutputFormat):
+    '''A NumPy .npz archive of uncompressed arrays: "features", the 
+    matrix of feature values given by 
+    :meth:`~music21.features.base.DataSet.getFeaturesAsArray`, 
+    "labels", its column labels, "classValues", the class value of each 
+    row, and "ids", the id of each row. Requires NumPy.
+
+    >>> of = features.OutputNPZ()
+    >>> of._ext
+    '.npz'
+    '''
+    def __init__(self, dataSet=None):
+        OutputFormat.__init__(self, dataSet=dataSet)
+        self._ext = '.npz'
+
+    def getString(self, includeClassLabel=True, includeId=True, lineBreak=None):
+        raise OutputFormatException('a binary format cannot be given as a string; use write()')
+
+    def write(self, fp=None, includeClassLabel=True, includeId=True):
+        '''Write the file. If not file path is given, a temporary file will be written.
+        '''
+        numpy = _getNumpy()
+        if fp is None:
+            fp = environLocal.getTempFile(suffix=self._ext)
+        if not fp.endswith(self._ext):
+            raise OutputFormatException('file path must end with %s: %s' % (self._ext, fp))
+        matrix, labels, classValues = self._dataSet.getFeaturesAsArray()
+        arrays = {'features': matrix, 'labels': numpy.array(labels)}
+        if includeClassLabel:
+            arrays['classValues'] = classValues
+        if includeId:
+            arrays['ids'] = numpy.array([di.getId() for di in 
+                                         self._dataSet.dataInstances])
+        f = open(fp, 'wb')
+        numpy.savez(f, **arrays)
+        f.close()
+        return fp
+
+
+class OutputNPY(OutputNPZ):
+    '''A NumPy .npy file of the matrix of feature values given by 
+    :meth:`~music21.features.base.DataSet.getFeaturesAsArray`, without 
+    labels, class values, or ids. Unlike a .npz archive, it can be 
+    memory-mapped with `numpy.load(fp, mmap_mode='r')`. Requires NumPy.
+
+    >>> of = features.OutputNPY()
+    >>> of._ext
+    '.npy'
+    '''
+    def __init__(self, dataSet=None):
+        OutputNPZ.__init__(self, dataSet=dataSet)
+        self._ext = '.npy'
+
+    def write(self, fp=None, includeClassLabel=True, includeId=True):
+        '''Write the file. If not file path is given, a temporary file will be written.
+        '''
+        numpy = _getNumpy()
+        if fp is None:
+            fp = environLocal.getTempFile(suffix=self._ext)
+        if not fp.endswith(self._ext):
+            raise OutputFormatException('file path must end with %s: %s' % (self._ext, fp))
+        matrix, unused_labels, unused_classValues = \
+            self._dataSet.getFeaturesAsArray()
+        f = open(fp, 'wb')
+        numpy.save(f, matrix)
+        f.close()
+        return fp
+
+
+
 #-------------------------------------------------------------------------------
+def _getNumpy():
+    '''
+    Import and return NumPy, or raise a DataSetException if it is not 
+    installed.
+    '''
+    from music21 import base as music21Base
+    if 'numpy' in music21Base._missingImport:
+        raise DataSetException('could not find numpy, feature arrays are not available')
+    import numpy
+    return numpy
+
+
+def _extractFeatures(dataInstance, featureExtractors, requiredForms=()):
+    '''
+    Extract the Features of a DataInstance with each of a list of 
+    FeatureExtractors, after making any `requiredForms`. Return a list 
+    of the Features, a list of (feature extractor class name, error 
+    message) pairs of any failures, and the times taken to make forms. 
+    '''
+    failures = []
+    try:
+        dataInstance.stream # parse now, if not yet parsed 
+    except Exception as e: # any error in parsing
+        environLocal.printDebug(['failed to parse:', dataInstance.getId()])
+        failures.append((None, '%s: %s' % (e.__class__.__name__, e)))
+        return [fe.getBlankFeature() for fe in featureExtractors], failures, {}
+    if requiredForms:
+        dataInstance.prepareForms(requiredForms)
+
+    row = []
+    for fe in featureExtractors:
+        fe.setData(dataInstance)
+        # in some cases there might be problem; to not fail 
+        try:
+            fReturned = fe.extract()
+        except Exception as e: # for now take any error
+            environLocal.printDebug(['failed feature extactor:', fe])
+            failures.append((fe.__class__.__name__, 
+                             '%s: %s' % (e.__class__.__name__, e)))
+            # provide a blank feature extactor
+            fReturned = fe.getBlankFeature()
+        row.append(fReturned) # get feature and store
+    return row, failures, dataInstance.getFormTimes()
+
+
+def _processDataWorker(job):
+    '''
+    Extract the Features of a path, or of a serialized Stream, in a 
+    worker process of :meth:`~music21.features.base.DataSet.process`. 
+    '''
+    dataPath, streamStr, featureExtractors, requiredForms = job
+    if dataPath is not None:
+        di = DataInstance(dataPath)
+    else:
+        di = DataInstance(converter.thawStr(streamStr), id='')
+    return _extractFeatures(di, featureExtractors, requiredForms)
+
+
 class DataSetException(exceptions21.Music21Exception):
     pass
 
@@ -865,13 +1199,16 @@ class DataSet(object):
     def __init__(self, classLabel=None, featureExtractors=[]):
         # assume a two dimensional array
         self.dataInstances = []
-        self.streams = []
         # order of feature extractors is the order used in the presentations
         self._featureExtractors = []
         # the label of the class
         self._classLabel = classLabel
         # store a multidimensional storage of all features
         self._features = [] 
+        # (id, feature extractor name, message) for each failure in processing
+        self.failures = []
+        # total seconds taken to make each form, over all DataInstances
+        self.formTimes = {}
         # set extractors
         self.addFeatureExtractors(featureExtractors)
         
@@ -954,51 +1291,143 @@ class DataSet(object):
         '''Add a Stream, DataInstance, or path to a corpus or local file to this data set.
 
         The class value passed here is assumed to be the same as the classLable assigned at startup. 
+
+        Paths are not parsed until processing, or until the DataInstance's 
+        Stream is needed.
         '''
         if self._classLabel is None:
             raise DataSetException('cannot add data unless a class label for this DataSet has been set.')
 
-        s = None
         if isinstance(dataOrStreamOrPath, DataInstance):
             di = dataOrStreamOrPath
-            s = di.stream
         elif common.isStr(dataOrStreamOrPath):
-            # could be corpus or file path
-            if os.path.exists(dataOrStreamOrPath) or dataOrStreamOrPath.startswith('http'):
-                s = converter.parse(dataOrStreamOrPath)
-            else: # assume corpus
-                s = corpus.parse(dataOrStreamOrPath)
+            # could be corpus or file path; 
             # assume we can use this string as an id
-            di = DataInstance(s, id=dataOrStreamOrPath)
+            di = DataInstance(dataOrStreamOrPath, id=dataOrStreamOrPath)
         else:        
             # for now, assume all else are streams
-            s = dataOrStreamOrPath
             di = DataInstance(dataOrStreamOrPath, id=id)
 
         di.setClassLabel(self._classLabel, classValue)
         self.dataInstances.append(di)
-        self.streams.append(s)
 
-    def process(self):
+    def _getStreams(self):
+        return [di.stream for di in self.dataInstances]
+
+    streams = property(_getStreams, doc='''
+        A list of the Streams of the DataInstances, parsing any added as 
+        paths that have not yet been parsed.
+        ''')
+
+    def getRequiredForms(self):
+        '''
+        Return a list of the forms used by the FeatureExtractors of this 
+        DataSet, as given in their `requiredForms`.
+
+        >>> ds = features.DataSet(classLabel='Composer')
+        >>> ds.addFeatureExtractors([features.jSymbolic.PitchClassDistributionFeature, 
+        ...     features.jSymbolic.FifthsPitchHistogramFeature, 
+        ...     features.jSymbolic.DirectionOfMotionFeature])
+        >>> ds.getRequiredForms()
+        ['pitchClassHistogram', 'parts.contourList']
+        '''
+        post = []
+        for fe in self._featureExtractors:
+            for key in fe.requiredForms:
+                if key not in post:
+                    post.append(key)
+        return post
+
+    def process(self, processes=1, prepareForms=False):
         '''Process all Data with all FeatureExtractors. Processed data is stored internally as numerous Feature objects. 
+
+        If `processes` is greater than one, the DataInstances are parsed, 
+        if added as paths, and processed in a pool of that many worker 
+        processes; if None, one fewer than the number of available cores 
+        is used. Features are stored in the order of the DataInstances. 
+        Paths processed in worker processes are not parsed in this one. 
+        Workers use copies of the FeatureExtractors of this DataSet, so any 
+        attributes set on them are kept.
+
+        A FeatureExtractor that fails on a DataInstance gives a blank 
+        Feature; each failure is recorded in `failures` as an (id, feature 
+        extractor class name, error message) tuple. A DataInstance that 
+        cannot be parsed gives blank Features for all FeatureExtractors, 
+        and a failure with a feature extractor name of None.
+
+        If `prepareForms` is True, the forms given by 
+        :meth:`getRequiredForms` are made for each DataInstance before its 
+        features are extracted. The total seconds taken to make each form, 
+        as given by :meth:`~music21.features.base.DataInstance.getFormTimes`, 
+        are stored in `formTimes`.
+
+        >>> ds = features.DataSet(classLabel='Composer')
+        >>> ds.addFeatureExtractors([features.jSymbolic.InitialTimeSignatureFeature])
+        >>> ds.addData('bwv66.6', classValue='Bach')
+        >>> ds.addData('bach/noSuchWork', classValue='Bach')
+        >>> ds.process(processes=2)
+        >>> ds.getFeaturesAsList()
+        [['bwv66.6', 4, 4, 'Bach'], ['bach/noSuchWork', 0, 0, 'Bach']]
+        >>> ds.failures[0][:2]
+        ('bach/noSuchWork', None)
         '''
         # clear features
         self._features = []
-        for data in self.dataInstances:
-            row = []
-            for fe in self._featureExtractors:
-                fe.setData(data)
-                # in some cases there might be problem; to not fail 
-                try:
-                    fReturned = fe.extract()
-                except: # for now take any error
-                    environLocal.printDebug(['failed feature extactor:', fe])
-                    # provide a blank feature extactor
-                    fReturned = fe.getBlankFeature()
-
-                row.append(fReturned) # get feature and store
+        self.failures = []
+        self.formTimes = {}
+        if prepareForms:
+            requiredForms = self.getRequiredForms()
+        else:
+            requiredForms = []
+        if processes is None:
+            processes = multiprocessing.cpu_count() - 1
+        # daemonic processes, such as the workers of a pool, cannot start a pool
+        if processes < 2 or multiprocessing.current_process().daemon:
+            results = (_extractFeatures(di, self._featureExtractors, 
+                                        requiredForms) 
+                       for di in self.dataInstances)
+            self._storeResults(results)
+            return
+
+        # the FeatureExtractors are sent with their configuration, but
+        # without the data of any earlier processing
+        featureExtractors = []
+        for fe in self._featureExtractors:
+            feCopy = copy.copy(fe)
+            feCopy.stream = None
+            feCopy.data = None
+            feCopy._feature = None
+            featureExtractors.append(feCopy)
+        jobs = []
+        for di in self.dataInstances:
+            if di.isLoaded():
+                from music21 import freezeThaw
+                v = freezeThaw.StreamFreezer(di.stream)
+                jobs.append((None, v.writeStr(fmt='pickle'), 
+                             featureExtractors, requiredForms))
+            else:
+                jobs.append((di._dataPath, None, featureExtractors, 
+                             requiredForms))
+        pool = multiprocessing.Pool(processes)
+        try:
+            self._storeResults(pool.imap(_processDataWorker, jobs, 1))
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def _storeResults(self, results):
+        '''
+        Store the (row, failures, formTimes) results of features, failures, 
+        and times taken to make forms of each DataInstance, in order.
+        '''
+        for di, (row, failures, formTimes) in zip(self.dataInstances, results):
             # rows will align with data the order of DataInstances
             self._features.append(row)
+            for featureExtractorName, message in failures:
+                self.failures.append((di.getId(), featureExtractorName, message))
+            for key, value in formTimes.items():
+                self.formTimes[key] = self.formTimes.get(key, 0.0) + value
 
     def getFeaturesAsList(self, includeClassLabel=True, includeId=True, concatenateLists=True):
         '''Get processed data as a list of lists, merging any sub-lists in multi-dimensional features. 
@@ -1023,6 +1452,32 @@ class DataSet(object):
         else:
             return post
 
+    def getFeaturesAsArray(self):
+        '''
+        Get processed data as a NumPy matrix of floats, with a row for each 
+        DataInstance and a column for each dimension of each feature. 
+        Return a tuple of the matrix, a list of the column labels, and a 
+        NumPy array of the class value of each row. Requires NumPy.
+
+        The matrix is filled in place, without first making a list of 
+        lists, and is contiguous, so it can be given directly to 
+        machine learning libraries, or written with the 'npz' or 'npy' 
+        formats.
+        '''
+        numpy = _getNumpy()
+        labels = self.getAttributeLabels(includeClassLabel=False, 
+                                         includeId=False)
+        matrix = numpy.zeros((len(self._features), len(labels)), 
+                             dtype=numpy.float64)
+        for i, row in enumerate(self._features):
+            j = 0
+            for f in row:
+                matrix[i, j:j + f.dimensions] = f.vector
+                j += f.dimensions
+        classValues = numpy.array([di.getClassValue() for di in 
+                                   self.dataInstances])
+        return matrix, labels, classValues
+
     def getUniqueClassValues(self):
         '''Return a list of unique class values.
         '''
@@ -1040,6 +1495,10 @@ class DataSet(object):
             outputFormat = OutputCSV(dataSet=self)
         elif featureFormat.lower() in ['arff', 'attribute']:
             outputFormat = OutputARFF(dataSet=self)
+        elif featureFormat.lower() in ['npz', 'numpy']:
+            outputFormat = OutputNPZ(dataSet=self)
+        elif featureFormat.lower() in ['npy']:
+            outputFormat = OutputNPY(dataSet=self)
         else:
             return None
         return outputFormat
@@ -1084,7 +1543,7 @@ class DataSet(object):
         if OutputFormat is None:
             raise DataSetException('no output format could be defined from file path %s or format %s' % (fp, format))
 
-        outputFormat.write(fp=fp, includeClassLabel=includeClassLabel)
+        return outputFormat.write(fp=fp, includeClassLabel=includeClassLabel)
         
 def allFeaturesAsList(streamInput):
     '''
@@ -1387,7 +1846,113 @@ class Test(unittest.TestCase):
         
         # process with all feature extractors, store all features
         ds.process()
+        # failures are recorded for each data instance and extractor
+        self.assertEqual(len(ds.failures), 6)
+        self.assertEqual([x[1] for x in ds.failures[:3]], 
+            ['RangeFeature', 'PrimaryRegisterFeature', 
+             'ImportanceOfBassRegisterFeature'])
+
+    def testDataSetProcessParallel(self):
+        from music21 import features
+        from music21 import note
+
+        featureExtractors = (
+            features.extractorsById(['ql1', 'ql2', 'ql4'], 'native') + 
+            features.extractorsById(['p20', 'm1'], 'jSymbolic'))
+        s = stream.Stream()
+        for ql in [1, 0.5, 0.5, 2]:
+            s.append(note.Note('e4', quarterLength=ql))
+        post = []
+        for processes in (1, 2):
+            ds = features.DataSet(classLabel='Composer')
+            ds.addFeatureExtractors(featureExtractors)
+            # the configuration of each FeatureExtractor is kept in workers
+            ds._featureExtractors[-1].normalize = False
+            ds.addData('bwv66.6', classValue='Bach')
+            ds.addData(s, classValue='Anonymous', id='s')
+            ds.addData('hwv56/movement3-05.md', classValue='Handel')
+            ds.addData('bach/noSuchWork', classValue='Bach')
+            # paths are not parsed when added
+            self.assertEqual([di.isLoaded() for di in ds.dataInstances], 
+                             [False, True, False, False])
+            ds.process(processes=processes)
+            post.append(ds.getFeaturesAsList())
+            self.assertEqual([x[:2] for x in ds.failures], 
+                             [('bach/noSuchWork', None)])
+            if processes == 2:
+                # paths processed in workers are not parsed here
+                self.assertEqual([di.isLoaded() for di in ds.dataInstances], 
+                                 [False, True, False, False])
+        self.assertEqual(post[0], post[1])
+        self.assertEqual([row[0] for row in post[1]], 
+            ['bwv66.6', 's', 'hwv56/movement3-05.md', 'bach/noSuchWork'])
+        self.assertEqual(post[1][1][1:4], [3, 0.5, 1.5])
+        self.assertEqual(post[1][0][-13:-1], 
+                         [0, 32, 12, 1, 16, 6, 29, 0, 14, 22, 3, 28])
+
+
+    def testRequiredForms(self):
+        from music21 import features
+        from music21.features import jSymbolic, native
+
+        s = corpus.parse('hwv56/movement3-05.md')
+        for fe in jSymbolic.featureExtractors + native.featureExtractors:
+            if fe.__name__ == 'ComposerPopularity': # needs a network
+                continue
+            di = features.DataInstance(s)
+            di.prepareForms(fe.requiredForms)
+            made = sorted(di.getFormTimes().keys())
+            try:
+                fe(di).extract()
+            except Exception: # some extractors fail on this work
+                pass
+            # no forms other than those prepared are needed
+            self.assertEqual(sorted(di.getFormTimes().keys()), made, fe)
+
+        # shared intermediate forms are only made once
+        di = features.DataInstance(s)
+        di.prepareForms(['midiIntervalHistogram', 'contourList', 
+                         'pitchClassHistogram', 'midiPitchHistogram'])
+        self.assertEqual(sorted(di.getFormTimes().keys()), 
+            ['contourList', 'flat', 'flat.pitches', 'midiIntervalHistogram', 
+             'midiPitchHistogram', 'pitchClassHistogram', 'prepareStream', 
+             'stripTiesByPart'])
+
+
+    def testFeaturesAsArray(self):
+        from music21 import base as music21Base
+        from music21 import features
+        if 'numpy' in music21Base._missingImport:
+            self.skipTest('numpy is not installed')
+        import numpy
+
+        featureExtractors = features.extractorsById(['ql1', 'ql2', 'ql4'], 'native')
+        ds = features.DataSet(classLabel='Composer')
+        ds.addFeatureExtractors(featureExtractors)
+        ds.addFeatureExtractors(features.jSymbolic.InitialTimeSignatureFeature)
+        ds.addData('bwv66.6', classValue='Bach')
+        ds.addData('hwv56/movement3-05.md', classValue='Handel')
+        ds.process()
 
+        matrix, labels, classValues = ds.getFeaturesAsArray()
+        self.assertEqual(matrix.shape, (2, 5))
+        self.assertTrue(matrix.flags['C_CONTIGUOUS'])
+        self.assertEqual(matrix.tolist(), 
+            [[3.0, 1.0, 1.5, 4.0, 4.0], [7.0, 0.5, 3.75, 4.0, 4.0]])
+        self.assertEqual(labels, ds.getAttributeLabels(includeClassLabel=False, 
+                                                       includeId=False))
+        self.assertEqual(classValues.tolist(), ['Bach', 'Handel'])
+
+        fp = ds.write(format='npz')
+        data = numpy.load(fp)
+        self.assertEqual(data['features'].tolist(), matrix.tolist())
+        self.assertEqual(data['labels'].tolist(), labels)
+        self.assertEqual(data['ids'].tolist(), ['bwv66.6', 'hwv56/movement3-05.md'])
+        self.assertEqual(data['classValues'].tolist(), ['Bach', 'Handel'])
+
+        fp = ds.write(format='npy')
+        mapped = numpy.load(fp, mmap_mode='r')
+        self.assertEqual(mapped.tolist(), matrix.tolist())
 
 
     #---------------------------------------------------------------------------
@@ -72,6 +72,7 @@ class MelodicIntervalHistogramFeature(featuresModule.FeatureExtractor):
     [0.146..., 0.853..., 1.0, 0.292..., 0.209..., 0.139..., 0.101..., 0.257..., 0.22299..., 0.456..., 0.1289..., 0.0871..., 0.233..., 0.07317..., 0.03832..., 0.031..., 0.0278..., 0.0139..., 0.01742..., 0.00348..., 0.0, 0.017..., 0.003484..., 0.01742..., 0.00348..., 0.0, 0.00348..., 0.0, 0.0174..., 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
     '''
     id = 'M1'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
  
@@ -99,6 +100,7 @@ class AverageMelodicIntervalFeature(featuresModule.FeatureExtractor):
     [2.0714...]
     '''
     id = 'M2'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
  
@@ -130,6 +132,7 @@ class MostCommonMelodicIntervalFeature(featuresModule.FeatureExtractor):
     [0]
     '''
     id = 'M3'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -159,6 +162,7 @@ class DistanceBetweenMostCommonMelodicIntervalsFeature(
     [2]
     '''
     id = 'M4'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -192,6 +196,7 @@ class MostCommonMelodicIntervalPrevalenceFeature(
     [0.3214285...]
     '''
     id = 'M5'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -222,6 +227,7 @@ class RelativeStrengthOfMostCommonIntervalsFeature(
     [0.77777...]
     '''
     id = 'M6'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -255,6 +261,7 @@ class NumberOfCommonMelodicIntervalsFeature(featuresModule.FeatureExtractor):
     [4]
     '''
     id = 'M7'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -285,6 +292,7 @@ class AmountOfArpeggiationFeature(featuresModule.FeatureExtractor):
     'Amount of Arpeggiation'
     '''
     id = 'M8'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -315,6 +323,7 @@ class RepeatedNotesFeature(featuresModule.FeatureExtractor):
     
     '''
     id = 'M9'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
  
@@ -344,6 +353,7 @@ class ChromaticMotionFeature(featuresModule.FeatureExtractor):
     
     '''
     id = 'm10'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -373,6 +383,7 @@ class StepwiseMotionFeature(featuresModule.FeatureExtractor):
     
     '''
     id = 'M11'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
  
@@ -402,6 +413,7 @@ class MelodicThirdsFeature(featuresModule.FeatureExtractor):
     
     '''
     id = 'M12'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -432,6 +444,7 @@ class MelodicFifthsFeature(featuresModule.FeatureExtractor):
     
     '''
     id = 'M13'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -462,6 +475,7 @@ class MelodicTritonesFeature(featuresModule.FeatureExtractor):
     
     '''
     id = 'M14'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -492,6 +506,7 @@ class MelodicOctavesFeature(featuresModule.FeatureExtractor):
     
     '''
     id = 'M15'
+    requiredForms = ('midiIntervalHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -529,6 +544,7 @@ class DirectionOfMotionFeature(featuresModule.FeatureExtractor):
     [0.5263...]
     '''
     id = 'm17'
+    requiredForms = ('parts.contourList',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -570,6 +586,7 @@ class DurationOfMelodicArcsFeature(featuresModule.FeatureExtractor):
     [3.1666...]
     '''
     id = 'M18'
+    requiredForms = ('parts.contourList',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -638,6 +655,7 @@ class SizeOfMelodicArcsFeature(featuresModule.FeatureExtractor):
     [8.5]
     '''
     id = 'M19'
+    requiredForms = ('parts.contourList',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -694,6 +712,7 @@ class MostCommonPitchPrevalenceFeature(featuresModule.FeatureExtractor):
     0.3...
     '''
     id = 'P1'
+    requiredForms = ('midiPitchHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
  
@@ -724,6 +743,7 @@ class MostCommonPitchClassPrevalenceFeature(featuresModule.FeatureExtractor):
     [0.333333333...]
     '''
     id = 'P2'
+    requiredForms = ('pitchClassHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -755,6 +775,7 @@ class RelativeStrengthOfTopPitchesFeature(featuresModule.FeatureExtractor):
     [0.5555555555...]
     '''
     id = 'P3'
+    requiredForms = ('midiPitchHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -790,6 +811,7 @@ class RelativeStrengthOfTopPitchClassesFeature(featuresModule.FeatureExtractor):
     [0.5]
     '''
     id = 'P4'
+    requiredForms = ('pitchClassHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
  
@@ -826,6 +848,7 @@ class IntervalBetweenStrongestPitchesFeature(featuresModule.FeatureExtractor):
     [2]
     '''
     id = 'P5'
+    requiredForms = ('midiPitchHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -861,6 +884,7 @@ class IntervalBetweenStrongestPitchClassesFeature(
     '''
     id = 'P6'
 
+    requiredForms = ('pitchClassHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -896,6 +920,7 @@ class NumberOfCommonPitchesFeature(featuresModule.FeatureExtractor):
     '''
     id = 'P7'
 
+    requiredForms = ('midiPitchHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -927,6 +952,7 @@ class PitchVarietyFeature(featuresModule.FeatureExtractor):
     '''
     id = 'P8'
 
+    requiredForms = ('midiPitchHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -957,6 +983,7 @@ class PitchClassVarietyFeature(featuresModule.FeatureExtractor):
     '''
     id = 'P9'
 
+    requiredForms = ('pitchClassHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -987,6 +1014,7 @@ class RangeFeature(featuresModule.FeatureExtractor):
     '''
     id = 'P10'
 
+    requiredForms = ('midiPitchHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -1018,6 +1046,7 @@ class MostCommonPitchFeature(featuresModule.FeatureExtractor):
     [0.5078125]
     '''
     id = 'P11'
+    requiredForms = ('midiPitchHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
  
@@ -1046,6 +1075,7 @@ class PrimaryRegisterFeature(featuresModule.FeatureExtractor):
     '''
     id = 'P12'
 
+    requiredForms = ('midiPitchHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
  
@@ -1077,6 +1107,7 @@ class ImportanceOfBassRegisterFeature(featuresModule.FeatureExtractor):
     [0.266666...]
     '''
     id = 'P13'
+    requiredForms = ('midiPitchHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -1109,6 +1140,7 @@ class ImportanceOfMiddleRegisterFeature(featuresModule.FeatureExtractor):
     [0.73333333...]
     '''
     id = 'P14'
+    requiredForms = ('midiPitchHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -1143,6 +1175,7 @@ class ImportanceOfHighRegisterFeature(featuresModule.FeatureExtractor):
     '''
     id = 'P15'
 
+    requiredForms = ('midiPitchHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -1176,6 +1209,7 @@ class MostCommonPitchClassFeature(featuresModule.FeatureExtractor):
     [5]
     '''
     id = 'P16'
+    requiredForms = ('pitchClassHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -1236,6 +1270,7 @@ class BasicPitchHistogramFeature(featuresModule.FeatureExtractor):
     [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.052631578..., 0.0, 0.0, 0.052631578..., 0.05263157894..., 0.2631578..., 0.0, 0.3157894..., 0.1052631..., 0.0, 0.052631..., 0.157894736..., 0.5263157..., 0.0, 0.368421052..., 0.6315789473..., 0.105263157..., 0.78947368..., 0.0, 1.0, 0.52631578..., 0.052631578..., 0.736842105..., 0.1578947..., 0.9473684..., 0.0, 0.36842105..., 0.47368421..., 0.0, 0.42105263..., 0.0, 0.36842105..., 0.0, 0.0, 0.052631578..., 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
     '''
     id = 'P19'
+    requiredForms = ('midiPitchHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -1266,6 +1301,7 @@ class PitchClassDistributionFeature(featuresModule.FeatureExtractor):
 
     '''
     id = 'P20'
+    requiredForms = ('pitchClassHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -1299,6 +1335,7 @@ class FifthsPitchHistogramFeature(featuresModule.FeatureExtractor):
     [0.0, 0.0, 0.375, 0.6875, 0.5, 0.875, 0.90625, 1.0, 0.4375, 0.03125, 0.09375, 0.1875]
     '''
     id = 'P21'
+    requiredForms = ('pitchClassHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -1341,6 +1378,7 @@ class QualityFeature(featuresModule.FeatureExtractor):
     '''
     id = 'P22'
 
+    requiredForms = ('flat.getElementsByClass.KeySignature',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -1711,6 +1749,7 @@ class NoteDensityFeature(featuresModule.FeatureExtractor):
     [12]
     '''
     id = 'R15'
+    requiredForms = ('secondsMap',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -1766,6 +1805,7 @@ class AverageNoteDurationFeature(featuresModule.FeatureExtractor):
     [0.220858...]
     '''
     id = 'R17'
+    requiredForms = ('secondsMap',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -1809,6 +1849,7 @@ class MaximumNoteDurationFeature(featuresModule.FeatureExtractor):
     [1.0]
     '''
     id = 'R19'
+    requiredForms = ('secondsMap',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -1836,6 +1877,7 @@ class MinimumNoteDurationFeature(featuresModule.FeatureExtractor):
     [0.25]
     '''
     id = 'R20'
+    requiredForms = ('secondsMap',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
  
@@ -1864,6 +1906,7 @@ class StaccatoIncidenceFeature(featuresModule.FeatureExtractor):
     [0.0]
     '''
     id = 'R21'
+    requiredForms = ('secondsMap',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -1892,6 +1935,7 @@ class AverageTimeBetweenAttacksFeature(featuresModule.FeatureExtractor):
     0.35
     '''
     id = 'R22'
+    requiredForms = ('secondsMap',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -1927,6 +1971,7 @@ class VariabilityOfTimeBetweenAttacksFeature(featuresModule.FeatureExtractor):
     [0.15000...]
     '''
     id = 'R23'
+    requiredForms = ('secondsMap',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
  
@@ -1964,6 +2009,7 @@ class AverageTimeBetweenAttacksForEachVoiceFeature(
     [0.4428...]
     '''
     id = 'R24'
+    requiredForms = ('parts.secondsMap',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2012,6 +2058,7 @@ class AverageVariabilityOfTimeBetweenAttacksForEachVoiceFeature(
     [0.1773926...]
     '''
     id = 'R25'
+    requiredForms = ('parts.secondsMap',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2125,6 +2172,7 @@ class InitialTempoFeature(featuresModule.FeatureExtractor):
 
     '''
     id = 'R30'
+    requiredForms = ('metronomeMarkBoundaries',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2152,6 +2200,7 @@ class InitialTimeSignatureFeature(featuresModule.FeatureExtractor):
 
     '''
     id = 'R31'
+    requiredForms = ('flat.getElementsByClass.TimeSignature',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2187,6 +2236,7 @@ class CompoundOrSimpleMeterFeature(featuresModule.FeatureExtractor):
     [1]
     '''
     id = 'R32'
+    requiredForms = ('flat.getElementsByClass.TimeSignature',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2226,6 +2276,7 @@ class TripleMeterFeature(featuresModule.FeatureExtractor):
     [1]
     '''
     id = 'R33'
+    requiredForms = ('flat.getElementsByClass.TimeSignature',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2257,6 +2308,7 @@ class QuintupleMeterFeature(featuresModule.FeatureExtractor):
     [0]
     '''
     id = 'R34'
+    requiredForms = ('flat.getElementsByClass.TimeSignature',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2291,6 +2343,7 @@ class ChangesOfMeterFeature(featuresModule.FeatureExtractor):
 
     '''
     id = 'R35'
+    requiredForms = ('flat.getElementsByClass.TimeSignature',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2401,6 +2454,7 @@ class MaximumNumberOfIndependentVoicesFeature(featuresModule.FeatureExtractor):
 
     '''
     id = 'T1'
+    requiredForms = ('chordify.getElementsByClass.Chord',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2442,6 +2496,7 @@ class AverageNumberOfIndependentVoicesFeature(featuresModule.FeatureExtractor):
     [3.96...]
     '''
     id = 'T2'
+    requiredForms = ('chordify.getElementsByClass.Chord',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2477,6 +2532,7 @@ class VariabilityOfNumberOfIndependentVoicesFeature(
     [0.489...]
     '''
     id = 'T3'
+    requiredForms = ('chordify.getElementsByClass.Chord',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2676,6 +2732,7 @@ class PitchedInstrumentsPresentFeature(featuresModule.FeatureExtractor):
     [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
     '''
     id = 'I1'
+    requiredForms = ('partitionByInstrument',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2696,8 +2753,9 @@ class PitchedInstrumentsPresentFeature(featuresModule.FeatureExtractor):
                 x = p.getElementsByClass('Instrument')
                 if len(x) > 0 :
                     i = x[0]
-                    if len(p.flat.notes) > 0:
+                    for unused_offset, n in p.iterFlat('NotRest'):
                         self._feature.vector[i.midiProgram] = 1
+                        break
                 else:
                     pass
         else:
@@ -2737,6 +2795,7 @@ class NotePrevalenceOfPitchedInstrumentsFeature(
 
     '''
     id = 'I3'
+    requiredForms = ('partitionByInstrument', 'pitchClassHistogram')
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2756,8 +2815,9 @@ class NotePrevalenceOfPitchedInstrumentsFeature(
         for p in s.parts:
             # always one instrument
             i = p.getElementsByClass('Instrument')[0]
-            if len(p.flat.notes) > 0:
-                self._feature.vector[i.midiProgram] = len(p.flat.notes) / float(total)
+            noteCount = len(list(p.iterFlat('NotRest')))
+            if noteCount > 0:
+                self._feature.vector[i.midiProgram] = noteCount / float(total)
 
 
 class NotePrevalenceOfUnpitchedInstrumentsFeature(
@@ -2808,6 +2868,7 @@ class VariabilityOfNotePrevalenceOfPitchedInstrumentsFeature(
 
     '''
     id = 'I6'
+    requiredForms = ('partitionByInstrument', 'pitchClassHistogram')
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
  
@@ -2824,8 +2885,9 @@ class VariabilityOfNotePrevalenceOfPitchedInstrumentsFeature(
         for p in s.parts:
             # always one instrument
             i = p.getElementsByClass('Instrument')[0]
-            if len(p.flat.notes) > 0:
-                coll.append(len(p.flat.notes) / float(total))
+            noteCount = len(list(p.iterFlat('NotRest')))
+            if noteCount > 0:
+                coll.append(noteCount / float(total))
         # would be faster to use numpy
         #numpy.std(coll)
         mean = sum(coll) / len(coll)
@@ -2864,6 +2926,7 @@ class NumberOfPitchedInstrumentsFeature(featuresModule.FeatureExtractor):
         
     '''
     id = 'I8'
+    requiredForms = ('partitionByInstrument',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2879,8 +2942,9 @@ class NumberOfPitchedInstrumentsFeature(featuresModule.FeatureExtractor):
         # each part has content for each instrument
         count = 0
         for p in s.parts:
-            if len(p.flat.notes) > 0:
+            for unused_offset, n in p.iterFlat('NotRest'):
                 count += 1
+                break
         self._feature.vector[0] = count
 
 
@@ -2921,6 +2985,7 @@ class PercussionPrevalenceFeature(featuresModule.FeatureExtractor):
 class InstrumentFractionFeature(featuresModule.FeatureExtractor):
     '''This subclass is in-turn subclassed by all FeatureExtractors that look at the proportional usage of an Insutrment
     '''
+    requiredForms = ('partitionByInstrument', 'pitchClassHistogram')
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -2936,7 +3001,7 @@ class InstrumentFractionFeature(featuresModule.FeatureExtractor):
         for p in s.parts:
             i = p.getElementsByClass('Instrument')[0]
             if i.midiProgram in self._targetPrograms:
-                count += len(p.flat.notes)
+                count += len(list(p.iterFlat('NotRest')))
         self._feature.vector[0] = count / float(total)
 
 
@@ -102,6 +102,7 @@ class QualityFeature(featuresModule.FeatureExtractor):
     '''
     id = 'P22'
 
+    requiredForms = ('flat.getElementsByClass.KeySignature', 'flat.analyzedKey')
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -152,6 +153,7 @@ class TonalCertainty(featuresModule.FeatureExtractor):
 
     '''
     id = 'K1' # TODO: need id
+    requiredForms = ('flat.tonalCertainty',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -200,6 +202,7 @@ class UniqueNoteQuarterLengths(featuresModule.FeatureExtractor):
     [7]
     '''
     id = 'QL1'
+    requiredForms = ('noteQuarterLengthHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -229,6 +232,7 @@ class MostCommonNoteQuarterLength(featuresModule.FeatureExtractor):
     [0.5]
     '''
     id = 'QL2'
+    requiredForms = ('noteQuarterLengthHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -260,6 +264,7 @@ class MostCommonNoteQuarterLengthPrevalence(featuresModule.FeatureExtractor):
     [0.533333...]
     '''
     id = 'QL3'
+    requiredForms = ('noteQuarterLengthHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -294,6 +299,7 @@ class RangeOfNoteQuarterLengths(featuresModule.FeatureExtractor):
     [3.75]
     '''
     id = 'QL4'
+    requiredForms = ('noteQuarterLengthHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -331,6 +337,7 @@ class UniquePitchClassSetSimultaneities(featuresModule.FeatureExtractor):
     [16]
     '''
     id = 'CS1'
+    requiredForms = ('chordifyPitchClassSetHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -361,6 +368,7 @@ class UniqueSetClassSimultaneities(featuresModule.FeatureExtractor):
     [5]
     '''
     id = 'CS2'
+    requiredForms = ('chordifySetClassHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -392,6 +400,7 @@ class MostCommonPitchClassSetSimultaneityPrevalence(
     [0.1333333333333...]
     '''
     id = 'CS3'
+    requiredForms = ('chordifyPitchClassSetHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -431,6 +440,7 @@ class MostCommonSetClassSimultaneityPrevalence(featuresModule.FeatureExtractor):
     [0.184...]
     '''
     id = 'CS4'
+    requiredForms = ('chordifySetClassHistogram',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -466,6 +476,7 @@ class MajorTriadSimultaneityPrevalence(featuresModule.FeatureExtractor):
     [0.1333333...]
     '''
     id = 'CS5'
+    requiredForms = ('chordify.getElementsByClass.Chord', 'chordifyTypesHistogram')
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -496,6 +507,7 @@ class MinorTriadSimultaneityPrevalence(featuresModule.FeatureExtractor):
     [0.13333333...]
     '''
     id = 'CS6'
+    requiredForms = ('chordify.getElementsByClass.Chord', 'chordifyTypesHistogram')
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -525,6 +537,7 @@ class DominantSeventhSimultaneityPrevalence(featuresModule.FeatureExtractor):
     [0.0]
     '''
     id = 'CS7'
+    requiredForms = ('chordify.getElementsByClass.Chord', 'chordifyTypesHistogram')
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -554,6 +567,7 @@ class DiminishedTriadSimultaneityPrevalence(featuresModule.FeatureExtractor):
     [0.018867924528...]
     '''
     id = 'CS8'
+    requiredForms = ('chordify.getElementsByClass.Chord', 'chordifyTypesHistogram')
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -589,6 +603,7 @@ class TriadSimultaneityPrevalence(featuresModule.FeatureExtractor):
     [0.022727...]
     '''
     id = 'CS9'
+    requiredForms = ('chordify.getElementsByClass.Chord', 'chordifyTypesHistogram')
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -619,6 +634,7 @@ class DiminishedSeventhSimultaneityPrevalence(featuresModule.FeatureExtractor):
     [0.0]
     '''
     id = 'CS10'
+    requiredForms = ('chordify.getElementsByClass.Chord', 'chordifyTypesHistogram')
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -662,6 +678,7 @@ class IncorrectlySpelledTriadPrevalence(featuresModule.FeatureExtractor):
     [0.007...]
     '''
     id = 'CS11'
+    requiredForms = ('chordifyTypesHistogram', 'chordifySetClassHistogram')
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -710,6 +727,7 @@ class ChordBassMotionFeature(featuresModule.FeatureExtractor):
     
     '''
     id = 'CS12'
+    requiredForms = ('flat.getElementsByClass.Harmony',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -785,6 +803,7 @@ class ComposerPopularity(featuresModule.FeatureExtractor):
     True
     '''
     id = 'MD1'
+    requiredForms = ('metadata',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -836,6 +855,7 @@ class LandiniCadence(featuresModule.FeatureExtractor):
     
     '''
     id = 'MC1'
+    requiredForms = ('parts.contourList',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
@@ -903,6 +923,7 @@ class LanguageFeature(featuresModule.FeatureExtractor):
     '''
     id = 'TX1'
 
+    requiredForms = ('assembledLyrics',)
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         featuresModule.FeatureExtractor.__init__(self, dataOrStream=dataOrStream,  *arguments, **keywords)
 
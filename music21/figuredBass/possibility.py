@@ -912,6 +912,35 @@ def couldBeItalianA6Resolution(possibA, possibB, threePartChordInfo = None, rest
     
     return True
 
+# COST METHODS
+# ------------
+def voiceLeadingDistance(possibA, possibB):
+    '''
+    Returns the total distance in semitones moved by the parts of possibA
+    going to possibB. Used as the default cost of a movement by
+    :meth:`~music21.figuredBass.realizer.Realization.getBestPossibilityProgressions`.
+    
+    >>> from music21 import pitch
+    >>> from music21.figuredBass import possibility
+    >>> C4 = pitch.Pitch('C4')
+    >>> D4 = pitch.Pitch('D4')
+    >>> E4 = pitch.Pitch('E4')
+    >>> F4 = pitch.Pitch('F4')
+    >>> G4 = pitch.Pitch('G4')
+    >>> B4 = pitch.Pitch('B4')
+    >>> C5 = pitch.Pitch('C5')
+    >>> possibA1 = (C5, G4, E4, C4)
+    >>> possibB1 = (B4, F4, D4, D4)
+    >>> possibility.voiceLeadingDistance(possibA1, possibB1)
+    7.0
+    >>> possibility.voiceLeadingDistance(possibA1, possibA1)
+    0.0
+    '''
+    distance = 0.0
+    for (pitchA, pitchB) in partPairs(possibA, possibB):
+        distance += abs(pitchB.ps - pitchA.ps)
+    return distance
+
 # HELPER METHODS
 # --------------
 def partPairs(possibA, possibB):
@@ -944,6 +973,189 @@ def partPairs(possibA, possibB):
     '''
     return list(itertools.izip(possibA, possibB))
 
+# ENCODED POSSIBILITIES
+# ---------------------
+class EncodedPossibility(object):
+    '''
+    A possibility together with the numbers which the rule checking methods
+    read from its pitches: pitch space values, spellings, pitch names, and two
+    bit masks marking which pairs of parts are separated by a (compound) fifth
+    or by a unison or (compound) octave. Part pairs are numbered in the order
+    (1,2), (1,3), ..., (1,n), (2,3), ..., so the outer voices are bit n-2.
+
+    The values are read once per possibility instead of once per rule per pair
+    of possibilities, and most pairs of possibilities can be cleared of parallel
+    or hidden intervals by a bitwise and of their masks.
+    
+    >>> from music21 import pitch
+    >>> from music21.figuredBass import possibility
+    >>> G5 = pitch.Pitch('G5')
+    >>> C5 = pitch.Pitch('C5')
+    >>> E4 = pitch.Pitch('E4')
+    >>> C4 = pitch.Pitch('C4')
+    >>> encodedA = possibility.EncodedPossibility((G5, C5, E4, C4))
+    >>> encodedA.ps
+    (79.0, 72.0, 64.0, 60.0)
+    >>> encodedA.spelling
+    ('G5', 'C5', 'E4', 'C4')
+    >>> sorted(encodedA.names)
+    ['C', 'E', 'G']
+    
+    
+    G5 and C5 form a fifth (bit 0), as do G5 and C4 (bit 2). C5 and C4 form an
+    octave (bit 4).
+    
+    
+    >>> bin(encodedA.fifthMask)
+    '0b101'
+    >>> bin(encodedA.octaveMask)
+    '0b10000'
+    '''
+    __slots__ = ('possib', 'ps', 'spelling', 'names', 'lowerMax', 'fifthMask', 'octaveMask')
+    
+    def __init__(self, possibA, pitchCodes = None):
+        if pitchCodes is None:
+            pitchCodes = [encodePitch(samplePitch) for samplePitch in possibA]
+        self.possib = possibA
+        self.ps = tuple([pitchCode[0] for pitchCode in pitchCodes])
+        self.spelling = tuple([pitchCode[1] for pitchCode in pitchCodes])
+        self.names = frozenset([pitchCode[2] for pitchCode in pitchCodes])
+        
+        psList = self.ps
+        numParts = len(psList)
+        # lowerMax[i] is the highest pitch among the parts below part i+1.
+        lowerMax = []
+        highestBelow = None
+        for partIndex in range(numParts - 1, 0, -1):
+            if highestBelow is None or psList[partIndex] > highestBelow:
+                highestBelow = psList[partIndex]
+            lowerMax.append(highestBelow)
+        lowerMax.reverse()
+        self.lowerMax = tuple(lowerMax)
+        
+        fifthMask = 0
+        octaveMask = 0
+        pairBit = 1
+        for part1Index in range(numParts):
+            higherPs = psList[part1Index]
+            for part2Index in range(part1Index + 1, numParts):
+                simpleSeparation = abs(higherPs - psList[part2Index]) % 12
+                if simpleSeparation == 7:
+                    fifthMask |= pairBit
+                elif simpleSeparation == 0:
+                    octaveMask |= pairBit
+                pairBit <<= 1
+        self.fifthMask = fifthMask
+        self.octaveMask = octaveMask
+
+    def __repr__(self):
+        return '<music21.figuredBass.possibility.EncodedPossibility %s>' % (' '.join(self.spelling))
+
+
+def encodePitch(samplePitch):
+    '''
+    Returns the pitch space value, spelling and name of samplePitch, the values
+    of a pitch which an :class:`~music21.figuredBass.possibility.EncodedPossibility` keeps.
+    Spellings compare equal exactly when the pitches do.
+    
+    >>> from music21 import pitch
+    >>> from music21.figuredBass import possibility
+    >>> possibility.encodePitch(pitch.Pitch('F#4'))
+    (66.0, 'F#4', 'F#')
+    '''
+    if samplePitch.microtone.cents:
+        spelling = samplePitch.fullName
+    else:
+        spelling = samplePitch.nameWithOctave
+    return (samplePitch.ps, spelling, samplePitch.name)
+
+def _encodedVoiceCrossing(encodedA):
+    psList = encodedA.ps
+    for partIndex in range(1, len(psList)):
+        if psList[partIndex] > psList[partIndex - 1]:
+            return True
+    return False
+
+def _encodedIsIncomplete(encodedA, pitchNamesToContain):
+    names = encodedA.names
+    for pitchName in pitchNamesToContain:
+        if pitchName not in names:
+            return True
+    return False
+
+def _encodedUpperPartsWithinLimit(encodedA, maxSemitoneSeparation = 12):
+    if maxSemitoneSeparation == None:
+        return True
+    upperParts = encodedA.ps[0:-1]
+    if not upperParts:
+        return True
+    return max(upperParts) - min(upperParts) <= maxSemitoneSeparation
+
+def _encodedParallelFifths(encodedA, encodedB):
+    if not (encodedA.fifthMask & encodedB.fifthMask):
+        return False
+    return parallelFifths(encodedA.possib, encodedB.possib)
+
+def _encodedParallelOctaves(encodedA, encodedB):
+    if not (encodedA.octaveMask & encodedB.octaveMask):
+        return False
+    return parallelOctaves(encodedA.possib, encodedB.possib)
+
+def _encodedHiddenFifth(encodedA, encodedB):
+    if not (encodedB.fifthMask >> (len(encodedB.ps) - 2)) & 1:
+        return False
+    return hiddenFifth(encodedA.possib, encodedB.possib)
+
+def _encodedHiddenOctave(encodedA, encodedB):
+    if not (encodedB.octaveMask >> (len(encodedB.ps) - 2)) & 1:
+        return False
+    return hiddenOctave(encodedA.possib, encodedB.possib)
+
+def _encodedVoiceOverlap(encodedA, encodedB):
+    psA = encodedA.ps
+    psB = encodedB.ps
+    lowerMaxA = encodedA.lowerMax
+    lowerMaxB = encodedB.lowerMax
+    for partIndex in range(len(lowerMaxA)):
+        if lowerMaxB[partIndex] > psA[partIndex] or psB[partIndex] < lowerMaxA[partIndex]:
+            return True
+    return False
+
+def _encodedPartMovementsWithinLimits(encodedA, encodedB, partMovementLimits = []):
+    psA = encodedA.ps
+    psB = encodedB.ps
+    for (partNumber, maxSeparation) in partMovementLimits:
+        if abs(psB[partNumber - 1] - psA[partNumber - 1]) > maxSeparation:
+            return False
+    return True
+
+def _encodedUpperPartsSame(encodedA, encodedB):
+    return encodedA.spelling[0:-1] == encodedB.spelling[0:-1]
+
+def _encodedPartsSame(encodedA, encodedB, partsToCheck = None):
+    if partsToCheck == None:
+        return True
+    spellingA = encodedA.spelling
+    spellingB = encodedB.spelling
+    for partNumber in partsToCheck:
+        if spellingA[partNumber - 1] != spellingB[partNumber - 1]:
+            return False
+    return True
+
+# rule checking methods on possibilities, mapped to their counterparts
+# on encoded possibilities, which take the same arguments and return the same values.
+encodedSingleMethods = {voiceCrossing: _encodedVoiceCrossing,
+                        isIncomplete: _encodedIsIncomplete,
+                        upperPartsWithinLimit: _encodedUpperPartsWithinLimit}
+encodedConsecutiveMethods = {parallelFifths: _encodedParallelFifths,
+                             parallelOctaves: _encodedParallelOctaves,
+                             hiddenFifth: _encodedHiddenFifth,
+                             hiddenOctave: _encodedHiddenOctave,
+                             voiceOverlap: _encodedVoiceOverlap,
+                             partMovementsWithinLimits: _encodedPartMovementsWithinLimits,
+                             upperPartsSame: _encodedUpperPartsSame,
+                             partsSame: _encodedPartsSame}
+
 # apply a function to one pitch of possibA at a time
 # apply a function to two pitches of possibA at a time
 # apply a function to one partPair of possibA, possibB at a time
@@ -958,7 +1170,7 @@ singlePossibilityMethods.sort(None, lambda x: x.__name__)
 consequentPossibilityMethods = [parallelFifths, parallelOctaves, hiddenFifth, hiddenOctave, voiceOverlap, 
                                   partMovementsWithinLimits, upperPartsSame, couldBeItalianA6Resolution]
 consequentPossibilityMethods.sort(None, lambda x: x.__name__)
-_DOC_ORDER = singlePossibilityMethods + [partPairs] + consequentPossibilityMethods
+_DOC_ORDER = singlePossibilityMethods + [partPairs] + consequentPossibilityMethods + [voiceLeadingDistance]
 
 
 class PossibilityException(exceptions21.Music21Exception):
@@ -970,6 +1182,33 @@ class Test(unittest.TestCase):
     def runTest(self):
         pass
 
+    def testEncodedMethods(self):
+        import random
+        from music21.figuredBass import segment
+        allPitches = segment.getPitches(['C', 'E-', 'G', 'B-', 'D#'], 'C3', 'B5')
+        rand = random.Random(11)
+        possibs = []
+        for unused in range(60):
+            possibs.append(tuple([rand.choice(allPitches) for unused in range(4)]))
+        for possibA in possibs:
+            encodedA = EncodedPossibility(possibA)
+            self.assertEqual(encodedSingleMethods[voiceCrossing](encodedA), voiceCrossing(possibA))
+            self.assertEqual(encodedSingleMethods[isIncomplete](encodedA, ['C', 'E-', 'G']), 
+                             isIncomplete(possibA, ['C', 'E-', 'G']))
+            for maxSeparation in (None, 5, 12):
+                self.assertEqual(encodedSingleMethods[upperPartsWithinLimit](encodedA, maxSeparation), 
+                                 upperPartsWithinLimit(possibA, maxSeparation))
+            for possibB in possibs:
+                encodedB = EncodedPossibility(possibB)
+                for method in (parallelFifths, parallelOctaves, hiddenFifth, hiddenOctave, 
+                               voiceOverlap, upperPartsSame):
+                    self.assertEqual(encodedConsecutiveMethods[method](encodedA, encodedB), 
+                                     method(possibA, possibB))
+                self.assertEqual(encodedConsecutiveMethods[partsSame](encodedA, encodedB, [2, 4]), 
+                                 partsSame(possibA, possibB, [2, 4]))
+                self.assertEqual(encodedConsecutiveMethods[partMovementsWithinLimits](encodedA, encodedB, [(1, 2), (4, 7)]), 
+                                 partMovementsWithinLimits(possibA, possibB, [(1, 2), (4, 7)]))
+
 if __name__ == "__main__":
     import music21
     music21.mainTest(Test)
@@ -42,6 +42,7 @@ See :meth:`~music21.figuredBass.realizer.figuredBassFromStream` for more details
 
 import collections
 import copy
+import heapq
 import itertools
 import random
 import unittest
@@ -58,6 +59,7 @@ from music21 import pitch
 from music21 import stream
 from music21.figuredBass import checker
 from music21.figuredBass import notation
+from music21.figuredBass import possibility
 from music21.figuredBass import realizerScale
 from music21.figuredBass import rules
 from music21.figuredBass import segment
@@ -561,7 +563,9 @@ class Realization(object):
       See :mod:`~music21.figuredBass.possibility` for more details on possibilities.
     '''
     _DOC_ORDER = ['getNumSolutions', 'generateRandomRealization', 'generateRandomRealizations', 'generateAllRealizations',
-                  'getAllPossibilityProgressions', 'getRandomPossibilityProgression', 'generateRealizationFromPossibilityProgression']
+                  'generateBestRealization', 'generateBestRealizations',
+                  'getAllPossibilityProgressions', 'getRandomPossibilityProgression', 'getBestPossibilityProgressions',
+                  'generateRealizationFromPossibilityProgression']
     _DOC_ATTR = {'keyboardStyleOutput': '''True by default. If True, generated realizations are represented in keyboard style, with two staves. If False,
     realizations are represented in chorale style with n staves, where n is the number of parts. SATB if n = 4.'''}
     def __init__(self, **fbLineOutputs):
@@ -678,6 +682,103 @@ class Realization(object):
 
         return progression
 
+    def getBestPossibilityProgressions(self, amountToReturn = 1, costFunction = None):
+        '''
+        Returns a list of the amountToReturn possibility progressions with the lowest
+        total cost, lowest first. The cost of a progression is the sum of
+        costFunction(possibA, possibB) over its movements, where costFunction
+        defaults to :meth:`~music21.figuredBass.possibility.voiceLeadingDistance`.
+        
+        
+        The progressions are found by dynamic programming over the movements
+        of each :class:`~music21.figuredBass.segment.Segment`, keeping at most
+        amountToReturn partial progressions which end in each possibility, so
+        that solutions are never enumerated.
+        
+        >>> from music21.figuredBass import examples
+        >>> from music21.figuredBass import possibility
+        >>> fbLine = examples.exampleB()
+        >>> fbRealization = fbLine.realize()
+        >>> fbRealization.getNumSolutions()
+        422
+        >>> bestProgressions = fbRealization.getBestPossibilityProgressions(3)
+        >>> for possibA in bestProgressions[0]:
+        ...     print ' '.join([p.nameWithOctave for p in possibA])
+        F5 D5 A4 D3
+        E5 C#5 G4 A3
+        D5 D5 F4 B-3
+        D5 A4 F4 F3
+        E5 B-4 E4 G3
+        E5 C#5 G4 A2
+        D5 D5 F4 D3
+        
+        
+        The cost of each movement can be any number. Here, the distance moved
+        is combined with a penalty for hidden octaves.
+        
+        
+        >>> def costWithPenalties(possibA, possibB):
+        ...     cost = possibility.voiceLeadingDistance(possibA, possibB)
+        ...     if possibility.hiddenOctave(possibA, possibB):
+        ...         cost += 10
+        ...     return cost
+        >>> progressionsWithPenalties = fbRealization.getBestPossibilityProgressions(3, costWithPenalties)
+        >>> len(progressionsWithPenalties)
+        3
+        '''
+        if costFunction is None:
+            costFunction = possibility.voiceLeadingDistance
+        if len(self._segmentList) == 1:
+            return [[possibA] for possibA in self._segmentList[0].correctA[0:amountToReturn]]
+        
+        # For each segment, maps each possibility to a list of at most amountToReturn
+        # (cost, order, previous possibility, index of previous entry), cheapest first.
+        bestEntries = [dict((possibA, [(0.0, order, None, None)]) for (order, possibA) in enumerate(self._segmentList[0].movements))]
+        order = 0
+        for segmentIndex in range(len(self._segmentList) - 1):
+            currMovements = self._segmentList[segmentIndex].movements
+            isLastMovement = (segmentIndex == len(self._segmentList) - 2)
+            if not isLastMovement:
+                nextMovements = self._segmentList[segmentIndex + 1].movements
+            heaps = {}
+            for (possibA, entriesA) in bestEntries[-1].iteritems():
+                for possibB in currMovements.get(possibA, []):
+                    if not isLastMovement and possibB not in nextMovements:
+                        continue
+                    movementCost = costFunction(possibA, possibB)
+                    heapB = heaps.setdefault(possibB, [])
+                    for entryIndex in range(len(entriesA)):
+                        order += 1
+                        # heapq keeps the smallest item first, so entries are negated
+                        # to keep the most expensive of the cheapest progressions first.
+                        entryB = (-(entriesA[entryIndex][0] + movementCost), -order, possibA, entryIndex)
+                        if len(heapB) < amountToReturn:
+                            heapq.heappush(heapB, entryB)
+                        elif entryB > heapB[0]:
+                            heapq.heapreplace(heapB, entryB)
+                        else:
+                            break
+            entriesB = {}
+            for (possibB, heapB) in heaps.iteritems():
+                entriesB[possibB] = sorted([(-negCost, -negOrder, possibA, entryIndex) for (negCost, negOrder, possibA, entryIndex) in heapB])
+            bestEntries.append(entriesB)
+
+        lastEntries = []
+        for (possibA, entriesA) in bestEntries[-1].iteritems():
+            for entryIndex in range(len(entriesA)):
+                lastEntries.append((entriesA[entryIndex][0:2], possibA, entryIndex))
+        lastEntries.sort()
+        
+        progressions = []
+        for (unused_costAndOrder, possibA, entryIndex) in lastEntries[0:amountToReturn]:
+            progression = []
+            for segmentIndex in range(len(bestEntries) - 1, -1, -1):
+                progression.append(possibA)
+                (unused_cost, unused_order, possibA, entryIndex) = bestEntries[segmentIndex][possibA][entryIndex]
+            progression.reverse()
+            progressions.append(progression)
+        return progressions
+
     def generateRealizationFromPossibilityProgression(self, possibilityProgression):
         '''
         Generates a realization as a :class:`~music21.stream.Score` given a possibility progression.        
@@ -780,6 +881,38 @@ class Realization(object):
         possibilityProgression = self.getRandomPossibilityProgression()
         return self.generateRealizationFromPossibilityProgression(possibilityProgression)
 
+    def generateBestRealization(self, costFunction = None):
+        '''
+        Generates the realization with the lowest total cost as a :class:`~music21.stream.Score`.
+        See :meth:`~music21.figuredBass.realizer.Realization.getBestPossibilityProgressions`.
+        '''
+        possibilityProgressions = self.getBestPossibilityProgressions(1, costFunction)
+        if len(possibilityProgressions) == 0:
+            raise FiguredBassLineException("Zero solutions")
+        return self.generateRealizationFromPossibilityProgression(possibilityProgressions[0])
+
+    def generateBestRealizations(self, amountToGenerate = 20, costFunction = None):
+        '''
+        Generates the *amountToGenerate* realizations with the lowest total cost,
+        lowest first, as a :class:`~music21.stream.Score`.
+        See :meth:`~music21.figuredBass.realizer.Realization.getBestPossibilityProgressions`.
+        '''
+        allSols = stream.Score()
+        possibilityProgressions = self.getBestPossibilityProgressions(amountToGenerate, costFunction)
+        if len(possibilityProgressions) == 0:
+            raise FiguredBassLineException("Zero solutions")
+        sol0 = self.generateRealizationFromPossibilityProgression(possibilityProgressions[0])
+        for music21Part in sol0:
+            allSols.append(music21Part)
+        
+        for possibIndex in range(1, len(possibilityProgressions)):
+            solX = self.generateRealizationFromPossibilityProgression(possibilityProgressions[possibIndex])
+            for partIndex in range(len(solX)):
+                for music21Measure in solX[partIndex]:
+                    allSols[partIndex].append(music21Measure)
+        
+        return allSols
+
     def generateRandomRealizations(self, amountToGenerate = 20):
         '''
         Generates *amountToGenerate* unique realizations as a :class:`~music21.stream.Score`.
@@ -815,6 +948,19 @@ class Test(unittest.TestCase):
     def runTest(self):
         pass
 
+    def testBestPossibilityProgressions(self):
+        from music21.figuredBass import examples
+        fbRealization = examples.exampleB().realize()
+        def progressionCost(progression):
+            return sum([possibility.voiceLeadingDistance(progression[i], progression[i + 1]) 
+                        for i in range(len(progression) - 1)])
+        allCosts = sorted([progressionCost(progression) for progression in fbRealization.getAllPossibilityProgressions()])
+        bestProgressions = fbRealization.getBestPossibilityProgressions(25)
+        self.assertEqual([progressionCost(progression) for progression in bestProgressions], allCosts[0:25])
+        allProgressions = fbRealization.getBestPossibilityProgressions(1000)
+        self.assertEqual(len(allProgressions), fbRealization.getNumSolutions())
+        self.assertEqual(len(set([tuple(progression) for progression in allProgressions])), len(allProgressions))
+
 if __name__ == "__main__":
     import music21
     music21.mainTest(Test)
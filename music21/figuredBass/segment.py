@@ -107,6 +107,7 @@ class Segment(object):
         self.allPitchesAboveBass = getPitches(self.pitchNamesInChord, self.bassNote.pitch, self._maxPitch)
         self.segmentChord = chord.Chord(self.allPitchesAboveBass, quarterLength = bassNote.quarterLength)
         self._environRules = environment.Environment(_MOD)
+        self._correctSinglePossibilitiesCache = (None, None)
     
     #-------------------------------------------------------------------------------
     # EXTERNAL METHODS
@@ -552,9 +553,7 @@ class Segment(object):
         ['C4', 'C4', 'G4', 'C3']
         ['G4', 'G3', 'C4', 'C3']
         '''
-        iterables = [self.allPitchesAboveBass] * (self.numParts - 1)
-        iterables.append([fbPitch.HashablePitch(self.bassNote.pitch.nameWithOctave)])
-        return itertools.product(*iterables)
+        return itertools.product(*self._partPitches())
     
     def allCorrectSinglePossibilities(self):
         '''
@@ -587,9 +586,7 @@ class Segment(object):
         ['C5', 'G4', 'E4', 'C3']
         ['G5', 'G5', 'E5', 'C3']
         '''
-        self._singlePossibilityRuleChecking = _compileRules(self.singlePossibilityRules(self.fbRules))
-        allA = self.allSinglePossibilities()
-        return itertools.ifilter(lambda possibA: self._isCorrectSinglePossibility(possibA), allA)
+        return iter([encodedA.possib for encodedA in self._allCorrectEncodedPossibilities()])
              
     def allCorrectConsecutivePossibilities(self, segmentB):
         '''
@@ -659,6 +656,102 @@ class Segment(object):
     #-------------------------------------------------------------------------------
     # INTERNAL METHODS
 
+    def _partPitches(self):
+        '''
+        Returns a list with, for each part from highest to lowest, the pitches
+        which that part can take in a possibility.
+        
+        >>> from music21.figuredBass import segment
+        >>> segmentA = segment.Segment()
+        >>> partPitches = segmentA._partPitches()
+        >>> len(partPitches)
+        4
+        >>> partPitches[0] == segmentA.allPitchesAboveBass
+        True
+        >>> partPitches[-1]
+        [<music21.pitch.Pitch C3>]
+        '''
+        iterables = [self.allPitchesAboveBass] * (self.numParts - 1)
+        iterables.append([fbPitch.HashablePitch(self.bassNote.pitch.nameWithOctave)])
+        return iterables
+
+    def _allCorrectEncodedPossibilities(self):
+        '''
+        Returns a list of the correct single possibilities of a Segment, in the order
+        of :meth:`~music21.figuredBass.segment.Segment.allCorrectSinglePossibilities`,
+        as :class:`~music21.figuredBass.possibility.EncodedPossibility` objects.
+        
+        
+        Possibilities are built one part at a time, from the highest part down,
+        and voice crossing and the separation of the upper parts, when forbidden,
+        are checked on each partial possibility, so that the naive possibilities
+        they rule out are never made. The list is kept until the rules
+        or the pitches of the Segment change.
+        
+        >>> from music21.figuredBass import segment
+        >>> segmentA = segment.Segment()
+        >>> encodedPossibilities = segmentA._allCorrectEncodedPossibilities()
+        >>> len(encodedPossibilities)
+        21
+        >>> encodedPossibilities[12]
+        <music21.figuredBass.possibility.EncodedPossibility C5 G4 E4 C3>
+        >>> segmentA._allCorrectEncodedPossibilities() is encodedPossibilities
+        True
+        '''
+        self._singlePossibilityRuleChecking = _compileRules(self.singlePossibilityRules(self.fbRules))
+        ruleChecking = self._singlePossibilityRuleChecking[True]
+        partPitches = self._partPitches()
+        cacheKey = (copy.deepcopy(ruleChecking), [[samplePitch.fullName for samplePitch in pitches] for pitches in partPitches])
+        (previousKey, previousPossibilities) = self._correctSinglePossibilitiesCache
+        if previousKey == cacheKey:
+            return previousPossibilities
+        
+        forbidVoiceCrossing = False
+        maxSemitoneSeparation = None
+        possibilityChecks = []
+        for (method, isCorrect, args) in ruleChecking:
+            if method == possibility.voiceCrossing and isCorrect == False:
+                forbidVoiceCrossing = True
+            elif method == possibility.upperPartsWithinLimit and isCorrect == True and len(args) == 1:
+                if args[0] != None and (maxSemitoneSeparation == None or args[0] < maxSemitoneSeparation):
+                    maxSemitoneSeparation = args[0]
+            else:
+                possibilityChecks.append((_encodedMethod(method, possibility.encodedSingleMethods), isCorrect, args))
+        
+        numParts = len(partPitches)
+        partialPossibilities = [()]
+        for partIndex in range(numParts):
+            partCodes = [possibility.encodePitch(samplePitch) + (samplePitch,) for samplePitch in partPitches[partIndex]]
+            checkSeparation = (maxSemitoneSeparation != None and partIndex < numParts - 1)
+            longerPossibilities = []
+            for partialPossib in partialPossibilities:
+                if partialPossib:
+                    lowestPs = partialPossib[-1][0]
+                    if checkSeparation:
+                        partialPs = [pitchCode[0] for pitchCode in partialPossib]
+                        lowestAllowed = max(partialPs) - maxSemitoneSeparation
+                        highestAllowed = min(partialPs) + maxSemitoneSeparation
+                for pitchCode in partCodes:
+                    if partialPossib:
+                        if forbidVoiceCrossing and pitchCode[0] > lowestPs:
+                            continue
+                        if checkSeparation and not (lowestAllowed <= pitchCode[0] <= highestAllowed):
+                            continue
+                    longerPossibilities.append(partialPossib + (pitchCode,))
+            partialPossibilities = longerPossibilities
+        
+        correctPossibilities = []
+        for pitchCodes in partialPossibilities:
+            encodedA = possibility.EncodedPossibility(tuple([pitchCode[3] for pitchCode in pitchCodes]), pitchCodes)
+            for (method, isCorrect, args) in possibilityChecks:
+                if not (method(encodedA, *args) == isCorrect):
+                    break
+            else:
+                correctPossibilities.append(encodedA)
+        
+        self._correctSinglePossibilitiesCache = (cacheKey, correctPossibilities)
+        return correctPossibilities
+
     def _isCorrectSinglePossibility(self, possibA):
         '''
         Takes in a possibility (possibA) from a segmentA (self) and returns True 
@@ -694,14 +787,17 @@ class Segment(object):
         on self (segmentA) and segmentB, respectively.
         Returns an iterator through (possibA, possibB) pairs for which
         :meth:`~music21.figuredBass.segment.Segment._isCorrectConsecutivePossibility` returns True.
+        The pairs are checked in encoded form, see
+        :class:`~music21.figuredBass.possibility.EncodedPossibility`.
         
         >>> from music21.figuredBass import segment
         '''
         self._consecutivePossibilityRuleChecking = _compileRules(self.consecutivePossibilityRules(self.fbRules))
-        correctA = self.allCorrectSinglePossibilities()
-        correctB = segmentB.allCorrectSinglePossibilities()
-        correctAB = itertools.product(correctA, correctB)
-        return itertools.ifilter(lambda possibAB: self._isCorrectConsecutivePossibility(possibA = possibAB[0], possibB = possibAB[1]), correctAB)        
+        consecutiveChecks = [(_encodedMethod(method, possibility.encodedConsecutiveMethods, 2), isCorrect, args)
+                             for (method, isCorrect, args) in self._consecutivePossibilityRuleChecking[True]]
+        correctA = self._allCorrectEncodedPossibilities()
+        correctB = segmentB._allCorrectEncodedPossibilities()
+        return _correctEncodedPairs(correctA, correctB, consecutiveChecks)
 
     def _resolveSpecialSegment(self, segmentB, specialResolutionMethods):
         resolutionMethodExecutor = _compileRules(specialResolutionMethods, 3)
@@ -735,12 +831,12 @@ class OverlayedSegment(Segment):
     '''
     Class to allow Segments to be overlayed with non-chord notes.
     '''
-    def allSinglePossibilities(self):
+    def _partPitches(self):
         iterables = [self.allPitchesAboveBass] * (self.numParts - 1) # Parts 1 -> n-1
         iterables.append([fbPitch.HashablePitch(self.bassNote.pitch.nameWithOctave)]) # Part n
         for (partNumber, partPitch) in self.fbRules._partPitchLimits:
             iterables[partNumber - 1] = [fbPitch.HashablePitch(partPitch.nameWithOctave)]
-        return itertools.product(*iterables)
+        return iterables
 
     
 # HELPER METHODS
@@ -810,6 +906,27 @@ def _compileRules(rulesList, maxLength = 4):
     
     return ruleChecking
 
+def _encodedMethod(method, encodedMethods, numPossibilities = 1):
+    '''
+    Returns the counterpart of a rule checking method which takes encoded possibilities,
+    from encodedMethods if there is one, otherwise a method which calls the original
+    method on the pitch tuples of the first numPossibilities arguments.
+    '''
+    if method in encodedMethods:
+        return encodedMethods[method]
+    if numPossibilities == 1:
+        return lambda encodedA, *args: method(encodedA.possib, *args)
+    return lambda encodedA, encodedB, *args: method(encodedA.possib, encodedB.possib, *args)
+
+def _correctEncodedPairs(correctA, correctB, consecutiveChecks):
+    for encodedA in correctA:
+        for encodedB in correctB:
+            for (method, isCorrect, args) in consecutiveChecks:
+                if not (method(encodedA, encodedB, *args) == isCorrect):
+                    break
+            else:
+                yield (encodedA.possib, encodedB.possib)
+
 def printRules(rulesList, maxLength = 4):
     '''
     Method which can print to the console rules inputted into
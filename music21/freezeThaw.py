@@ -199,14 +199,106 @@ class StreamFreezer(StreamFreezeThawBase):
         self.topLevel = topLevel
         self.streamIds = streamIds
 
+        # (object, activeSite) pairs of the stored Stream to restore after thawing
+        self.storedActiveSites = []
+
         if streamObj is not None and fastButUnsafe is False:
             # deepcopy necessary because we mangle sites in the objects
             # before serialization
+            originalObjs = self.findActiveSiteObjects(streamObj)
+            originalActiveSites = [(obj._activeSite, obj._activeSiteId) for obj in originalObjs]
             self.stream = copy.deepcopy(streamObj)
             #self.stream = streamObj
+            self.replaceOriginalSpannedElements(streamObj, self.stream)
+            copiedObjs = self.findActiveSiteObjects(self.stream)
+            # deepcopying can change activeSites in the original: restore them,
+            # and keep the matching activeSites of the copy to restore when thawed
+            copiesById = {}
+            if len(copiedObjs) == len(originalObjs):
+                for obj, copiedObj in zip(originalObjs, copiedObjs):
+                    copiesById[id(obj)] = copiedObj
+            for obj, (activeSite, activeSiteId) in zip(originalObjs, originalActiveSites):
+                obj._activeSite = activeSite
+                obj._activeSiteId = activeSiteId
+                if id(obj) in copiesById and activeSiteId in copiesById:
+                    self.storedActiveSites.append((copiesById[id(obj)], copiesById[activeSiteId]))
         elif streamObj is not None:
             self.stream = streamObj
 
+    def replaceOriginalSpannedElements(self, streamObj, copiedStream):
+        '''
+        Deepcopying a Stream does not copy the elements of a Spanner that
+        are not found at the same level as the Spanner (such as a Slur in a
+        Part connecting Notes in Voices, or a Crescendo connecting Notes
+        that are in no Stream at all).  Replace every such element left in
+        the Spanners of copiedStream with a copy, so that mangling the sites
+        of copiedStream leaves streamObj unaltered.
+
+        >>> from music21 import freezeThaw
+        >>> s = corpus.parse('schoenberg/opus19/movement6', forceSource=True)
+        >>> sf = freezeThaw.StreamFreezer(s)
+        >>> originals = set([id(n) for n in s.recurse()])
+        >>> [n for sp in sf.stream.recurse() if sp.isSpanner
+        ...     for n in sp.getSpannedElements() if id(n) in originals]
+        []
+        '''
+        copies = {}
+        spanners = []
+        pairs = [(streamObj, copiedStream)]
+        while pairs:
+            obj, copiedObj = pairs.pop()
+            copies[id(obj)] = copiedObj
+            if not obj.isStream:
+                if copiedObj.isSpanner:
+                    spanners.append(copiedObj)
+                continue
+            pairs.extend(zip(obj._elements + obj._endElements,
+                copiedObj._elements + copiedObj._endElements))
+        copiedIds = set([id(copiedObj) for copiedObj in copies.values()])
+        for sp in spanners:
+            for el in sp.getSpannedElements():
+                if id(el) in copiedIds:
+                    continue
+                if id(el) not in copies:
+                    copies[id(el)] = copy.deepcopy(el)
+                    copiedIds.add(id(copies[id(el)]))
+                sp.replaceSpannedElement(el, copies[id(el)])
+
+    def findActiveSiteObjects(self, streamObj, memo=None):
+        '''
+        Return a list of streamObj and every object in its hierarchy,
+        including the storage Streams of Spanners and Variants, each
+        once, in an order that is the same for a deepcopy of streamObj.
+
+        >>> from music21 import freezeThaw
+        >>> s = stream.Score()
+        >>> p = stream.Part()
+        >>> p.append(note.Note())
+        >>> s.insert(0, p)
+        >>> sf = freezeThaw.StreamFreezer()
+        >>> sf.findActiveSiteObjects(s)
+        [<music21.stream.Score ...>, <music21.stream.Part ...>, <music21.note.Note C>]
+        '''
+        if memo is None:
+            memo = set()
+        post = []
+        if id(streamObj) in memo:
+            return post
+        memo.add(id(streamObj))
+        post.append(streamObj)
+        for el in streamObj._elements + streamObj._endElements:
+            if el.isStream:
+                post.extend(self.findActiveSiteObjects(el, memo))
+                continue
+            if id(el) not in memo:
+                memo.add(id(el))
+                post.append(el)
+            if el.isSpanner:
+                post.extend(self.findActiveSiteObjects(el.spannedElements, memo))
+            elif el.isVariant:
+                post.extend(self.findActiveSiteObjects(el._stream, memo))
+        return post
+
     def getPickleFp(self, directory):
         if directory == None:
             raise ValueError
@@ -226,6 +318,8 @@ class StreamFreezer(StreamFreezeThawBase):
             streamObj = self.stream
         self.setupSerializationScaffold(streamObj)
         storage = {'stream': streamObj, 'm21Version': base.VERSION}
+        if self.storedActiveSites:
+            storage['activeSites'] = self.storedActiveSites
         return storage
 
     def setupSerializationScaffold(self, streamObj = None):
@@ -844,6 +938,14 @@ class StreamThawer(StreamFreezeThawBase):
         streamObj = storage['stream']
 
         self.teardownSerializationScaffold(streamObj)
+        # restore activeSites as they were in the Stream that was frozen
+        if 'activeSites' in storage:
+            for obj, activeSite in storage['activeSites']:
+                obj.activeSite = activeSite
+        # the sites of the frozen Stream were cleared, including the
+        # default location that gives it an offset outside of any Stream
+        if not streamObj.sites.hasSiteId(None):
+            streamObj.sites.add(None, 0.0)
         return streamObj
 
     def parseOpenFmt(self, storage):
@@ -903,7 +1005,9 @@ class StreamThawer(StreamFreezeThawBase):
             storage = jsonpickle.decode(fileData)
         else:
             raise FreezeThawException('bad StreamFreezer format: %s' % fmt)
-        environLocal.printDebug("StreamThawer:openStr: storage is: %s" % storage)
+        # activeSites are left out, as their objects cannot be shown before thawing
+        environLocal.printDebug("StreamThawer:openStr: storage is: %s" % 
+            dict([(k, v) for (k, v) in storage.items() if k != 'activeSites']))
         self.stream = self.unpackStream(storage)
 
 #--------------------------------------------------------------------------------
@@ -1847,6 +1951,28 @@ class Test(unittest.TestCase):
         #s.show()
         #s.show('t')
 
+    def testFreezeThawTopLevelOffset(self):
+        from music21 import freezeThaw
+        from music21 import stream
+        from music21 import note
+
+        s = stream.Score()
+        p = stream.Part()
+        p.append(note.Note(type='whole'))
+        s.insert(0, p)
+
+        sf = freezeThaw.StreamFreezer(s)
+        d = sf.writeStr()
+
+        st = freezeThaw.StreamThawer()
+        st.openStr(d)
+        s2 = st.stream
+        # the thawed Stream can be given a new offset, as medren does
+        self.assertEqual(s2.offset, 0.0)
+        s2.offset = s2.offset * 2
+        self.assertEqual(s2.offset, 0.0)
+        self.assertEqual(s2.parts[0].offset, 0.0)
+
     def testFreezeThawSimpleVariant(self):
         from music21 import freezeThaw
         from music21 import variant
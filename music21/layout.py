@@ -616,6 +616,8 @@ def divideByPages(scoreIn, printUpdates=False, fastMeasures=False):
                     #if len(allStaffLayouts) > 1:
                     #    print "Got many staffLayouts"
                     p.staffLayout = allStaffLayouts[0]
+            # classes of contained parts have changed
+            thisSystem._elementsChanged()
 
             allSystemLayouts = thisSystem.flat.getElementsByClass('SystemLayout', returnStreamSubClass='list')
             if len(allSystemLayouts) > 1:
@@ -286,6 +286,148 @@ def putNumbersAsList(numList):
         post.append(chr(n))
     return ''.join(post)
 
+
+class MidiReader(object):
+    r'''
+    Reads numbers and data from a string of MIDI data by advancing a 
+    cursor, `position`, through the string. Unlike :func:`getNumber` and 
+    :func:`getVariableLengthNumber`, the remaining string is not copied 
+    after each read, so reading a track is linear in its length.
+
+    Reading does not go beyond `end`, which defaults to the length of 
+    the string.
+
+    >>> mr = midi.MidiReader('MThd\x00\x00\x00\x06\x81\x00abc')
+    >>> mr.readBytes(4)
+    'MThd'
+    >>> mr.readNumber(4)
+    6
+    >>> mr.readVariableLengthNumber()
+    128
+    >>> mr.position, mr.remaining()
+    (10, 3)
+
+    Data is not read beyond `end`:
+
+    >>> mr.end = 12
+    >>> mr.readBytes(5)
+    'ab'
+    >>> mr.remaining()
+    0
+    >>> mr.readNumber(1)
+    Traceback (most recent call last):
+    IndexError: string index out of range
+    '''
+    def __init__(self, midiStr, position=0, end=None):
+        self.midiStr = midiStr
+        self.position = position
+        if end is None:
+            end = len(midiStr)
+        self.end = end
+
+    def remaining(self):
+        '''
+        Return the number of characters left to read, or 0 if the
+        cursor has moved beyond `end`.
+        '''
+        return max(self.end - self.position, 0)
+
+    def readNumber(self, length):
+        '''
+        Return the value of the next `length` chars, as :func:`getNumber`.
+        '''
+        position = self.position
+        if position + length > self.end:
+            raise IndexError('string index out of range')
+        midiStr = self.midiStr
+        summation = 0
+        for i in range(position, position + length):
+            summation = (summation << 8) + ord(midiStr[i])
+        self.position = position + length
+        return summation
+
+    def readVariableLengthNumber(self):
+        '''
+        Return the value of a variable length number, as 
+        :func:`getVariableLengthNumber`.
+        '''
+        midiStr = self.midiStr
+        end = self.end
+        i = self.position
+        summation = 0
+        while True:
+            if i >= end:
+                raise IndexError('string index out of range')
+            x = ord(midiStr[i])
+            summation = (summation << 7) + (x & 0x7F)
+            i += 1
+            if not (x & 0x80):
+                self.position = i
+                return summation
+
+    def readBytes(self, length):
+        '''
+        Return the next `length` chars, or all that remain before `end`.
+        '''
+        start = self.position
+        self.position = start + length
+        return self.midiStr[start:min(self.position, self.end)]
+
+def putTrack(timedEvents, runningStatus=False):
+    r'''
+    Return the string of a complete track, starting with "MTrk", for a 
+    list of (delta time, :class:`MidiEvent`) pairs. Data is written to 
+    a single bytearray, without creating :class:`DeltaTime` objects or 
+    concatenating strings for each event; the string is the same as 
+    that of a :class:`MidiTrack` with these events.
+
+    If `runningStatus` is True, the status byte of a channel message is 
+    not written when it is the same as that of the channel message 
+    before it, making the track smaller. Meta and system exclusive 
+    events cancel the running status.
+
+    >>> mt = midi.MidiTrack(1)
+    >>> timedEvents = []
+    >>> for p, v in [(60, 90), (60, 0), (62, 90), (62, 0)]:
+    ...     me = midi.MidiEvent(mt, type='NOTE_ON', channel=2)
+    ...     me.pitch, me.velocity = p, v
+    ...     timedEvents.append((512, me))
+    >>> midi.putTrack(timedEvents)
+    'MTrk\x00\x00\x00\x14\x84\x00\x91<Z\x84\x00\x91<\x00\x84\x00\x91>Z\x84\x00\x91>\x00'
+    >>> midi.putTrack(timedEvents, runningStatus=True)
+    'MTrk\x00\x00\x00\x11\x84\x00\x91<Z\x84\x00<\x00\x84\x00>Z\x84\x00>\x00'
+    '''
+    trackBytes = bytearray()
+    lastStatus = None
+    for deltaTime, e in timedEvents:
+        if 0 <= deltaTime < 0x80:
+            trackBytes.append(deltaTime)
+        else:
+            trackBytes.extend(putVariableLengthNumber(deltaTime))
+        try:
+            if e.type in _twoByteChannelStatus:
+                try:
+                    eventBytes = bytearray((
+                        _twoByteChannelStatus[e.type] + e.channel - 1,
+                        e._parameter1, e._parameter2))
+                except (TypeError, ValueError):
+                    # let write() raise the appropriate exception
+                    eventBytes = bytearray(e.write())
+            else:
+                eventBytes = bytearray(e.write())
+        except MidiException as me:
+            environLocal.warn("Conversion error for %s: %s; ignored." % (e, me))
+            continue
+        status = eventBytes[0]
+        if status >= 0xF0:
+            lastStatus = None
+        elif runningStatus and status == lastStatus:
+            del eventBytes[0]
+        else:
+            lastStatus = status
+        trackBytes.extend(eventBytes)
+    return "MTrk" + putNumber(len(trackBytes), 4) + str(trackBytes)
+
 #-------------------------------------------------------------------------------
 class Enumeration(object): 
     '''
@@ -356,6 +498,13 @@ channelVoiceMessages = Enumeration([("NOTE_OFF", 0x80),
                                     ("CHANNEL_KEY_PRESSURE", 0xD0), 
                                     ("PITCH_BEND", 0xE0)]) 
 
+# status bytes, for channel 1, of the channel voice messages with two data bytes
+_twoByteChannelStatus = {}
+for _type in ['NOTE_OFF', 'NOTE_ON', 'POLYPHONIC_KEY_PRESSURE', 
+              'CONTROLLER_CHANGE', 'PITCH_BEND']:
+    _twoByteChannelStatus[_type] = getattr(channelVoiceMessages, _type)
+del _type
+
 channelModeMessages = Enumeration([("ALL_SOUND_OFF", 0x78), 
                                    ("RESET_ALL_CONTROLLERS", 0x79), 
                                    ("LOCAL_CONTROL", 0x7A), 
@@ -632,7 +781,10 @@ class MidiEvent(object):
         '''
         Parse the string that is given and take the beginning
         section and convert it into data for this event and return the
-        now truncated string.
+        now truncated string. 
+        
+        See :meth:`readFrom`, which is used to read :class:`MidiTrack` 
+        objects.
 
         The `time` value is the number of ticks into the Track 
         at which this event happens. This is derived from reading 
@@ -650,60 +802,99 @@ class MidiEvent(object):
         >>> (159 & 0x0F) + 1 # getting the channel
         16
         '''
-        if len(midiStr) < 2:
+        reader = MidiReader(midiStr)
+        self.readFrom(time, reader)
+        return midiStr[reader.position:]
+
+    def readFrom(self, time, reader):
+        '''
+        Read the data for this event from a :class:`MidiReader`, 
+        advancing its position to the end of the event.
+
+        Running status is supported: if the first char is a data byte,
+        not a status byte, `lastStatusByte` (as set by the event read
+        before this one) is used as the status.
+
+        >>> mt = midi.MidiTrack(1)
+        >>> mr = midi.MidiReader(midi.intsToHexString([145, 60, 120, 62, 0]))
+        >>> me1 = midi.MidiEvent(mt)
+        >>> me1.readFrom(0, mr)
+        >>> me1
+        <MidiEvent NOTE_ON, t=None, track=1, channel=2, pitch=60, velocity=120>
+        >>> me2 = midi.MidiEvent(mt)
+        >>> me2.lastStatusByte = me1.lastStatusByte
+        >>> me2.readFrom(0, mr)
+        >>> me2
+        <MidiEvent NOTE_ON, t=None, track=1, channel=2, pitch=62, velocity=0>
+        >>> mr.remaining()
+        0
+        '''
+        midiStr = reader.midiStr
+        position = reader.position
+        if reader.end - position < 2:
             # often what we have here are null events:
             # the string is simply: 0x00
-            environLocal.printDebug(['MidiEvent.read(): got bad data string', 'time', time, 'str', repr(midiStr)])
-            return ''
+            environLocal.printDebug(['MidiEvent.read(): got bad data string', 'time', time, 'str', repr(midiStr[position:reader.end])])
+            reader.position = reader.end
+            return
 
         # x, y, and z define characteristics of the first two chars
         # for x: The left nybble (4 bits) contains the actual command, and the right nibble contains the midi channel number on which the command will be executed.
-        x = ord(midiStr[0]) # given a string representation, get decimal number
+        x = ord(midiStr[position]) # given a string representation, get decimal number
 
         # detect running status: if the status byte is less than 128, its 
         # not a status byte, but a data byte
         if x < 128:
             # environLocal.printDebug(['MidiEvent.read(): found running status even data', 'self.lastStatusByte:', self.lastStatusByte])
-
             if self.lastStatusByte is not None:
                 rsb = self.lastStatusByte
             else: # provide a default
                 rsb = chr(0x90)
-            #post = self._parseChannelVoiceMessage(str, runningStatusByte=rsb)
-            #return post
-            # add the running status byte to the front of the string 
-            # and process as before
-            midiStr = rsb + midiStr
-            x = ord(midiStr[0]) # given a string representation, get decimal number
+            # the data starts at the current position
+            x = ord(rsb)
         else:
             # store last status byte
-            self.lastStatusByte = midiStr[0]
+            self.lastStatusByte = midiStr[position]
+            position += 1
 
         y = x & 0xF0  # bitwise and to derive message type
-        z = ord(midiStr[1]) 
-
-        #environLocal.printDebug(['MidiEvent.read(): trying to parse a MIDI event, looking at first two chars:', 'repr(x)', repr(x), 'charToBinary(str[0])', charToBinary(str[0]), 'charToBinary(str[1])', charToBinary(str[1])])
+        z = ord(midiStr[position]) 
 
         if channelVoiceMessages.hasValue(y): 
-            return self._parseChannelVoiceMessage(midiStr)
+            self.channel = (x & 0x0F) + 1
+            self.type = channelVoiceMessages.whatis(y) 
+            if (self.type == "PROGRAM_CHANGE" or 
+                self.type == "CHANNEL_KEY_PRESSURE"): 
+                self.data = z 
+                reader.position = position + 1
+                return
+            if position + 1 >= reader.end:
+                raise IndexError('string index out of range')
+            # for a controller change, this is the controller id and value
+            self.pitch = z 
+            self.velocity = ord(midiStr[position + 1]) 
+            reader.position = position + 2
+            return
 
         elif y == 0xB0 and channelModeMessages.hasValue(z): 
             self.channel = (x & 0x0F) + 1 
             self.type = channelModeMessages.whatis(z) 
             if self.type == "LOCAL_CONTROL": 
-                self.data = (ord(midiStr[2]) == 0x7F) 
+                self.data = (ord(midiStr[position + 1]) == 0x7F) 
             elif self.type == "MONO_MODE_ON": 
-                self.data = ord(midiStr[2]) 
+                self.data = ord(midiStr[position + 1]) 
             else:
-                environLocal.printDebug(['unhandled message:', midiStr[2]])
-            return midiStr[3:]
+                environLocal.printDebug(['unhandled message:', midiStr[position + 1]])
+            reader.position = position + 2
+            return
 
         elif x == 0xF0 or x == 0xF7: 
             self.type = {0xF0: "F0_SYSEX_EVENT", 
                          0xF7: "F7_SYSEX_EVENT"}[x] 
-            length, midiStr = getVariableLengthNumber(midiStr[1:]) 
-            self.data = midiStr[:length] 
-            return midiStr[length:]
+            reader.position = position
+            length = reader.readVariableLengthNumber() 
+            self.data = reader.readBytes(length)
+            return
 
         # SEQUENCE_TRACK_NAME and other MetaEvents are here
         elif x == 0xFF: 
@@ -713,17 +904,14 @@ class MidiEvent(object):
                 sys.stdout.flush() 
                 raise MidiException("Unknown midi event type: %r, %r" % (x, z))
             self.type = metaEvents.whatis(z) 
-            length, midiStr = getVariableLengthNumber(midiStr[2:]) 
-            self.data = midiStr[:length] 
-            # return remainder
-            return midiStr[length:] 
+            reader.position = position + 1
+            length = reader.readVariableLengthNumber() 
+            self.data = reader.readBytes(length)
+            return
         else:
             # an uncaught message
-            environLocal.printDebug(['got unknown midi event type', repr(x), 'charToBinary(midiStr[0])', charToBinary(midiStr[0]), 'charToBinary(midiStr[1])', charToBinary(midiStr[1])])
-
+            environLocal.printDebug(['got unknown midi event type', repr(x), 'charToBinary(midiStr[0])', charToBinary(midiStr[reader.position]), 'charToBinary(midiStr[1])', charToBinary(midiStr[reader.position + 1])])
             raise MidiException("Unknown midi event type")
-            #return everything but the first character
-            return midiStr[1:] # 
 
 
     def write(self): 
@@ -919,6 +1107,14 @@ class DeltaTime(MidiEvent):
         self.time, newstr = getVariableLengthNumber(oldstr) 
         return self.time, newstr 
 
+    def readFrom(self, reader):
+        '''
+        Read the time from a :class:`MidiReader`, advancing its position,
+        and return it.
+        '''
+        self.time = reader.readVariableLengthNumber()
+        return self.time
+
     def write(self): 
         midiStr = putVariableLengthNumber(self.time) 
         return midiStr
@@ -962,27 +1158,60 @@ class MidiTrack(object):
         Creates and stores :class:`~music21.midi.base.DeltaTime` 
         and :class:`~music21.midi.base.MidiEvent` objects. 
         '''
-        time = 0 # a running counter of ticks
+        reader = MidiReader(midiStr)
+        self.readFrom(reader)
+        return midiStr[reader.position:] # remainder string after extracting track data
+
+    def readFrom(self, reader):
+        '''
+        Read a track from a :class:`MidiReader`, advancing its position 
+        to the end of the track.
 
-        if not midiStr[:4] == "MTrk":
+        Creates and stores :class:`~music21.midi.base.DeltaTime` 
+        and :class:`~music21.midi.base.MidiEvent` objects. 
+        '''
+        trackReader = self._readHeaderFrom(reader)
+        for delta_t, e in self._iterEventsFrom(trackReader):
+            self.events.append(delta_t) 
+            self.events.append(e) 
+
+    def _readHeaderFrom(self, reader):
+        '''
+        Read the track header from a :class:`MidiReader`, advancing its 
+        position to the end of the track, and return a new reader 
+        for the events of the track.
+        '''
+        if not reader.readBytes(4) == "MTrk":
             raise MidiException('badly formed midi string: missing leading MTrk')
         # get the 4 chars after the MTrk encoding
-        length, midiStr = getNumber(midiStr[4:], 4)      
+        length = reader.readNumber(4)
         #environLocal.printDebug(['MidiTrack.read(): got chunk size', length])   
         self.length = length 
 
-        # all event data is in the track str
-        trackStr = midiStr[:length] 
-        remainder = midiStr[length:] 
+        # all event data is in the track; read it with its own reader,
+        # sharing the string, so that events cannot read beyond the track
+        end = min(reader.position + length, reader.end)
+        trackReader = MidiReader(reader.midiStr, reader.position, end)
+        reader.position += length
+        return trackReader
 
+    def _iterEventsFrom(self, trackReader):
+        '''
+        Read events from a reader returned by :meth:`_readHeaderFrom`, 
+        yielding pairs of :class:`~music21.midi.base.DeltaTime` and
+        :class:`~music21.midi.base.MidiEvent` objects as they are read.
+        '''
+        time = 0 # a running counter of ticks
+        end = trackReader.end
         ePrevious = None
-        while trackStr: 
+        while trackReader.position < end: 
             # shave off the time stamp from the event
             delta_t = DeltaTime(self) 
-            # return extracted time, as well as remaining string
-            dt, trackStrCandidate = delta_t.read(trackStr) 
+            # return extracted time, advancing the reader
+            dt = delta_t.readFrom(trackReader) 
             # this is the offset that this event happens at, in ticks
             timeCandidate = time + dt 
+            positionCandidate = trackReader.position
     
             # pass self to event, set this MidiTrack as the track for this event
             e = MidiEvent(self) 
@@ -990,23 +1219,19 @@ class MidiTrack(object):
                 e.lastStatusByte = ePrevious.lastStatusByte
             # some midi events may raise errors; simply skip for now
             try:
-                trackStrCandidate = e.read(timeCandidate, trackStrCandidate) 
+                e.readFrom(timeCandidate, trackReader) 
             except MidiException:
-                # assume that trackStr, after delta extraction, is still correct
+                # assume that the position after delta extraction
+                # is still correct
                 #environLocal.printDebug(['forced to skip event; delta_t:', delta_t])
-                # set to result after taking delta time
-                trackStr = trackStrCandidate
+                trackReader.position = positionCandidate
                 continue
             # only set after trying to read, which may raise exception
             time = timeCandidate
-            trackStr = trackStrCandidate # remainder string
-            # only append if we get this far
-            self.events.append(delta_t) 
-            self.events.append(e) 
+            # only yield if we get this far
+            yield delta_t, e
             ePrevious = e
 
-        return remainder # remainder string after extracting track data
-    
     def write(self): 
         '''
         returns a string of midi-data from the `.events` in the object.
@@ -1015,14 +1240,14 @@ class MidiTrack(object):
         # set time to the first event
         # time = self.events[0].time 
         # build str using MidiEvents 
-        midiStr = ""
+        post = []
         for e in self.events: 
             # this writes both delta time and message events
             try:
-                ew = e.write()
-                midiStr = midiStr + ew
+                post.append(e.write())
             except MidiException as me:
                 environLocal.warn("Conversion error for %s: %s; ignored." % (e, me))
+        midiStr = ''.join(post)
         return "MTrk" + putNumber(len(midiStr), 4) + midiStr
     
     def __repr__(self): 
@@ -1138,22 +1363,97 @@ class MidiFile(object):
         data in `.ticksPerQuarterNote` and a list of
         `MidiTrack` objects in the attribute `.tracks`. 
         '''
+        reader, numTracks = self._readHeader(midiStr)
+        for i in range(numTracks): 
+            trk = MidiTrack(i) # sets the MidiTrack index parameters
+            trk.readFrom(reader) # advances the reader to the next track
+            self.tracks.append(trk) 
+
+    def iterTracks(self, midiStr=None):
+        '''
+        Read the header of MIDI data given as a string, setting 
+        `.ticksPerQuarterNote`, and return a generator of 
+        (:class:`MidiTrack`, eventIterator) pairs, one for each track. 
+        Each eventIterator yields pairs of :class:`DeltaTime` and 
+        :class:`MidiEvent` objects as they are read. 
+        
+        Neither the tracks nor their events are stored, so that events 
+        can be processed, and discarded, while MIDI data is read.
+
+        If `midiStr` is None, MIDI data is read from the file opened 
+        with `.open()`, one track at a time as the generator reaches it, 
+        so that only the data of one track is held in memory. The file 
+        must stay open until the generator is exhausted.
+
+        >>> import os
+        >>> fp = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive', 'test09.mid')
+        >>> mf = midi.MidiFile()
+        >>> tracks = mf.iterTracks(open(fp, 'rb').read())
+        >>> mf.ticksPerQuarterNote
+        192
+        >>> for mt, events in tracks:
+        ...     print mt.index, len([e for dt, e in events if e.isNoteOn()])
+        0 0
+        1 1449
+        2 1426
+        >>> mf.tracks
+        []
+
+        >>> mf = midi.MidiFile()
+        >>> mf.open(fp)
+        >>> for mt, events in mf.iterTracks():
+        ...     print mt.index, len([e for dt, e in events if e.isNoteOn()])
+        0 0
+        1 1449
+        2 1426
+        >>> mf.close()
+        '''
+        if midiStr is None:
+            # the header is 14 bytes
+            unused_reader, numTracks = self._readHeader(self.file.read(14))
+            return self._iterTracksFromFile(numTracks)
+        reader, numTracks = self._readHeader(midiStr)
+        return self._iterTracksFrom(reader, numTracks)
+
+    def _iterTracksFrom(self, reader, numTracks):
+        for i in range(numTracks): 
+            trk = MidiTrack(i)
+            trackReader = trk._readHeaderFrom(reader)
+            yield trk, trk._iterEventsFrom(trackReader)
+
+    def _iterTracksFromFile(self, numTracks):
+        for i in range(numTracks): 
+            # MTrk and the length of the track, then the track
+            trackHeader = self.file.read(8)
+            length = MidiReader(trackHeader, 4).readNumber(4)
+            reader = MidiReader(trackHeader + self.file.read(length))
+            trk = MidiTrack(i)
+            trackReader = trk._readHeaderFrom(reader)
+            yield trk, trk._iterEventsFrom(trackReader)
+
+    def _readHeader(self, midiStr):
+        '''
+        Read the header of the MIDI data string, setting the attributes of 
+        this object, and return a :class:`MidiReader` positioned at the 
+        first track, and the number of tracks. 
+        '''
         if not midiStr[:4] == "MThd":
             raise MidiException('badly formated midi string, got: %s' % midiStr[:20])
 
-        # we step through the str src, chopping off characters as we go
-        # and reassigning to str
-        length, midiStr = getNumber(midiStr[4:], 4) 
+        # we step through the str src with a reader, advancing its 
+        # position as we go
+        reader = MidiReader(midiStr, 4)
+        length = reader.readNumber(4) 
         if not length == 6:
             raise MidiException('badly formated midi string')
 
-        midiFormatType, midiStr = getNumber(midiStr, 2) 
+        midiFormatType = reader.readNumber(2) 
         self.format = midiFormatType
         if not midiFormatType in [0, 1]:
             raise MidiException('cannot handle midi file format: %s' % format)
 
-        numTracks, midiStr = getNumber(midiStr, 2) 
-        division, midiStr = getNumber(midiStr, 2) 
+        numTracks = reader.readNumber(2) 
+        division = reader.readNumber(2) 
 
         # very few midi files seem to define ticksPerSecond
         if division & 0x8000: 
@@ -1168,11 +1468,7 @@ class MidiFile(object):
             self.ticksPerQuarterNote = division & 0x7FFF 
 
         #environLocal.printDebug(['MidiFile.readstr(): got midi file format:', self.format, 'with specified number of tracks:', numTracks, 'ticksPerSecond:', self.ticksPerSecond, 'ticksPerQuarterNote:', self.ticksPerQuarterNote])
-
-        for i in range(numTracks): 
-            trk = MidiTrack(i) # sets the MidiTrack index parameters
-            midiStr = trk.read(midiStr) # pass all the remaining string, reassing
-            self.tracks.append(trk) 
+        return reader, numTracks
     
     def write(self): 
         '''
@@ -1191,12 +1487,12 @@ class MidiFile(object):
         # Don't handle ticksPerSecond yet, too confusing 
         if (division & 0x8000) != 0:
             raise MidiException('Cannot write midi string unless self.ticksPerQuarterNote is a multiple of 1024')
-        midiStr = "MThd" + putNumber(6, 4) + putNumber(self.format, 2) 
-        midiStr = midiStr + putNumber(len(self.tracks), 2) 
-        midiStr = midiStr + putNumber(division, 2) 
+        post = ["MThd" + putNumber(6, 4) + putNumber(self.format, 2)]
+        post.append(putNumber(len(self.tracks), 2))
+        post.append(putNumber(division, 2))
         for trk in self.tracks: 
-            midiStr = midiStr + trk.write() 
-        return midiStr 
+            post.append(trk.write())
+        return ''.join(post)
 
 
 
@@ -1517,6 +1813,42 @@ class Test(unittest.TestCase):
         #    print n, n.quarterLength
         #s.show()
 
+    def testReadLargeTrackWithRunningStatus(self):
+        # a track of many note on/off pairs, all after the first 
+        # using running status
+        numberOfNotes = 5000
+        data = []
+        for i in range(numberOfNotes):
+            pitch = 36 + i % 60
+            if i == 0:
+                data.append('\x00\x90' + chr(pitch) + '\x64')
+            else:
+                data.append('\x00' + chr(pitch) + '\x64')
+            data.append('\x60' + chr(pitch) + '\x00')
+        data.append('\x00\xff\x2f\x00')
+        data = ''.join(data)
+        midiStr = ('MThd' + putNumber(6, 4) + putNumber(0, 2) + 
+                   putNumber(1, 2) + putNumber(1024, 2) +
+                   'MTrk' + putNumber(len(data), 4) + data)
+
+        mf = MidiFile()
+        mf.readstr(midiStr)
+        self.assertEqual(mf.ticksPerQuarterNote, 1024)
+        events = mf.tracks[0].events
+        self.assertEqual(len(events), numberOfNotes * 4 + 2)
+        self.assertEqual(mf.tracks[0].length, len(data))
+        noteOn = [e for e in events if e.type == 'NOTE_ON']
+        self.assertEqual(len(noteOn), numberOfNotes * 2)
+        self.assertEqual([e.pitch for e in noteOn[-4:]], [54, 54, 55, 55])
+        self.assertEqual([e.velocity for e in noteOn[-4:]], [100, 0, 100, 0])
+        self.assertEqual(events[-1].type, 'END_OF_TRACK')
+        # reading with the string api gives the same events, and the 
+        # string following the track
+        mt = MidiTrack(1)
+        remainder = mt.read(midiStr[14:] + 'MTrk')
+        self.assertEqual(remainder, 'MTrk')
+        self.assertEqual(repr(mt.events), repr(events).replace('track=0', 'track=1'))
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = []
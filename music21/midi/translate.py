@@ -18,6 +18,7 @@ notes takes place in the :meth:`~music21.stream.Stream.quantize` method not here
 import unittest
 import math
 import copy
+import collections
 
 from music21 import defaults
 from music21 import common
@@ -1388,11 +1389,144 @@ def packetsToMidiTrack(packets, trackId=1, channels=None):
     return mt
 
 
+def _timedEventsToObjects(timedEvents, ticksPerQuarter):
+    '''
+    A generator that converts (time, MidiEvent) pairs, with absolute times 
+    in ticks and in time order, to music21 objects, yielding 
+    (time, object, overlapped) triples. 
+    
+    Meta events are yielded as they are read. A note-on is paired with 
+    the next note event of the same pitch and channel in a table of open 
+    notes, and notes that start together (within a 64th note) and end 
+    together are gathered into Chords. Notes and Chords are yielded, in 
+    order of their start times, once all notes that might be gathered 
+    with them have ended, so only sounding notes, and those that start 
+    with them, are held. `overlapped` is True if a Note or Chord starts 
+    with another note that does not end with it, requiring voices. 
+
+    >>> mt = midi.MidiTrack(1)
+    >>> timedEvents = []
+    >>> for t, p, v in [(0, 60, 90), (0, 64, 90), (1024, 60, 0), (1024, 64, 0), 
+    ...                 (1024, 67, 90), (2048, 67, 0)]:
+    ...     me = midi.MidiEvent(mt, type='NOTE_ON', channel=1)
+    ...     me.pitch, me.velocity = p, v
+    ...     timedEvents.append((t, me))
+    >>> for t, obj, overlapped in midi.translate._timedEventsToObjects(timedEvents, 1024):
+    ...     print t, obj, obj.quarterLength, overlapped
+    0 <music21.chord.Chord C4 E4> 1.0 False
+    1024 <music21.note.Note G> 1.0 False
+    '''
+    from music21 import chord
+    from music21 import note
+
+    # can set a tolerance for gathering notes into chords; here at 1/16th
+    # of a quarter
+    chunkTolerance = ticksPerQuarter / 16
+
+    openNotes = {} # (channel, pitch) : entry of a sounding note
+    # entries for notes, in order of note-on, as 
+    # [tOn, eOn, tOff, eOff], where tOff is None while sounding
+    pending = collections.deque()
+    gathered = set() # ids of entries already gathered into a chord
+
+    def finished(tNow, final=False):
+        # yield the notes at the front of the pending list that can no 
+        # longer be gathered with notes that have not yet ended or started
+        while pending:
+            entry = pending[0]
+            if id(entry) in gathered:
+                gathered.discard(id(entry))
+                pending.popleft()
+                continue
+            t = entry[0]
+            if not final and tNow <= t + chunkTolerance:
+                break # notes may still start within the tolerance
+            # notes starting within the tolerance; as times are in order,
+            # these are contiguous
+            window = []
+            for other in pending:
+                if other[0] - t > chunkTolerance:
+                    break
+                window.append(other)
+            if not final and [x for x in window if x[2] is None]:
+                break # must wait for notes to end
+            
+            # look for other notes that start within a certain small time 
+            # window to make into a chord;
+            # if we find a note with a different end time but same start
+            # time, through into a different voice
+            tOff = entry[2]
+            chordSub = None
+            overlapped = False
+            for other in window[1:]:
+                if abs(other[2] - tOff) > chunkTolerance:
+                    # need to store this as requiring movement to a diff
+                    # voice
+                    overlapped = True
+                    continue
+                if chordSub is None: # start a new one
+                    chordSub = [[entry[:2], entry[2:]]]
+                chordSub.append([other[:2], other[2:]])
+                gathered.add(id(other))
+            if chordSub is not None:
+                # create a chord here
+                c = chord.Chord()
+                midiEventsToChord(chordSub, ticksPerQuarter, c)
+                c.midiTickStart = t
+                obj = c
+            else: # just the note
+                n = note.Note()
+                midiEventsToNote([entry[:2], entry[2:]], ticksPerQuarter, n)
+                n.midiTickStart = t
+                obj = n
+            pending.popleft()
+            yield t, obj, overlapped
+
+    t = 0
+    for t, e in timedEvents:
+        if e.type in ('NOTE_ON', 'NOTE_OFF'):
+            # any note event with the pitch and channel of a sounding 
+            # note ends it
+            key = (e.channel, e.pitch)
+            entry = openNotes.pop(key, None)
+            if entry is not None:
+                entry[2:] = [t, e]
+            elif e.isNoteOn():
+                entry = [t, e, None, None]
+                openNotes[key] = entry
+                pending.append(entry)
+        elif e.type == 'TIME_SIGNATURE':
+            # time signature should be 4 bytes
+            yield t, midiEventsToTimeSignature(e), False
+        elif e.type == 'KEY_SIGNATURE':
+            yield t, midiEventsToKeySignature(e), False
+        elif e.type == 'SET_TEMPO':
+            yield t, midiEventsToTempo(e), False
+        elif e.type == 'PROGRAM_CHANGE':
+            yield t, midiEventsToInstrument(e), False
+        else:
+            pass
+            #environLocal.printDebug(['unhandled event:', e.type, e.data])
+        for post in finished(t):
+            yield post
+
+    # notes that have not ended are dropped
+    for entry in openNotes.values():
+        pending.remove(entry)
+    for post in finished(t, final=True):
+        yield post
+
+
 def midiTrackToStream(mt, ticksPerQuarter=None, quantizePost=True,
-    inputM21=None):
+    inputM21=None, eventIterator=None):
     '''
     Note that quantization takes place in stream.py since it's useful not just for MIDI.
 
+    If `eventIterator` is given, it is used instead of the events of `mt`: 
+    it is an iterator of pairs of DeltaTime and MidiEvent objects, as 
+    returned by :meth:`~music21.midi.base.MidiFile.iterTracks`, which are 
+    converted as they are read.
+
     >>> import os
     >>> fp = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive',  'test05.mid')
     >>> mf = midi.MidiFile()
@@ -1418,10 +1552,49 @@ def midiTrackToStream(mt, ticksPerQuarter=None, quantizePost=True,
     if ticksPerQuarter == None:
         ticksPerQuarter = defaults.ticksPerQuarter
 
-    # need to build chords and notes
-    from music21 import chord
-    from music21 import note
+    if eventIterator is not None:
+        events = _eventPairsToTimedEvents(eventIterator)
+    else:
+        events = _midiTrackToTimedEvents(mt)
+    return _timedEventsToStream(events, ticksPerQuarter, quantizePost, s)
+
 
+def _timedEventsToStream(events, ticksPerQuarter, quantizePost, s):
+    '''
+    Insert the music21 objects converted from (time, MidiEvent) pairs 
+    into the Stream `s`, and quantize and fill gaps with rests, as 
+    :func:`midiTrackToStream`.
+    '''
+    #environLocal.printDebug(['raw event pairs', events])
+    voicesRequired = False
+    for t, obj, overlapped in _timedEventsToObjects(events, ticksPerQuarter):
+        if overlapped:
+            voicesRequired = True
+        if 'GeneralNote' in obj.classes:
+            s._insertCore(t / float(ticksPerQuarter), obj)
+        else:
+            s.insert(t / float(ticksPerQuarter), obj)
+
+    s._elementsChanged()
+    # quantize to nearest 16th
+    if quantizePost:    
+        s.quantize([8, 3], processOffsets=True, processDurations=True, inPlace=True)
+
+    if voicesRequired:
+        pass
+        # this procedure will make the appropriate rests
+        s.makeVoices(inPlace=True, fillGaps=True)
+    else:
+        # always need to fill gaps, as rests are not found in any other way
+        s.makeRests(inPlace=True, fillGaps=True)
+    return s
+
+
+def _midiTrackToTimedEvents(mt):
+    '''
+    Return a list of [time, MidiEvent] pairs for the events of a MidiTrack,
+    with absolute times in ticks.
+    '''
     # get an abs start time for each event, discard deltas
     events = []
     t = 0
@@ -1461,161 +1634,34 @@ def midiTrackToStream(mt, ticksPerQuarter=None, quantizePost=True,
             #environLocal.printDebug(['cannot pair to delta time', mt.events[i]])
             i += 1
             continue
-    #environLocal.printDebug(['raw event pairs', events])
-    # need to pair note-on with note-off
-    notes = [] # store pairs of pairs
-    metaEvents = [] # store pairs of abs time, m21 object
-    memo = [] # store already matched note off
-    for i in range(len(events)):
-        #environLocal.printDebug(['midiTrackToStream(): paired events', events[i][0], events[i][1]])
-        if i in memo:
-            continue
-        t, e = events[i]
-        # for each note on event, we need to search for a match in all future
-        # events
-        if e.isNoteOn():
-            match = None
-            #environLocal.printDebug(['midiTrackToStream(): isNoteOn', e])
-            for j in range(i+1, len(events)):
-                if j in memo: 
-                    continue
-                tSub, eSub = events[j]
-                if e.matchedNoteOff(eSub):
-                    memo.append(j)
-                    match = i, j
-                    break
-            if match is not None:
-                i, j = match
-                notes.append([events[i], events[j]])
-            else:
-                pass
-                #environLocal.printDebug(['midiTrackToStream(): cannot find a note off for a note on', e])
-        else:
-            if e.type == 'TIME_SIGNATURE':
-                # time signature should be 4 bytes
-                metaEvents.append([t, midiEventsToTimeSignature(e)])
-            elif e.type == 'KEY_SIGNATURE':
-                metaEvents.append([t, midiEventsToKeySignature(e)])
-            elif e.type == 'SET_TEMPO':
-                metaEvents.append([t, midiEventsToTempo(e)])
-            elif e.type == 'INSTRUMENT_NAME':
-                # TODO import instrument object
-                pass
-            elif e.type == 'PROGRAM_CHANGE':
-                metaEvents.append([t, midiEventsToInstrument(e)])
-            elif e.type == 'MIDI_PORT':
-                pass
-            else:
-                pass
-                #environLocal.printDebug(['unhandled event:', e.type, e.data])
+    return events
 
-    # first create meta events
-    for t, obj in metaEvents:
-        #environLocal.printDebug(['insert midi meta event:', t, obj])
-        s.insert(t / float(ticksPerQuarter), obj)
 
-    #environLocal.printDebug(['midiTrackToStream(): found notes ready for Stream import', len(notes)])
+def _eventPairsToTimedEvents(eventIterator):
+    '''
+    A generator of (time, MidiEvent) pairs, with absolute times in ticks,
+    from an iterator of DeltaTime and MidiEvent pairs.
+    '''
+    t = 0
+    for dt, e in eventIterator:
+        t += dt.time
+        yield t, e
 
-    # collect notes with similar start times into chords
-    # create a composite list of both notes and chords
-    #composite = []
-    chordSub = None
-    i = 0
-    iGathered = [] # store a lost of indexes of gathered values put into chords
-    voicesRequired = False
-    if len(notes) > 1:
-        #environLocal.printDebug(['\nmidiTrackToStream(): notes', notes])
-        while i < len(notes):
-            if i in iGathered:
-                i += 1
-                continue
-            # look at each note; get on time and event
-            on, off = notes[i]
-            t, e = on
-            tOff, unused_eOff = off
-            #environLocal.printDebug(['on, off', on, off, 'i', i, 'len(notes)', len(notes)])
-
-            # go through all following notes; if there is only 1 note, this will 
-            # not execute;
-            # looking for other events that start within a certain small time 
-            # window to make into a chord
-            # if we find a note with a different end time but same start
-            # time, through into a different voice
-            for j in range(i+1, len(notes)):
-                # look at each on time event
-                onSub, offSub = notes[j]
-                tSub, unused_eSub = onSub
-                tOffSub, unused_eOffSub = offSub
- 
-                # can set a tolerance for chordSubing; here at 1/16th
-                # of a quarter
-                chunkTolerance = ticksPerQuarter / 16
-                if abs(tSub - t) <= chunkTolerance:
-                    # isolate case where end time is not w/n tolerance
-                    if abs(tOffSub - tOff) > chunkTolerance:
-                        # need to store this as requiring movement to a diff
-                        # voice
-                        voicesRequired = True
-                        continue
-                    if chordSub is None: # start a new one
-                        chordSub = [notes[i]]
-                        iGathered.append(i)
-                    chordSub.append(notes[j])
-                    iGathered.append(j)
-                    continue # keep looping through events to see 
-                    # if we can add more elements to this chord group
-                else: # no more matches; assuming chordSub tones are contiguous
-                    break
-            # this comparison must be outside of j loop, as the case where we
-            # have the last note in a list of notes and the j loop does not 
-            # execute; chordSub will be None
-            if chordSub is not None:
-                #composite.append(chordSub)
-                # create a chord here
-                c = chord.Chord()
-                midiEventsToChord(chordSub, ticksPerQuarter, c)
-                o = notes[i][0][0] / float(ticksPerQuarter)
-                c.midiTickStart = notes[i][0][0]
-                
-                s._insertCore(o, c)
-                #iSkip = len(chordSub) # amount of accumulated chords
-                chordSub = None
-            else: # just append the note, chordSub is None
-                #composite.append(notes[i])
-                # create a note here
-                n = note.Note()
-                midiEventsToNote(notes[i], ticksPerQuarter, n)
-                # the time is the first value in the first pair
-                # need to round, as floating point error is likely
-                o = notes[i][0][0] / float(ticksPerQuarter)
-                n.midiTickStart = notes[i][0][0]
-
-                s._insertCore(o, n)
-                #iSkip = 1
-            #break # exit secondary loop
-            i += 1
-    elif len(notes) == 1: # rare case of just one note
-        n = note.Note()
-        midiEventsToNote(notes[0], ticksPerQuarter, n)
-        # the time is the first value in the first pair
-        # need to round, as floating point error is likely
-        o = notes[0][0][0] / float(ticksPerQuarter)
-        n.midiTickStart = notes[i][0][0]
-        s._insertCore(o, n)
-                    
-    s._elementsChanged()
-    # quantize to nearest 16th
-    if quantizePost:    
-        s.quantize([8, 3], processOffsets=True, processDurations=True, inPlace=True)
 
-    if voicesRequired:
-        pass
-        # this procedure will make the appropriate rests
-        s.makeVoices(inPlace=True, fillGaps=True)
-    else:
-        # always need to fill gaps, as rests are not found in any other way
-        s.makeRests(inPlace=True, fillGaps=True)
-    return s
+def _peekNotes(timedEvents):
+    '''
+    Read (time, MidiEvent) pairs from `timedEvents` until the first 
+    note-on, and return True or False if a note-on was found, and an 
+    iterator of all pairs, including those already read.
+    '''
+    import itertools
+    timedEvents = iter(timedEvents)
+    head = []
+    for t, e in timedEvents:
+        head.append((t, e))
+        if e.isNoteOn():
+            return True, itertools.chain(head, timedEvents)
+    return False, iter(head)
 
     
 def _prepareStreamForMidi(s):
@@ -1672,12 +1718,47 @@ def streamHierarchyToMidiTracks(inputM21, acceptableChannelList = None):
     '''
     from music21 import midi as midiModule
 
-    # makes a deepcopy
-    s = _prepareStreamForMidi(inputM21)
+    packetStorage, netPackets = _streamHierarchyToPackets(inputM21, 
+                                acceptableChannelList=acceptableChannelList)
 
     # return a list of MidiTrack objects
     midiTracks = []
 
+    #environLocal.printDebug(['got netPackets:', len(netPackets), 'packetStorage keys (tracks)', packetStorage.keys()])
+    # build each track, sorting out the appropriate packets based on track
+    # ids
+    for trackId in packetStorage:   
+        initChannel = packetStorage[trackId]['initChannel']
+        instObj = packetStorage[trackId]['initInstrument']
+        # TODO: for a given track id, need to find start/end channel
+        mt = midiModule.MidiTrack(trackId) 
+        # need to pass preferred channel here
+        mt.events += _getStartEvents(mt, channel=initChannel, 
+                                    instrumentObj=instObj) 
+        # note that netPackets is must be passed here, and then be filtered
+        # packets have been added to net packets
+        mt.events += _packetsToEvents(mt, netPackets, trackIdFilter=trackId)
+        mt.events += getEndEvents(mt, channel=initChannel)
+        mt.updateEvents()
+    # need to filter out packets only for the desired tracks
+        midiTracks.append(mt)
+
+    return midiTracks
+
+
+def _streamHierarchyToPackets(inputM21, acceptableChannelList=None):
+    '''
+    Prepare a Stream hierarchy and convert it to packets with channels 
+    allocated, as used by :func:`streamHierarchyToMidiTracks` and 
+    :func:`streamToMidiString`.
+
+    Returns a dictionary of track data (the initial channel and instrument) 
+    keyed by track id, and a list of packets for all tracks, sorted 
+    by offset.
+    '''
+    # makes a deepcopy
+    s = _prepareStreamForMidi(inputM21)
+
     # TODO: may need to shift all time values to accomodate 
     # Streams that do not start at same time
 
@@ -1781,27 +1862,7 @@ def streamHierarchyToMidiTracks(inputM21, acceptableChannelList = None):
         channelForInstrument=channelForInstrument, 
         channelsDynamic=channelsDynamic, 
         initChannelForTrack=initChannelForTrack)
-
-    #environLocal.printDebug(['got netPackets:', len(netPackets), 'packetStorage keys (tracks)', packetStorage.keys()])
-    # build each track, sorting out the appropriate packets based on track
-    # ids
-    for trackId in packetStorage:   
-        initChannel = packetStorage[trackId]['initChannel']
-        instObj = packetStorage[trackId]['initInstrument']
-        # TODO: for a given track id, need to find start/end channel
-        mt = midiModule.MidiTrack(trackId) 
-        # need to pass preferred channel here
-        mt.events += _getStartEvents(mt, channel=initChannel, 
-                                    instrumentObj=instObj) 
-        # note that netPackets is must be passed here, and then be filtered
-        # packets have been added to net packets
-        mt.events += _packetsToEvents(mt, netPackets, trackIdFilter=trackId)
-        mt.events += getEndEvents(mt, channel=initChannel)
-        mt.updateEvents()
-    # need to filter out packets only for the desired tracks
-        midiTracks.append(mt)
-
-    return midiTracks
+    return packetStorage, netPackets
 
 
 def midiTracksToStreams(midiTracks, ticksPerQuarter=None, quantizePost=True,
@@ -1835,6 +1896,56 @@ def midiTracksToStreams(midiTracks, ticksPerQuarter=None, quantizePost=True,
             midiTrackToStream(mt, ticksPerQuarter, quantizePost, 
                               inputM21=conductorTrack)
     #environLocal.printDebug(['show() conductorTrack elements'])
+    _addConductorElements(s, conductorTrack)
+    return s
+
+
+def midiTrackEventsToStreams(tracks, ticksPerQuarter=None, quantizePost=True,
+    inputM21=None):
+    '''
+    As :func:`midiTracksToStreams`, but given the (MidiTrack, eventIterator) 
+    pairs returned by :meth:`~music21.midi.base.MidiFile.iterTracks`: 
+    each track is converted while its events are read, and the events are 
+    not stored. 
+
+    >>> import os
+    >>> fp = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive',  'test05.mid')
+    >>> mf = midi.MidiFile()
+    >>> tracks = mf.iterTracks(open(fp, 'rb').read())
+    >>> s = midi.translate.midiTrackEventsToStreams(tracks, mf.ticksPerQuarterNote)
+    >>> len(s.parts), len(s.flat.notesAndRests)
+    (1, 11)
+    '''
+    from music21 import stream
+    if inputM21 == None:
+        s = stream.Score()
+    else:
+        s = inputM21
+    if ticksPerQuarter == None:
+        ticksPerQuarter = defaults.ticksPerQuarter
+    # store common elements such as time sig, key sig from conductor
+    conductorTrack = stream.Stream()
+    for unused_mt, eventIterator in tracks:
+        hasNotes, timedEvents = _peekNotes(
+                                    _eventPairsToTimedEvents(eventIterator))
+        if hasNotes:
+            streamPart = stream.Part() # create a part instance for each part
+            _timedEventsToStream(timedEvents, ticksPerQuarter, quantizePost, 
+                                 streamPart)
+            s.insert(0, streamPart)
+        else:
+            _timedEventsToStream(timedEvents, ticksPerQuarter, quantizePost, 
+                                 conductorTrack)
+    _addConductorElements(s, conductorTrack)
+    return s
+
+
+def _addConductorElements(s, conductorTrack):
+    '''
+    Add copies of the time signatures and key signatures of the 
+    conductorTrack Stream, made from tracks without notes, to each 
+    part of the Score `s`, and tempo indications to the top-most part. 
+    '''
     # if we have time sig/key sig elements, add to each part
     
     # TODO: this would be faster if we iterated in the other order.
@@ -1855,7 +1966,6 @@ def midiTracksToStreams(midiTracks, ticksPerQuarter=None, quantizePost=True,
         # multiple references of the same
         eventCopy = copy.deepcopy(e)
         p.insert(e.getOffsetBySite(conductorTrack), eventCopy)
-    return s
 
 
 def streamToMidiFile(inputM21):
@@ -1898,7 +2008,72 @@ def streamToMidiFile(inputM21):
     return mf
 
 
-def midiFilePathToStream(filePath, inputM21=None):
+def streamToMidiString(inputM21, runningStatus=False):
+    '''
+    Converts a Stream hierarchy directly into a string of MIDI file data.
+    
+    The string is the same as that written by the 
+    :class:`~music21.midi.base.MidiFile` from :func:`streamToMidiFile`, 
+    but is faster to make: the packets of each track are written to a 
+    bytearray, without creating :class:`~music21.midi.base.MidiTrack` 
+    and :class:`~music21.midi.base.DeltaTime` objects.
+
+    If `runningStatus` is True, repeated status bytes, as for the notes 
+    of a chord, are omitted, making the data smaller. 
+    
+    >>> s = stream.Stream()
+    >>> s.repeatAppend(chord.Chord(['c4', 'e4', 'g4']), 4)
+    >>> midiStr = midi.translate.streamToMidiString(s)
+    >>> midiStr == midi.translate.streamToMidiFile(s).writestr()
+    True
+    >>> len(midiStr), len(midi.translate.streamToMidiString(s, runningStatus=True))
+    (134, 118)
+    '''
+    packetStorage, netPackets = _streamHierarchyToPackets(inputM21)
+    return _packetsToMidiString(packetStorage, netPackets, 
+                                runningStatus=runningStatus)
+
+
+def _packetsToMidiString(packetStorage, netPackets, runningStatus=False):
+    '''
+    Write the track data and packets returned by 
+    :func:`_streamHierarchyToPackets` as a string of MIDI file data.
+    '''
+    from music21 import midi as midiModule
+
+    division = defaults.ticksPerQuarter
+    post = ['MThd' + midiModule.putNumber(6, 4) + midiModule.putNumber(1, 2)]
+    post.append(midiModule.putNumber(len(packetStorage), 2))
+    post.append(midiModule.putNumber(division, 2))
+
+    for trackId in packetStorage:   
+        initChannel = packetStorage[trackId]['initChannel']
+        instObj = packetStorage[trackId]['initInstrument']
+        # start and end events are pairs of DeltaTime and MidiEvent
+        startEvents = _getStartEvents(channel=initChannel, 
+                                      instrumentObj=instObj) 
+        endEvents = getEndEvents(channel=initChannel)
+
+        timedEvents = []
+        for i in range(0, len(startEvents), 2):
+            timedEvents.append((startEvents[i].time, startEvents[i + 1]))
+        lastOffset = 0
+        for p in netPackets:
+            if p['trackId'] != trackId:
+                continue
+            t = p['offset'] - lastOffset
+            if t < 0:
+                raise TranslateException('got a negative delta time')
+            timedEvents.append((t, p['midiEvent']))
+            lastOffset = p['offset']
+        for i in range(0, len(endEvents), 2):
+            timedEvents.append((endEvents[i].time, endEvents[i + 1]))
+        post.append(midiModule.putTrack(timedEvents, 
+                                        runningStatus=runningStatus))
+    return ''.join(post)
+
+
+def midiFilePathToStream(filePath, inputM21=None, streaming=False):
     '''
     Used by music21.converter:
     
@@ -1906,6 +2081,13 @@ def midiFilePathToStream(filePath, inputM21=None):
     
     return a :class:`~music21.stream.Score` object (or if inputM21 is passed in,
     use that object instead).
+
+    If `streaming` is True, each track is converted while its events are 
+    read, using :func:`midiTrackEventsToStreams`, rather than after all 
+    tracks have been read into a :class:`~music21.midi.base.MidiFile`; 
+    this uses less memory for long files. The data of each track is 
+    read from the file when it is reached, so the data of only one 
+    track is held.
     
     >>> import os #_DOCS_HIDE
     >>> fp = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive',  'test05.mid') #_DOCS_HIDE
@@ -1913,26 +2095,250 @@ def midiFilePathToStream(filePath, inputM21=None):
     >>> streamScore = midi.translate.midiFilePathToStream(fp)
     >>> streamScore
     <music21.stream.Score ...>
+    >>> midi.translate.midiFilePathToStream(fp, streaming=True)
+    <music21.stream.Score ...>
     '''
     from music21 import midi as midiModule
     mf = midiModule.MidiFile()
     mf.open(filePath)
+    if streaming:
+        tracks = mf.iterTracks()
+        try:
+            return midiTrackEventsToStreams(tracks, 
+                    ticksPerQuarter=mf.ticksPerQuarterNote, inputM21=inputM21)
+        finally:
+            mf.close()
     mf.read()
     mf.close()
     return midiFileToStream(mf, inputM21)
 
-def midiStringToStream(strData, inputM21):
+def midiStringToStream(strData, inputM21, streaming=False):
     '''
     Convert a string of binary midi data to a Music21 stream.Score object.
+
+    See :func:`midiFilePathToStream` for `streaming`.
     '''
     from music21 import midi as midiModule
     
     mf = midiModule.MidiFile()
     # do not need to call open or close on MidiFile instance
+    if streaming:
+        tracks = mf.iterTracks(strData)
+        return midiTrackEventsToStreams(tracks, 
+                    ticksPerQuarter=mf.ticksPerQuarterNote, inputM21=inputM21)
     mf.readstr(strData)
     return midiFileToStream(mf, inputM21)
 
 
+def midiStringToPartMeasures(strData, quantizePost=True):
+    '''
+    Convert a string of binary MIDI data to Parts made one 
+    :class:`~music21.stream.Measure` at a time, rather than to a 
+    :class:`~music21.stream.Score`.
+
+    Returns a generator of (Part, measureIterator) pairs, one for each 
+    track with notes. The Part is empty; measureIterator yields the 
+    Measures of the track, in order, as its events are read, with notes 
+    tied over bar lines and gaps filled with rests. Only the sounding 
+    notes and the Measure being made are held, so that a long file can 
+    be processed, or written out, a Measure at a time.
+
+    Time signatures, key signatures, and tempo indications of tracks 
+    without notes, such as the first track of most files, are added to 
+    the Parts that follow them, as in :func:`midiTracksToStreams`. A time 
+    signature takes effect at the first bar line at or after it; Measures 
+    are in 4/4 until there is one.
+
+    Only the creation of objects is streamed: `strData` holds the whole 
+    file. Use :func:`midiFilePathToPartMeasures` to read a file one 
+    track at a time.
+
+    >>> import os
+    >>> fp = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive',  'test05.mid')
+    >>> for p, measures in midi.translate.midiStringToPartMeasures(open(fp, 'rb').read()):
+    ...     for m in measures:
+    ...         p.append(m)
+    >>> p.getElementsByClass('Measure')[0]
+    <music21.stream.Measure 1 offset=0.0>
+    >>> len(p.getElementsByClass('Measure')), len(p.flat.notes)
+    (4, 7)
+    >>> p.getElementsByClass('Measure')[0].timeSignature
+    <music21.meter.TimeSignature 4/4>
+    '''
+    from music21 import midi as midiModule
+    mf = midiModule.MidiFile()
+    tracks = mf.iterTracks(strData)
+    return _midiTrackEventsToPartMeasures(tracks, mf.ticksPerQuarterNote, 
+                                          quantizePost)
+
+
+def midiFilePathToPartMeasures(filePath, quantizePost=True):
+    '''
+    Convert a MIDI file to Parts made one Measure at a time, as 
+    :func:`midiStringToPartMeasures`, reading the data of each track 
+    from the file when the track is reached, so that neither the whole 
+    file nor the whole Score is held in memory. The file is closed when 
+    the generator is exhausted.
+
+    >>> import os
+    >>> fp = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive',  'test05.mid')
+    >>> for p, measures in midi.translate.midiFilePathToPartMeasures(fp):
+    ...     print len([m for m in measures])
+    4
+    '''
+    from music21 import midi as midiModule
+    mf = midiModule.MidiFile()
+    mf.open(filePath)
+    try:
+        tracks = mf.iterTracks()
+        for post in _midiTrackEventsToPartMeasures(tracks, 
+                                    mf.ticksPerQuarterNote, quantizePost):
+            yield post
+    finally:
+        mf.close()
+
+
+def _midiTrackEventsToPartMeasures(tracks, ticksPerQuarter, quantizePost):
+    from music21 import stream
+    # objects from tracks without notes, to add to parts
+    conductorObjects = [] 
+    isFirstPart = True
+    for unused_mt, eventIterator in tracks:
+        hasNotes, timedEvents = _peekNotes(
+                                    _eventPairsToTimedEvents(eventIterator))
+        objects = _timedEventsToObjects(timedEvents, ticksPerQuarter)
+        if not hasNotes:
+            for t, obj, unused_overlapped in objects:
+                if 'TimeSignature' in obj.classes or (
+                    'KeySignature' in obj.classes or 
+                    'MetronomeMark' in obj.classes):
+                    conductorObjects.append((t, obj))
+            continue
+        inherited = []
+        for t, obj in conductorObjects:
+            # tempo is only added to the top-most part
+            if isFirstPart or 'MetronomeMark' not in obj.classes:
+                inherited.append((t, copy.deepcopy(obj)))
+        isFirstPart = False
+        yield stream.Part(), _objectsToMeasures(objects, inherited, 
+                                    ticksPerQuarter, quantizePost)
+
+
+def _quantizeValue(value, quarterLengthDivisors=(8, 3)):
+    '''
+    Snap a value to the nearest multiple of a quarter length divided by 
+    one of the divisors, as :meth:`~music21.stream.Stream.quantize`.
+
+    >>> midi.translate._quantizeValue(1.01)
+    1.0
+    >>> midi.translate._quantizeValue(0.32)
+    0.333...
+    '''
+    found = []
+    for div in quarterLengthDivisors:
+        match, error = common.nearestMultiple(value, (1.0/div))
+        found.append((error, match)) # reverse for sorting
+    # get first, and leave out the error
+    return sorted(found)[0][1]
+
+
+def _objectsToMeasures(objects, inherited, ticksPerQuarter, quantizePost):
+    '''
+    A generator of the Measures of the (time, object, overlapped) triples 
+    from :func:`_timedEventsToObjects`, and the (time, object) pairs 
+    of `inherited` conductor objects. 
+    '''
+    from music21 import meter
+    from music21 import stream
+
+    delta = 1e-06 # tolerance for floating point offsets
+    def toOffset(t):
+        o = t / float(ticksPerQuarter)
+        if quantizePost:
+            o = _quantizeValue(o)
+        return o
+    
+    # objects after the current measure, as (offset, object) pairs 
+    waiting = [(toOffset(t), obj) for t, obj in inherited]
+    carried = [] # parts of notes tied over the bar line
+    measureState = {'start': 0.0, 'number': 1, 'timeSignature': None}
+
+    def newMeasure():
+        m = stream.Measure()
+        m.number = measureState['number']
+        mStart = measureState['start']
+        # time signatures at or before the bar line take effect
+        for o, obj in list(waiting):
+            if 'TimeSignature' in obj.classes and o <= mStart + delta:
+                waiting.remove((o, obj))
+                measureState['timeSignature'] = obj
+                m.timeSignature = obj
+        if measureState['timeSignature'] is None:
+            measureState['timeSignature'] = meter.TimeSignature('4/4')
+            m.timeSignature = measureState['timeSignature']
+        barQL = measureState['timeSignature'].barDuration.quarterLength
+        for o, obj in list(waiting):
+            if o < mStart + barQL - delta and 'TimeSignature' not in obj.classes:
+                waiting.remove((o, obj))
+                m.insert(max(o - mStart, 0.0), obj)
+        notes = carried[:]
+        del carried[:]
+        for n in notes:
+            placeNote(m, 0.0, n, barQL)
+        return m, barQL
+
+    def placeNote(m, o, n, barQL):
+        # split notes over the bar line, carrying the rest to the next 
+        # measure
+        if o + n.duration.quarterLength > barQL + delta:
+            n, nNext = n.splitAtQuarterLength(barQL - o)
+            carried.append(nNext)
+        m._insertCore(o, n)
+
+    def finishedMeasure(m, barQL):
+        m._elementsChanged()
+        # overlapping notes are put in voices
+        end = None
+        overlapped = False
+        for n in m.notes:
+            o = n.getOffsetBySite(m)
+            if end is not None and o < end - delta:
+                overlapped = True
+                break
+            end = max(end, o + n.duration.quarterLength)
+        if overlapped:
+            m.makeVoices(inPlace=True, fillGaps=True)
+        m.makeRests(refStreamOrTimeRange=[0.0, barQL], fillGaps=True,
+                    inPlace=True)
+        measureState['start'] += barQL
+        measureState['number'] += 1
+        return m
+
+    m, barQL = newMeasure()
+    for t, obj, unused_overlapped in objects:
+        o = toOffset(t)
+        if 'GeneralNote' not in obj.classes:
+            if ('TimeSignature' in obj.classes or 
+                o >= measureState['start'] + barQL - delta):
+                waiting.append((o, obj))
+            else:
+                m.insert(max(o - measureState['start'], 0.0), obj)
+            continue
+        if quantizePost:
+            obj.duration.quarterLength = _quantizeValue(
+                                            obj.duration.quarterLength)
+        while o >= measureState['start'] + barQL - delta:
+            yield finishedMeasure(m, barQL)
+            m, barQL = newMeasure()
+        placeNote(m, max(o - measureState['start'], 0.0), obj, barQL)
+    # complete measures of notes tied over, or of objects after the last note
+    while True:
+        yield finishedMeasure(m, barQL)
+        if not carried and not waiting:
+            break
+        m, barQL = newMeasure()
+
+
 def midiFileToStream(mf, inputM21=None):
     '''
     Convert a :class:`~music21.midi.base.MidiFile` object to a 
@@ -2654,10 +3060,96 @@ class Test(unittest.TestCase):
         s = converter.parse(fp)
         #s.show('t')
         self.assertEqual(len(s.flat.getElementsByClass('Chord')), 4)
+
+    def testMidiStringA(self):
+        from music21 import corpus, stream, note, instrument
+        from music21 import midi as midiModule
+
+        # parts with instruments, and microtones requiring pitch bends
+        # and channel changes
+        s = corpus.parse('bach/bwv66.6')
+        p = stream.Part()
+        p.insert(0, instrument.Viola())
+        for i in range(12):
+            n = note.Note(60 + i, quarterLength=1.5)
+            n.pitch.microtone = (i % 3) * 25
+            p.append(n)
+        s.insert(0, p)
+
+        midiStr = streamToMidiString(s)
+        self.assertEqual(midiStr, streamToMidiFile(s).writestr())
         
+        # running status data is smaller, and reads as the same events
+        midiStrRunningStatus = streamToMidiString(s, runningStatus=True)
+        self.assertTrue(len(midiStrRunningStatus) < len(midiStr))
+        mf = midiModule.MidiFile()
+        mf.readstr(midiStr)
+        mfRunningStatus = midiModule.MidiFile()
+        mfRunningStatus.readstr(midiStrRunningStatus)
+        self.assertEqual(len(mfRunningStatus.tracks), 5)
+        for i in range(5):
+            self.assertEqual(repr(mfRunningStatus.tracks[i].events), 
+                             repr(mf.tracks[i].events))
+        
+    def testMidiStreamingA(self):
+        import os
+        from music21 import converter
+
+        dirLib = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive')
+        for fn in ('test03.mid', 'test05.mid', 'test09.mid', 'test12.mid'):
+            fp = os.path.join(dirLib, fn)
+            s = converter.parse(fp, forceSource=True)
+            sStreaming = converter.parse(fp, forceSource=True, streaming=True)
+            # a MIDI string is streamed as well
+            sStringStreaming = converter.parse(open(fp, 'rb').read(), 
+                                               streaming=True)
+            for sTest in (sStreaming, sStringStreaming):
+                self.assertEqual(len(sTest.parts), len(s.parts))
+                for p, pStreaming in zip(s.parts, sTest.parts):
+                    post = [(e.offset, e.classes[0], e.duration.quarterLength) 
+                            for e in p.flat]
+                    postStreaming = [(e.offset, e.classes[0], 
+                                      e.duration.quarterLength) 
+                                     for e in pStreaming.flat]
+                    self.assertEqual(postStreaming, post)
+
+    def testMidiPartMeasuresA(self):
+        import os
+        
+        fp = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive', 
+                          'test03.mid')
+        s = midiFilePathToStream(fp)
+        parts = []
+        for p, measures in midiStringToPartMeasures(open(fp, 'rb').read()):
+            for m in measures:
+                self.assertEqual(m.duration.quarterLength, 
+                                 m.barDuration.quarterLength)
+                p.append(m)
+            parts.append(p)
+        self.assertEqual(len(parts), len(s.parts))
+        for p, pScore in zip(parts, s.parts):
+            self.assertEqual(p.getElementsByClass('Measure')[0].number, 1)
+            # notes tied over bar lines are counted once
+            starts = [n for n in p.flat.notes 
+                      if n.tie is None or n.tie.type == 'start']
+            self.assertEqual(len(starts), len(pScore.flat.notes))
+
+        # reading the file a track at a time gives the same Measures
+        partsFromFile = []
+        for p, measures in midiFilePathToPartMeasures(fp):
+            partsFromFile.append([(m.number, [(e.offset, e.classes[0], 
+                                    e.duration.quarterLength) for e in m])
+                                  for m in measures])
+        self.assertEqual(partsFromFile, 
+                         [[(m.number, [(e.offset, e.classes[0], 
+                            e.duration.quarterLength) for e in m])
+                           for m in p.getElementsByClass('Measure')]
+                          for p in parts])
+
 
 #-------------------------------------------------------------------------------
-_DOC_ORDER = [streamToMidiFile, midiFileToStream]
+_DOC_ORDER = [streamToMidiFile, streamToMidiString, midiFileToStream, 
+              midiStringToPartMeasures, midiFilePathToPartMeasures]
 
 if __name__ == "__main__":
     import music21
@@ -2507,11 +2507,16 @@ def mxToMeasure(mxMeasure, spannerBundle=None, inputM21=None, lastMeasureInfo=No
 # Streams
 
 
-def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
+def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None,
+    mxMeasures=None):
     '''
     Load a part into a new Stream or one provided by 
     `inputM21` given an mxScore and a part name.
 
+    If `mxMeasures` is given, it is an iterable of the part's mxObjects
+    Measures, used in place of the Measures stored in the mxScore; this
+    permits Measures to be translated as they are parsed.
+
     The `spannerBundle` reference, when passed in, 
     is used to accumulate Spanners. These are not inserted here.
 
@@ -2530,7 +2535,11 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
     if spannerBundle == None:
         spannerBundle = spanner.SpannerBundle()
 
-    mxPart = mxScore.getPart(partId)
+    if mxMeasures is None:
+        mxPart = mxScore.getPart(partId)
+        mxMeasures = mxPart
+    else:
+        mxPart = None
     # in some cases there may be more than one instrument defined
     # in each score part; this has not been tested
     mxInstrument = mxScore.getScorePart(partId)
@@ -2561,8 +2570,13 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
 
     lastMeasureNumber = 0
     lastMeasureSuffix = None
+    # the highest number of staves used in this part
+    stavesCount = 1
 
-    for i, mxMeasure in enumerate(mxPart):
+    for i, mxMeasure in enumerate(mxMeasures):
+        mxAttributes = mxMeasure.attributesObj
+        if mxAttributes is not None and mxAttributes.staves is not None:
+            stavesCount = max(stavesCount, int(mxAttributes.staves))
         # t here is transposition, if defined; otherwise it is None
         try:
             m, staffReference, t = mxToMeasure(mxMeasure,
@@ -2682,7 +2696,7 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
     # then then we need to update the spannerBundle after the part is copied
 
     streamPartStaff = None
-    if mxPart.getStavesCount() > 1:
+    if stavesCount > 1:
         separateOutPartStaffs(mxPart, streamPart, spannerBundle, s, staffReferenceList, partId)
     else:
         streamPart.addGroupForElements(partId) # set group for components 
@@ -2800,7 +2814,7 @@ def _getStaffExclude(staffReference, targetKey):
     return post
 
 
-def mxScoreToScore(mxScore, spannerBundle=None, inputM21=None):
+def mxScoreToScore(mxScore, spannerBundle=None, inputM21=None, mxParts=None):
     '''
     Translate an mxScore into a music21 Score object 
     or puts it into the
@@ -2811,6 +2825,19 @@ def mxScoreToScore(mxScore, spannerBundle=None, inputM21=None):
 
     All spannerBundles accumulated at all lower levels 
     are inserted here.
+
+    If `mxParts` is given, it is an iterable of pairs of a part id and
+    an iterable of that part's mxObjects Measures, such as returned by 
+    :meth:`~music21.musicxml.xmlHandler.Document.iterParts`, used in place 
+    of the parts stored in the mxScore. Everything else is read from 
+    the mxScore once all parts are translated.
+
+    >>> from music21.musicxml import testPrimitive
+    >>> d = musicxml.xmlHandler.Document()
+    >>> mxParts = d.iterParts(testPrimitive.pitches01a, isFile=False)
+    >>> s = musicxml.fromMxObjects.mxScoreToScore(d.score, mxParts=mxParts)
+    >>> len(s.parts[0].getElementsByClass('Measure'))
+    26
     '''
     # TODO: may not want to wait to this leve to insert spanners; may want to 
     # insert in lower positions if it makes sense
@@ -2821,20 +2848,22 @@ def mxScoreToScore(mxScore, spannerBundle=None, inputM21=None):
     if spannerBundle == None:
         spannerBundle = spanner.SpannerBundle()
 
-    mxPartIds = mxScore.getPartIdsFromPartListObj()
-    #print mxPartIds
+    if mxParts is None:
+        mxParts = [(partId, None) for partId in 
+                   mxScore.getPartIdsFromPartListObj()]
     #mxPartIdDictionary = mxScore.partIdToNameDict()
     m21PartIdDictionary = {}
     # values are part names
     #partNameIds = mxPartIdDictionary.keys()
     #partNameIds.sort()
     #for partId in partNameIds: # part names are part ids
-    for pNum, partId in enumerate(mxPartIds): # part names are part ids
+    for pNum, (partId, mxMeasures) in enumerate(mxParts): # part names are part ids
         # NOTE: setting partId not partId: might change
         # return the part; however, it is still already attached to the Score
         try:
             part = mxToStreamPart(mxScore, partId=partId,
-                                  spannerBundle=spannerBundle, inputM21=s)
+                                  spannerBundle=spannerBundle, inputM21=s,
+                                  mxMeasures=mxMeasures)
         except Exception as e:
             import sys
             # see http://stackoverflow.com/questions/6062576/adding-information-to-a-python-exception
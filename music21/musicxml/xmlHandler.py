@@ -46,6 +46,10 @@ except ImportError:
 
 import xml.sax
 import xml.dom.minidom # @UnusedImport
+try:
+    import xml.etree.cElementTree as ElementTree
+except ImportError:
+    import xml.etree.ElementTree as ElementTree
 
 from music21.base import VERSION
 from music21 import xmlnode
@@ -68,13 +72,17 @@ class Handler(xml.sax.ContentHandler):
     this is the main conversion handler for musicxml to mxObjects
     '''
    
-    def __init__(self, tagLib=None):
+    def __init__(self, tagLib=None, storeMeasures=True):
         if tagLib == None:
             self.t = musicxmlMod.TagLib()
         else:
             self.t = tagLib
         #environLocal.printDebug(['creating Handler'])
 
+        # if False, completed measures are not added to their part;
+        # they must be collected as they are completed
+        self.storeMeasures = storeMeasures
+
         # this is in use in characters()
         self._currentTag = None # store current tag object
 
@@ -288,7 +296,8 @@ class Handler(xml.sax.ContentHandler):
             # measures need to be stored in order; numbers may have odd values
             # update note start times w/ measure utility method
             self._mxObjs['measure'].update()
-            self._mxObjs['part'].componentList.append(self._mxObjs['measure'])
+            if self.storeMeasures:
+                self._mxObjs['part'].componentList.append(self._mxObjs['measure'])
 
         elif name == 'slur': 
             self._mxObjs['notations'].componentList.append(self._mxObjs['slur'])
@@ -833,6 +842,10 @@ class Handler(xml.sax.ContentHandler):
             self._mxObjs['part-list'].componentList.append(
                 self._mxObjs['score-part'])
 
+        elif name == 'part-list':
+            # set now so that parts can be read before parsing is complete
+            self._mxObjs['score'].partListObj = self._mxObjs['part-list']
+
         elif name == 'part-name':
             # copy completed character data and clear
             self._mxObjs['score-part'].partName = self._currentTag.charData
@@ -1061,6 +1074,91 @@ class Document(object):
     def open(self, fp, audit=False):
         self._load(fp, True, audit)
 
+    def _iterParse(self, h, fileLike, isFile=True):
+        '''
+        Parse with ElementTree's iterparse, passing elements to the Handler
+        `h` as they start and end. Yields ('part', mxPart) when a part starts,
+        ('measure', mxMeasure) when a measure is complete, and
+        ('part-end', mxPart) when a part ends.
+
+        Measures are not stored on their part, and each XML element is
+        cleared once it has been handled.
+        '''
+        if not isFile:
+            if isinstance(fileLike, unicode):
+                fileLike = fileLike.encode('utf-8')
+            fileLikeOpen = StringIO.StringIO(fileLike)
+        else:
+            fileLikeOpen = open(fileLike, 'rb')
+
+        try:
+            for event, elem in ElementTree.iterparse(fileLikeOpen,
+                events=('start', 'end')):
+                name = elem.tag
+                if event == 'start':
+                    h.startElement(name, elem.attrib)
+                    if name == 'part':
+                        yield 'part', h._mxObjs['part']
+                    continue
+                # all character data of an element is available at its end
+                if elem.text and h._currentTag is not None:
+                    h.characters(elem.text)
+                if name == 'measure':
+                    mxMeasure = h._mxObjs['measure']
+                    h.endElement(name)
+                    elem.clear()
+                    yield 'measure', mxMeasure
+                elif name == 'part':
+                    mxPart = h._mxObjs['part']
+                    h.endElement(name)
+                    elem.clear()
+                    yield 'part-end', mxPart
+                else:
+                    h.endElement(name)
+                    elem.clear()
+        finally:
+            fileLikeOpen.close()
+        self.score = h.getContent()
+
+    def _iterParts(self, events):
+        for event, mxObj in events:
+            if event == 'part':
+                yield mxObj.get('id'), self._iterPartMeasures(events)
+
+    def _iterPartMeasures(self, events):
+        for event, mxObj in events:
+            if event == 'measure':
+                yield mxObj
+            elif event == 'part-end':
+                return
+
+    def iterParts(self, fileLike, isFile=True):
+        '''
+        Parse a MusicXML file (or, if `isFile` is False, a string)
+        incrementally, yielding a pair of a part id and an iterator of the
+        part's mxObjects Measures for each part, as soon as the part starts.
+        Each Measure is yielded as soon as it is complete, and Measures are
+        not stored, so that the whole document is never held in memory.
+        The measures of a part must be consumed before the next part is
+        read.
+
+        The :attr:`score` attribute is set when parsing starts, and is
+        complete, though without Measures, when parsing ends.
+
+        >>> from music21.musicxml import testPrimitive
+        >>> d = musicxml.xmlHandler.Document()
+        >>> for partId, mxMeasures in d.iterParts(testPrimitive.pitches01a, isFile=False):
+        ...     print('%s %s' % (partId, len(list(mxMeasures))))
+        P1 26
+        >>> len(d.score)
+        1
+        >>> len(d.score.getPart('P1'))
+        0
+        '''
+        h = Handler(self.tagLib, storeMeasures=False)
+        self.score = h._mxObjs['score']
+        return self._iterParts(self._iterParse(h, fileLike, isFile))
+
     #---------------------------------------------------------------------------        
     # convenience routines to get meta-data
     def getBestTitle(self):
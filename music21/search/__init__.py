@@ -200,11 +200,11 @@ def approximateNoteSearch(thisStream, otherStreams):
     o2 0.083333...
     '''
     isJunk = None
-    n = thisStream.flat.notesAndRests
+    n = [e for unused_offset, e in thisStream.iterFlat('GeneralNote')]
     thisStreamStr = translateStreamToString(n)
     sorterList = []
     for s in otherStreams:
-        sn = s.flat.notesAndRests
+        sn = [e for unused_offset, e in s.iterFlat('GeneralNote')]
         thatStreamStr = translateStreamToString(sn)
         ratio = difflib.SequenceMatcher(isJunk, thisStreamStr, thatStreamStr).ratio()
         s.matchProbability = ratio
@@ -239,11 +239,11 @@ def approximateNoteSearchNoRhythm(thisStream, otherStreams):
     o2 0.1666666...
     '''
     isJunk = None
-    n = thisStream.flat.notesAndRests
+    n = [e for unused_offset, e in thisStream.iterFlat('GeneralNote')]
     thisStreamStr = translateStreamToStringNoRhythm(n)
     sorterList = []
     for s in otherStreams:
-        sn = s.flat.notesAndRests
+        sn = [e for unused_offset, e in s.iterFlat('GeneralNote')]
         thatStreamStr = translateStreamToStringNoRhythm(sn)
         ratio = difflib.SequenceMatcher(isJunk, thisStreamStr, thatStreamStr).ratio()
         s.matchProbability = ratio
@@ -277,11 +277,11 @@ def approximateNoteSearchOnlyRhythm(thisStream, otherStreams):
     o2 0.0
     '''
     isJunk = None
-    n = thisStream.flat.notesAndRests
+    n = [e for unused_offset, e in thisStream.iterFlat('GeneralNote')]
     thisStreamStr = translateStreamToStringOnlyRhythm(n)
     sorterList = []
     for s in otherStreams:
-        sn = s.flat.notesAndRests
+        sn = [e for unused_offset, e in s.iterFlat('GeneralNote')]
         thatStreamStr = translateStreamToStringOnlyRhythm(sn)
         ratio = difflib.SequenceMatcher(isJunk, thisStreamStr, thatStreamStr).ratio()
         s.matchProbability = ratio
@@ -317,14 +317,14 @@ def approximateNoteSearchWeighted(thisStream, otherStreams):
     o2 0.25
     '''
     isJunk = None
-    n = thisStream.flat.notesAndRests
+    n = [e for unused_offset, e in thisStream.iterFlat('GeneralNote')]
     thisStreamStrPitches = translateStreamToStringNoRhythm(n)
     thisStreamStrDuration = translateStreamToStringOnlyRhythm(n)   
 #    print "notes",thisStreamStrPitches
 #    print "rhythm",thisStreamStrDuration 
     sorterList = []
     for s in otherStreams:
-        sn = s.flat.notesAndRests
+        sn = [e for unused_offset, e in s.iterFlat('GeneralNote')]
         thatStreamStrPitches = translateStreamToStringNoRhythm(sn)
         thatStreamStrDuration = translateStreamToStringOnlyRhythm(sn)
 #        print "notes2",thatStreamStrPitches
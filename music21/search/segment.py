@@ -23,6 +23,15 @@ Speed notes:
    Unix (compilation is much more difficult on Windows; sorry). The ratios are very 
    slightly different, but the speedup is between 10 and 100x!
 
+   For searches across many scores, `indexSegmentNGrams` builds an inverted index
+   of the n-grams of each segment, which can be saved with `saveSegmentIndex`.
+   `searchSegmentIndex` and `segmentIndexSimilarity` then only compute ratios
+   for segments sharing n-grams with the query, rather than for every segment.
+
+   To keep an index of many scores up to date, `updateScoreIndex` saves the
+   content hashes of the score files with their segments and only parses and 
+   indexes new or changed scores, optionally in several processes.
+
 '''
 from music21 import converter
 from music21 import corpus
@@ -34,6 +43,8 @@ import os
 import math
 import json
 import difflib
+import hashlib
+import multiprocessing
 
 
 def translateMonophonicPartToSegments(
@@ -161,6 +172,23 @@ def indexScoreParts(scoreFile, *args, **kwds):
     return indexedList
 
 
+def _indexScoreFile(job):
+    '''
+    Parse and index a single score for indexScoreFilePaths, possibly in a 
+    worker process. Returns the file path, the list from indexScoreParts 
+    (or None), and a string describing the error raised (or None).
+    '''
+    filePath, args, kwds = job
+    try:
+        if not os.path.isabs(filePath):
+            scoreObj = corpus.parse(filePath)
+        else:
+            scoreObj = converter.parse(filePath)
+        return filePath, indexScoreParts(scoreObj, *args, **kwds), None
+    except Exception as e: # pylint: disable=broad-except
+        return filePath, None, '%s: %s' % (e.__class__.__name__, e)
+
+
 def indexScoreFilePaths(
     scoreFilePaths,
     giveUpdates=False,
@@ -195,24 +223,59 @@ def indexScoreFilePaths(
         >>> scoreDict['bwv190.7.mxl'][0]['segmentList'][0]
         'NNJLNOLLLJJIJLLLLNJJJIJLLJNNJL'
     
+    If the keyword `processes` is given and greater than one, scores are 
+    parsed and indexed in a pool of that many worker processes. 
+    
+    Scores that cannot be parsed or indexed are left out of the dictionary;
+    if the keyword `failures` gives a list, a tuple of the file path and a 
+    description of the error is appended to it for each such score.
+
+    ::
+
+        >>> filePaths = [corpus.getWork('bach/bwv197.5.mxl'), 
+        ...     corpus.getWork('bach/bwv190.7.mxl'), '/noSuchDirectory/noSuchFile.xml']
+        >>> failures = []
+        >>> scoreDict = search.segment.indexScoreFilePaths(filePaths, 
+        ...     processes=2, failures=failures)
+        Failed on parse for: /noSuchDirectory/noSuchFile.xml
+        >>> sorted(scoreDict.keys())
+        [u'bwv190.7.mxl', u'bwv197.5.mxl']
+        >>> failures
+        [('/noSuchDirectory/noSuchFile.xml', 'ConverterException: File not found...')]
     '''
+    processes = kwds.pop('processes', 1)
+    failures = kwds.pop('failures', None)
     scoreDict = {}
     scoreIndex = 0
     totalScores = len(scoreFilePaths)
-    for filePath in scoreFilePaths:
-        shortfp = filePath.split(os.sep)[-1]
-        if giveUpdates is True:
-            print "Indexing %s (%d/%d)" % (
-                shortfp, scoreIndex, totalScores)
-        scoreIndex += 1
-        try:
-            if not os.path.isabs(filePath):
-                scoreObj = corpus.parse(filePath)
-            else:
-                scoreObj = converter.parse(filePath)
-            scoreDict[shortfp] = indexScoreParts(scoreObj, *args, **kwds)
-        except:
-            print "Failed on parse for: %s" % filePath
+    jobs = [(filePath, args, kwds) for filePath in scoreFilePaths]
+    # daemonic processes, such as the workers of a pool, cannot start a pool
+    if processes < 2 or multiprocessing.current_process().daemon:
+        pool = None
+        results = (_indexScoreFile(job) for job in jobs)
+    else:
+        pool = multiprocessing.Pool(processes)
+        results = pool.imap(_indexScoreFile, jobs, 1)
+    try:
+        for filePath, indexedList, error in results:
+            shortfp = filePath.split(os.sep)[-1]
+            if giveUpdates is True:
+                print "Indexing %s (%d/%d)" % (
+                    shortfp, scoreIndex, totalScores)
+            scoreIndex += 1
+            if error is not None:
+                print "Failed on parse for: %s" % filePath
+                environLocal.printDebug(['failed on parse for', filePath, error])
+                if failures is not None:
+                    failures.append((filePath, error))
+                continue
+            scoreDict[shortfp] = indexedList
+        if pool is not None:
+            pool.close()
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
     return scoreDict
 
 
@@ -239,6 +302,122 @@ def loadScoreDict(filePath):
     return scoreDict
 
 
+def _getFileHash(filePath):
+    '''
+    Return an md5 hash of the contents of the file at filePath, or of the 
+    corpus file it names, or None if no single file is found.
+    '''
+    if not os.path.isfile(filePath):
+        if os.path.isabs(filePath):
+            return None
+        workList = corpus.getWorkList(filePath)
+        if len(workList) != 1:
+            return None
+        filePath = workList[0]
+    m = hashlib.md5()
+    with open(filePath, 'rb') as f:
+        m.update(f.read())
+    return m.hexdigest()
+
+
+def updateScoreIndex(
+    indexFilePath,
+    scoreFilePaths,
+    giveUpdates=False,
+    processes=1,
+    **kwds
+    ):
+    r'''
+    Update the score index saved as a .json file at indexFilePath (which need 
+    not yet exist) so that it indexes the scores in scoreFilePaths, and return it.
+
+    The index is a dictionary with the `scoreDict` of indexScoreFilePaths, 
+    the `fileHashes` of each score file's contents, the `failures` of files
+    that could not be indexed, and the `indexArguments` (segmentLengths, 
+    overlap, and algorithm) used for indexScoreParts.
+
+    Only scores that are not in the index or whose contents have changed are 
+    parsed and indexed (in a pool of `processes` worker processes); scores 
+    no longer in scoreFilePaths are removed. If the indexArguments differ from 
+    those of the saved index, all scores are indexed again.
+    
+    ::
+
+        >>> import os
+        >>> from music21 import environment
+        >>> indexFilePath = environment.Environment().getTempFile('.json')
+        >>> filePaths = [corpus.getWork('bach/bwv197.5.mxl'), 
+        ...     corpus.getWork('bach/bwv190.7.mxl')]
+        >>> index = search.segment.updateScoreIndex(indexFilePath, filePaths, 
+        ...     giveUpdates=True)
+        Indexing bwv197.5.mxl (0/2)
+        Indexing bwv190.7.mxl (1/2)
+        >>> sorted(index['scoreDict'].keys())
+        [u'bwv190.7.mxl', u'bwv197.5.mxl']
+        >>> index['scoreDict']['bwv190.7.mxl'][0]['segmentList'][0]
+        u'NNJLNOLLLJJIJLLLLNJJJIJLLJNNJL'
+
+    Adding a score only indexes that score:
+
+    ::
+
+        >>> filePaths.append(corpus.getWork('bach/bwv197.10.mxl'))
+        >>> index = search.segment.updateScoreIndex(indexFilePath, filePaths, 
+        ...     giveUpdates=True)
+        Indexing bwv197.10.mxl (0/1)
+        >>> len(index['scoreDict'])
+        3
+        >>> index = search.segment.updateScoreIndex(indexFilePath, filePaths, 
+        ...     giveUpdates=True)
+        >>> len(index['fileHashes'])
+        3
+        >>> os.remove(indexFilePath)
+    '''
+    from music21 import search
+    algorithm = kwds.get('algorithm', None)
+    if algorithm is None:
+        algorithm = search.translateStreamToStringNoRhythm
+    indexArguments = {
+        'segmentLengths': kwds.get('segmentLengths', 30), 
+        'overlap': kwds.get('overlap', 12), 
+        'algorithm': algorithm.__name__,
+        }
+
+    oldIndex = None
+    # an empty file, such as a new temporary file, has no index
+    if os.path.exists(indexFilePath) and os.path.getsize(indexFilePath) > 0:
+        oldIndex = loadScoreDict(indexFilePath)
+        if oldIndex.get('indexArguments') != indexArguments:
+            oldIndex = None
+    if oldIndex is None:
+        oldIndex = {'scoreDict': {}, 'fileHashes': {}, 'failures': {}}
+
+    index = {'scoreDict': {}, 'fileHashes': {}, 'failures': {}, 
+             'indexArguments': indexArguments}
+    filePathsToIndex = []
+    for filePath in scoreFilePaths:
+        shortfp = filePath.split(os.sep)[-1]
+        fileHash = _getFileHash(filePath)
+        index['fileHashes'][shortfp] = fileHash
+        if fileHash is None or oldIndex['fileHashes'].get(shortfp) != fileHash:
+            filePathsToIndex.append(filePath)
+        elif shortfp in oldIndex['scoreDict']:
+            index['scoreDict'][shortfp] = oldIndex['scoreDict'][shortfp]
+        elif shortfp in oldIndex['failures']:
+            index['failures'][shortfp] = oldIndex['failures'][shortfp]
+        else:
+            filePathsToIndex.append(filePath)
+
+    failures = []
+    index['scoreDict'].update(indexScoreFilePaths(filePathsToIndex, giveUpdates, 
+        processes=processes, failures=failures, **kwds))
+    for filePath, error in failures:
+        index['failures'][filePath.split(os.sep)[-1]] = error
+    saveScoreDict(index, indexFilePath)
+    # return the index as it would be loaded
+    return loadScoreDict(indexFilePath)
+
+
 def getDifflibOrPyLev(
     seq2=None, 
     junk=None, 
@@ -360,6 +539,238 @@ def scoreSimilarity(
     #pprint.pprint(similarityScores)
     return similarityScores
     
+def indexSegmentNGrams(scoreDict, nGramLength=3):
+    r'''
+    Build an inverted index of the n-grams of length `nGramLength` found in the
+    segments of a scoreDict from indexScoreFilePaths, for use with
+    searchSegmentIndex and segmentIndexSimilarity.
+
+    Returns a dictionary (which can be saved as .json with saveSegmentIndex) 
+    with the `nGramLength`, a list of `segments`, each a list of the score name,
+    part number, segment number, measure number, and segment string, 
+    and `nGrams`, a dictionary of the indices of the segments containing each 
+    n-gram.
+
+    ::
+
+        >>> filePaths = []
+        >>> filePaths.append(corpus.getWork('bach/bwv197.5.mxl'))
+        >>> filePaths.append(corpus.getWork('bach/bwv190.7.mxl'))
+        >>> scoreDict = search.segment.indexScoreFilePaths(filePaths)
+        >>> segmentIndex = search.segment.indexSegmentNGrams(scoreDict)
+        >>> len(segmentIndex['segments'])
+        43
+        >>> segmentIndex['segments'][0]
+        [u'bwv190.7.mxl', 0, 0, 0, 'NNJLNOLLLJJIJLLLLNJJJIJLLJNNJL']
+        >>> segmentIndex['nGrams']['NNJ']
+        [0, 1, 3, 4, 5]
+
+    '''
+    segments = []
+    nGrams = {}
+    for scoreKey in sorted(scoreDict.keys()):
+        thisScore = scoreDict[scoreKey]
+        for pNum in range(len(thisScore)):
+            measureList = thisScore[pNum]['measureList']
+            for segmentNumber, thisSegment in enumerate(thisScore[pNum]['segmentList']):
+                segmentId = len(segments)
+                segments.append([scoreKey, pNum, segmentNumber, 
+                                 measureList[segmentNumber], thisSegment])
+                for nGram in _getNGrams(thisSegment, nGramLength):
+                    if nGram not in nGrams:
+                        nGrams[nGram] = []
+                    nGrams[nGram].append(segmentId)
+    return {'nGramLength': nGramLength, 'segments': segments, 'nGrams': nGrams}
+
+
+def _getNGrams(segment, nGramLength):
+    '''
+    Return the set of distinct n-grams of length nGramLength in segment
+
+    >>> sorted(search.segment._getNGrams('ABCABC', 3))
+    ['ABC', 'BCA', 'CAB']
+    '''
+    return set(segment[i:i + nGramLength] 
+               for i in range(len(segment) - nGramLength + 1))
+
+
+def saveSegmentIndex(segmentIndex, filePath=None):
+    '''
+    Save the segment index from indexSegmentNGrams as a .json file for quickly
+    reloading
+
+    Returns the filepath (assumes you'll probably be using a temporary file)
+    '''
+    return saveScoreDict(segmentIndex, filePath)
+
+
+def loadSegmentIndex(filePath):
+    '''
+    Load a segment index saved with saveSegmentIndex from filePath
+    '''
+    return loadScoreDict(filePath)
+
+
+def _getCandidateSegments(segmentIndex, segment, minimumSharedNGrams):
+    '''
+    Return a dictionary of the number of distinct n-grams that each segment of the 
+    segmentIndex shares with segment, for each segment sharing at least 
+    minimumSharedNGrams.
+    '''
+    counts = {}
+    nGramIndex = segmentIndex['nGrams']
+    for nGram in _getNGrams(segment, segmentIndex['nGramLength']):
+        for segmentId in nGramIndex.get(nGram, ()):
+            counts[segmentId] = counts.get(segmentId, 0) + 1
+    if minimumSharedNGrams > 1:
+        for segmentId in list(counts.keys()):
+            if counts[segmentId] < minimumSharedNGrams:
+                del counts[segmentId]
+    return counts
+
+
+def searchSegmentIndex(
+    segmentIndex,
+    query,
+    minimumRatio=0.5,
+    minimumSharedNGrams=1,
+    algorithm=None,
+    forceDifflib=False,
+    ):
+    r'''
+    Search the segments of a segmentIndex from indexSegmentNGrams for those 
+    similar to `query`, a segment string or a Stream of Notes, which is translated 
+    with `algorithm` (by default music21.search.translateStreamToStringNoRhythm, 
+    as in translateMonophonicPartToSegments).
+
+    Only segments sharing at least `minimumSharedNGrams` n-grams with the query
+    are compared. Returns a list of tuples of score name, voice number, segment 
+    number, measure number, and similarity score, for each segment with a 
+    similarity score of at least `minimumRatio`, from most to least similar.
+
+    ::
+
+        >>> filePaths = []
+        >>> filePaths.append(corpus.getWork('bach/bwv197.5.mxl'))
+        >>> filePaths.append(corpus.getWork('bach/bwv190.7.mxl'))
+        >>> filePaths.append(corpus.getWork('bach/bwv197.10.mxl'))
+        >>> scoreDict = search.segment.indexScoreFilePaths(filePaths)
+        >>> segmentIndex = search.segment.indexSegmentNGrams(scoreDict)
+        >>> query = scoreDict['bwv197.5.mxl'][0]['segmentList'][0]
+        >>> results = search.segment.searchSegmentIndex(segmentIndex, query, 
+        ...     forceDifflib=True)
+        >>> results
+        [(u'bwv197.5.mxl', 0, 0, 0, 1.0)]
+        >>> results = search.segment.searchSegmentIndex(segmentIndex, query, 
+        ...     minimumRatio=0.3, forceDifflib=True)
+        >>> for result in results[0:3]:
+        ...     result
+        ...
+        (u'bwv197.5.mxl', 0, 0, 0, 1.0)
+        (u'bwv197.5.mxl', 0, 2, 9, 0.490...)
+        (u'bwv197.10.mxl', 0, 2, 10, 0.468...)
+
+    A Stream can also be used as a query:
+
+    ::
+
+        >>> bwv197 = corpus.parse('bach/bwv197.5.mxl')
+        >>> query = bwv197.parts[0].flat.notes[0:12]
+        >>> results = search.segment.searchSegmentIndex(segmentIndex, query, 
+        ...     forceDifflib=True)
+        >>> for result in results:
+        ...     result
+        ...
+        (u'bwv197.5.mxl', 0, 2, 9, 0.628...)
+        (u'bwv197.5.mxl', 0, 0, 0, 0.571...)
+    '''
+    if not isinstance(query, basestring):
+        if algorithm is None:
+            from music21 import search
+            algorithm = search.translateStreamToStringNoRhythm
+        query = algorithm(query.flat.getElementsByClass('Note'))
+    segments = segmentIndex['segments']
+    dl = getDifflibOrPyLev(query, forceDifflib=forceDifflib)
+    results = []
+    for segmentId in sorted(_getCandidateSegments(
+            segmentIndex, query, minimumSharedNGrams)):
+        scoreKey, pNum, segmentNumber, measureNumber, thatSegment = segments[segmentId]
+        dl.set_seq1(thatSegment)
+        ratio = dl.ratio()
+        if ratio >= minimumRatio:
+            results.append((scoreKey, pNum, segmentNumber, measureNumber, ratio))
+    results.sort(key=lambda x: x[-1], reverse=True)
+    return results
+
+
+def segmentIndexSimilarity(
+    segmentIndex, 
+    minimumLength=20, 
+    minimumRatio=0.5,
+    minimumSharedNGrams=2,
+    giveUpdates=False, 
+    includeReverse=False,
+    forceDifflib=False,
+    ):
+    r'''
+    Find the similar pairs of segments in different scores of a segmentIndex 
+    from indexSegmentNGrams, as scoreSimilarity does for a scoreDict.
+
+    Unlike scoreSimilarity, each pair is compared only once, only pairs of
+    segments sharing at least `minimumSharedNGrams` n-grams are compared, and 
+    only pairs with a similarity score of at least `minimumRatio` are returned.
+    Pairs of dissimilar segments rarely share many n-grams, so this finds
+    nearly all of the similar pairs while comparing only a small fraction 
+    of all pairs.
+
+    Returns tuples in the same form as scoreSimilarity.
+
+    ::
+
+        >>> filePaths = []
+        >>> filePaths.append(corpus.getWork('bach/bwv197.5.mxl'))
+        >>> filePaths.append(corpus.getWork('bach/bwv190.7.mxl'))
+        >>> filePaths.append(corpus.getWork('bach/bwv197.10.mxl'))
+        >>> scoreDict = search.segment.indexScoreFilePaths(filePaths)
+        >>> segmentIndex = search.segment.indexSegmentNGrams(scoreDict)
+        >>> scoreSim = search.segment.segmentIndexSimilarity(segmentIndex, 
+        ...     forceDifflib=True)
+        >>> scoreSim
+        [(u'bwv190.7.mxl', 1, 5, 25, u'bwv197.5.mxl', 1, 2, 7, 0.518...)]
+    '''
+    similarityScores = []
+    segments = segmentIndex['segments']
+    totalSegments = len(segments)
+    for segmentId in range(totalSegments):
+        thisScoreKey, pNum, segmentNumber, thisMeasureNumber, thisSegment = segments[segmentId]
+        if len(thisSegment) < minimumLength:
+            continue
+        if giveUpdates is True and segmentNumber == 0:
+            print "Comparing {0} {1} ({2}/{3})".format(
+                thisScoreKey, pNum, segmentId, totalSegments)
+        dl = getDifflibOrPyLev(thisSegment, forceDifflib=forceDifflib)
+        candidates = _getCandidateSegments(segmentIndex, thisSegment, 
+                                           minimumSharedNGrams)
+        for thatSegmentId in sorted(candidates):
+            if thatSegmentId <= segmentId:
+                continue
+            (thatScoreKey, pNum2, thatSegmentNumber, thatMeasureNumber, 
+                thatSegment) = segments[thatSegmentId]
+            if thatScoreKey == thisScoreKey or len(thatSegment) < minimumLength:
+                continue
+            dl.set_seq1(thatSegment)
+            ratio = dl.ratio()
+            if ratio < minimumRatio:
+                continue
+            similarityScores.append((thisScoreKey, pNum, segmentNumber, 
+                thisMeasureNumber, thatScoreKey, pNum2, thatSegmentNumber, 
+                thatMeasureNumber, ratio))
+            if includeReverse is True:
+                similarityScores.append((thatScoreKey, pNum2, thatSegmentNumber, 
+                    thatMeasureNumber, thisScoreKey, pNum, segmentNumber, 
+                    thisMeasureNumber, ratio))
+    return similarityScores
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = []
@@ -20,7 +20,9 @@ and :class:`~music21.stream.Score` objects, are defined in
 this module.
 '''
 
+import bisect
 import copy
+import heapq
 import unittest
 import sys
 
@@ -28,7 +30,7 @@ from music21 import base
 
 from music21 import bar
 from music21 import common
-#from music21 import classCache
+from music21 import classCache
 from music21 import clef
 from music21 import chord
 from music21 import defaults
@@ -48,7 +50,10 @@ from music21 import tempo
 
 from music21 import environment
 
+import contextCache
+import flatCache
 import makeNotation
+import offsetIndex
 import streamStatus
 
 _MOD = "stream.py"
@@ -309,6 +314,10 @@ class Stream(base.Music21Object):
 
         self._cache = {}
 
+        # a classCache.ClassIndex of element positions by class name;
+        # created when first needed by getElementsByClass
+        self._classIndex = None
+
         #self.analysisData = defaultdict(list)
         #self.analysisData['ResultDict'] = defaultdict(dict)
 
@@ -462,12 +471,21 @@ class Stream(base.Music21Object):
     # most will set isSorted to False
 
     def _elementsChanged(self, updateIsFlat=True, clearIsSorted=True,
-        memo=None, keepIndex=False):
+        memo=None, keepIndex=False, keepClassIndex=False, flatChange=None):
         '''
         This method is called any time the elements in the Stream are changed.
 
         The various arguments permit optimizing the clearing of cached data in situations when completely dropping all cached data is excessive.
 
+        If `keepClassIndex` is True, the class index is retained, as when
+        elements have only been added with the core insertion methods,
+        which update the index.
+
+        If `flatChange`, a :class:`~music21.stream.flatCache.FlatChange`, is
+        given, the elements added or removed are described by it, and
+        cached flat and semiFlat representations of this Stream and of the
+        Streams containing it are patched rather than discarded.
+
 
         >>> a = stream.Stream()
         >>> a.isFlat
@@ -483,18 +501,34 @@ class Stream(base.Music21Object):
 
         if memo is None:
             memo = []
+        elif id(self) in memo:
+            return
         memo.append(id(self))
         # if this Stream is a flat representation of something, and its
         # elements have changed, than we must clear the cache of that
         # ancestor; we can do that by calling _elementsChanged on
         # flattenedRepresentationOf
         if self.flattenedRepresentationOf is not None:
-            self.flattenedRepresentationOf._elementsChanged(memo=memo)
+            # only a change in order leaves a flat representation valid
+            originChange = None
+            if flatChange is not None and len(flatChange) == 0:
+                originChange = flatChange
+            self.flattenedRepresentationOf._elementsChanged(memo=memo,
+                keepClassIndex=True, flatChange=originChange)
 
         # may not always need to clear cache of the active site, but may
-        # be a good idea; may need to intead clear all sites
-        if self.activeSite is not None:
-            self.activeSite._elementsChanged()
+        # be a good idea; clear the caches of all Streams containing this
+        # Stream. Flat representations are updated by the Streams they
+        # represent.
+        for site in self.sites.getSites(excludeNone=True):
+            if (not isinstance(site, Stream) or
+                site.flattenedRepresentationOf is not None):
+                continue
+            siteChange = None
+            if flatChange is not None:
+                siteChange = flatChange.toSite(self, site)
+            site._elementsChanged(memo=memo, keepClassIndex=True,
+                flatChange=siteChange)
 
         # clear these attributes for setting later
         if clearIsSorted:
@@ -511,15 +545,44 @@ class Stream(base.Music21Object):
                 #if hasattr(e, 'elements'):
                     self.isFlat = False
                     break
+        # the class index is maintained by the core add methods; if
+        # elements were added otherwise, the counts will not match
+        if self._classIndex is not None:
+            if not keepClassIndex or not self._classIndex.isValidFor(self):
+                self._classIndex = None
+
         # resetting the cache removes lowest and highest time storage
         # a slight performance optimization: not creating unless needed
         if len(self._cache) > 0:
             if keepIndex and 'index' in self._cache:
                 indexCache = self._cache['index']
+            patchedFlats = self._patchFlatCaches(flatChange)
             # alway clear cache when elements have changed
             self._cache = {} #common.DefaultHash()
             if keepIndex:
                 self._cache['index'] = indexCache
+            self._cache.update(patchedFlats)
+
+    def _patchFlatCaches(self, flatChange):
+        '''
+        Return a dictionary of the cached flat and semiFlat representations
+        of this Stream, and their branch indices, that could be patched with
+        `flatChange`; count the others as discarded.
+        '''
+        post = {}
+        for key in ('flat', 'semiFlat'):
+            flatStream = self._cache.get(key)
+            if flatStream is None:
+                continue
+            branchKey = key + 'Branches'
+            branches = self._cache.get(branchKey)
+            if (flatChange is not None and branches is not None and
+                flatCache.patchFlat(flatStream, branches, flatChange, self)):
+                post[key] = flatStream
+                post[branchKey] = branches
+            else:
+                flatCache.statistics.invalidations += 1
+        return post
 
     def _getElements(self):
         '''
@@ -541,6 +604,7 @@ class Stream(base.Music21Object):
 
         Removing the elements from the current Stream seems necessary.
         '''
+        self._classIndex = None
         if (not common.isListLike(value) and hasattr(value, 'isStream') and
             value.isStream):
             self._elements = list(value._elements)
@@ -631,6 +695,7 @@ class Stream(base.Music21Object):
 
         # assign in new position
         self._elements[key] = value
+        self._classIndex = None
         value.activeSite = self
         # must get native offset
         value.sites.add(self, value.offset)
@@ -657,6 +722,7 @@ class Stream(base.Music21Object):
         9
         '''
         del self._elements[key]
+        self._classIndex = None
         self._elementsChanged()
 
 
@@ -856,6 +922,15 @@ class Stream(base.Music21Object):
         False
         '''
         #environLocal.printDebug(['calling hasElementOfClass()', className])
+        if isinstance(className, str):
+            if (self._classIndex is not None and
+                self._classIndex.isValidFor(self)):
+                return self._classIndex.hasClass(className)
+            # as context searches ask this repeatedly of the same Stream,
+            # the class index is created on the second request
+            if self._cache.get('classIndexRequested', False):
+                return self._getClassIndex().hasClass(className)
+            self._cache['classIndexRequested'] = True
         for e in self._elements:
             if e.isClassOrSubclass([className]):
                 return True
@@ -866,6 +941,133 @@ class Stream(base.Music21Object):
 
 
 
+    def _getClassIndex(self):
+        '''
+        Return the :class:`~music21.classCache.ClassIndex` of this Stream,
+        creating it if it does not exist or is no longer valid.
+
+        The index is updated as elements are added with the core insertion
+        methods, and is discarded when elements are removed or sorted.
+
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 3)
+        >>> ci = s._getClassIndex()
+        >>> ci.positions['Note']
+        [0, 1, 2]
+        >>> s.append(note.Rest())
+        >>> s._getClassIndex() is ci
+        True
+        >>> ci.positions['Rest']
+        [3]
+        >>> s.pop(0)
+        <music21.note.Note C>
+        >>> s._getClassIndex() is ci
+        False
+        >>> s._getClassIndex().positions['Note']
+        [0, 1]
+        '''
+        if self._classIndex is None or not self._classIndex.isValidFor(self):
+            self._classIndex = classCache.ClassIndex(self)
+        return self._classIndex
+
+    def _addToClassIndex(self, element, atEnd=False):
+        '''
+        Update the class index with an element that has just been appended
+        to `_elements` (or `_endElements` if `atEnd` is True). If the index
+        is out of date it is discarded.
+        '''
+        ci = self._classIndex
+        if atEnd:
+            valid = (ci.streamId == id(self) and
+                ci.elementCount == len(self._elements) and
+                ci.endElementCount == len(self._endElements) - 1)
+        else:
+            valid = (ci.streamId == id(self) and
+                ci.elementCount == len(self._elements) - 1 and
+                ci.endElementCount == len(self._endElements))
+        if not valid:
+            self._classIndex = None
+        elif atEnd:
+            ci.addEndElement(element)
+        else:
+            ci.addElement(element)
+
+    def _getOffsetIndex(self):
+        '''
+        Return the :class:`~music21.stream.offsetIndex.OffsetIndex` of this
+        Stream, or None if the Stream is not sorted by offset.
+
+        As creating the index requires examining every element, the index
+        is only created on the second offset search after the elements of
+        the Stream have changed; the first search examines the elements
+        directly.
+
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 4)
+        >>> s._getOffsetIndex() is None
+        True
+        >>> s._getOffsetIndex()
+        <music21.stream.offsetIndex.OffsetIndex object at 0x...>
+        >>> s.append(note.Note())
+        >>> s._getOffsetIndex() is None
+        True
+        '''
+        if not self.isSorted:
+            return None
+        oi = self._cache.get('offsetIndex')
+        # the cache may be shared with a shallow copy of this Stream
+        if oi is None or oi.srcStreamId != id(self):
+            if not self._cache.get('offsetIndexRequested', False):
+                self._cache['offsetIndexRequested'] = True
+                return None
+            oi = offsetIndex.OffsetIndex(self)
+            self._cache['offsetIndex'] = oi
+        if not oi.isOrdered:
+            return None
+        return oi
+
+    def _getContextCache(self):
+        '''
+        Return the :class:`~music21.stream.contextCache.ContextCache` of this
+        Stream, used by
+        :meth:`~music21.base.Music21Object.getContextByClass` to search the
+        semiFlat representation of this Stream. The cache is kept until the
+        elements of this Stream or of one of its substreams change.
+
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 4)
+        >>> cc = s._getContextCache()
+        >>> len(cc)
+        4
+        >>> s._getContextCache() is cc
+        True
+        >>> s.append(note.Note())
+        >>> s._getContextCache() is cc
+        False
+        '''
+        cc = self._cache.get('contextCache')
+        # the cache may be shared with a shallow copy of this Stream
+        if cc is None or cc.srcStreamId != id(self):
+            cc = contextCache.ContextCache(self)
+            self._cache['contextCache'] = cc
+        return cc
+
+    def _getClassListIndices(self, classList):
+        '''
+        Return a sorted list of indices in `elements` of elements matching
+        `classList`, or None if the class index cannot be used.
+        '''
+        matchedPositions = self._getClassIndex().getPositions(classList, self)
+        if matchedPositions is None:
+            return None
+        if not matchedPositions[1]:
+            return matchedPositions[0]
+        eLen = len(self._elements)
+        return matchedPositions[0] + [eLen + i for i in matchedPositions[1]]
+
     def _hasElementByObjectId(self, objId):
         '''Return True if an element object id, provided as an argument, is contained in this Stream.
 
@@ -1089,6 +1291,7 @@ class Stream(base.Music21Object):
                 else:
                     match = self._endElements.pop(indexInStream-baseElementCount)
                     matchedEndElement = True
+                self._classIndex = None
 
                 if match is not None:
                     if shiftOffsets is True:
@@ -1131,12 +1334,17 @@ class Stream(base.Music21Object):
             else: # its in end elements
                 match = self._endElements.pop(i-baseElementCount)
                 matchedEndElement = True
+            self._classIndex = None
 
             if match is not None:
                 if shiftOffsets is True:
                     matchOffset = match.getOffsetBySite(self)
+                flatChange = None
+                if not matchedEndElement and not shiftOffsets:
+                    flatChange = flatCache.FlatChange(removed=[match])
                 # removing an object will never change the sort status
-                self._elementsChanged(clearIsSorted=False)
+                self._elementsChanged(clearIsSorted=False,
+                    flatChange=flatChange)
                 match.removeLocationBySite(self)
 
                 if shiftOffsets is True and matchedEndElement is False: #shift all elements after the deletion point
@@ -1169,6 +1377,7 @@ class Stream(base.Music21Object):
             post = self._elements.pop(index)
         else: # its in the _endElements
             post = self._endElements.pop(index - eLen)
+        self._classIndex = None
 
         self._elementsChanged(clearIsSorted=False)
         # remove self from locations here only if
@@ -1222,6 +1431,7 @@ class Stream(base.Music21Object):
             post.removeLocationBySite(self)
 
         # call elements changed once; sorted arrangement has not changed
+        self._classIndex = None
         self._elementsChanged(clearIsSorted=False)
 
 
@@ -1257,6 +1467,7 @@ class Stream(base.Music21Object):
             post.removeLocationBySite(self)
 
         # call elements changed once; sorted arrangement has not changed
+        self._classIndex = None
         self._elementsChanged(clearIsSorted=False)
 
 
@@ -1295,7 +1506,7 @@ class Stream(base.Music21Object):
                 newValue = copy.deepcopy(self._derivation)
                 newValue.setContainer(new)
                 setattr(new, name, newValue)
-            elif name == '_cache' or name == 'analysisData':
+            elif name in ('_cache', '_classIndex', 'analysisData'):
                 continue # skip for now
             elif name == '_elements':
                 # must manually add elements to new Stream
@@ -1450,6 +1661,8 @@ class Stream(base.Music21Object):
             element.activeSite = self
         # will be sorted later if necessary
         self._elements.append(element)
+        if self._classIndex is not None:
+            self._addToClassIndex(element)
         return storeSorted
 
 
@@ -1555,9 +1768,13 @@ class Stream(base.Music21Object):
         storeSorted = self._insertCore(offset, element,
                      ignoreSort=ignoreSort, setActiveSite=setActiveSite)
         updateIsFlat = False
+        flatChange = None
         if element.isStream:
             updateIsFlat = True
-        self._elementsChanged(updateIsFlat=updateIsFlat)
+        else:
+            flatChange = flatCache.FlatChange(added=[(element, offset)])
+        self._elementsChanged(updateIsFlat=updateIsFlat, keepClassIndex=True,
+            flatChange=flatChange)
         if ignoreSort is False:
             self.isSorted = storeSorted
 
@@ -1576,6 +1793,8 @@ class Stream(base.Music21Object):
         # need to explicitly set the activeSite of the element
         element.activeSite = self
         self._elements.append(element)
+        if self._classIndex is not None:
+            self._addToClassIndex(element)
         # does not change sorted state
         if element.duration is not None:
             self._setHighestTime(self.highestTime +
@@ -1765,6 +1984,7 @@ class Stream(base.Music21Object):
             # back into a list for list processing if single
             others = [others]
         updateIsFlat = False
+        flatChange = flatCache.FlatChange()
         for e in others:
             try:
                 if e.isStream: # any on that is a Stream req update
@@ -1775,9 +1995,12 @@ class Stream(base.Music21Object):
             # add this Stream as a location for the new elements, with the
             # the offset set to the current highestTime
             e.sites.add(self, highestTime)
+            flatChange.added.append((e, highestTime))
             # need to explicitly set the activeSite of the element
             e.activeSite = self
             self._elements.append(e)
+            if self._classIndex is not None:
+                self._addToClassIndex(e)
 
             # TODO: may need to be replaced with a common almost equal
             if e.duration.quarterLength != 0:
@@ -1787,7 +2010,10 @@ class Stream(base.Music21Object):
         # does not change sorted state
         storeSorted = self.isSorted
         # we cannot keep the index cache here b/c we might
-        self._elementsChanged(updateIsFlat=updateIsFlat)
+        if updateIsFlat:
+            flatChange = None
+        self._elementsChanged(updateIsFlat=updateIsFlat, keepClassIndex=True,
+            flatChange=flatChange)
         self.isSorted = storeSorted
         self._setHighestTime(highestTime) # call after to store in cache
 
@@ -1804,6 +2030,8 @@ class Stream(base.Music21Object):
         # could also do self.elements = self.elements + [element]
         #self._elements.append(element)
         self._endElements.append(element)
+        if self._classIndex is not None:
+            self._addToClassIndex(element, atEnd=True)
 
 
     def storeAtEnd(self, itemOrList, ignoreSort=False):
@@ -1853,7 +2081,7 @@ class Stream(base.Music21Object):
 
         self._storeAtEndCore(element)
         # Streams cannot reside in end elements, thus do not update is flat
-        self._elementsChanged(updateIsFlat=False)
+        self._elementsChanged(updateIsFlat=False, keepClassIndex=True)
 
 
     #---------------------------------------------------------------------------
@@ -2041,6 +2269,7 @@ class Stream(base.Music21Object):
         except StreamException:
             return  # do nothing if no match
 
+        self._classIndex = None
         eLen = len(self._elements)
         if i < eLen:
             target = self._elements[i] # target may have been obj id; reassing
@@ -2520,15 +2749,24 @@ class Stream(base.Music21Object):
         if returnList is False:
             found.isSorted = self.isSorted
 
-        # to use class cache, class must be provided as a string,
-        # and there must be only one class
-#         if canUseClassCache:
-#             if self._cache['classCache'] is None:
-#                 self._cache['classCache'] = classCache.ClassCache()
-#                 self._cache['classCache'].load(self)
-#             found = self._cache['classCache'].getElementsByClass(found,
-#                                               classFilterList)
-#             return found
+        # the class index gives the positions of all matching elements;
+        # as positions are in _elements order, offset order is retained
+        matchedPositions = self._getClassIndex().getPositions(
+            classFilterList, self)
+        if matchedPositions is not None:
+            elements = self._elements
+            endElements = self._endElements
+            if returnList:
+                found.extend([elements[i] for i in matchedPositions[0]])
+                found.extend([endElements[i] for i in matchedPositions[1]])
+                return found
+            for i in matchedPositions[0]:
+                e = elements[i]
+                found._insertCore(e.getOffsetBySite(self), e, ignoreSort=True)
+            for i in matchedPositions[1]:
+                found._storeAtEndCore(endElements[i])
+            found._elementsChanged()
+            return found
 
         #found.show('t')
         # need both _elements and _endElements
@@ -2961,8 +3199,19 @@ class Stream(base.Music21Object):
         found.derivesFrom = self
         found.derivationMethod = 'getElementsByOffset'
 
-        # need both _elements and _endElements
-        for e in self.elements:
+        if not self.isSorted and self.autoSort:
+            self.sort() # will set isSorted to True
+        oi = self._getOffsetIndex()
+        if oi is not None:
+            # only elements beginning in the span, or, if mustBeginInSpan is
+            # False, sounding at its start, need to be examined
+            candidates = [oi.elements[i] for i in oi.getRange(offsetStart,
+                offsetEnd, includeSounding=not mustBeginInSpan)]
+        else:
+            # need both _elements and _endElements
+            candidates = self.elements
+
+        for e in candidates:
             if classList is not None:
                 if not e.isClassOrSubclass(classList):
                     continue
@@ -3117,6 +3366,48 @@ class Stream(base.Music21Object):
         candidates = []
         nearestTrailSpan = offset # start with max time
 
+        if not self.isSorted and self.autoSort:
+            self.sort() # will set isSorted to True
+        oi = self._getOffsetIndex()
+        if oi is not None:
+            elements = oi.elements
+            indices = None
+            if classList is not None:
+                indices = self._getClassListIndices(classList)
+            if indices is not None or classList is None:
+                # search backwards from the last element at or before
+                # offset; only the elements with the nearest offset are
+                # candidates
+                j = oi.bisectRight(offset + .00000001, indices)
+                candidateOffset = None
+                while j > 0:
+                    j -= 1
+                    if indices is None:
+                        i = j
+                    else:
+                        i = indices[j]
+                    eOffset = oi.offsets[i]
+                    span = offset - eOffset
+                    if span < -.000000001:
+                        continue
+                    if candidateOffset is None:
+                        candidateOffset = eOffset
+                        # elements before zero are only found when at offset
+                        if (span > nearestTrailSpan and
+                            not common.almostEquals(span, 0)):
+                            break
+                    elif eOffset != candidateOffset:
+                        break
+                    candidates.append((span, elements[i]))
+                if len(candidates) > 0:
+                    # restore stream order, as ties are kept in order
+                    candidates.reverse()
+                    candidates.sort()
+                    candidates[0][1].activeSite = self
+                    return candidates[0][1]
+                else:
+                    return None
+
         # need both _elements and _endElements
         for e in self.elements:
             #eClasses = e.classes  # store once, as this is property call
@@ -3210,6 +3501,46 @@ class Stream(base.Music21Object):
         candidates = []
         nearestTrailSpan = offset # start with max time
 
+        if not self.isSorted and self.autoSort:
+            self.sort() # will set isSorted to True
+        oi = self._getOffsetIndex()
+        if oi is not None:
+            elements = oi.elements
+            indices = None
+            if classList is not None:
+                indices = self._getClassListIndices(classList)
+            if indices is not None or classList is None:
+                # search backwards from the last element at offset; only the
+                # elements with the nearest offset before are candidates
+                j = oi.bisectRight(offset, indices)
+                candidateOffset = None
+                while j > 0:
+                    j -= 1
+                    if indices is None:
+                        i = j
+                    else:
+                        i = indices[j]
+                    eOffset = oi.offsets[i]
+                    span = offset - eOffset
+                    if span <= 0:
+                        continue
+                    if candidateOffset is None:
+                        candidateOffset = eOffset
+                        # elements before zero are never found
+                        if span > nearestTrailSpan:
+                            break
+                    elif eOffset != candidateOffset:
+                        break
+                    candidates.append((span, elements[i]))
+                if len(candidates) > 0:
+                    # restore stream order, as ties are kept in order
+                    candidates.reverse()
+                    candidates.sort()
+                    candidates[0][1].activeSite = self
+                    return candidates[0][1]
+                else:
+                    return None
+
         # need both _elements and _endElements
         for e in self.elements:
             #eClasses = e.classes  # store once, as this is property call
@@ -4952,6 +5283,12 @@ class Stream(base.Music21Object):
         all parts, or if multi-part by all unique offsets. All
         simultaneous durations are then gathered into single chords.
 
+        Scores of Parts of Measures (and Parts of Measures) are chordified
+        in a single pass over the onsets and releases of all parts, which
+        builds new Measures directly and neither copies nor alters the
+        source (see :meth:`~music21.stream.Stream._chordifyBySweep`);
+        other Streams are chordified by slicing a copy of the Stream.
+
         If `addPartIdAsGroup` is True, all elements found in the
         Stream will have their source Part id added to the
         element's pitches' Group.  These groups names are useful
@@ -5050,6 +5387,31 @@ class Stream(base.Music21Object):
             >>> cn[0].pitches
             (<music21.pitch.Pitch C4>, <music21.pitch.Pitch D#4>)
 
+        '''
+        post = self._chordifyBySweep(addTies=addTies,
+            displayTiedAccidentals=displayTiedAccidentals,
+            addPartIdAsGroup=addPartIdAsGroup,
+            removeRedundantPitches=removeRedundantPitches,
+            toSoundingPitch=toSoundingPitch)
+        if post is None:
+            post = self._chordifyBySlicing(addTies=addTies,
+                displayTiedAccidentals=displayTiedAccidentals,
+                addPartIdAsGroup=addPartIdAsGroup,
+                removeRedundantPitches=removeRedundantPitches,
+                toSoundingPitch=toSoundingPitch)
+        return post
+
+    def _chordifyBySlicing(self, addTies=True, displayTiedAccidentals=False,
+        addPartIdAsGroup=False, removeRedundantPitches=True,
+        toSoundingPitch=True):
+        '''
+        Chordify a deepcopy of this Stream by slicing every Part
+        at all the offsets of each Measure and gathering the sliced
+        notes with :meth:`~music21.stream.Stream.makeChords`.
+
+        This is the general implementation used by
+        :meth:`~music21.stream.Stream.chordify` for Streams that
+        :meth:`~music21.stream.Stream._chordifyBySweep` does not handle.
         '''
         # TODO: need to handle flat Streams contained in a Stream
         # TODO: need to handle voices
@@ -5168,6 +5530,296 @@ class Stream(base.Music21Object):
         #return post
 
 
+    def _chordifyBySweep(self, addTies=True, displayTiedAccidentals=False,
+        addPartIdAsGroup=False, removeRedundantPitches=True,
+        toSoundingPitch=True):
+        '''
+        Chordify a Score of Parts of Measures, or a Part of Measures,
+        in one sorted pass over the onsets and releases of all Parts,
+        without copying or slicing the source.
+
+        The pieces that slicing would produce are only computed, never
+        made; each Chord is built from copies of the Pitches that sound
+        at its offset and placed into a copy of the first Part's Measure,
+        made without its notes. The result is the same as that of
+        :meth:`~music21.stream.Stream._chordifyBySlicing`.
+
+        Returns None for Streams that this does not handle: those
+        without Measures, with Measures that do not line up across
+        Parts, with notes outside of Measures or in Streams other
+        than Voices, with Unpitched or Harmony objects, with nothing
+        but rests, or whose first Part needs to be transposed to
+        sounding pitch.
+
+        >>> b = corpus.parse('bach/bwv66.6')
+        >>> cc = b._chordifyBySweep()
+        >>> for c in cc.measure(1).notes:
+        ...     print c
+        <music21.chord.Chord A4 F#4 C#4 F#3>
+        <music21.chord.Chord B4 E4 B3 G#3>
+        <music21.chord.Chord C#5 E4 A3>
+        <music21.chord.Chord E5 E4 B3 G#3>
+        >>> b.parts[0].measure(1).notes[0]
+        <music21.note.Note A>
+        '''
+        if self.hasPartLikeStreams():
+            allParts = list(self.getElementsByClass('Stream'))
+            partOffsets = [p.getOffsetBySite(self) for p in allParts]
+        else:
+            allParts = [self]
+            partOffsets = [0.0]
+        if toSoundingPitch and allParts[0].atSoundingPitch == False:
+            return None
+        for e in self._elements:
+            if isinstance(e, note.GeneralNote):
+                return None
+        for p in allParts:
+            for e in p._elements:
+                if (isinstance(e, note.GeneralNote) or
+                    (e.isStream and 'Measure' not in e.classes)):
+                    return None
+        partsMeasures = [list(p.getElementsByClass('Measure')) for p in allParts]
+        mCount = len(partsMeasures[0])
+        if mCount == 0:
+            return None
+        for measures in partsMeasures:
+            if len(measures) != mCount:
+                return None
+
+        # each piece is a tuple of: absolute offset, sort key, cleaned
+        # absolute offset, cleaned absolute end, source, piece index,
+        # piece count, whether it is tagged with its part id, and the
+        # tie types of the last piece of a tied source
+        pieces = []
+        # slicing changes the type of a stop Tie of the first piece in
+        # place; Tie objects may be shared between notes
+        tieTypes = {}
+        for i in range(mCount):
+            # gather notes and rests by measure, as in Measure.flat
+            measureNotes = []
+            uniqueOffsets = set()
+            for pNum, p in enumerate(allParts):
+                m = partsMeasures[pNum][i]
+                hasVoices = False
+                found = []
+                for e in m.elements:
+                    if e.isStream:
+                        if 'Voice' not in e.classes or e.getOffsetBySite(m) != 0:
+                            return None
+                        hasVoices = True
+                        for eSub in e.elements:
+                            if eSub.isStream:
+                                return None
+                            found.append((eSub, eSub.getOffsetBySite(e), True))
+                    elif isinstance(e, note.GeneralNote):
+                        found.append((e, e.getOffsetBySite(m), False))
+                    elif pNum == 0 and e.duration.quarterLength > 0:
+                        # would be sliced and kept in the chordified Measure
+                        return None
+                for e, o, inVoice in found:
+                    classes = e.classes
+                    if 'Harmony' in classes or not ('Note' in classes or
+                        'Chord' in classes or 'Rest' in classes):
+                        return None
+                    oStart = common.cleanupFloat(o)
+                    uniqueOffsets.add(oStart)
+                    uniqueOffsets.add(common.cleanupFloat(
+                        oStart + e.duration.quarterLength))
+                # a Measure with Voices only slices the notes in its Voices
+                measureNotes.append((pNum, m, found, hasVoices))
+            uniqueOffsets = sorted(uniqueOffsets)
+
+            for pNum, m, found, hasVoices in measureNotes:
+                pOffset = partOffsets[pNum]
+                mOffset = m.getOffsetBySite(allParts[pNum])
+                created = 0
+                for seq, (e, o, inVoice) in enumerate(found):
+                    ql = e.duration.quarterLength
+                    oStart = common.cleanupFloat(o)
+                    oEnd = common.cleanupFloat(oStart + ql)
+                    cutPoints = []
+                    if inVoice == hasVoices:
+                        cutPoints = [c for c in uniqueOffsets if oStart < c < oEnd]
+                    starts = [o] + cutPoints
+                    ends = cutPoints + [o + ql]
+                    remainTies = None
+                    if addTies and cutPoints and 'Rest' not in e.classes:
+                        remainTies = []
+                        if e.isChord:
+                            components = e._notes
+                        else:
+                            components = [e]
+                        for comp in components:
+                            tieType = None
+                            if comp.tie is not None:
+                                tieType = tieTypes.get(id(comp.tie), comp.tie.type)
+                            if tieType in ('start', 'continue'):
+                                remainTies.append('continue')
+                            else:
+                                remainTies.append('stop')
+                                if tieType == 'stop':
+                                    tieTypes[id(comp.tie)] = 'continue'
+                    sortKey = (e.priority, e.classSortOrder, not e.isGrace)
+                    for k in range(len(starts)):
+                        oAbs = (starts[k] + mOffset) + pOffset
+                        oClean = common.cleanupFloat(oAbs)
+                        if k == 0:
+                            gather = (pNum, i, 0, seq)
+                        else:
+                            gather = (pNum, i, 1, created)
+                            created += 1
+                        pieces.append((oAbs, sortKey + gather, oClean,
+                            common.cleanupFloat(oClean + ends[k] - starts[k]),
+                            e, k, len(starts), k > 0 or not inVoice, remainTies))
+
+        boundaries = set()
+        for piece in pieces:
+            boundaries.add(piece[2])
+            boundaries.add(piece[3])
+        boundaries = sorted(boundaries)
+        pieces.sort(key=lambda piece: (piece[0],) + piece[1])
+
+        windows = [[] for b in boundaries]
+        for piece in pieces:
+            if 'Rest' in piece[4].classes:
+                continue
+            windowIndex = bisect.bisect_right(boundaries, piece[2]) - 1
+            if 0 <= windowIndex < len(boundaries) - 1:
+                windows[windowIndex].append(piece)
+        if not [w for w in windows if w]:
+            return None
+
+        partTags = [str(p.id) for p in allParts]
+        expressionCopies = {}
+        post = Stream()
+        for windowIndex, window in enumerate(windows):
+            if not window:
+                continue
+            # notes beginning in a window are found sorted by class order
+            window.sort(key=lambda piece: piece[1][:3])
+            oStart = boundaries[windowIndex]
+            oEnd = boundaries[windowIndex + 1]
+            c = chord.Chord()
+            c.duration.quarterLength = oEnd - oStart
+            tempPitches = []
+            tempTies = []
+            for piece in window:
+                (unused_oAbs, sortKey, unused_oClean, unused_oEnd,
+                    e, k, count, tagged, remainTies) = piece
+                groups = list(e.groups)
+                if tagged and addPartIdAsGroup:
+                    groups.append(partTags[sortKey[3]])
+                if e.isChord:
+                    components = e._notes
+                else:
+                    components = [e]
+                for j, comp in enumerate(components):
+                    p = copy.deepcopy(comp.pitch)
+                    if k > 0 and not e.isChord and p.accidental is not None:
+                        if not displayTiedAccidentals:
+                            if e.accidental.displayType not in ['even-tied']:
+                                p.accidental.displayStatus = False
+                        else:
+                            p.accidental.displayType = 'even-tied'
+                            p.accidental.displayStatus = True
+                    if addPartIdAsGroup:
+                        for g in groups:
+                            p.groups.append(g)
+                    tieType = None
+                    if comp.tie is not None:
+                        tieType = tieTypes.get(id(comp.tie), comp.tie.type)
+                    if remainTies is not None:
+                        if k == 0:
+                            if tieType is None:
+                                tieType = 'start'
+                        elif k == count - 1:
+                            tieType = remainTies[j]
+                        else:
+                            tieType = 'continue'
+                    tempPitches.append(p)
+                    tempTies.append(tieType)
+            c.pitches = tempPitches
+            for tieType, p in zip(tempTies, tempPitches):
+                if tieType is not None:
+                    c.setTie(tieType, p)
+            for piece in window:
+                e, k = piece[4], piece[5]
+                if k == 0:
+                    c.articulations += [copy.deepcopy(a) for a in e.articulations]
+            for piece in window:
+                e, k, count = piece[4], piece[5], piece[6]
+                if id(e) not in expressionCopies:
+                    expressionCopies[id(e)] = [copy.deepcopy(x) for x in e.expressions]
+                for x in expressionCopies[id(e)]:
+                    tieAttach = getattr(x, 'tieAttach', 'all')
+                    if tieAttach == 'first' and k > 0:
+                        continue
+                    if tieAttach == 'last' and k < count - 1:
+                        continue
+                    c.expressions.append(x)
+            if removeRedundantPitches:
+                c.removeRedundantPitches(inPlace=True)
+            post._insertCore(oStart, c)
+
+        # fill gaps with rests as makeRests does for the flat, sliced Score,
+        # in which all elements other than notes and rests remain
+        sourceFlat = self.flat
+        oLowTarget = sourceFlat.lowestOffset
+        oHighTarget = sourceFlat.highestTime
+        spans = [(e.getOffsetBySite(sourceFlat), e.duration.quarterLength)
+            for e in sourceFlat._elements if not isinstance(e, note.GeneralNote)]
+        spans += [(c.getOffsetBySite(post), c.duration.quarterLength) for c in post._elements]
+        oLow = min([o for o, ql in spans])
+        oHigh = max([0.0] + [o + ql for o, ql in spans])
+        rests = []
+        if oLow - oLowTarget > 0:
+            rests.append((oLowTarget, oLow - oLowTarget))
+        if oHighTarget - oHigh > 0:
+            rests.append((oHigh, oHighTarget - oHigh))
+        spans += rests
+        spans.sort(key=lambda span: span[0])
+        highestCurrentEndTime = 0
+        for o, ql in spans:
+            if o > highestCurrentEndTime:
+                if o - highestCurrentEndTime <= .001:
+                    continue
+                rests.append((highestCurrentEndTime, o - highestCurrentEndTime))
+            highestCurrentEndTime = max(highestCurrentEndTime, o + ql)
+        for o, ql in rests:
+            r = note.Rest()
+            r.duration.quarterLength = ql
+            post._insertCore(o, r)
+        post._elementsChanged()
+
+        # distribute into copies of the first Part's Measures
+        postNotes = list(post.notesAndRests)
+        postOffsets = [e.getOffsetBySite(post) for e in postNotes]
+        mStream = allParts[0].__class__()
+        mStream.derivesFrom = self
+        mStream.derivationMethod = 'chordify'
+        for m in partsMeasures[0]:
+            mOffsetStart = m.getOffsetBySite(allParts[0])
+            mOffsetEnd = mOffsetStart + m.duration.quarterLength
+            storedElements = m._elements
+            m._elements = [e for e in storedElements if not e.isStream and
+                not isinstance(e, note.GeneralNote)]
+            try:
+                mNew = copy.deepcopy(m)
+            finally:
+                m._elements = storedElements
+            for j in range(bisect.bisect_left(postOffsets, mOffsetStart),
+                bisect.bisect_left(postOffsets, mOffsetEnd)):
+                mNew._insertCore(postOffsets[j] - mOffsetStart, postNotes[j])
+            mNew._elementsChanged()
+            mStream._insertCore(mOffsetStart, mNew)
+        mStream._elementsChanged()
+
+        if (self.hasPartLikeStreams() and hasattr(self, 'metadata')
+            and self.metadata is not None):
+            mStream.insert(0, copy.deepcopy(self.metadata))
+        return mStream
+
+
     def splitByClass(self, classObj, fx):
         '''
         Given a stream, get all objects of type classObj and divide them into
@@ -6036,6 +6688,7 @@ class Stream(base.Music21Object):
         # experimental
         if (not self.isSorted and self._mutable) or force:
             #environLocal.printDebug(['sorting _elements, _endElements'])
+            unsortedElements = self._elements[:]
             self._elements.sort(
                 cmp=lambda x, y: cmp(
                     x.getOffsetBySite(self), y.getOffsetBySite(self))
@@ -6047,10 +6700,30 @@ class Stream(base.Music21Object):
                 cmp=lambda x, y: cmp(x.priority, y.priority) or
                     cmp(x.classSortOrder, y.classSortOrder)
                 )
+            orderChanged = False
+            for i, e in enumerate(unsortedElements):
+                if self._elements[i] is not e:
+                    orderChanged = True
+                    break
             # as sorting changes order, elements have changed;
             # need to clear cache, but flat status is the same
-            self._elementsChanged(updateIsFlat=False, clearIsSorted=False)
             self.isSorted = True
+            if orderChanged and not self.isFlat:
+                self._elementsChanged(updateIsFlat=False, clearIsSorted=False)
+            else:
+                # as sorting is stable, flattening a Stream that is flat or
+                # whose order is unchanged gives the same order as before;
+                # cached flat representations remain valid
+                self._elementsChanged(updateIsFlat=False, clearIsSorted=False,
+                    keepClassIndex=not orderChanged,
+                    flatChange=flatCache.FlatChange())
+                if orderChanged:
+                    # except for those of this Stream, as the stored branch
+                    # indices are no longer valid
+                    for key in ('flat', 'semiFlat'):
+                        if key in self._cache:
+                            flatCache.statistics.invalidations += 1
+                    self._cache = {}
             #environLocal.printDebug(['_elements', self._elements])
 
     def _getSorted(self):
@@ -6168,11 +6841,18 @@ class Stream(base.Music21Object):
         ''')
 
 
-    def _getFlatOrSemiFlat(self, retainContainers):
+    def _getFlatOrSemiFlat(self, retainContainers, branches=None):
         '''
         The `retainContainers` option, if True,
         returns a semiFlat version: containers are not
         discarded in flattening.
+
+        If `branches`, a dictionary, is given, it is filled with, for the id
+        of each element of the flattened Stream, its path: a tuple of the
+        index in this Stream's `_elements` of the element from which it was
+        taken, followed by the path of the element in that element's flat
+        representation, if it is a Stream. The paths are used to patch the
+        flattened Stream in :func:`~music21.stream.flatCache.patchFlat`.
         '''
         #environLocal.printDebug(['_getFlatOrSemiFlat(): self', self, 'self.activeSite', self.activeSite])
 
@@ -6192,9 +6872,12 @@ class Stream(base.Music21Object):
         sNew._cache = {} #common.DefaultHash()
         sNew._elements = []
         sNew._endElements = []
-        sNew._elementsChanged()
+        # as this copy shares the sites of this Stream, calling
+        # _elementsChanged() would clear the caches of its containers
+        sNew._classIndex = None
+        sNew.isSorted = False
 
-        for e in self._elements:
+        for i, e in enumerate(self._elements):
             #environLocal.printDebug(['_getFlatOrSemiFlat', 'processing e:', e])
             # check for stream instance instead
 
@@ -6214,11 +6897,17 @@ class Stream(base.Music21Object):
                     #sNew.insert(recurseStreamOffset, e, setActiveSite=False)
                     sNew._insertCore(recurseStreamOffset, e,
                         setActiveSite=False)
+                    if branches is not None:
+                        branches[id(e)] = (i,)
                     # this may be a cached version;
                     recurseStream = e.semiFlat
                     #recurseStream = e._getFlatOrSemiFlat(retainContainers=True)
+                    subBranches = e._cache.get('semiFlatBranches')
                 else:
                     recurseStream = e.flat
+                    subBranches = e._cache.get('flatBranches')
+                if subBranches is None:
+                    subBranches = {}
 
                 #environLocal.printDebug("recurseStreamOffset: " + str(e.id) + " " + str(recurseStreamOffset))
                 # recurse Stream is the flat or semiFlat contents of a Stream
@@ -6230,17 +6919,29 @@ class Stream(base.Music21Object):
                     #    recurseStreamOffset, eSub)
                     sNew._insertCore(eSub.getOffsetBySite(recurseStream) +
                         recurseStreamOffset, eSub)
+                    if branches is not None:
+                        # without a path in the flat representation of e,
+                        # the element cannot be ordered when patching
+                        subBranch = subBranches.get(id(eSub))
+                        if subBranch is not None:
+                            subBranch = (i,) + subBranch
+                        branches[id(eSub)] = subBranch
             # if element not a Stream
             else:
                 # insert into new stream at offset in old stream
                 #sNew.insert(e.getOffsetBySite(self), e)
                 sNew._insertCore(e.getOffsetBySite(self), e)
+                if branches is not None:
+                    branches[id(e)] = (i,)
 
         # highest time elements should never be Streams
         for e in self._endElements:
             #sNew.storeAtEnd(e)
             sNew._storeAtEndCore(e)
 
+        flatCache.statistics.rebuilds += 1
+        flatCache.statistics.rebuiltElements += (len(sNew._elements) +
+            len(sNew._endElements))
         sNew.isFlat = True
         # here, we store the source stream from which this stream was derived
         # TODO: this should probably be a weakref
@@ -6268,18 +6969,23 @@ class Stream(base.Music21Object):
         sNew._cache = {} #common.DefaultHash()
         sNew._elements = []
         sNew._endElements = []
-        sNew._elementsChanged() # clear caches
-        for e in self._elements:
+        # as this copy shares the sites of the semiFlat Stream, calling
+        # _elementsChanged() would clear the caches of its containers
+        sNew._classIndex = None
+        for e in sf._elements:
             # if this element is a Stream, recurse
             #if hasattr(e, "elements"):
             if e.isStream:
                 continue
-            sNew._insertCore(e.getOffsetBySite(self), e)
+            sNew._insertCore(e.getOffsetBySite(sf), e)
         # endElements should never be Streams
-        for e in self._endElements:
+        for e in sf._endElements:
             #sNew.storeAtEnd(e)
             sNew._storeAtEndCore(e)
-        sNew._elementsChanged()
+        sNew.isSorted = False
+        flatCache.statistics.rebuilds += 1
+        flatCache.statistics.rebuiltElements += (len(sNew._elements) +
+            len(sNew._endElements))
         sNew.isFlat = True
         # here, we store the source stream from which this stream was derived
         sNew.flattenedRepresentationOf = sf.flattenedRepresentationOf
@@ -6289,9 +6995,15 @@ class Stream(base.Music21Object):
         if 'flat' not in self._cache or self._cache['flat'] is None:
             if 'semiFlat' in self._cache and self._cache['semiFlat'] is not None:
                 self._cache['flat'] = self._getFlatFromSemiFlat()
+                if 'semiFlatBranches' in self._cache:
+                    self._cache['flatBranches'] = dict(
+                        self._cache['semiFlatBranches'])
             else:
+                branches = {}
                 self._cache['flat'] = self._getFlatOrSemiFlat(
-                                      retainContainers=False)
+                                      retainContainers=False,
+                                      branches=branches)
+                self._cache['flatBranches'] = branches
         return self._cache['flat']
 
         # non cached approach
@@ -6489,8 +7201,10 @@ class Stream(base.Music21Object):
     def _getSemiFlat(self):
         if 'semiFlat' not in self._cache or self._cache['semiFlat'] is None:
             #environLocal.printDebug(['using cached semiFlat', self])
+            branches = {}
             self._cache['semiFlat'] = self._getFlatOrSemiFlat(
-                                    retainContainers=True)
+                                    retainContainers=True, branches=branches)
+            self._cache['semiFlatBranches'] = branches
         return self._cache['semiFlat']
 
         #return self._getFlatOrSemiFlat(retainContainers = True)
@@ -6711,6 +7425,143 @@ class Stream(base.Music21Object):
             restoreActiveSites=True):
             pass
 
+    def _iterFlatSortKeys(self, retainContainers=False, nested=False):
+        '''
+        Yield (sortKey, element) pairs for all non-Stream elements in this
+        Stream and its substreams, in the order given by the
+        :attr:`~music21.stream.Stream.flat` representation, or, if
+        `retainContainers` is True, for all elements, in the order given by
+        the :attr:`~music21.stream.Stream.semiFlat` representation. The sort
+        key is that used by :meth:`~music21.stream.Stream.sort`, beginning
+        with the offset relative to this Stream. No Stream is created and
+        no element's sites are changed.
+
+        As in heapq.merge(), the elements of this Stream and those yielded
+        for each of its substreams are merged with a heap, holding only the
+        next element of each substream, so no list of all the elements is
+        made at any level.
+
+        If `nested` is True, the elements stored at the end of this Stream
+        are merged with the others by offset, as they are when this Stream
+        is flattened within a Stream containing it; otherwise they are
+        yielded last.
+
+
+        >>> m = stream.Measure()
+        >>> m.insert(0, clef.BassClef())
+        >>> m.append(note.Note(type='whole'))
+        >>> [(key, e.classes[0]) for key, e in m._iterFlatSortKeys()]
+        [((0.0, 0, 0, True), 'BassClef'), ((0.0, 0, 20, True), 'Note')]
+        '''
+        # among elements that compare equal, those of this Stream are
+        # ordered by their index, and those of a substream follow the
+        # substream itself, in the order that the substream gives
+        heap = []
+        for i, e in enumerate(self._elements):
+            offset = e.getOffsetBySite(self)
+            if not e.isStream or retainContainers:
+                heap.append(((offset, e.priority, e.classSortOrder,
+                              not e.isGrace), i, 0, e, None))
+            if not e.isStream:
+                continue
+            subIterator = e._iterFlatSortKeys(
+                retainContainers=retainContainers, nested=True)
+            for subKey, eSub in subIterator:
+                # as in _getFlatOrSemiFlat(), sub-offsets are added to the
+                # offset of the substream
+                heap.append(((subKey[0] + offset,) + subKey[1:], i, 1, eSub,
+                             (subIterator, offset)))
+                break
+        endElements = sorted(self._endElements,
+            key=lambda e: (e.priority, e.classSortOrder))
+        endKeys = [(e.getOffsetBySite(self), e.priority, e.classSortOrder,
+                    not e.isGrace) for e in endElements]
+        if nested:
+            for j, e in enumerate(endElements):
+                heap.append((endKeys[j], len(self._elements) + j, 0, e, None))
+        heapq.heapify(heap)
+
+        while heap:
+            key, i, unused_order, e, source = heap[0]
+            if source is None:
+                heapq.heappop(heap)
+            else:
+                subIterator, offset = source
+                for subKey, eSub in subIterator:
+                    heapq.heapreplace(heap, ((subKey[0] + offset,) + subKey[1:],
+                        i, 1, eSub, source))
+                    break
+                else:
+                    heapq.heappop(heap)
+            yield key, e
+
+        if not nested:
+            for j, e in enumerate(endElements):
+                yield endKeys[j], e
+
+    def _getFlatOffsets(self, retainContainers=False, offsetsById=None):
+        '''
+        Return a list of (offset, element) pairs for the elements yielded by
+        :meth:`~music21.stream.Stream._iterFlatSortKeys`.
+
+        If `offsetsById`, a dictionary, is given, it is filled with the
+        offset of each element by id(); as in a Stream, an element found
+        more than once has the offset at which it was last found.
+        '''
+        post = [(key[0], e) for key, e in
+                self._iterFlatSortKeys(retainContainers=retainContainers)]
+        if offsetsById is not None:
+            for offset, e in post:
+                offsetsById[id(e)] = offset
+        return post
+
+    def iterFlat(self, classFilter=None):
+        '''
+        Iterate over the elements of the :attr:`~music21.stream.Stream.flat`
+        representation of this Stream without creating it, yielding
+        (offset, element) pairs, where the offset is relative to this Stream.
+
+        Unlike `flat`, no new Stream is created, and the elements' sites are
+        not changed, so this is an inexpensive way to read through the
+        contents of a large Stream. Elements are yielded in the same order
+        as found in `flat`, merged from the substreams as they are needed,
+        so no list of all the elements is made either.
+
+        If `classFilter`, a class name or list of class names, is given,
+        only elements of those classes are yielded.
+
+
+        >>> p = stream.Part()
+        >>> m1 = stream.Measure()
+        >>> m1.append(note.Note('C', type='whole'))
+        >>> m2 = stream.Measure()
+        >>> m2.insert(0, clef.BassClef())
+        >>> m2.append(note.Rest(type='half'))
+        >>> n = note.Note('G', type='half')
+        >>> m2.append(n)
+        >>> p.append([m1, m2])
+        >>> for offset, e in p.iterFlat():
+        ...     print offset, e
+        0.0 <music21.note.Note C>
+        4.0 <music21.clef.BassClef>
+        4.0 <music21.note.Rest rest>
+        6.0 <music21.note.Note G>
+
+        >>> [(offset, e.name) for offset, e in p.iterFlat('Note')]
+        [(0.0, 'C'), (6.0, 'G')]
+
+        As no flat Stream was created, the Notes are found only in their
+        Measures:
+
+        >>> n.sites.getSites(excludeNone=True)
+        [<music21.stream.Measure 0 offset=4.0>]
+        '''
+        if classFilter is not None and not common.isListLike(classFilter):
+            classFilter = [classFilter]
+        for key, e in self._iterFlatSortKeys():
+            if classFilter is None or e.isClassOrSubclass(classFilter):
+                yield key[0], e
+
     def makeImmutable(self):
         '''
         Clean this Stream: for self and all elements, purge all dead locations
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+#------------------------------------------------------------------------------
+# Name:         contextCache.py
+# Purpose:      index of semiFlat offsets for context searches
+#
+# Authors:      Michael Scott Cuthbert
+#               Christopher Ariza
+#
+# Copyright:    Copyright © 2013 Michael Scott Cuthbert and the music21
+#               Project
+# License:      LGPL, see license.txt
+#------------------------------------------------------------------------------
+'''
+The :class:`~music21.stream.contextCache.ContextCache` stores the offsets
+of all elements of the semiFlat representation of a
+:class:`~music21.stream.Stream`, so that
+:meth:`~music21.base.Music21Object.getContextByClass` can find the
+element of a class (such as the TimeSignature, KeySignature or Clef) in
+effect at the position of an element contained in the Stream or in one of
+its substreams without creating a new semiFlat Stream for each search.
+
+A ContextCache is stored in a Stream's cache and is thus discarded whenever
+the elements of the Stream, or of one of its substreams, change.
+'''
+
+import bisect
+import unittest
+
+from music21 import common
+from music21 import environment
+
+environLocal = environment.Environment(__file__)
+
+
+#------------------------------------------------------------------------------
+
+
+class ContextCache(object):
+    '''
+    An index of the offsets of the elements of the semiFlat representation
+    of a Stream, in semiFlat order, with, for each class searched for, the
+    positions of the elements of that class.
+
+    No semiFlat Stream is created, and the sites of the elements are not
+    changed.
+
+
+    >>> p = stream.Part()
+    >>> m1 = stream.Measure()
+    >>> m1.insert(0, meter.TimeSignature('3/4'))
+    >>> m1.append(note.Note(quarterLength=3))
+    >>> m2 = stream.Measure()
+    >>> m2.insert(0, meter.TimeSignature('2/4'))
+    >>> n = note.Note(type='half')
+    >>> m2.append(n)
+    >>> p.append([m1, m2])
+    >>> cc = stream.contextCache.ContextCache(p)
+    >>> cc.getOffset(n)
+    3.0
+    >>> cc.getOffset(note.Note()) is None
+    True
+    >>> cc.getElementAtOrBefore(3.0, 'TimeSignature')
+    <music21.meter.TimeSignature 2/4>
+    >>> cc.getElementBeforeOffset(3.0, 'TimeSignature')
+    <music21.meter.TimeSignature 3/4>
+    >>> cc.getElementAtOrBefore(2.0, 'Measure')
+    <music21.stream.Measure 0 offset=0.0>
+    '''
+    def __init__(self, srcStream):
+        self.srcStreamId = id(srcStream)
+        self._offsetsById = {}
+        entries = srcStream._getFlatOffsets(retainContainers=True,
+                                            offsetsById=self._offsetsById)
+        self.offsets = [o for o, unused_e in entries]
+        self.elements = [e for unused_o, e in entries]
+        # for each class searched for, a list of the offsets of matching
+        # elements and a list of their positions
+        self._classOffsets = {}
+
+    def __len__(self):
+        return len(self.elements)
+
+    def getOffset(self, element):
+        '''
+        Return the offset of `element` in the semiFlat representation, or
+        None if it is not found there.
+        '''
+        return self._offsetsById.get(id(element))
+
+    def _getClassOffsets(self, className):
+        try:
+            return self._classOffsets[className]
+        except KeyError:
+            pass
+        offsets = []
+        positions = []
+        classList = [className]
+        for i, e in enumerate(self.elements):
+            if e.isClassOrSubclass(classList):
+                offsets.append(self.offsets[i])
+                positions.append(i)
+        self._classOffsets[className] = (offsets, positions)
+        return offsets, positions
+
+    def getElementAtOrBefore(self, offset, className):
+        '''
+        Return the element of class `className` that
+        :meth:`~music21.stream.Stream.getElementAtOrBefore` would find in the
+        semiFlat representation at `offset`, or None.
+        '''
+        offsets, positions = self._getClassOffsets(className)
+        j = bisect.bisect_right(offsets, offset + .00000001)
+        candidates = []
+        candidateOffset = None
+        while j > 0:
+            j -= 1
+            eOffset = offsets[j]
+            span = offset - eOffset
+            if span < -.000000001:
+                continue
+            if candidateOffset is None:
+                candidateOffset = eOffset
+                # elements before zero are only found when at offset
+                if span > offset and not common.almostEquals(span, 0):
+                    break
+            elif eOffset != candidateOffset:
+                break
+            candidates.append((span, self.elements[positions[j]]))
+        return self._bestCandidate(candidates)
+
+    def getElementBeforeOffset(self, offset, className):
+        '''
+        Return the element of class `className` that
+        :meth:`~music21.stream.Stream.getElementBeforeOffset` would find in
+        the semiFlat representation before `offset`, or None.
+        '''
+        offsets, positions = self._getClassOffsets(className)
+        j = bisect.bisect_right(offsets, offset)
+        candidates = []
+        candidateOffset = None
+        while j > 0:
+            j -= 1
+            eOffset = offsets[j]
+            span = offset - eOffset
+            if span <= 0:
+                continue
+            if candidateOffset is None:
+                candidateOffset = eOffset
+                # elements before zero are never found
+                if span > offset:
+                    break
+            elif eOffset != candidateOffset:
+                break
+            candidates.append((span, self.elements[positions[j]]))
+        return self._bestCandidate(candidates)
+
+    def _bestCandidate(self, candidates):
+        # candidates have been gathered in reverse order; choose among them
+        # as the Stream methods do
+        if len(candidates) == 0:
+            return None
+        candidates.reverse()
+        candidates.sort()
+        return candidates[0][1]
+
+
+#------------------------------------------------------------------------------
+
+
+class Test(unittest.TestCase):
+    '''
+    Note: all Stream tests are found in test/testStream.py
+    '''
+
+    def runTest(self):
+        pass
+
+
+#------------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    import music21
+    music21.mainTest(Test)
+
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+#------------------------------------------------------------------------------
+# Name:         flatCache.py
+# Purpose:      incremental maintenance of cached flat Stream representations
+#
+# Authors:      Michael Scott Cuthbert
+#               Christopher Ariza
+#
+# Copyright:    Copyright © 2013 Michael Scott Cuthbert and the music21
+#               Project
+# License:      LGPL, see license.txt
+#------------------------------------------------------------------------------
+'''
+Tools for keeping the cached `flat` and `semiFlat` representations of a
+:class:`~music21.stream.Stream` up to date when single elements are added to
+or removed from one of its substreams, rather than discarding and rebuilding
+them.
+
+When a Stream is flattened, the path of each flattened element is stored
+with the flat representation: the index of the element in the `_elements`
+of the Stream containing it, preceded by the index of that Stream in the
+`_elements` of the Stream containing it, and so on up to the flattened
+Stream. When elements are later inserted into
+or removed from a substream, a :class:`FlatChange` describing the edit is
+passed up through the substream's sites and each cached flat representation
+is patched, placing new elements in the position that rebuilding the flat
+representation would have given them.
+
+The module-level :data:`statistics` object counts the cost of flat
+representations that have been discarded and rebuilt, and of those that
+have been patched, for profiling:
+
+
+>>> stream.flatCache.statistics.reset()
+>>> p = stream.Part()
+>>> m = stream.Measure()
+>>> m.repeatAppend(note.Note(), 4)
+>>> p.append(m)
+>>> len(p.flat.notes)
+4
+>>> m.insert(1.5, note.Note('G'))
+>>> len(p.flat.notes)
+5
+
+Flattening the Part also flattened the Measure; after the insertion, both
+flat representations were patched:
+
+>>> stream.flatCache.statistics.rebuilds
+2
+>>> stream.flatCache.statistics.patches
+2
+'''
+
+import unittest
+
+from music21 import base
+from music21 import environment
+
+environLocal = environment.Environment(__file__)
+
+
+#------------------------------------------------------------------------------
+
+
+class FlatCacheStatistics(object):
+    '''
+    Counts of the work done creating and maintaining flat representations
+    of Streams.
+
+    `invalidations` is the number of cached flat or semiFlat representations
+    discarded, `rebuilds` and `rebuiltElements` the number of flat
+    representations created and of elements placed in them, and `patches`
+    and `patchedElements` the number of cached representations patched and
+    of elements added to or removed from them.
+
+
+    >>> stats = stream.flatCache.FlatCacheStatistics()
+    >>> stats.rebuilds
+    0
+    >>> stats.rebuilds += 2
+    >>> stats
+    <music21.stream.flatCache.FlatCacheStatistics invalidations=0 rebuilds=2 rebuiltElements=0 patches=0 patchedElements=0>
+    >>> stats.reset()
+    >>> stats.rebuilds
+    0
+    '''
+    def __init__(self):
+        self.reset()
+
+    def __repr__(self):
+        return ('<music21.stream.flatCache.FlatCacheStatistics invalidations=%s'
+            ' rebuilds=%s rebuiltElements=%s patches=%s patchedElements=%s>' % (
+            self.invalidations, self.rebuilds, self.rebuiltElements,
+            self.patches, self.patchedElements))
+
+    def reset(self):
+        '''
+        Set all counts to zero.
+        '''
+        self.invalidations = 0
+        self.rebuilds = 0
+        self.rebuiltElements = 0
+        self.patches = 0
+        self.patchedElements = 0
+
+
+statistics = FlatCacheStatistics()
+
+
+#------------------------------------------------------------------------------
+
+
+class FlatChange(object):
+    '''
+    A description of elements added to or removed from a Stream, as passed
+    to :meth:`~music21.stream.Stream._elementsChanged`.
+
+    `added` is a list of (element, offset) pairs for elements appended to
+    the Stream's `_elements`, `removed` a list of elements removed from it.
+    Offsets are relative to the Stream receiving the change. `child` is
+    None if the elements are (or were) contained directly in that Stream;
+    otherwise it is the contained Stream through which the change was
+    passed, and `childChange` is the change relative to it.
+
+
+    >>> s = stream.Stream()
+    >>> m = stream.Measure()
+    >>> s.insert(4, m)
+    >>> n = note.Note()
+    >>> m.insert(1, n)
+    >>> fc = stream.flatCache.FlatChange(added=[(n, 1.0)])
+    >>> fcParent = fc.toSite(m, s)
+    >>> fcParent.added[0][1]
+    5.0
+    >>> fcParent.child is m
+    True
+    >>> fcParent.getPath(n, s)
+    (0, 0)
+    >>> fc.toSite(m, stream.Stream()) is None
+    True
+    '''
+    def __init__(self, added=None, removed=None, child=None,
+                 childChange=None):
+        if added is None:
+            added = []
+        if removed is None:
+            removed = []
+        self.added = added
+        self.removed = removed
+        self.child = child
+        self.childChange = childChange
+
+    def __len__(self):
+        return len(self.added) + len(self.removed)
+
+    def getPath(self, element, srcStream):
+        '''
+        Return the path of `element`, one of the added elements, in
+        `srcStream`, the Stream receiving this change, or None if it
+        cannot be found.
+        '''
+        if self.child is None:
+            index = _indexOfObject(srcStream._elements, element)
+            if index is None:
+                return None
+            return (index,)
+        index = _indexOfObject(srcStream._elements, self.child)
+        if index is None:
+            return None
+        path = self.childChange.getPath(element, self.child)
+        if path is None:
+            return None
+        return (index,) + path
+
+    def toSite(self, srcStream, site):
+        '''
+        Return a new FlatChange describing this change, made within
+        `srcStream`, relative to a `site` containing `srcStream`, or None
+        if `srcStream` has no offset in `site`.
+        '''
+        try:
+            shift = srcStream.getOffsetBySite(site)
+        except base.SitesException:
+            return None
+        if shift is None:
+            return None
+        return FlatChange(added=[(e, o + shift) for e, o in self.added],
+                          removed=self.removed, child=srcStream,
+                          childChange=self)
+
+
+#------------------------------------------------------------------------------
+
+
+def _sortKey(element, site):
+    # the same comparison used by Stream.sort()
+    return (element.getOffsetBySite(site), element.priority,
+            element.classSortOrder, not element.isGrace)
+
+
+def _bisectKey(flatStream, key, right=False):
+    elements = flatStream._elements
+    lo = 0
+    hi = len(elements)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        midKey = _sortKey(elements[mid], flatStream)
+        if midKey < key or (right and midKey == key):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _indexOfObject(elements, obj):
+    # identity search, starting from the end, where added elements are
+    for i in range(len(elements) - 1, -1, -1):
+        if elements[i] is obj:
+            return i
+    return None
+
+
+def patchFlat(flatStream, branches, flatChange, srcStream):
+    '''
+    Apply `flatChange`, an edit made within `srcStream`, to `flatStream`, a
+    flat or semiFlat representation of `srcStream`, and to `branches`, the
+    dictionary of element paths stored with it. Return True if the patch
+    was made, or False if it could not be, in which case `flatStream` must
+    be discarded.
+
+    Only non-Stream elements can be patched in or out, and only in a flat
+    Stream that automatically sorts. A FlatChange with no elements describes
+    a change in order only, which leaves `flatStream` unchanged.
+
+
+    >>> m = stream.Measure()
+    >>> m.append(note.Note('C', type='half'))
+    >>> branches = {}
+    >>> f = m._getFlatOrSemiFlat(retainContainers=False, branches=branches)
+    >>> n = note.Note('D')
+    >>> m.insert(0, n)
+    >>> fc = stream.flatCache.FlatChange(added=[(n, 0.0)])
+    >>> stream.flatCache.patchFlat(f, branches, fc, m)
+    True
+    >>> [x.name for x in f]
+    ['C', 'D']
+    >>> n.getOffsetBySite(f)
+    0.0
+    >>> branches[id(n)]
+    (1,)
+    '''
+    if len(flatChange) == 0:
+        # only the order of elements has changed
+        return True
+    if not flatStream.autoSort or not flatStream._mutable:
+        return False
+    # placing elements requires a sorted flat representation; sorting here,
+    # rather than with Stream.sort(), as srcStream is already being changed
+    if not flatStream.isSorted:
+        flatStream._elements.sort(key=lambda e: _sortKey(e, flatStream))
+        flatStream._endElements.sort(
+            key=lambda e: (e.priority, e.classSortOrder))
+        flatStream.isSorted = True
+    for e, unused_offset in flatChange.added:
+        if e.isStream:
+            return False
+    for e in flatChange.removed:
+        if e.isStream:
+            return False
+    elements = flatStream._elements
+
+    for e in flatChange.removed:
+        try:
+            key = _sortKey(e, flatStream)
+        except base.SitesException:
+            return False
+        i = _bisectKey(flatStream, key)
+        found = False
+        while i < len(elements):
+            if elements[i] is e:
+                found = True
+                break
+            i += 1
+        if not found:
+            return False
+        elements.pop(i)
+        e.sites.remove(flatStream)
+        if e.activeSite is flatStream:
+            e.activeSite = None
+        branch = branches.pop(id(e), None)
+        if branch is None:
+            return False
+        # later elements of the Stream in which the edit was made have
+        # moved down one place
+        depth = len(branch) - 1
+        prefix = branch[:depth]
+        for eId, otherBranch in branches.items():
+            if (otherBranch is not None and len(otherBranch) > depth and
+                otherBranch[depth] > branch[depth] and
+                otherBranch[:depth] == prefix):
+                branches[eId] = (prefix + (otherBranch[depth] - 1,) +
+                                 otherBranch[depth + 1:])
+
+    for e, offset in flatChange.added:
+        branch = flatChange.getPath(e, srcStream)
+        if branch is None:
+            return False
+        key = (offset, e.priority, e.classSortOrder, not e.isGrace)
+        lo = _bisectKey(flatStream, key)
+        hi = _bisectKey(flatStream, key, right=True)
+        # among elements with the same sort key, flattening keeps the order
+        # of the elements from which they were taken, at every level
+        position = hi
+        for i in range(lo, hi):
+            otherBranch = branches.get(id(elements[i]))
+            if otherBranch is None:
+                return False
+            if otherBranch > branch:
+                position = i
+                break
+        e.sites.add(flatStream, offset)
+        elements.insert(position, e)
+        branches[id(e)] = branch
+
+    # clear the flat Stream's own cache without propagating the change
+    flatStream._cache = {}
+    flatStream._classIndex = None
+    statistics.patches += 1
+    statistics.patchedElements += len(flatChange)
+    return True
+
+
+#------------------------------------------------------------------------------
+
+
+class Test(unittest.TestCase):
+    '''
+    Note: all Stream tests are found in test/testStream.py
+    '''
+
+    def runTest(self):
+        pass
+
+
+#------------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    import music21
+    music21.mainTest(Test)
+
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+#------------------------------------------------------------------------------
+# Name:         offsetIndex.py
+# Purpose:      sorted and interval indices of Stream element offsets
+#
+# Authors:      Michael Scott Cuthbert
+#               Christopher Ariza
+#
+# Copyright:    Copyright © 2013 Michael Scott Cuthbert and the music21
+#               Project
+# License:      LGPL, see license.txt
+#------------------------------------------------------------------------------
+'''
+The :class:`~music21.stream.offsetIndex.OffsetIndex` stores the offsets
+and end times of the elements of a sorted :class:`~music21.stream.Stream`
+so that offset range queries, such as
+:meth:`~music21.stream.Stream.getElementsByOffset` and
+:meth:`~music21.stream.Stream.getElementAtOrBefore`, can be answered with
+binary searches rather than by examining every element.
+
+An OffsetIndex is stored in a Stream's cache and is thus discarded whenever
+the Stream's elements change.
+'''
+
+import bisect
+import unittest
+
+from music21 import common
+from music21 import environment
+
+environLocal = environment.Environment(__file__)
+
+
+#------------------------------------------------------------------------------
+
+
+class IntervalNode(object):
+    '''
+    A node in a centered interval tree. Each node stores the intervals that
+    contain its `center`, sorted both by start and by descending end, and
+    the subtrees of intervals entirely before and after the center.
+
+    Intervals are given as (start, end, index) tuples.
+    '''
+    __slots__ = ('center', 'byStart', 'byEnd', 'left', 'right')
+
+    def __init__(self, intervals):
+        # intervals are sorted by start; centering on the start of the
+        # middle interval leaves at most half of the intervals to each side
+        self.center = intervals[len(intervals) // 2][0]
+        center = self.center
+        before = []
+        after = []
+        overlapping = []
+        for interval in intervals:
+            if interval[1] < center:
+                before.append(interval)
+            elif interval[0] > center:
+                after.append(interval)
+            else:
+                overlapping.append(interval)
+        self.byStart = overlapping # already sorted by start
+        self.byEnd = sorted(overlapping, key=lambda x: x[1], reverse=True)
+        self.left = None
+        self.right = None
+        if before:
+            self.left = IntervalNode(before)
+        if after:
+            self.right = IntervalNode(after)
+
+    def stab(self, point, post):
+        '''
+        Append to `post` the index of every interval where
+        start < point <= end.
+        '''
+        node = self
+        while node is not None:
+            if point <= node.center:
+                # all overlapping intervals end at or after point
+                for start, unused_end, i in node.byStart:
+                    if start >= point:
+                        break
+                    post.append(i)
+                node = node.left
+            else:
+                # all overlapping intervals start before point
+                for unused_start, end, i in node.byEnd:
+                    if end < point:
+                        break
+                    post.append(i)
+                node = node.right
+
+
+class OffsetIndex(object):
+    '''
+    An index of the offsets of all elements (including end elements) of a
+    sorted Stream, in the order given by the Stream's
+    :attr:`~music21.stream.Stream.elements`.
+
+    Raw offsets are stored when the index is created; offsets and end
+    times cleaned with :func:`~music21.common.cleanupFloat`, as used by
+    :meth:`~music21.stream.Stream.getElementsByOffset`, and the interval
+    tree used to find elements sounding at a point, are created when
+    first needed.
+
+
+    >>> s = stream.Stream()
+    >>> s.insert(0, note.Note('C', type='whole'))
+    >>> s.insert(1, note.Note('D'))
+    >>> s.insert(2, note.Note('E'))
+    >>> s.insert(2, clef.BassClef())
+    >>> oi = stream.offsetIndex.OffsetIndex(s)
+    >>> oi.offsets
+    [0.0, 1.0, 2.0, 2.0]
+    >>> oi.isOrdered
+    True
+    >>> oi.cleanEnds
+    [4.0, 2.0, 2.0, 3.0]
+
+    Indices of elements beginning in the span from 1 to 2 (inclusive):
+
+    >>> oi.getRange(1, 2)
+    [1, 2, 3]
+
+    And also including those that began before 1.5 but are sounding then:
+
+    >>> oi.getRange(1.5, 2, includeSounding=True)
+    [0, 1, 2, 3]
+    '''
+    def __init__(self, srcStream):
+        self.srcStreamId = id(srcStream)
+        self.elements = srcStream.elements
+        self.offsets = [e.getOffsetBySite(srcStream) for e in self.elements]
+        # elements added with Stream._insertCore may not yet be sorted,
+        # even if the Stream is marked as sorted
+        self.isOrdered = True
+        previous = None
+        for o in self.offsets:
+            if previous is not None and o < previous:
+                self.isOrdered = False
+                break
+            previous = o
+        self._cleanOffsets = None
+        self._cleanEnds = None
+        self._tree = None
+
+    def __len__(self):
+        return len(self.elements)
+
+    def _getCleanOffsets(self):
+        if self._cleanOffsets is None:
+            self._cleanOffsets = [common.cleanupFloat(o) for o in self.offsets]
+        return self._cleanOffsets
+
+    cleanOffsets = property(_getCleanOffsets, doc='''
+        A list of offsets, as processed by
+        :func:`~music21.common.cleanupFloat`.
+        ''')
+
+    def _getCleanEnds(self):
+        if self._cleanEnds is None:
+            cleanOffsets = self.cleanOffsets
+            self._cleanEnds = [
+                common.cleanupFloat(cleanOffsets[i] + e.duration.quarterLength)
+                for i, e in enumerate(self.elements)]
+        return self._cleanEnds
+
+    cleanEnds = property(_getCleanEnds, doc='''
+        A list of element end times (offset plus quarterLength), as processed
+        by :func:`~music21.common.cleanupFloat`.
+        ''')
+
+    def _getTree(self):
+        if self._tree is None:
+            cleanOffsets = self.cleanOffsets
+            cleanEnds = self.cleanEnds
+            intervals = [(cleanOffsets[i], cleanEnds[i], i) for i in
+                         range(len(cleanOffsets)) if cleanEnds[i] > cleanOffsets[i]]
+            if intervals:
+                self._tree = IntervalNode(intervals)
+        return self._tree
+
+    def getRange(self, offsetStart, offsetEnd, includeSounding=False):
+        '''
+        Return a sorted list of the indices of all elements whose cleaned
+        offsets are between `offsetStart` and `offsetEnd` (inclusive).
+
+        If `includeSounding` is True, elements that begin before `offsetStart`
+        and end at or after it are also included.
+        '''
+        cleanOffsets = self.cleanOffsets
+        lo = bisect.bisect_left(cleanOffsets, offsetStart)
+        hi = bisect.bisect_right(cleanOffsets, offsetEnd)
+        if not includeSounding:
+            return range(lo, hi)
+        tree = self._getTree()
+        post = []
+        if tree is not None:
+            tree.stab(offsetStart, post)
+            post.sort()
+        post.extend(range(lo, hi))
+        return post
+
+    def bisectRight(self, offset, indices=None):
+        '''
+        Return the number of elements with an offset less than or equal to
+        `offset`. If `indices`, a sorted list of element indices, is
+        given, only those elements are counted.
+
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 4)
+        >>> oi = stream.offsetIndex.OffsetIndex(s)
+        >>> oi.bisectRight(2.0)
+        3
+        >>> oi.bisectRight(2.0, [1, 3])
+        1
+        >>> oi.bisectRight(-1, [1, 3])
+        0
+        '''
+        offsets = self.offsets
+        if indices is None:
+            return bisect.bisect_right(offsets, offset)
+        lo = 0
+        hi = len(indices)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if offset < offsets[indices[mid]]:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+
+#------------------------------------------------------------------------------
+
+
+class Test(unittest.TestCase):
+    '''
+    Note: all Stream tests are found in test/testStream.py
+    '''
+
+    def runTest(self):
+        pass
+
+
+#------------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    import music21
+    music21.mainTest(Test)
+
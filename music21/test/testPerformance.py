@@ -15,6 +15,7 @@ This file is not run with the standard test battery presently.
 '''
 
 
+import os
 import unittest
 
 import music21
@@ -25,7 +26,52 @@ from music21 import environment
 _MOD = 'test/testPerformance.py'
 environLocal = environment.Environment(_MOD)
 
+
+def peakMemoryOfParse(workName, streaming=False):
+    '''
+    Return the peak resident memory, in megabytes, of a new Python process
+    that parses `workName` from the corpus. Without `streaming`, no pickled
+    Stream is used. With `streaming`, the default call is made: such a Stream
+    is never pickled, though a pickle written by an earlier parse without
+    `streaming` would be loaded.
+    '''
+    import subprocess
+    import sys
+    script = '; '.join([
+        'import resource',
+        'from music21 import converter, corpus',
+        'converter.parse(corpus.getWork(%r), forceSource=%r, streaming=%r)' % (
+            workName, not streaming, streaming),
+        'print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)',
+        ])
+    maxRSS = int(subprocess.check_output([sys.executable, '-c', script]).split()[-1])
+    if sys.platform == 'darwin': # reported in bytes, not kilobytes
+        maxRSS = maxRSS // 1024
+    return maxRSS // 1024
+
+
 #-------------------------------------------------------------------------------
+def syntheticMidiString(numberOfNotes):
+    '''
+    Return a string of a type 0 MIDI file of one track with `numberOfNotes`
+    note on/off pairs, all after the first using running status.
+    '''
+    from music21 import midi
+    data = []
+    for i in range(numberOfNotes):
+        pitch = 36 + i % 60
+        if i == 0:
+            data.append('\x00\x90' + chr(pitch) + '\x64')
+        else:
+            data.append('\x00' + chr(pitch) + '\x64')
+        data.append('\x60' + chr(pitch) + '\x00')
+    data.append('\x00\xff\x2f\x00')
+    data = ''.join(data)
+    return ('MThd' + midi.putNumber(6, 4) + midi.putNumber(0, 2) +
+            midi.putNumber(1, 2) + midi.putNumber(1024, 2) +
+            'MTrk' + midi.putNumber(len(data), 4) + data)
+
+
 class Test(unittest.TestCase):
 
     def runTest(self):
@@ -104,6 +150,175 @@ class Test(unittest.TestCase):
             self.assertEqual(len(post), 1500)
 
 
+    def runGetElementsByClassRepeated(self):
+        '''Getting sparse classes repeatedly from a flat chorale (class index)
+        '''
+        s = corpus.parse('bwv66.6')
+        sFlat = s.flat
+        for i in range(500):
+            post = sFlat.getElementsByClass('TimeSignature')
+            self.assertEqual(len(post), 4)
+            post = sFlat.getElementsByClass('Clef')
+            post = sFlat.getElementsByClass(['KeySignature'])
+
+    def runGetElementsByOffsetVertical(self):
+        '''Getting sounding elements at each of 600 offsets in all parts (offset index)
+        '''
+        s = corpus.parse('beethoven/opus59no2/movement3')
+        parts = [p.flat.notesAndRests for p in s.parts]
+        offsets = set()
+        for p in parts:
+            for n in p:
+                offsets.add(n.offset)
+        for o in sorted(offsets)[:600]:
+            for p in parts:
+                post = p.getElementsByOffset(o, mustBeginInSpan=False)
+                post = p.getElementAtOrBefore(o)
+
+    def runFlatNotesWithInsertions(self):
+        '''Getting flat notes after each of 50 insertions in a Measure (patched flat cache)
+        '''
+        from music21 import note
+        s = corpus.parse('beethoven/opus59no2/movement3')
+        m = s.parts[1].getElementsByClass('Measure')[10]
+        for i in range(50):
+            post = s.flat.notes
+            m.insert(i % 4, note.Note('G'))
+        self.assertEqual(len(s.flat.notes), 1675)
+
+    def runBeatOfFlatNotes(self):
+        '''Getting the beat and measure number of all notes of a flat chorale (context cache)
+        '''
+        s = corpus.parse('bwv66.6')
+        for n in s.flat.notes:
+            post = n.beat
+            post = n.beatStr
+            post = n.measureNumber
+            post = n.getContextByClass('KeySignature')
+            assert post != None
+
+    def runParseRepeatedMemoryCache(self):
+        '''Parsing a chorale 20 times (immutable in-memory parse cache)
+        '''
+        from music21 import converter
+        mc = converter.memoryCache
+        maxEntries, immutable = mc.maxEntries, mc.immutable
+        mc.maxEntries = 10
+        mc.immutable = True
+        try:
+            for i in range(20):
+                post = corpus.parse('bach/bwv66.6')
+        finally:
+            mc.maxEntries, mc.immutable = maxEntries, immutable
+            mc.clear()
+
+    def runParseLargestMusicXML(self):
+        '''Loading the largest MusicXML files of the corpus, streaming: beethoven/opus132, beethoven/opus74
+        '''
+        from music21 import converter
+        for workName in ('beethoven/opus132', 'beethoven/opus74'):
+            junk = converter.parse(corpus.getWork(workName), streaming=True)
+
+    def runReadLargeMidi(self):
+        '''Reading a synthetic MIDI file of 400,000 events
+        '''
+        from music21 import midi
+        midiStr = syntheticMidiString(100000)
+        mf = midi.MidiFile()
+        mf.readstr(midiStr)
+
+    def runWriteMidiPackets(self):
+        '''Writing the MIDI packets of bach/bwv66.6 as MIDI data, 200 times
+        '''
+        from music21.midi import translate
+        s = corpus.parse('bach/bwv66.6')
+        packetStorage, netPackets = translate._streamHierarchyToPackets(s)
+        for i in range(200):
+            junk = translate._packetsToMidiString(packetStorage, netPackets)
+
+    def runParseLargeMidi(self):
+        '''Loading a synthetic MIDI file of 20,000 notes, streaming
+        '''
+        from music21.midi import translate
+        midiStr = syntheticMidiString(20000)
+        junk = translate.midiStringToStream(midiStr, None, streaming=True)
+
+    def runFeatureStreamForms(self):
+        '''Preparing the feature forms of beethoven/opus18no1/movement1 and its parts
+        '''
+        from music21 import features
+        s = corpus.parse('beethoven/opus18no1/movement1')
+        di = features.DataInstance(s)
+        junk = di['parts'][0]['flat.notes']
+
+    def runKeyscape(self):
+        '''Key analysis of bach/bwv66.6 at all window sizes
+        '''
+        from music21.analysis import windowed, discrete
+        s = corpus.parse('bach/bwv66.6')
+        wa = windowed.WindowedAnalysis(s, discrete.KrumhanslSchmuckler())
+        junk = wa.process(1, None, 1)
+
+    def runKeyscapeHaydn(self):
+        '''Key analysis of haydn/opus74no1/movement3 in windows of 16 quarters
+        '''
+        from music21.analysis import windowed, discrete
+        s = corpus.parse('haydn/opus74no1/movement3')
+        wa = windowed.WindowedAnalysis(s, discrete.KrumhanslSchmuckler())
+        junk = wa.process(16, 16, includeTotalWindow=False)
+
+    def runSegmentSimilarity(self):
+        '''Finding similar segments among 40 Bach chorales
+        '''
+        from music21.search import segment
+        scoreDict = segment.indexScoreFilePaths(
+                    sorted(corpus.getBachChorales())[:40])
+        segmentIndex = segment.indexSegmentNGrams(scoreDict)
+        junk = segment.segmentIndexSimilarity(segmentIndex, forceDifflib=True)
+
+    def runUpdateScoreIndex(self):
+        '''Indexing segments of 40 Bach chorales, then of these and 5 more
+        '''
+        from music21.search import segment
+        filePaths = sorted(corpus.getBachChorales())[:45]
+        indexFilePath = environLocal.getTempFile('.json')
+        junk = segment.updateScoreIndex(indexFilePath, filePaths[:40])
+        junk = segment.updateScoreIndex(indexFilePath, filePaths)
+        os.remove(indexFilePath)
+
+    def runChordifyHaydn(self):
+        '''Chordifying file: haydn/opus17no1/movement3
+        '''
+        x = corpus.parse('haydn/opus17no1/movement3')
+        junk = x.chordify()
+
+    def runCommonPracticeErrorsBach(self):
+        '''Identifying common practice errors in: bach/bwv66.6
+        '''
+        from music21.theoryAnalysis import theoryAnalyzer
+        x = corpus.parse('bach/bwv66.6')
+        theoryAnalyzer.identifyCommonPracticeErrors(x)
+
+    def runRealizeFiguredBassFiveParts(self):
+        '''Realizing figured bass example D in five parts
+        '''
+        from music21.figuredBass import examples
+        fbRealization = examples.exampleD().realize(numParts = 5)
+        fbRealization.getNumSolutions()
+
+    def runParallelFifthsBachChorales(self):
+        '''Finding parallel fifths between all pairs of parts in six Bach chorales
+        '''
+        from music21 import voiceLeading
+        for workName in ['bach/bwv66.6', 'bach/bwv7.7', 'bach/bwv10.7', 
+                         'bach/bwv101.7', 'bach/bwv102.7', 'bach/bwv103.6']:
+            x = corpus.parse(workName)
+            parts = x.parts
+            for partNum1 in range(len(parts)):
+                for partNum2 in range(partNum1 + 1, len(parts)):
+                    vlqs = voiceLeading.VoiceLeadingQuartetSeries(parts[partNum1], parts[partNum2])
+                    junk = vlqs.indices(vlqs.parallelFifths())
+
     def runParseBeethoven(self):
         '''Loading file: beethoven/opus59no2/movement3
         '''
@@ -263,6 +478,121 @@ class Test(unittest.TestCase):
         # provide work and expected min/max in seconds
         for testMethod, best in [
 
+            (self.runGetElementsByClassRepeated,
+                {
+                 '2026.10.16': 1.71, # linear scan of all elements
+                 '2026.10.17': 0.27, # with stream class index
+                }),
+
+            (self.runGetElementsByOffsetVertical,
+                {
+                 '2026.10.16': 13.12, # linear scan of all elements
+                 '2026.10.17': 0.55, # with stream offset index
+                }),
+
+            (self.runFlatNotesWithInsertions,
+                {
+                 '2026.10.16': 36.06, # flat rebuilt on each access
+                 '2026.10.17': 5.47, # with patched flat cache
+                }),
+
+            (self.runBeatOfFlatNotes,
+                {
+                 '2026.10.16': 2.51, # semiFlat Stream built for each search
+                 '2026.10.17': 0.28, # with stream context cache
+                }),
+
+            (self.runParseRepeatedMemoryCache,
+                {
+                 '2026.10.16': 1.81, # unpickled from scratch directory
+                 '2026.10.17': 0.47, # with immutable in-memory cache
+                }),
+
+            # the default call, which takes as long as with forceSource, 
+            # as a Stream parsed with streaming is not pickled
+            (self.runParseLargestMusicXML,
+                {
+                 '2026.10.16': 92.15, # SAX parse to mxObjects, then translate
+                 '2026.10.17': 82.12, # translated by measure while parsing
+                }),
+
+            # reading time is linear in the number of events: 
+            # 800,000 events take 8.18 (previously 61.52)
+            (self.runReadLargeMidi,
+                {
+                 '2026.10.16': 11.00, # remaining string copied after each read
+                 '2026.10.17': 3.57, # read with an offset cursor
+                }),
+
+            (self.runWriteMidiPackets,
+                {
+                 '2026.10.16': 1.30, # MidiTrack and DeltaTime objects, string concatenation
+                 '2026.10.17': 0.75, # packets written to a bytearray
+                }),
+
+            # peak memory is 193 MB (previously 288 MB); made as Measures 
+            # with midiStringToPartMeasures, 55 MB, the same when read from 
+            # a file with midiFilePathToPartMeasures, as the data is 120 KB
+            (self.runParseLargeMidi,
+                {
+                 '2026.10.16': 24.78, # note off events found by scanning
+                 '2026.10.17': 6.10, # open note table, tracks read as events
+                }),
+
+            (self.runFeatureStreamForms,
+                {
+                 '2026.10.16': 18.13, # Score and each Part copied to strip ties
+                 '2026.10.17': 10.51, # Parts of the stripped Score shared
+                }),
+
+            (self.runKeyscape,
+                {
+                 '2026.10.16': 7.12, # a Stream built and analyzed for each window
+                 '2026.10.17': 0.79, # cumulative distributions from a window index
+                }),
+
+            (self.runKeyscapeHaydn,
+                {
+                 '2026.10.16': 18.81, # makeMeasures and makeTies into 1/4 measures
+                 '2026.10.17': 0.40, # notes indexed by window, no measures made
+                }),
+
+            (self.runSegmentSimilarity,
+                {
+                 '2026.10.16': 12.39, # every pair of segments compared
+                 '2026.10.17': 6.72, # pairs sharing n-grams found with an inverted index
+                }),
+
+            (self.runUpdateScoreIndex,
+                {
+                 '2026.10.16': 8.73, # all scores indexed again
+                 '2026.10.17': 3.57, # only new or changed scores indexed
+                }),
+
+            (self.runChordifyHaydn,
+                {
+                 '2026.10.16': 23.02, # deepcopy, slice, and makeChords
+                 '2026.10.17': 1.40, # single sweep, no copy of the score
+                }),
+
+            (self.runCommonPracticeErrorsBach,
+                {
+                 '2026.10.16': 53.59, # key analysis per VLQ, slices re-derived per check
+                 '2026.10.17': 5.64, # one slice pass, shared by all checks
+                }),
+
+            (self.runRealizeFiguredBassFiveParts,
+                {
+                 '2026.10.16': 7.92, # every naive possibility checked rule by rule on Pitches
+                 '2026.10.17': 1.37, # encoded possibilities, partial possibilities pruned
+                }),
+
+            (self.runParallelFifthsBachChorales,
+                {
+                 '2026.10.16': 2.86, # theoryAnalyzer, one VoiceLeadingQuartet per note pair
+                 '2026.10.17': 0.55, # VoiceLeadingQuartetSeries per pair of parts
+                }),
+
             (self.runGetElementsByPrevious, 
                 {
                  '2011.11.29': 4.69, 
@@ -389,6 +719,40 @@ class Test(unittest.TestCase):
             )
             #self.assertEqual(True, dur <= max) # performance test
 
+    def testMemoryTolerance(self):
+        '''
+        Test the peak memory, in megabytes, of parsing large files, 
+        comparing it to that of past runs. As with testTimingTolerance, 
+        this is only used for reference.
+        '''
+        for workName, streaming, best in [
+
+            # the default call, which needs no more memory than with
+            # forceSource, as a Stream parsed with streaming is not pickled
+            ('beethoven/opus132', True,
+                {
+                 '2026.10.16': 556, # SAX parse to mxObjects, then translate
+                 '2026.10.17': 267, # translated by measure while parsing
+                }),
+
+            ('beethoven/opus74', True,
+                {
+                 '2026.10.16': 448, # SAX parse to mxObjects, then translate
+                 '2026.10.17': 220, # translated by measure while parsing
+                }),
+
+            ]:
+            peak = peakMemoryOfParse(workName, streaming=streaming)
+            items = best.items()
+            items.sort()
+            items.reverse()
+            environLocal.printDebug(['\n\npeak memory tolerance for parsing:',
+                workName, 'streaming:', streaming,
+                '\nthis run:', peak, '\nbest runs:', 
+                ['%s: %s' % (x, y) for x, y in items], '\n'
+                ]
+            )
+
 
 
 
@@ -4868,6 +4868,56 @@ class Test(unittest.TestCase):
         #post.show()
         self.assertEqual(len(post.flat.getElementsByClass('Chord')), 8)
 
+    def testChordifySweep(self):
+        from music21 import corpus, stream
+
+        def summary(post):
+            match = []
+            for m in post.getElementsByClass('Measure'):
+                match.append((m.number, m.getOffsetBySite(post)))
+                for e in m.elements:
+                    if 'GeneralNote' not in e.classes:
+                        match.append(repr(e))
+                        continue
+                    row = [e.getOffsetBySite(m), e.quarterLength, repr(e)]
+                    if e.isChord:
+                        for p in e.pitches:
+                            accidental = None
+                            if p.accidental is not None:
+                                accidental = p.accidental.displayStatus
+                            row.append((p.nameWithOctave, accidental,
+                                list(p.groups), repr(e.getTie(p))))
+                        row.append([repr(a) for a in e.articulations])
+                        row.append([repr(x) for x in e.expressions])
+                    match.append(row)
+            return match
+
+        # bwv66.6 has ties, bwv324 a fermata on every phrase,
+        # and opus19 voices and a pickup
+        for work in ['bach/bwv66.6', 'bach/bwv324',
+            'schoenberg/opus19/movement6']:
+            s = corpus.parse(work)
+            for kwargs in [{}, {'addPartIdAsGroup': True},
+                {'addTies': False, 'displayTiedAccidentals': True}]:
+                post = s._chordifyBySweep(**kwargs)
+                self.assertNotEqual(post, None)
+                self.assertEqual(summary(post),
+                    summary(s._chordifyBySlicing(**kwargs)))
+
+        # the source is left unaltered
+        s = corpus.parse('bach/bwv66.6')
+        self.assertEqual(len(s.parts[0].getElementsByClass('Measure')[1].notes), 4)
+        junk = s.chordify()
+        self.assertEqual(len(s.parts[0].getElementsByClass('Measure')[1].notes), 4)
+
+        # Streams without Measures are sliced
+        s = stream.Score()
+        p = stream.Part()
+        p.repeatAppend(note.Note(quarterLength=3), 2)
+        s.insert(0, p)
+        self.assertEqual(s._chordifyBySweep(), None)
+        self.assertEqual(len(s.chordify().getElementsByClass('Chord')), 2)
+
 
     def testOpusSearch(self):
         from music21 import corpus
@@ -5500,8 +5550,9 @@ class Test(unittest.TestCase):
         self.assertEqual(p1FlatNotes.derivationChain, [p1Flat, p1])
 
 
-        # we cannot do this, as each call to flat produces a new Stream
-        self.assertEqual(p1.flat.notesAndRests.derivesFrom is p1.flat, False)
+        # the flat representation is cached, so each call to flat returns
+        # the same Stream until the Part changes
+        self.assertEqual(p1.flat.notesAndRests.derivesFrom is p1.flat, True)
         # chained calls to .derives from can be used
         self.assertEqual(p1.flat.notesAndRests.derivesFrom.derivesFrom is p1, True)
         
@@ -7334,6 +7385,321 @@ class Test(unittest.TestCase):
         #s.show()
 
 
+    def testClassIndexA(self):
+        from music21 import stream, note, clef, meter, bar
+
+        def byScan(s, classFilterList):
+            return [e for e in s.elements if
+                    e.isClassOrSubclass(classFilterList)]
+
+        s = stream.Stream()
+        s.repeatAppend(note.Note('C4'), 5)
+        s.insert(0, meter.TimeSignature('3/4'))
+        s.insert(0, clef.BassClef())
+        s.storeAtEnd(bar.Barline('final'))
+        filters = [['Note'], ['GeneralNote'], [note.Rest],
+                   ['TimeSignature', clef.Clef], ['Barline'],
+                   [note.Note, 'Music21Object']]
+        for cf in filters:
+            self.assertEqual(list(s.getElementsByClass(cf)), byScan(s, cf))
+        ci = s._classIndex
+        self.assertNotEqual(ci, None)
+
+        # appending keeps the index and updates it
+        r = note.Rest()
+        s.append(r)
+        self.assertEqual(s._classIndex is ci, True)
+        self.assertEqual(list(s.getElementsByClass('Rest')), [r])
+        # inserting out of order requires sorting, which rebuilds the index
+        n = note.Note('G4')
+        s.insert(1.5, n)
+        for cf in filters:
+            self.assertEqual(list(s.getElementsByClass(cf)), byScan(s, cf))
+        self.assertEqual(s.getElementsByClass('Note')[2] is n, True)
+
+        # removal, popping, and replacement
+        s.remove(n)
+        self.assertEqual(n in s.getElementsByClass('Note'), False)
+        s.pop(len(s._elements) - 1)
+        self.assertEqual(len(s.getElementsByClass('Rest')), 0)
+        r2 = note.Rest()
+        s.replace(s.getElementsByClass('Note')[0], r2)
+        self.assertEqual(list(s.getElementsByClass('Rest')), [r2])
+        s.removeByClass('Rest')
+        for cf in filters:
+            self.assertEqual(list(s.getElementsByClass(cf)), byScan(s, cf))
+        self.assertEqual(list(s.getElementsByClass('Note',
+            returnStreamSubClass='list')), byScan(s, ['Note']))
+
+        # direct manipulation followed by _elementsChanged is detected
+        r3 = note.Rest()
+        r3.sites.add(s, 20.0)
+        s._elements.append(r3)
+        s._elementsChanged()
+        self.assertEqual(len(s.getElementsByClass('Rest')), 1)
+
+        # changes within contained Streams do not discard the index
+        p = stream.Part()
+        for i in range(3):
+            m = stream.Measure()
+            m.append(note.Note())
+            p.append(m)
+        self.assertEqual(len(p.getElementsByClass('Measure')), 3)
+        ci = p._classIndex
+        p.getElementsByClass('Measure')[0].append(note.Note())
+        self.assertEqual(p._classIndex is ci, True)
+        self.assertEqual(len(p.getElementsByClass('Measure')), 3)
+
+
+    def testOffsetIndexA(self):
+        import random
+        from music21 import stream, note, clef, meter
+
+        random.seed(3)
+        s = stream.Stream()
+        for i in range(200):
+            n = note.Note()
+            n.quarterLength = random.choice([0, .25, .5, 1, 1.5, 2, 4, 1/3.])
+            s.insert(random.choice(range(60)) * .25, n)
+        for o in [0, 3, 7.5, 11]:
+            s.insert(o, clef.TrebleClef())
+            s.insert(o, meter.TimeSignature('3/4'))
+
+        def withoutIndex(method, *args, **keywords):
+            oi = s._cache.pop('offsetIndex', None)
+            s._cache['offsetIndexRequested'] = False
+            post = method(*args, **keywords)
+            self.assertEqual(s._cache.get('offsetIndex'), None)
+            if oi is not None:
+                s._cache['offsetIndex'] = oi
+            return post
+
+        def withIndex(method, *args, **keywords):
+            s._cache['offsetIndexRequested'] = True
+            post = method(*args, **keywords)
+            self.assertNotEqual(s._cache.get('offsetIndex'), None)
+            return post
+
+        flags = ['includeEndBoundary', 'mustFinishInSpan', 'mustBeginInSpan',
+                 'includeElementsThatEndAtStart']
+        for i in range(150):
+            start = random.choice(range(64)) * .25
+            end = random.choice([None, start, start + .25, start + 1,
+                                 start + 3.5, start - 1])
+            keywords = {}
+            for f in flags:
+                keywords[f] = random.choice([True, False])
+            classList = random.choice([None, ['Clef'], ['Note']])
+            a = withoutIndex(s.getElementsByOffset, start, end,
+                             classList=classList, **keywords)
+            b = withIndex(s.getElementsByOffset, start, end,
+                          classList=classList, **keywords)
+            self.assertEqual(list(a), list(b))
+
+            # sorting candidates of mixed classes at the same offset
+            # is not supported
+            if classList is None:
+                classList = ['GeneralNote']
+            for method in [s.getElementAtOrBefore, s.getElementBeforeOffset]:
+                a = withoutIndex(method, start, classList)
+                b = withIndex(method, start, classList)
+                self.assertEqual(a is b, True)
+
+        # index is discarded when elements change
+        self.assertNotEqual(s._cache.get('offsetIndex'), None)
+        s.insert(3.0, note.Note())
+        self.assertEqual(s._cache.get('offsetIndex'), None)
+
+    def testFlatCacheA(self):
+        from music21 import stream
+        from music21.stream import flatCache
+
+        s = stream.Score()
+        for pIndex in range(2):
+            p = stream.Part()
+            for mIndex in range(4):
+                m = stream.Measure()
+                m.number = mIndex + 1
+                if mIndex == 0:
+                    m.insert(0, meter.TimeSignature('4/4'))
+                m.repeatAppend(note.Note(type='quarter'), 4)
+                p.append(m)
+            s.insert(0, p)
+        parts = s.getElementsByClass('Part')
+        measures = [p.getElementsByClass('Measure') for p in parts]
+
+        def compare(sFlat, retainContainers):
+            rebuilt = s._getFlatOrSemiFlat(retainContainers=retainContainers)
+            rebuilt.sort()
+            self.assertEqual([id(e) for e in sFlat], [id(e) for e in rebuilt])
+            self.assertEqual([e.getOffsetBySite(sFlat) for e in sFlat],
+                             [e.getOffsetBySite(rebuilt) for e in rebuilt])
+
+        sFlat = s.flat
+        sSemiFlat = s.semiFlat
+        self.assertEqual(len(sFlat.notes), 32)
+        flatCache.statistics.reset()
+        # notes at the same offsets as notes in the other Part, in the
+        # first and second Parts
+        n1 = note.Note('G')
+        measures[1][2].insert(1, n1)
+        n2 = note.Note('A')
+        measures[0][2].insert(2, n2)
+        n3 = note.Rest()
+        measures[0][3].append(n3)
+        self.assertEqual(flatCache.statistics.invalidations, 0)
+        self.assertEqual(s.flat is sFlat, True)
+        self.assertEqual(s.semiFlat is sSemiFlat, True)
+        self.assertEqual(len(sFlat.notes), 34)
+        compare(sFlat, False)
+        compare(sSemiFlat, True)
+
+        measures[1][2].remove(n1)
+        self.assertEqual(s.flat is sFlat, True)
+        self.assertEqual(len(sFlat.notes), 33)
+        compare(sFlat, False)
+        compare(sSemiFlat, True)
+
+        # adding a Stream discards the flat representations
+        measures[0][1].insert(0, stream.Voice())
+        self.assertEqual(s.flat is sFlat, False)
+        self.assertEqual(flatCache.statistics.invalidations > 0, True)
+
+    def testFlatCacheB(self):
+        import random
+        from music21 import stream
+        from music21.stream import flatCache
+
+        def compare(container, retainContainers):
+            if retainContainers:
+                sFlat = container.semiFlat
+            else:
+                sFlat = container.flat
+            rebuilt = container._getFlatOrSemiFlat(
+                retainContainers=retainContainers)
+            rebuilt.sort()
+            self.assertEqual([id(e) for e in sFlat], [id(e) for e in rebuilt])
+            self.assertEqual([e.getOffsetBySite(sFlat) for e in sFlat],
+                             [e.getOffsetBySite(rebuilt) for e in rebuilt])
+
+        # random edits, with notes at the same offsets in different
+        # Measures and Voices of a Part, are patched into the flat and
+        # semiFlat representations as rebuilding them would place them
+        flatCache.statistics.reset()
+        for seed in range(300):
+            rand = random.Random(seed)
+            s = stream.Score()
+            containers = []
+            for pIndex in range(2):
+                p = stream.Part()
+                for mIndex in range(3):
+                    m = stream.Measure()
+                    m.number = mIndex + 1
+                    if mIndex == 1:
+                        for vIndex in range(2):
+                            v = stream.Voice()
+                            v.append(note.Note(type='half'))
+                            m.insert(0, v)
+                            containers.append(v)
+                    else:
+                        m.append(note.Note(type='whole'))
+                    containers.append(m)
+                    p.append(m)
+                s.insert(0, p)
+            parts = list(s.getElementsByClass('Part'))
+            flats = [(s, False), (s, True)] + [(p, False) for p in parts]
+            for flatContainer, retainContainers in flats:
+                compare(flatContainer, retainContainers)
+            added = []
+            for unused in range(8):
+                if added and rand.random() < 0.25:
+                    container, n = added.pop(rand.randrange(len(added)))
+                    container.remove(n)
+                else:
+                    container = rand.choice(containers)
+                    n = note.Note(type='quarter')
+                    container.insert(rand.randrange(8) * 0.5, n)
+                    added.append((container, n))
+                    if rand.random() < 0.25:
+                        container.sort()
+                for flatContainer, retainContainers in flats:
+                    compare(flatContainer, retainContainers)
+        self.assertEqual(flatCache.statistics.patches > 0, True)
+
+    def testIterFlatA(self):
+        from music21 import stream, bar
+
+        p = stream.Part()
+        for mIndex in range(3):
+            m = stream.Measure()
+            if mIndex == 0:
+                m.insert(0, meter.TimeSignature('3/4'))
+                m.insert(0, clef.TrebleClef())
+            v1 = stream.Voice()
+            v1.repeatAppend(note.Note('E', type='quarter'), 3)
+            v2 = stream.Voice()
+            v2.append(note.Note('C', type='half'))
+            v2.append(note.Rest(type='quarter'))
+            m.insert(0, v1)
+            m.insert(0, v2)
+            m.storeAtEnd(bar.Barline('double'))
+            p.append(m)
+        # a grace note, sorted before the note at the same offset
+        g = note.Note('D').getGrace()
+        p.getElementsByClass('Measure')[1].voices[0].insert(1, g)
+        p.storeAtEnd(clef.BassClef())
+
+        siteCounts = [len(e.sites) for e in p.recurse()]
+        post = list(p.iterFlat())
+        # no sites were added
+        self.assertEqual([len(e.sites) for e in p.recurse()], siteCounts)
+
+        pFlat = p.flat
+        self.assertEqual([id(e) for offset, e in post], [id(e) for e in pFlat])
+        self.assertEqual([offset for offset, e in post],
+                         [e.getOffsetBySite(pFlat) for e in pFlat])
+        self.assertEqual(post[-1][1].classes[0], 'BassClef')
+
+        post = list(p.iterFlat(['Rest', 'Barline']))
+        self.assertEqual([(offset, e.classes[0]) for offset, e in post],
+            [(2.0, 'Rest'), (3.0, 'Barline'), (5.0, 'Rest'), (6.0, 'Barline'),
+             (8.0, 'Rest'), (9.0, 'Barline')])
+
+    def testContextCacheA(self):
+        from music21 import stream
+
+        p = stream.Part()
+        for mIndex, tsString in enumerate(['3/4', None, '2/4', None]):
+            m = stream.Measure()
+            m.number = mIndex + 1
+            if tsString is not None:
+                m.insert(0, meter.TimeSignature(tsString))
+            m.repeatAppend(note.Note('G4'), 2)
+            p.append(m)
+        notes = [e for e in p.recurse() if 'Note' in e.classes]
+
+        self.assertEqual([n.getContextByClass('TimeSignature').ratioString
+                          for n in notes], ['3/4'] * 4 + ['2/4'] * 4)
+        self.assertEqual([n.measureNumber for n in notes],
+                         [1, 1, 2, 2, 3, 3, 4, 4])
+        # searches from the Part use a single ContextCache
+        cc = p._getContextCache()
+        self.assertEqual(len(cc), 14)
+        self.assertEqual([n.getContextByClass('TimeSignature').ratioString
+                          for n in notes], ['3/4'] * 4 + ['2/4'] * 4)
+        self.assertTrue(p._getContextCache() is cc)
+        # no semiFlat Streams were added as sites
+        self.assertEqual([len(n.sites) for n in notes], [2] * 8)
+
+        # a change to a Measure invalidates the cache of the Part
+        m2 = p.getElementsByClass('Measure')[1]
+        m2.insert(0, meter.TimeSignature('6/8'))
+        self.assertFalse(p._getContextCache() is cc)
+        self.assertEqual([n.getContextByClass('TimeSignature').ratioString
+                          for n in notes],
+                         ['3/4'] * 2 + ['6/8'] * 2 + ['2/4'] * 4)
+
+
 
 #------------------------------------------------------------------------------
 
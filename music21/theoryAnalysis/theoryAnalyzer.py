@@ -33,6 +33,7 @@ because they provide easy access to the components within them, and those compon
 a direct pointer to the original object in the score.
 
 * :meth:`~music21.theoryAnalysis.theoryAnalyzer.getVerticalSlices` 
+* :meth:`~music21.theoryAnalysis.theoryAnalyzer.iterateVerticalSlices` 
 * :meth:`~music21.theoryAnalysis.theoryAnalyzer.getVLQs` 
 * :meth:`~music21.theoryAnalysis.theoryAnalyzer.getThreeNoteLinearSegments` 
 * :meth:`~music21.theoryAnalysis.theoryAnalyzer.getLinearSegments` 
@@ -158,7 +159,7 @@ from music21 import environment
 _MOD = 'theoryAnalyzer.py'
 environLocal = environment.Environment(_MOD)
 
-_DOC_ORDER = ['getVerticalSlices', 'getVLQs', 'getThreeNoteLinearSegments', 'getLinearSegments', 'getVerticalSliceNTuplets','getHarmonicIntervals', 'getMelodicIntervals', 'getParallelFifths', 'getPassingTones', 
+_DOC_ORDER = ['getVerticalSlices', 'iterateVerticalSlices', 'getVLQs', 'getThreeNoteLinearSegments', 'getLinearSegments', 'getVerticalSliceNTuplets','getHarmonicIntervals', 'getMelodicIntervals', 'getParallelFifths', 'getPassingTones', 
             'getNeighborTones','getParallelOctaves', 'identifyParallelFifths',  'identifyParallelOctaves', 'identifyParallelUnisons',
             'identifyHiddenFifths', 'identifyHiddenOctaves', 'identifyImproperResolutions',
             'identifyLeapNotSetWithStep', 'identifyOpensIncorrectly', 'identifyClosesIncorrectly',
@@ -171,6 +172,8 @@ _DOC_ORDER = ['getVerticalSlices', 'getVLQs', 'getThreeNoteLinearSegments', 'get
             'getResultsString', 'colorResults', 'getHTMLResultsString', 'getAllPartNumPairs', 'getNotes'
             ]
 
+# the classes of the vertical slices stored in a score's analysisData
+_DEFAULT_SLICE_CLASSES = ['Note', 'Chord', 'Harmony', 'Rest']
 
 def addAnalysisData(score):
     '''
@@ -259,41 +262,78 @@ def getVerticalSlices(score, classFilterList=['Note', 'Chord', 'Harmony', 'Rest'
 
     '''   
     
-    vsList = []
     addAnalysisData(score)
-    if 'VerticalSlices' in score.analysisData and score.analysisData['VerticalSlices'] != None:
+    if classFilterList == _DEFAULT_SLICE_CLASSES and score.analysisData.get('VerticalSlices'):
         return score.analysisData['VerticalSlices']
 
+    return list(iterateVerticalSlices(score, classFilterList))
+
+def iterateVerticalSlices(score, classFilterList=['Note', 'Chord', 'Harmony', 'Rest']):
+    '''
+    Generator version of :meth:`~music21.theoryAnalysis.theoryAnalyzer.getVerticalSlices`,
+    yielding the same :class:`~music21.voiceLeading.VerticalSlice` objects
+    one at a time.
+
+    The parts are each read through once, by
+    :meth:`~music21.voiceLeading.iterateElementsAtOffsets`, and, if the
+    default classFilterList is used, the slices are stored in the score's
+    analysisData when the generator is exhausted. Later calls (and all the
+    get and identify methods that are built on vertical slices) then reuse
+    them instead of parsing the score again.
+
+    >>> sc = stream.Score()
+    >>> part0 = stream.Part()
+    >>> part0.append(note.Note('c5', quarterLength=2))
+    >>> part1 = stream.Part()
+    >>> part1.append(note.Note('f4'))
+    >>> part1.append(note.Note('g4'))
+    >>> sc.insert(part0)
+    >>> sc.insert(part1)
+    >>> for vs in theoryAnalysis.theoryAnalyzer.iterateVerticalSlices(sc):
+    ...     print vs.getObjectsByClass('Note')
+    [<music21.note.Note C>, <music21.note.Note F>]
+    [<music21.note.Note C>, <music21.note.Note G>]
+    >>> theoryAnalysis.theoryAnalyzer.getVerticalSlices(sc) is sc.analysisData['VerticalSlices']
+    True
+    '''
+    addAnalysisData(score)
+    storeSlices = (classFilterList == _DEFAULT_SLICE_CLASSES)
+    if storeSlices and score.analysisData.get('VerticalSlices'):
+        for vs in score.analysisData['VerticalSlices']:
+            yield vs
+        return
+
     # if elements exist at same offset, return both 
+    offsetList = [c.offset for c in score.chordify().flat.getElementsByClass('Chord')]
+    if len(score.parts) > 1:
+        streamList = [part.flat for part in score.parts]
+    else:
+        streamList = [score.flat]
 
-    # If speed is an issue, could try using offset maps...
-    
-    chordifiedSc = score.chordify()
-    
-    for c in chordifiedSc.flat.getElementsByClass('Chord'):
+    vsList = []
+    for elementLists in voiceLeading.iterateElementsAtOffsets(streamList, offsetList, classFilterList):
         contentDict = defaultdict(list)
-        partNum= 0
-        
-        if len(score.parts) > 1:
-            for part in score.parts:
-                elementStream = part.flat.getElementsByOffset(c.offset,mustBeginInSpan=False, classList=classFilterList)
-                #el = part.flat.getElementAtOrBefore(c.offset,classList=['Note','Rest', 'Chord', 'Harmony'])
-                for el in elementStream.elements:
-                    contentDict[partNum].append(el)    
-                partNum+=1
-        else:
-            elementStream = score.flat.getElementsByOffset(c.offset,mustBeginInSpan=False, classList=classFilterList)
-            #el = part.flat.getElementAtOrBefore(c.offset,classList=['Note','Rest', 'Chord', 'Harmony'])
-            for el in elementStream.elements:
-                contentDict[partNum].append(el)    
-            partNum+=1
-                    
+        for partNum, elements in enumerate(elementLists):
+            if elements:
+                contentDict[partNum].extend(elements)
         vs = voiceLeading.VerticalSlice(contentDict)
         vsList.append(vs)
-    if classFilterList==['Note', 'Chord', 'Harmony', 'Rest']:
+        yield vs
+    if storeSlices:
         score.analysisData['VerticalSlices'] = vsList
-    
-    return vsList
+
+def _clearVerticalSliceIndex(score):
+    '''
+    Removes the vertical slices, and everything derived from them, that are
+    stored in the score's analysisData, so that they are made anew from the
+    score the next time they are needed. To be called after altering the notes of the score.
+    '''
+    addAnalysisData(score)
+    score.analysisData['VerticalSlices'] = None
+    for cacheKey in ['vlqs', 'ThreeNoteLinearSegments', 'VerticalSliceNTuplets',
+                     'HarmonicIntervals', 'KeyAtMeasure', 'AnalyzedKey']:
+        if cacheKey in score.analysisData:
+            del score.analysisData[cacheKey]
      
 def getVLQs(score, partNum1, partNum2):
     '''
@@ -327,24 +367,19 @@ def getVLQs(score, partNum1, partNum2):
         return score.analysisData['vlqs'][vlqCacheKey]
     
     vlqList = []
-    
-    verticalSlices = getVerticalSlices(score)
-    
-    for (i, verticalSlice) in enumerate(verticalSlices[:-1]):
-        nextVerticalSlice = verticalSlices[i + 1]
-        
-        v1n1 = verticalSlice.getObjectsByPart(partNum1, classFilterList=['Note'])
-        v1n2 = nextVerticalSlice.getObjectsByPart(partNum1, classFilterList=['Note'])
-         
-        v2n1 = verticalSlice.getObjectsByPart(partNum2, classFilterList=['Note'])
-        v2n2 = nextVerticalSlice.getObjectsByPart(partNum2, classFilterList=['Note'])
-        
-        if v1n1 != None and v1n2 != None and v2n1 != None and v2n2 != None:
-            getKeyAtMeasure(score, v1n1.measureNumber)
-            
-            vlq = voiceLeading.VoiceLeadingQuartet(v1n1,v1n2,v2n1,v2n2, key=getKeyAtMeasure(score, v1n1.measureNumber))
-            
-            vlqList.append(vlq)
+    previousNotes = None
+    for verticalSlice in iterateVerticalSlices(score):
+        # the notes of each slice are looked up once, as the second pair
+        # of one quartet and the first pair of the next
+        notes = (verticalSlice.getObjectsByPart(partNum1, classFilterList=['Note']),
+                 verticalSlice.getObjectsByPart(partNum2, classFilterList=['Note']))
+        if previousNotes is not None:
+            v1n1, v2n1 = previousNotes
+            v1n2, v2n2 = notes
+            if v1n1 != None and v1n2 != None and v2n1 != None and v2n2 != None:
+                vlq = voiceLeading.VoiceLeadingQuartet(v1n1,v1n2,v2n1,v2n2, key=getKeyAtMeasure(score, v1n1.measureNumber))
+                vlqList.append(vlq)
+        previousNotes = notes
         
     if 'vlqs' not in score.analysisData:
         score.analysisData['vlqs'] = {vlqCacheKey: vlqList}
@@ -501,14 +536,14 @@ def getVerticalSliceNTuplets(score, ntupletNum):
 
     '''
 
-    verticalSliceNTuplets = []
+    # Caches the list of n-tuplets once they have been computed
+    # for a specified ntupletNum
     addAnalysisData(score)
-    if 'VerticalSlices' not in score.analysisData:
-        verticalSlices = getVerticalSlices(score)
-    else:
-        verticalSlices = score.analysisData['VerticalSlices']
-        if verticalSlices == None:
-            verticalSlices = getVerticalSlices(score)
+    if 'VerticalSliceNTuplets' in score.analysisData and ntupletNum in score.analysisData['VerticalSliceNTuplets']:
+        return score.analysisData['VerticalSliceNTuplets'][ntupletNum]
+
+    verticalSliceNTuplets = []
+    verticalSlices = getVerticalSlices(score)
     for i in range(0, len(verticalSlices)-(ntupletNum-1)):
         verticalSliceList = []
         for countNum in range(i,i+ntupletNum):
@@ -518,6 +553,11 @@ def getVerticalSliceNTuplets(score, ntupletNum):
         else: 
             vsnt = voiceLeading.VerticalSliceNTuplet(verticalSliceList)
         verticalSliceNTuplets.append(vsnt)
+
+    if 'VerticalSliceNTuplets' not in score.analysisData:
+        score.analysisData['VerticalSliceNTuplets'] = {ntupletNum: verticalSliceNTuplets}
+    else:
+        score.analysisData['VerticalSliceNTuplets'][ntupletNum] = verticalSliceNTuplets
     return verticalSliceNTuplets
 
 
@@ -550,9 +590,16 @@ def getHarmonicIntervals(score, partNum1, partNum2):
     >>> theoryAnalysis.theoryAnalyzer.getHarmonicIntervals(sc, 0,1)[1].name
     'm3'
     '''
+    # Caches the list of intervals once they have been computed
+    # for a specified set of partNums
+    hInvCacheKey = str(partNum1) + "," + str(partNum2)
+
+    addAnalysisData(score)
+    if 'HarmonicIntervals' in score.analysisData and hInvCacheKey in score.analysisData['HarmonicIntervals']:
+        return score.analysisData['HarmonicIntervals'][hInvCacheKey]
+
     hInvList = []
-    verticalSlices = getVerticalSlices(score)
-    for verticalSlice in verticalSlices:
+    for verticalSlice in iterateVerticalSlices(score):
         
         nUpper = verticalSlice.getObjectsByPart(partNum1, classFilterList=['Note'])
         nLower = verticalSlice.getObjectsByPart(partNum2, classFilterList=['Note'])
@@ -563,7 +610,11 @@ def getHarmonicIntervals(score, partNum1, partNum2):
             hIntv = interval.notesToInterval(nLower, nUpper)
         
         hInvList.append(hIntv)
-                
+
+    if 'HarmonicIntervals' not in score.analysisData:
+        score.analysisData['HarmonicIntervals'] = {hInvCacheKey: hInvList}
+    else:
+        score.analysisData['HarmonicIntervals'][hInvCacheKey] = hInvList
     return hInvList
 
 def getMelodicIntervals(score, partNum):
@@ -778,10 +829,7 @@ def _identifyBasedOnNote(score, partNum, color, dictKey, testFunction, textFunct
                    
 def _identifyBasedOnVerticalSlice(score, color, dictKey, testFunction, textFunction, responseOffsetMap=[]):
     addAnalysisData(score)
-    if 'VerticalSlices' not in score.analysisData:
-        unused_vslist = getVerticalSlices(score)
-    
-    for vs in score.analysisData['VerticalSlices']:
+    for vs in iterateVerticalSlices(score):
         if responseOffsetMap and vs.offset(leftAlign=True) not in responseOffsetMap:
             continue
         if testFunction(vs, score) is not False:
@@ -1384,7 +1432,7 @@ def removePassingTones(score, dictKey = 'unaccentedPassingTones'):
                 break
         a.n1.duration = music21.duration.Duration(durationNewTone)
         score.stripTies(inPlace=True, matchByPitch=True, retainContainers=False)
-    score.analysisData['VerticalSlices'] = None
+    _clearVerticalSliceIndex(score)
     
 def removeNeighborTones(score, dictKey = 'unaccentedNeighborTones'):
     '''
@@ -1427,7 +1475,7 @@ def removeNeighborTones(score, dictKey = 'unaccentedNeighborTones'):
         a.n1.duration = music21.duration.Duration(durationNewTone)
         score.stripTies(inPlace=True, matchByPitch=True, retainContainers=False)
         #a.n1.color = 'red'
-    score.analysisData['VerticalSlices'] = None
+    _clearVerticalSliceIndex(score)
 
 def identifyNeighborTones(score, partNumToIdentify = None, color = None, dictKey = None, unaccentedOnly=True, \
                           editorialDictKey='isNeighborTone', editorialValue=True):
@@ -2046,6 +2094,8 @@ def setKeyMeasureMap(score, keyMeasureMap):
     '''
     addAnalysisData(score)
     score.analysisData['KeyMeasureMap'] = keyMeasureMap
+    if 'KeyAtMeasure' in score.analysisData:
+        del score.analysisData['KeyAtMeasure']
     
 def getKeyAtMeasure(score, measureNumber):
     '''
@@ -2066,21 +2116,45 @@ def getKeyAtMeasure(score, measureNumber):
     
     '''
     
+    # Caches the key found for each measure number; without a keyMeasureMap
+    # the key analysis of the whole score is found only once
+    if not hasattr(score, 'analysisData'):
+        addAnalysisData(score)
+    if 'KeyAtMeasure' not in score.analysisData:
+        score.analysisData['KeyAtMeasure'] = {}
+    keyAtMeasure = score.analysisData['KeyAtMeasure']
+    if measureNumber in keyAtMeasure:
+        return keyAtMeasure[measureNumber]
+
+    foundKey = None
     keyMeasureMap = getKeyMeasureMap(score)
     if keyMeasureMap:
         for dictKey in sorted(keyMeasureMap.iterkeys(), reverse=True):
             if measureNumber >= dictKey:                             
                 if common.isStr(keyMeasureMap[dictKey]):
-                    return key.Key(key.convertKeyStringToMusic21KeyString(keyMeasureMap[dictKey]))
+                    foundKey = key.Key(key.convertKeyStringToMusic21KeyString(keyMeasureMap[dictKey]))
                 else:
-                    return keyMeasureMap[dictKey]
-        if measureNumber == 0: #just in case of a pickup measure
-            if 1 in keyMeasureMap:
-                return key.Key(key.convertKeyStringToMusic21KeyString(keyMeasureMap[1]))
+                    foundKey = keyMeasureMap[dictKey]
+                break
         else:
-            return score.analyze('key')
+            if measureNumber == 0: #just in case of a pickup measure
+                if 1 in keyMeasureMap:
+                    foundKey = key.Key(key.convertKeyStringToMusic21KeyString(keyMeasureMap[1]))
+            else:
+                foundKey = _getAnalyzedKey(score)
     else:
-        return score.analyze('key')
+        foundKey = _getAnalyzedKey(score)
+    keyAtMeasure[measureNumber] = foundKey
+    return foundKey
+
+def _getAnalyzedKey(score):
+    '''
+    returns the key analysis of the score as a whole, found once and kept in
+    the score's analysisData
+    '''
+    if 'AnalyzedKey' not in score.analysisData:
+        score.analysisData['AnalyzedKey'] = score.analyze('key')
+    return score.analysisData['AnalyzedKey']
 
 class TheoryAnalyzerException(music21.Music21Exception):
     pass
@@ -100,8 +100,9 @@ class PolyphonicSnippet(stream.Score):
     
             for part in fiveExcelCells[0:3]:
                 if part is not None and hasattr(part, 'isStream') and part.isStream == True:
+                    oldClasses = part.classes
                     part.__class__ = stream.Part
-                    part.classes.insert(0, 'Part')
+                    part._classes = ['Part'] + oldClasses
             
             self.cadenceType = fiveExcelCells[3]
             self.timeSig = meter.TimeSignature(fiveExcelCells[4])
@@ -19,6 +19,7 @@ divide a score up into these segments, returning a list of segments to later ana
 The list of objects included here are:
 
 * :class:`~music21.voiceLeading.VoiceLeadingQuartet` : two by two matrix of notes
+    * :class:`~music21.voiceLeading.VoiceLeadingQuartetSeries` : all the quartets between two voices
 
 * :class:`~music21.voiceLeading.VerticalSlice` : vertical context in a score, composed of any music21 objects
     * :class:`~music21.voiceLeading.VerticalSliceNTuplet` : group of three contiguous verticalSlice objects
@@ -1006,6 +1007,264 @@ class VoiceLeadingQuartetException(exceptions21.Music21Exception):
     pass
 
 
+# memo of the interval attributes which voice leading checks read, keyed by the
+# (staff distance, semitones) of the interval, the two numbers it is made from
+_intervalAttributeCache = {}
+
+def _getIntervalAttributes(staffDistance, semitones):
+    if (staffDistance, semitones) not in _intervalAttributeCache:
+        genericInterval = interval.GenericInterval(interval.convertStaffDistanceToInterval(staffDistance))
+        intervalObj = interval.intervalFromGenericAndChromatic(genericInterval, interval.ChromaticInterval(semitones))
+        _intervalAttributeCache[(staffDistance, semitones)] = (intervalObj.name, intervalObj.simpleName, 
+            intervalObj.directedSimpleName, intervalObj.semiSimpleName, intervalObj.direction)
+    return _intervalAttributeCache[(staffDistance, semitones)]
+
+
+class VoiceLeadingQuartetSeries(object):
+    '''
+    The voice leading quartets between two voices, analyzed all at once. Quartet i
+    is formed by the notes at position i and i+1 of each voice, and gives the same
+    answers as a :class:`~music21.voiceLeading.VoiceLeadingQuartet` made from those notes.
+    
+    
+    The voices can be given as two lists of the same length of notes or pitches,
+    with None where a voice has no note, or as two Streams, which are aligned
+    at every offset where either of them has a note.
+    
+    
+    Each note is read once, for its pitch space and diatonic note numbers, and
+    each check returns a list with one value per quartet, None or False where
+    one of the four notes is missing. Intervals are looked up by staff distance
+    and semitones instead of being built for every quartet.
+    
+    >>> s1 = stream.Part()
+    >>> for pitchName in ['D4', 'E4', 'G4', 'G4', 'A4']:
+    ...     s1.append(note.Note(pitchName))
+    >>> s2 = stream.Part()
+    >>> for pitchName in ['G3', 'A3', 'C4', 'B3']:
+    ...     s2.append(note.Note(pitchName))
+    >>> s2.append(note.Rest())
+    >>> vlqs = voiceLeading.VoiceLeadingQuartetSeries(s1, s2)
+    >>> len(vlqs)
+    4
+    >>> vlqs.motionTypes()
+    ['Parallel', 'Parallel', 'Oblique', None]
+    >>> vlqs.parallelFifths()
+    [True, True, False, False]
+    
+    
+    Results map back to the notes of each quartet:
+    
+    
+    >>> for quartetIndex in vlqs.indices(vlqs.parallelFifths()):
+    ...     print [n.nameWithOctave for n in vlqs.getNotes(quartetIndex)]
+    ['D4', 'E4', 'G3', 'A3']
+    ['E4', 'G4', 'A3', 'C4']
+    >>> vlqs.getQuartet(1).parallelFifth()
+    True
+    >>> vlqs.getQuartet(3) is None
+    True
+    '''
+    def __init__(self, voice1, voice2):
+        if hasattr(voice1, 'flat') and hasattr(voice2, 'flat'):
+            (voice1, voice2) = self._alignStreams(voice1, voice2)
+        if len(voice1) != len(voice2):
+            raise VoiceLeadingQuartetException('voices of unequal length cannot be aligned: %d, %d' % (len(voice1), len(voice2)))
+        self.v1Notes = [self._toNote(n) for n in voice1]
+        self.v2Notes = [self._toNote(n) for n in voice2]
+        
+        # vertical intervals at each position, melodic intervals of each voice
+        # between one position and the next, as tuples of interval attributes
+        self._vertical = []
+        self._horizontal1 = []
+        self._horizontal2 = []
+        previous = None
+        for (n1, n2) in zip(self.v1Notes, self.v2Notes):
+            if n1 is None or n2 is None:
+                current = None
+                self._vertical.append(None)
+            else:
+                current = (n1.ps, n1.diatonicNoteNum, n2.ps, n2.diatonicNoteNum)
+                self._vertical.append(_getIntervalAttributes(current[3] - current[1], current[2] - current[0]))
+            if previous is not None and current is not None:
+                self._horizontal1.append(_getIntervalAttributes(current[1] - previous[1], current[0] - previous[0]))
+                self._horizontal2.append(_getIntervalAttributes(current[3] - previous[3], current[2] - previous[2]))
+            else:
+                self._horizontal1.append(None)
+                self._horizontal2.append(None)
+            previous = current
+        self._horizontal1 = self._horizontal1[1:]
+        self._horizontal2 = self._horizontal2[1:]
+        self._flags = None
+
+    def __len__(self):
+        return len(self._horizontal1)
+
+    def __repr__(self):
+        return '<music21.voiceLeading.%s of %d quartets>' % (self.__class__.__name__, len(self))
+
+    def _toNote(self, value):
+        if common.isStr(value):
+            return note.Note(value)
+        return value
+
+    def _alignStreams(self, stream1, stream2):
+        streamList = [stream1.flat.notes, stream2.flat.notes]
+        offsets = set()
+        for s in streamList:
+            for n in s.getElementsByClass('Note'):
+                offsets.add(common.cleanupFloat(n.getOffsetBySite(s)))
+        voices = ([], [])
+        for found in iterateElementsAtOffsets(streamList, sorted(offsets), ['Note']):
+            for voiceIndex in range(2):
+                if found[voiceIndex]:
+                    voices[voiceIndex].append(found[voiceIndex][0])
+                else:
+                    voices[voiceIndex].append(None)
+        return voices
+
+    def _getFlags(self):
+        '''
+        Computes, for every quartet, the motion checks of
+        :class:`~music21.voiceLeading.VoiceLeadingQuartet`, as a dictionary
+        of lists keyed by method name.
+        '''
+        if self._flags is not None:
+            return self._flags
+        if len(intervalCache) == 0:
+            intervalCache.append(interval.Interval("P1"))
+            intervalCache.append(interval.Interval("P5"))
+            intervalCache.append(interval.Interval("P8"))
+        (unison, fifth, octave) = intervalCache[0:3]
+        
+        flags = {}
+        for flagName in ['noMotion', 'obliqueMotion', 'similarMotion', 'parallelMotion', 'contraryMotion', 
+                         'antiParallelMotion', 'parallelFifth', 'parallelOctave', 'parallelUnison', 
+                         'hiddenFifth', 'hiddenOctave']:
+            flags[flagName] = []
+        motionTypes = []
+        for quartetIndex in range(len(self)):
+            h1 = self._horizontal1[quartetIndex]
+            h2 = self._horizontal2[quartetIndex]
+            if h1 is None:
+                for flagList in flags.values():
+                    flagList.append(False)
+                motionTypes.append(None)
+                continue
+            vA = self._vertical[quartetIndex]
+            vB = self._vertical[quartetIndex + 1]
+            # attributes are (name, simpleName, directedSimpleName, semiSimpleName, direction)
+            noMotion = h1[0] == 'P1' and h2[0] == 'P1'
+            obliqueMotion = not noMotion and (h1[0] == 'P1' or h2[0] == 'P1')
+            similarMotion = not noMotion and h1[4] == h2[4]
+            parallelMotion = similarMotion and vA[2] == vB[2]
+            contraryMotion = not noMotion and not obliqueMotion and h1[4] != h2[4]
+            antiParallelMotion = contraryMotion and vA[1] == vB[1]
+            parallelOrAntiParallel = parallelMotion or antiParallelMotion
+            hiddenMotion = similarMotion and not parallelMotion
+            
+            flags['noMotion'].append(noMotion)
+            flags['obliqueMotion'].append(obliqueMotion)
+            flags['similarMotion'].append(similarMotion)
+            flags['parallelMotion'].append(parallelMotion)
+            flags['contraryMotion'].append(contraryMotion)
+            flags['antiParallelMotion'].append(antiParallelMotion)
+            flags['parallelFifth'].append(parallelOrAntiParallel and vA[3] == fifth.semiSimpleName)
+            flags['parallelOctave'].append(parallelOrAntiParallel and vA[3] == octave.semiSimpleName)
+            flags['parallelUnison'].append(parallelOrAntiParallel and vA[3] == unison.semiSimpleName)
+            flags['hiddenFifth'].append(hiddenMotion and vB[1] == fifth.simpleName)
+            flags['hiddenOctave'].append(hiddenMotion and vB[1] == octave.simpleName)
+            
+            if obliqueMotion:
+                motionTypes.append('Oblique')
+            elif parallelMotion:
+                motionTypes.append('Parallel')
+            elif similarMotion:
+                motionTypes.append('Similar')
+            elif contraryMotion:
+                motionTypes.append('Contrary')
+            elif noMotion:
+                motionTypes.append('No Motion')
+            else:
+                motionTypes.append('')
+        flags['motionType'] = motionTypes
+        self._flags = flags
+        return flags
+
+    def getNotes(self, quartetIndex):
+        '''
+        Returns the notes (v1n1, v1n2, v2n1, v2n2) of quartet quartetIndex.
+        '''
+        return (self.v1Notes[quartetIndex], self.v1Notes[quartetIndex + 1], 
+                self.v2Notes[quartetIndex], self.v2Notes[quartetIndex + 1])
+
+    def getQuartet(self, quartetIndex, key=key.Key('C')):
+        '''
+        Returns a :class:`~music21.voiceLeading.VoiceLeadingQuartet` of the notes
+        of quartet quartetIndex, or None if one of them is missing.
+        '''
+        notes = self.getNotes(quartetIndex)
+        if None in notes:
+            return None
+        return VoiceLeadingQuartet(*notes, key=key)
+
+    def indices(self, flagList):
+        '''
+        Returns the indices of the quartets for which flagList, as returned by
+        one of the checks, is True.
+        
+        >>> vlqs = voiceLeading.VoiceLeadingQuartetSeries(['C4', 'D4', 'C4'], ['C3', 'D3', 'E3'])
+        >>> vlqs.parallelOctaves()
+        [True, False]
+        >>> vlqs.indices(vlqs.parallelOctaves())
+        [0]
+        '''
+        return [quartetIndex for quartetIndex in range(len(flagList)) if flagList[quartetIndex]]
+
+    def motionTypes(self):
+        '''
+        Returns the :meth:`~music21.voiceLeading.VoiceLeadingQuartet.motionType` of each quartet.
+        '''
+        return list(self._getFlags()['motionType'])
+
+    def noMotions(self):
+        return list(self._getFlags()['noMotion'])
+
+    def obliqueMotions(self):
+        return list(self._getFlags()['obliqueMotion'])
+
+    def similarMotions(self):
+        return list(self._getFlags()['similarMotion'])
+
+    def parallelMotions(self):
+        return list(self._getFlags()['parallelMotion'])
+
+    def contraryMotions(self):
+        return list(self._getFlags()['contraryMotion'])
+
+    def antiParallelMotions(self):
+        return list(self._getFlags()['antiParallelMotion'])
+
+    def parallelFifths(self):
+        return list(self._getFlags()['parallelFifth'])
+
+    def parallelOctaves(self):
+        return list(self._getFlags()['parallelOctave'])
+
+    def parallelUnisons(self):
+        return list(self._getFlags()['parallelUnison'])
+
+    def parallelUnisonsOrOctaves(self):
+        flags = self._getFlags()
+        return [octave or unison for (octave, unison) in zip(flags['parallelOctave'], flags['parallelUnison'])]
+
+    def hiddenFifths(self):
+        return list(self._getFlags()['hiddenFifth'])
+
+    def hiddenOctaves(self):
+        return list(self._getFlags()['hiddenOctave'])
+
+
 def getVerticalSliceFromObject(music21Obj, scoreObjectIsFrom, classFilterList=None):
     '''
     returns the :class:`~music21.voiceLeading.VerticalSlice` object given a score, and a music21 object within this score
@@ -1034,6 +1293,76 @@ def getVerticalSliceFromObject(music21Obj, scoreObjectIsFrom, classFilterList=No
     return VerticalSlice(contentDict)
 
 
+def iterateElementsAtOffsets(streamList, offsetList, classFilterList=None):
+    '''
+    Generator that, for each offset in the ascending list `offsetList`, yields a
+    list holding, for each Stream in `streamList`, a list of the elements
+    found at that offset the way
+    ``getElementsByOffset(offset, mustBeginInSpan=False, classList=classFilterList)``
+    would find them: elements sounding at the offset and zero-length elements
+    placed exactly on it.
+
+    Rather than searching every Stream once per offset, each Stream is
+    read through only once, so that the vertical slices of a whole
+    score can be gathered in a single pass (see
+    :meth:`~music21.theoryAnalysis.theoryAnalyzer.iterateVerticalSlices`).
+    As with getElementsByOffset, the activeSite of each element found
+    is set to the Stream it was found in.
+
+    >>> p0 = stream.Part()
+    >>> p0.append(note.Note('C5', quarterLength=2.0))
+    >>> p0.append(note.Note('D5', quarterLength=2.0))
+    >>> p1 = stream.Part()
+    >>> p1.repeatAppend(note.Note('F3'), 4)
+    >>> p1.insert(1.0, clef.BassClef())
+    >>> for found in voiceLeading.iterateElementsAtOffsets([p0, p1], [0.0, 1.0, 2.0]):
+    ...     print found
+    [[<music21.note.Note C>], [<music21.note.Note F>]]
+    [[<music21.note.Note C>], [<music21.clef.BassClef>, <music21.note.Note F>]]
+    [[<music21.note.Note D>], [<music21.note.Note F>]]
+    >>> for found in voiceLeading.iterateElementsAtOffsets([p0, p1], [1.0, 3.5], ['Note']):
+    ...     print found
+    [[<music21.note.Note C>], [<music21.note.Note F>]]
+    [[<music21.note.Note D>], [<music21.note.Note F>]]
+    '''
+    # for each Stream: the (offset, end, isZeroLength, element) entries in
+    # Stream order, the index of the next entry not yet reached, and the
+    # (index, end, element) lists of sounding and zero-length entries reached
+    walkers = []
+    for s in streamList:
+        entries = []
+        for e in s.elements:
+            if classFilterList is not None and not e.isClassOrSubclass(classFilterList):
+                continue
+            offset = common.cleanupFloat(e.getOffsetBySite(s))
+            quarterLength = e.duration.quarterLength
+            end = common.cleanupFloat(offset + quarterLength)
+            entries.append((offset, end, quarterLength == 0, e))
+        walkers.append([s, entries, 0, [], []])
+
+    for offset in offsetList:
+        found = []
+        for walker in walkers:
+            s, entries, i, sounding, zeroLength = walker
+            sounding = [x for x in sounding if x[1] > offset]
+            zeroLength = [x for x in zeroLength if x[1] == offset]
+            while i < len(entries) and entries[i][0] <= offset:
+                eOffset, end, isZeroLength, e = entries[i]
+                if isZeroLength:
+                    if eOffset == offset:
+                        zeroLength.append((i, eOffset, e))
+                elif end > offset:
+                    sounding.append((i, end, e))
+                i += 1
+            walker[2:] = [i, sounding, zeroLength]
+            elements = []
+            for unused_index, unused_end, e in sorted(sounding + zeroLength):
+                e.activeSite = s
+                elements.append(e)
+            found.append(elements)
+        yield found
+
+
 class VerticalSlice(base.Music21Object):
     ''' A vertical slice object provides more accessible information about
     vertical moments in a score. A vertical slice is instantiated by passing in a dictionary of 
@@ -1987,7 +2316,48 @@ class Test(unittest.TestCase):
             if callable(obj) and not isinstance(obj, types.FunctionType):
                 unused_a = copy.copy(obj)
                 unused_b = copy.deepcopy(obj)
-   
+
+    def testIterateElementsAtOffsets(self):
+        from music21 import corpus
+        s = corpus.parse('bach/bwv66.6')
+        streamList = [p.flat for p in s.parts]
+        offsetList = sorted(set([n.offset for n in s.flat.notesAndRests] + [1.75, 2.25]))
+        for classFilterList in [None, ['Note', 'Rest']]:
+            found = list(iterateElementsAtOffsets(streamList, offsetList, classFilterList))
+            self.assertEqual(len(found), len(offsetList))
+            for elementLists, offset in zip(found, offsetList):
+                for elements, flatPart in zip(elementLists, streamList):
+                    expected = flatPart.getElementsByOffset(offset, mustBeginInSpan=False,
+                                                            classList=classFilterList)
+                    self.assertEqual([id(e) for e in elements], [id(e) for e in expected.elements])
+
+    def testVoiceLeadingQuartetSeries(self):
+        import random
+        rand = random.Random(5)
+        pitchNames = ['C4', 'C#4', 'D-4', 'D4', 'E4', 'F4', 'F#4', 'G4', 'A-4', 'A4', 'B4', 'C5', 
+                      'G3', 'A3', 'B-3', 'C3', 'D3', 'F3', 'G5', 'E5']
+        voice1 = [note.Note(rand.choice(pitchNames)) for unused in range(300)]
+        voice2 = [note.Note(rand.choice(pitchNames)) for unused in range(300)]
+        voice1[50] = None
+        voice2[120] = None
+        vlqs = VoiceLeadingQuartetSeries(voice1, voice2)
+        self.assertEqual(len(vlqs), 299)
+        checks = [('motionTypes', 'motionType'), ('noMotions', 'noMotion'), ('obliqueMotions', 'obliqueMotion'),
+                  ('similarMotions', 'similarMotion'), ('parallelMotions', 'parallelMotion'), 
+                  ('contraryMotions', 'contraryMotion'), ('antiParallelMotions', 'antiParallelMotion'), 
+                  ('parallelFifths', 'parallelFifth'), ('parallelOctaves', 'parallelOctave'), 
+                  ('parallelUnisons', 'parallelUnison'), ('parallelUnisonsOrOctaves', 'parallelUnisonOrOctave'), 
+                  ('hiddenFifths', 'hiddenFifth'), ('hiddenOctaves', 'hiddenOctave')]
+        for (seriesMethod, quartetMethod) in checks:
+            results = getattr(vlqs, seriesMethod)()
+            for quartetIndex in range(len(vlqs)):
+                vlq = vlqs.getQuartet(quartetIndex)
+                if vlq is None:
+                    self.assertTrue(quartetIndex in (49, 50, 119, 120))
+                    self.assertTrue(results[quartetIndex] in (None, False))
+                else:
+                    self.assertEqual(results[quartetIndex], getattr(vlq, quartetMethod)())
+
     def test_unifiedTest(self):
         C4 = note.Note(); C4.name = "C"
         D4 = note.Note(); D4.name = "D"
@@ -2030,7 +2400,7 @@ class TestExternal(unittest.TestCase):
 
 #------------------------------------------------------------------------------
 
-_DOC_ORDER = [VoiceLeadingQuartet, ThreeNoteLinearSegment, VerticalSlice, VerticalSliceNTuplet]
+_DOC_ORDER = [VoiceLeadingQuartet, VoiceLeadingQuartetSeries, ThreeNoteLinearSegment, VerticalSlice, VerticalSliceNTuplet]
 
 if __name__ == "__main__":
     import music21